@@ -31,16 +31,27 @@ from .loggers import (
     FuzzLoggerDbReader,
     FuzzLoggerPostgres,
     FuzzLoggerPostgresReader,
+    FuzzLoggerRingBuffer,
     FuzzLogger,
     IFuzzLogger,
-    IFuzzLoggerBackend
+    IFuzzLoggerBackend,
+    LogRecord
 )
 from .constants import BIG_ENDIAN, DEFAULT_PROCMON_PORT, LITTLE_ENDIAN
 from .event_hook import EventHook
 from .exception import BoofuzzFailure, MustImplementException, SizerNotUtilizedError, SullyRuntimeError
 from .fuzzable import Fuzzable
 from .fuzzable_block import FuzzableBlock
-from .monitors import BaseMonitor, CallbackMonitor, NetworkMonitor, pedrpc, ProcessMonitor, BusyboxMonitor
+from .monitors import (
+    BaseMonitor,
+    BusyboxMonitor,
+    CallbackMonitor,
+    CoverageMonitor,
+    MonitorWatcher,
+    NetworkMonitor,
+    pedrpc,
+    ProcessMonitor,
+)
 from .utils.process_monitor_local import ProcessMonitorLocal
 from .primitives import (
     BasePrimitive,
@@ -61,8 +72,31 @@ from .primitives import (
     String,
     Word,
 )
+from .packed_corpus import PackedCorpus, PackedCorpusWriter, PackedRecord
 from .repeater import CountRepeater, Repeater, TimeRepeater
-from .sessions import BaseConfig, open_test_run, Session, Target, get_datetime
+from .sessions import (
+    AdaptiveNominalSchedule,
+    AimdPacer,
+    BannerProbe,
+    BaseConfig,
+    CampaignPlanner,
+    CorpusExporter,
+    CoveringArray,
+    EnergyScheduler,
+    NominalProbe,
+    open_test_run,
+    ReadinessProbe,
+    RenderPool,
+    SentPayloadFilter,
+    Session,
+    StackOrderScheduler,
+    StoredCase,
+    Target,
+    TCPConnectProbe,
+    TokenBucket,
+    UDPProbe,
+    get_datetime,
+)
 from .protocol_session import ProtocolSession
 from .protocol_session_reference import ProtocolSessionReference
 from .callbacks import (
@@ -80,7 +114,10 @@ if sys.platform == "win32" and sys.version_info >= (3, 8):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # pytype: disable=module-attr
 
 __all__ = [
+    "AdaptiveNominalSchedule",
+    "AimdPacer",
     "Aligned",
+    "BannerProbe",
     "BaseCallback",
     "BaseConfig",
     "BaseMonitor",
@@ -95,11 +132,16 @@ __all__ = [
     "Byte",
     "Bytes",
     "CallbackMonitor",
+    "CampaignPlanner",
     "Checksum",
+    "CorpusExporter",
     "CountRepeater",
+    "CoveringArray",
+    "CoverageMonitor",
     "DEFAULT_PROCMON_PORT",
     "Delim",
     "DWord",
+    "EnergyScheduler",
     "EventHook",
     "exception",
     "FileConnection",
@@ -115,6 +157,7 @@ __all__ = [
     "FuzzLoggerDbReader",
     "FuzzLoggerPostgres",
     "FuzzLoggerPostgresReader",
+    "FuzzLoggerRingBuffer",
     "Group",
     "IFuzzLogger",
     "IFuzzLoggerBackend",
@@ -124,13 +167,19 @@ __all__ = [
     "legos",
     "loggers",
     "LITTLE_ENDIAN",
+    "LogRecord",
     "main_helper",
     "Mirror",
+    "MonitorWatcher",
     "MultipleDefault",
     "MustImplementException",
     "NETCONFConnection",
+    "NominalProbe",
     "NetworkMonitor",
     "open_test_run",
+    "PackedCorpus",
+    "PackedCorpusWriter",
+    "PackedRecord",
     "pedrpc",
     "primitives",
     "ProcessMonitor",
@@ -139,6 +188,8 @@ __all__ = [
     "RandomData",
     "RawL2SocketConnection",
     "RawL3SocketConnection",
+    "ReadinessProbe",
+    "RenderPool",
     "Repeat",
     "Repeater",
     "Request",
@@ -188,6 +239,7 @@ __all__ = [
     "s_unknown",
     "s_update",
     "s_word",
+    "SentPayloadFilter",
     "SerialConnection",
     "SerialConnectionLowLevel",
     "Session",
@@ -196,15 +248,20 @@ __all__ = [
     "SocketConnection",
     "SSLSocketConnection",
     "Simple",
+    "StackOrderScheduler",
     "Static",
+    "StoredCase",
     "String",
     "SullyRuntimeError",
     "Target",
+    "TCPConnectProbe",
     "TCPSocketConnection",
     "ProtocolSession",
     "ProtocolSessionReference",
     "TimeRepeater",
     "TftpCallback",
+    "TokenBucket",
+    "UDPProbe",
     "UDPSocketConnection",
     "UnixSocketConnection",
     "WebsocketCallback",
@@ -581,6 +638,7 @@ def s_update(name, value):
         raise exception.SullyRuntimeError("NO OBJECT WITH NAME '%s' FOUND IN CURRENT REQUEST" % name)
 
     blocks.CURRENT.names[name]._default_value = value
+    blocks.CURRENT.names[name].invalidate_num_mutations()
 
 
 # PRIMITIVES
@@ -74,6 +74,7 @@ class Request(FuzzableBlock, Node):
         self.smooth_rtt: float = 0  # Smoothed Round Trip Time
         self.rtt_variations: float = 0  # Round Trip Time Variations
         self.rto: float = 100  # Retransmission Timeout
+        self.rto_measured: bool = False  # True once rto comes from measured round trip times, see calculate_rto()
 
         self.receive_data_after_transmit:bool = receive_data_after_transmit
         self.answer_must_contain: list[str|bytes] | None = answer_must_contain
@@ -230,6 +231,7 @@ class Request(FuzzableBlock, Node):
             self.stack.append(item)
         else:
             self.block_stack[-1].push(item)
+        self.invalidate_num_mutations()
 
         # add the opened block to the block stack.
         if isinstance(item, FuzzableBlock):
@@ -257,7 +259,7 @@ class Request(FuzzableBlock, Node):
         @return: Sulley Primitives
         """
 
-        if not stack:
+        if stack is None:
             stack = self.stack
 
         for item in stack:
@@ -367,10 +369,11 @@ class Request(FuzzableBlock, Node):
         """
 
         # If it is the first rtt measurement, we set the initial values
-        if self.rto == 100:
+        if not self.rto_measured:
             self.smooth_rtt = rtt
             self.rtt_variations = rtt / 2
             self.rto = self.smooth_rtt + k * self.rtt_variations
+            self.rto_measured = True
         else:
             # calculate the new round trip time variations
             self.rtt_variations = (1 - beta) * self.rtt_variations + beta * abs(rtt - self.smooth_rtt)
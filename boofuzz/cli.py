@@ -94,7 +94,7 @@ def fuzz(
     elif tui:
         fuzz_loggers.append(FuzzLoggerCurses())
     if csv_out is not None:
-        f = open("boofuzz.csv", "wb")
+        f = open("boofuzz.csv", "w", newline="")
         fuzz_loggers.append(FuzzLoggerCsv(file_handle=f))
 
     procmon_options = {}
@@ -1,7 +1,10 @@
+import atexit
 import errno
 import os
 
 from . import itarget_connection
+from .. import constants
+from ..packed_corpus import PackedCorpusWriter
 
 
 class FileConnection(itarget_connection.ITargetConnection):
@@ -11,13 +14,19 @@ class FileConnection(itarget_connection.ITargetConnection):
         directory: Directory for new message files.
         one_file_only (bool): Set to True to continually overwrite a single file. Can be used in conjunction with a hook
             that processes the file.
+        packed (bool): Set to True to append every message to a single packed corpus file in the directory instead,
+            see :class:`PackedCorpus`. Each message is a record whose test case index is the number of the connection.
+        compress (bool): In packed mode, write zlib-compressed blocks.
     """
 
-    def __init__(self, directory, one_file_only=False):
+    def __init__(self, directory, one_file_only=False, packed=False, compress=False):
         self._dirname = directory
         self._file_id = 1
         self._file_handle = None
         self._one_file_only = one_file_only
+        self._packed = packed
+        self._compress = compress
+        self._writer = None
 
         try:
             os.mkdir(self._dirname)
@@ -32,6 +41,11 @@ class FileConnection(itarget_connection.ITargetConnection):
 
         :return: None
         """
+        if self._packed:
+            if not self._compress:
+                self._writer.flush()
+            self._file_id += 1
+            return
         self._file_handle.close()
         if not self._one_file_only:
             self._file_id += 1
@@ -42,6 +56,13 @@ class FileConnection(itarget_connection.ITargetConnection):
 
         :return: None
         """
+        if self._packed:
+            if self._writer is None:
+                self._writer = PackedCorpusWriter(
+                    os.path.join(self._dirname, constants.PACKED_CORPUS_NAME), compress=self._compress
+                )
+                atexit.register(self._writer.close)
+            return
         self._file_handle = open(os.path.join(self._dirname, str(self._file_id)), "wb")
 
     def recv(self, max_bytes):
@@ -66,8 +87,13 @@ class FileConnection(itarget_connection.ITargetConnection):
         Returns:
             int: Number of bytes actually sent.
         """
+        if self._packed:
+            self._writer.append(data, test_case_index=self._file_id)
+            return len(data)
         self._file_handle.write(data)
 
     @property
     def info(self):
+        if self._packed:
+            return "directory: {0}, packed record: {1}".format(self._dirname, str(self._file_id))
         return "directory: {0}, filename: {1}".format(self._dirname, str(self._file_id))
@@ -12,6 +12,11 @@ RESULTS_DIR = "fuzzungus-results"
 LOG_RECAP_NAME = 'fuzz_log_recap.txt'
 CONF_NAME = 'conf.json'
 GRAPH_NAME = 'graph.png'
+FEEDBACK_CORPUS_NAME = 'feedback_corpus.jsonl'
+STATS_SEGMENT_NAME = 'live_stats.shm'
+EXPORT_DIR_NAME = 'export'
+EXPORT_INDEX_NAME = 'index.csv'
+PACKED_CORPUS_NAME = 'corpus.pack'
 
 DB_MAX_IDENTIFIERS_LEN = 63  # Default for Postgres
 DB_USER_NAME = 'fuzz'
@@ -52,6 +52,12 @@ class BoofuzzRpcError(BoofuzzError):
     pass
 
 
+class BoofuzzStopCampaign(BoofuzzError):
+    """Raised to end a campaign normally, e.g. when its time budget or maximum number of rounds is reached."""
+
+    pass
+
+
 class SullyRuntimeError(Exception):
     pass
 
@@ -0,0 +1,7 @@
+"""Feedback from the target steering the random_mutation rounds."""
+
+from .corpus import Corpus
+from .coverage_map import CoverageMap
+from .response_novelty import NoveltyTable, ResponseFingerprint, ResponseFingerprinter
+
+__all__ = ["Corpus", "CoverageMap", "NoveltyTable", "ResponseFingerprint", "ResponseFingerprinter"]
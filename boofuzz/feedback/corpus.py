@@ -0,0 +1,110 @@
+"""Element values that made the target do something new."""
+
+import json
+import os
+import threading
+
+
+def _encode_value(value):
+    if isinstance(value, str):
+        return {"str": value}
+    if isinstance(value, bytes):
+        return {"hex": value.hex()}
+    if isinstance(value, int):
+        return {"int": value}
+    return None
+
+
+def _decode_value(entry):
+    if "str" in entry:
+        return entry["str"]
+    if "hex" in entry:
+        return bytes.fromhex(entry["hex"])
+    return entry["int"]
+
+
+class Corpus:
+    """
+    Values of fuzzable elements that reached new coverage or triggered new responses.
+
+    random_mutation rounds mutate corpus values of an element in addition to its library values (see
+    :meth:`BasePrimitive.corpus_values <boofuzz.primitives.base_primitive.BasePrimitive.corpus_values>`). Values added
+    during a round are only used from the next round on, so that a round's test cases depend only on the corpus as it
+    was when the round started and stay replayable.
+
+    Each value also has an energy, its weight when picking the corpus value mutated by a round. Values start with an
+    energy of 1; feedback sources may add more with :meth:`add_energy`.
+
+    With a path, entries are appended to that file as JSON lines and loaded back when the corpus is created, so that a
+    continued campaign keeps its corpus.
+
+    Args:
+        path (str): File in which the corpus is kept. Default None: in memory only.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._values = {}  # qualified name -> {value: energy}, in insertion order
+        self._round_values = {}  # qualified name -> [(value, energy)] as of the start of the round
+        self.generation = 0  # incremented by start_round, lets callers cache what depends on the round's values
+        if path is not None and os.path.isfile(path):
+            self._load(path)
+        self.start_round()
+
+    def __len__(self):
+        return sum(len(values) for values in self._values.values())
+
+    def add(self, qualified_name, value):
+        """Add a value of an element. Return True if it was not in the corpus yet.
+
+        Only str, bytes and int values are kept.
+        """
+        if _encode_value(value) is None:
+            return False
+        with self._lock:
+            values = self._values.setdefault(qualified_name, {})
+            if value in values:
+                return False
+            values[value] = 1
+        self._append({"element": qualified_name, "value": _encode_value(value)})
+        return True
+
+    def add_energy(self, qualified_name, value, energy):
+        """Give `energy` more weight to a value of an element, adding the value if needed."""
+        if _encode_value(value) is None:
+            return
+        with self._lock:
+            values = self._values.setdefault(qualified_name, {})
+            values[value] = values.get(value, 0) + energy
+        self._append({"element": qualified_name, "value": _encode_value(value), "energy": energy})
+
+    def start_round(self):
+        """Freeze the values used by the round about to start."""
+        with self._lock:
+            self._round_values = {name: list(values.items()) for name, values in self._values.items()}
+            self.generation += 1
+
+    def values(self, qualified_name):
+        """Return the (value, energy) pairs of an element as of the start of the current round."""
+        return self._round_values.get(qualified_name, [])
+
+    def _append(self, entry):
+        if self._path is None:
+            return
+        with self._lock, open(self._path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _load(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if "input" in entry:
+                    # Whole test cases kept by earlier versions, which nothing mutates.
+                    continue
+                value = _decode_value(entry["value"])
+                values = self._values.setdefault(entry["element"], {})
+                values[value] = values.get(value, 0) + entry.get("energy", 1)
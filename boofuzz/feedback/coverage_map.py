@@ -0,0 +1,130 @@
+"""Edge-coverage bitmap shared with an instrumented target.
+
+Targets built with afl-clang-fast / afl-gcc, or with SanitizerCoverage linked against the AFL++ runtime, look for the
+``__AFL_SHM_ID`` environment variable at startup, attach the System V shared memory segment it names and increment one
+byte per edge they execute. :class:`CoverageMap` creates such a segment; start the target with :attr:`CoverageMap.env`
+in its environment (see the `env` option of :class:`ProcessMonitorLocal <boofuzz.ProcessMonitorLocal>`), clear the map
+before each test case and call :meth:`CoverageMap.check` after it.
+
+Hit counts are bucketed like AFL does (1, 2, 3, 4-7, 8-15, 16-31, 32-127, 128+), so that a loop running a few more times
+counts as new behaviour but not every single extra iteration.
+"""
+
+import atexit
+import ctypes
+import ctypes.util
+
+from boofuzz import exception
+
+SHM_ENV_VAR = "__AFL_SHM_ID"
+MAP_SIZE = 1 << 16
+
+NO_NEW_COVERAGE = 0
+NEW_HIT_COUNTS = 1
+NEW_EDGES = 2
+
+_IPC_PRIVATE = 0
+_IPC_CREAT = 0o1000
+_IPC_EXCL = 0o2000
+_IPC_RMID = 0
+
+
+def _bucket(count):
+    for limit, bucket in ((0, 0), (1, 1), (2, 2), (3, 4), (7, 8), (15, 16), (31, 32), (127, 64)):
+        if count <= limit:
+            return bucket
+    return 128
+
+
+# Byte translation tables: raw hit count -> bucket bit, and raw hit count -> 1 if the edge was hit at all.
+_COUNT_CLASS_TABLE = bytes(_bucket(count) for count in range(256))
+_EDGE_TABLE = bytes([0] + [1] * 255)
+
+
+def _load_libc():
+    name = ctypes.util.find_library("c")
+    try:
+        libc = ctypes.CDLL(name, use_errno=True)
+        libc.shmget.restype = ctypes.c_int
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+    except (OSError, AttributeError, TypeError) as e:
+        raise exception.BoofuzzError("System V shared memory is not available: {0}".format(e))
+    return libc
+
+
+class CoverageMap:
+    """
+    System V shared memory segment receiving the edge hit counts of an instrumented target.
+
+    Args:
+        map_size (int): Size of the map in bytes. Must match the map size the target was built with. Default 65536.
+    """
+
+    def __init__(self, map_size=MAP_SIZE):
+        self.map_size = map_size
+        self._libc = _load_libc()
+        self.shm_id = self._libc.shmget(_IPC_PRIVATE, map_size, _IPC_CREAT | _IPC_EXCL | 0o600)
+        if self.shm_id < 0:
+            raise exception.BoofuzzError("shmget failed: errno {0}".format(ctypes.get_errno()))
+        self._address = self._libc.shmat(self.shm_id, None, 0)
+        if self._address is None or self._address == ctypes.c_void_p(-1).value:
+            self._libc.shmctl(self.shm_id, _IPC_RMID, None)
+            raise exception.BoofuzzError("shmat failed: errno {0}".format(ctypes.get_errno()))
+        atexit.register(self.close)
+
+        # Bits of the bucketed map never seen so far, and edges seen so far (one bit per byte), as big integers:
+        # comparing 64 KiB maps then costs a few integer operations instead of a Python loop.
+        self._virgin = (1 << (8 * map_size)) - 1
+        self._edges = 0
+        self.reset()
+
+    @property
+    def env(self):
+        """Environment variables to pass to the target so that it writes into this map."""
+        return {SHM_ENV_VAR: str(self.shm_id)}
+
+    @property
+    def edges_covered(self):
+        """Number of distinct edges hit since the map was created."""
+        return self._edges.bit_count()
+
+    def reset(self):
+        """Clear the hit counts, typically before sending a test case."""
+        ctypes.memset(self._address, 0, self.map_size)
+
+    def read(self):
+        """Return a copy of the raw hit counts."""
+        return ctypes.string_at(self._address, self.map_size)
+
+    def check(self, raw=None):
+        """Compare the hit counts of the last test case with everything seen before, and remember them.
+
+        Args:
+            raw (bytes): Hit counts to check. Default: the current content of the map.
+
+        Returns:
+            int: NEW_EDGES if an edge was hit for the first time, NEW_HIT_COUNTS if a known edge was hit a number of
+            times never seen before, NO_NEW_COVERAGE otherwise.
+        """
+        if raw is None:
+            raw = self.read()
+        hits = int.from_bytes(raw.translate(_COUNT_CLASS_TABLE), "little")
+        if hits & self._virgin == 0:
+            return NO_NEW_COVERAGE
+        self._virgin &= ~hits
+        edges = int.from_bytes(raw.translate(_EDGE_TABLE), "little")
+        if edges & ~self._edges:
+            self._edges |= edges
+            return NEW_EDGES
+        return NEW_HIT_COUNTS
+
+    def close(self):
+        """Detach and remove the segment."""
+        if self._address is not None:
+            self._libc.shmdt(self._address)
+            self._libc.shmctl(self.shm_id, _IPC_RMID, None)
+            self._address = None
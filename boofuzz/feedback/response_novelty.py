@@ -0,0 +1,118 @@
+"""Black-box feedback: classify the target's responses and remember which classes each request has produced.
+
+A response is reduced to a :class:`ResponseFingerprint`: its length class, its opcode/status bytes, a hash of its
+content with volatile fields (counters, timestamps, session ids...) masked, and a latency bucket relative to the
+request's RTO estimate (see :meth:`Request.calculate_rto <boofuzz.Request.calculate_rto>`). A test case whose
+response has a fingerprint never seen for its request is considered novel: its mutated values get extra energy in the
+session's :class:`Corpus <boofuzz.feedback.Corpus>`, so that later random_mutation rounds mutate them more often.
+"""
+
+import hashlib
+import re
+import threading
+
+import attr
+
+# Digit runs, and hexadecimal runs long enough to be ids, hashes or nonces.
+DEFAULT_VOLATILE_PATTERNS = (rb"[0-9a-fA-F]{8,}", rb"[0-9]+")
+
+LATENCY_UNKNOWN = -1
+LATENCY_FAST = 0
+LATENCY_NORMAL = 1
+LATENCY_SLOW = 2
+
+
+@attr.s(frozen=True, slots=True)
+class ResponseFingerprint:
+    """Class of a response; two responses with the same fingerprint are assumed to exercise the same code."""
+
+    length_class = attr.ib(type=int)
+    opcode = attr.ib(type=bytes)
+    digest = attr.ib(type=bytes)
+    latency = attr.ib(type=int)
+
+
+class ResponseFingerprinter:
+    """
+    Compute the :class:`ResponseFingerprint` of responses.
+
+    Args:
+        opcode_offset (int): Offset of the opcode/status bytes in responses. Default 0.
+        opcode_length (int): Number of opcode/status bytes. Default 1. Set to 0 to ignore them.
+        volatile_patterns (list[bytes]): Regular expressions matching fields whose value changes from a response to
+            the other regardless of the request, masked before hashing. Default: digit runs and long hexadecimal runs.
+        use_latency (bool): Include the latency bucket in fingerprints. Only available for requests with
+            timeout_check, the others have no RTO estimate. Default True.
+        energy (int): Energy given to each mutated value of a test case with a novel response. Default 4.
+    """
+
+    def __init__(
+        self,
+        opcode_offset=0,
+        opcode_length=1,
+        volatile_patterns=DEFAULT_VOLATILE_PATTERNS,
+        use_latency=True,
+        energy=4,
+    ):
+        self.opcode_offset = opcode_offset
+        self.opcode_length = opcode_length
+        self._volatile = None
+        if volatile_patterns:
+            self._volatile = re.compile(b"|".join(b"(?:" + pattern + b")" for pattern in volatile_patterns))
+        self.use_latency = use_latency
+        self.energy = energy
+
+    def fingerprint(self, data, elapsed_time=None, request=None):
+        """Return the fingerprint of a response.
+
+        Args:
+            data (bytes): Response. None or empty if nothing was received.
+            elapsed_time (float): Time between sending the request and receiving the response, in seconds.
+            request (Request): Request answered, whose RTO estimate is used for the latency bucket.
+
+        Returns:
+            ResponseFingerprint
+        """
+        data = data or b""
+        opcode = data[self.opcode_offset : self.opcode_offset + self.opcode_length]
+        normalised = self._volatile.sub(b"*", data) if self._volatile is not None else data
+        return ResponseFingerprint(
+            length_class=len(data).bit_length(),
+            opcode=opcode,
+            digest=hashlib.blake2b(normalised, digest_size=8).digest(),
+            latency=self._latency_bucket(elapsed_time, request) if self.use_latency else LATENCY_UNKNOWN,
+        )
+
+    @staticmethod
+    def _latency_bucket(elapsed_time, request):
+        if elapsed_time is None or request is None or not request.rto_measured:
+            return LATENCY_UNKNOWN
+        if elapsed_time <= request.smooth_rtt:
+            return LATENCY_FAST
+        if elapsed_time <= request.rto:
+            return LATENCY_NORMAL
+        return LATENCY_SLOW
+
+
+class NoveltyTable:
+    """Response fingerprints seen so far, per request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seen = {}  # request name -> set of fingerprints
+
+    def observe(self, request_name, fingerprint):
+        """Record a fingerprint. Return True if the request never produced it before."""
+        with self._lock:
+            seen = self._seen.setdefault(request_name, set())
+            if fingerprint in seen:
+                return False
+            seen.add(fingerprint)
+            return True
+
+    def classes(self, request_name):
+        """Return the number of distinct response classes seen for a request."""
+        return len(self._seen.get(request_name, ()))
+
+    def __len__(self):
+        return sum(len(seen) for seen in self._seen.values())
@@ -46,6 +46,7 @@ class Fuzzable:
     """
 
     name_counter = 0
+    _num_mutations_version = 0
 
     def __init__(self,
                  name=None,
@@ -185,6 +186,17 @@ class Fuzzable:
         return self.num_mutations(default_value=
                                   self.original_value(test_case_context=None)) + len(self._fuzz_values)
 
+    def invalidate_num_mutations(self):
+        """Forget the mutation counts cached by the blocks of this element's request.
+
+        Call it after changing the structure, default value or budgets of an element once it is pushed. Changes made
+        through :meth:`FuzzableBlock.push <boofuzz.FuzzableBlock.push>`, :meth:`Request.push <boofuzz.Request.push>`,
+        :func:`s_update <boofuzz.s_update>` and :meth:`BasePrimitive.set_budget
+        <boofuzz.primitives.base_primitive.BasePrimitive.set_budget>` already do.
+        """
+        owner = self.request if self.request is not None else self
+        owner._num_mutations_version += 1
+
     def get_value(self, mutation_context=None):
         """Helper method to get the currently applicable value.
 
@@ -7,7 +7,8 @@ class FuzzableBlock(Fuzzable):
     FuzzableBlock overrides the following methods, changing the default behavior for any type based on FuzzableBlock:
 
     1. :meth:`mutations` Iterate through the mutations yielded by all child nodes.
-    2. :meth:`num_mutations` Sum the mutations represented by each child node.
+    2. :meth:`num_mutations` Sum the mutations represented by each child node. The sum is cached until the request's
+       structure changes (see :meth:`invalidate_num_mutations`) or the session starts another round or seed.
     3. :meth:`encode` Call :meth:`get_child_data`.
 
     FuzzableBlock adds the following methods:
@@ -34,6 +35,7 @@ class FuzzableBlock(Fuzzable):
             self.stack = [children]
         else:
             self.stack = list(children)
+        self._num_mutations_cache = None  # (key, number of mutations)
 
     def mutations(self, default_value, skip_elements=None):
         if skip_elements is None:
@@ -46,13 +48,28 @@ class FuzzableBlock(Fuzzable):
                 yield mutation
 
     def num_mutations(self, default_value=None):
+        key = self._num_mutations_key()
+        if self._num_mutations_cache is not None and self._num_mutations_cache[0] == key:
+            return self._num_mutations_cache[1]
+
         num_mutations = 0
 
         for item in self.stack:
             if item.fuzzable:
                 num_mutations += item.get_num_mutations()
+        self._num_mutations_cache = (key, num_mutations)
         return num_mutations
 
+    def _num_mutations_key(self):
+        """Everything the children's mutation counts depend on, besides the elements' own settings."""
+        owner = self.request if self.request is not None else self
+        session = getattr(owner, "parent_session", None)
+        session_state = None
+        if session is not None:
+            corpus = getattr(session, "feedback_corpus", None)
+            session_state = (session.round_type, session.seed, getattr(corpus, "generation", None))
+        return id(owner), owner._num_mutations_version, tuple(id(item) for item in self.stack), session_state
+
     def get_child_data(self, mutation_context):
         """Get child or referenced data for this node.
 
@@ -82,3 +99,4 @@ class FuzzableBlock(Fuzzable):
         Returns: None
         """
         self.stack.append(item)
+        self.invalidate_num_mutations()
@@ -363,8 +363,9 @@ def pause_for_signal():
             time.sleep(0.001)
 
 
-def get_time_stamp():
-    t = time.time()
+def get_time_stamp(t=None):
+    if t is None:
+        t = time.time()
     s = time.strftime("[%Y-%m-%d %H:%M:%S", time.localtime(t))
     s += ",%03d]" % (t * 1000 % 1000)
     return s
@@ -381,8 +382,20 @@ def _indent_after_first_line(lines, amount, ch=" "):
 
 
 def format_log_msg(
-        msg_type, description=None, data=None, indent_size=2, timestamp=None, truncated=False, format_type="terminal"
+        msg_type,
+        description=None,
+        data=None,
+        indent_size=2,
+        timestamp=None,
+        truncated=False,
+        format_type="terminal",
+        data_length=None,
 ):
+    """Format a log line.
+
+    `data_length` is the length of the original data when `data` has been cut short by the caller; the line then
+    shows the original length and how many bytes are displayed.
+    """
     curses_mode = False
     if data is None:
         data = b""
@@ -399,8 +412,14 @@ def format_log_msg(
     else:
         msg = ""
 
+    if truncated:
+        note = " (data truncated for database storage)"
+    elif data_length is not None and data_length > len(data):
+        note = " (first {0} bytes shown)".format(len(data))
+    else:
+        note = ""
     msg = test_step_info[msg_type][format_type].format(  # pytype: disable=attribute-error
-        msg=msg, n=len(data), note="" if not truncated else " (data truncated for database storage)"
+        msg=msg, n=len(data) if data_length is None else data_length, note=note
     )
     msg = _indent_all_lines(msg, (test_step_info[msg_type]["indent"]) * indent_size)
     msg = timestamp + " " + _indent_after_first_line(msg, len(timestamp) + 1)
@@ -4,9 +4,11 @@ from .fuzz_logger_text import FuzzLoggerText
 from .fuzz_logger_curses import FuzzLoggerCurses
 from .fuzz_logger_db import FuzzLoggerDb, FuzzLoggerDbReader
 from .fuzz_logger_postgres import FuzzLoggerPostgres, FuzzLoggerPostgresReader
+from .fuzz_logger_ring_buffer import FuzzLoggerRingBuffer
 from .fuzz_logger import FuzzLogger
 from .ifuzz_logger_backend import IFuzzLoggerBackend
 from .ifuzz_logger import IFuzzLogger
+from .log_record import LogRecord
 
 __all__ = [
     "FuzzLoggerCsv",
@@ -16,7 +18,9 @@ __all__ = [
     "FuzzLoggerDbReader",
     "FuzzLoggerPostgres",
     "FuzzLoggerPostgresReader",
+    "FuzzLoggerRingBuffer",
     "FuzzLogger",
     "IFuzzLogger",
     "IFuzzLoggerBackend",
+    "LogRecord",
 ]
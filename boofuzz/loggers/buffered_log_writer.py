@@ -0,0 +1,99 @@
+import atexit
+import sys
+import threading
+
+
+class BufferedLogWriter:
+    """
+    Accumulates log text in memory and writes it to a file handle in large chunks.
+
+    The buffer is written when it grows over `buffer_size` characters, when :meth:`flush` is called (loggers do so on
+    failures and at the end of a test run), and by a background thread every `flush_interval` seconds so that the
+    output never lags far behind. The thread starts on the first write and stops on :meth:`close`.
+
+    Consoles started with PYTHONUNBUFFERED=1 (as in the Docker image) otherwise pay for a write system call per
+    log line.
+
+    Args:
+        file_handle: Open file handle to write to.
+        buffer_size (int): Size, in characters, above which the buffer is written. Default 64 KiB.
+        flush_interval (float): Maximum time, in seconds, text stays in the buffer. Default 0.5.
+    """
+
+    def __init__(self, file_handle, buffer_size=64 * 1024, flush_interval=0.5):
+        self._file_handle = file_handle
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._buffer = []
+        self._buffer_len = 0
+        self._last_overwritable = False
+        self._lock = threading.Lock()
+        self._flush_thread = None
+        self._stop_flushing = None
+
+    def write(self, text, overwritable=False):
+        """Add text to the buffer.
+
+        Args:
+            text (str): Text to write.
+            overwritable (bool): The text is a status line that the next status line overwrites on the console
+                (it starts with a carriage return). If it is still buffered when the next one comes, it is dropped.
+        """
+        with self._lock:
+            if overwritable and self._last_overwritable and self._buffer:
+                self._buffer_len -= len(self._buffer.pop())
+            self._buffer.append(text)
+            self._buffer_len += len(text)
+            self._last_overwritable = overwritable
+            if self._buffer_len >= self._buffer_size:
+                self._flush_locked()
+        if self._flush_thread is None:
+            self._start_flush_thread()
+
+    def flush(self):
+        """Write the buffer to the file handle."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Write the buffer, stop the background thread and unregister the exit handler.
+
+        The file handle is left open. Writing again starts a new thread.
+        """
+        thread, self._flush_thread = self._flush_thread, None
+        if thread is not None:
+            self._stop_flushing.set()
+            if thread is not threading.current_thread():
+                thread.join()
+            atexit.unregister(self.flush)
+        self.flush()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        self._file_handle.write("".join(self._buffer))
+        self._buffer.clear()
+        self._buffer_len = 0
+        self._last_overwritable = False
+        try:
+            self._file_handle.flush()
+        except (OSError, ValueError):
+            # The console may be gone at exit.
+            pass
+
+    def _start_flush_thread(self):
+        self._stop_flushing = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, args=(self._stop_flushing,), name="log-flush", daemon=True
+        )
+        self._flush_thread.start()
+        atexit.register(self.flush)
+
+    def _flush_periodically(self, stop):
+        while not stop.wait(self._flush_interval):
+            self.flush()
+
+
+def is_console(file_handle):
+    """True if file_handle is the standard output or error of the process."""
+    return file_handle is sys.stdout or file_handle is sys.stderr
@@ -1,6 +1,11 @@
+import functools
+import queue
+import threading
+import traceback
 from typing import Union  # noqa: F401
 
 from boofuzz.loggers.ifuzz_logger import IFuzzLogger
+from boofuzz.loggers.log_record import LogRecord
 
 
 class FuzzLogger(IFuzzLogger):
@@ -9,15 +14,26 @@ class FuzzLogger(IFuzzLogger):
 
     FuzzLogger also maintains summary failure and error data.
 
+    Each message is turned into one :class:`LogRecord`, delivered to the backends whose
+    :meth:`IFuzzLogger.accepts` returns True for its type; nothing is built when no backend wants it. Descriptions
+    may be passed as callables returning the text, so that they are only formatted when a backend keeps them.
+    Backend interest is cached per message type; call :meth:`refresh_interest` after changing a backend's filters.
+
+    With `asynchronous`, backends are called from a worker thread, in order, so that slow backends (console,
+    database) do not hold the fuzzing loop. Descriptions are formatted in the calling thread. close_test() waits for
+    the worker to catch up.
+
     Args:
         fuzz_loggers (:obj:`list` of :obj:`IFuzzLogger`): IFuzzLogger objects
                                                           to which to send log data.
+        asynchronous (bool): Call backends from a worker thread. Default False.
     """
 
-    def __init__(self, fuzz_loggers=None):
+    def __init__(self, fuzz_loggers=None, asynchronous=False):
         if fuzz_loggers is None:
             fuzz_loggers = []
         self._fuzz_loggers: list[IFuzzLogger] = fuzz_loggers
+        self._interest: dict[str, list[IFuzzLogger]] = {}
 
         self._cur_test_case_id: Union[int, str] = ""
         self.failed_test_cases = {}
@@ -28,79 +44,141 @@ class FuzzLogger(IFuzzLogger):
         self._last_passed_id = ""  # helps avoid duplicates
         self.test_case_count = 0
 
+        self._queue = None
+        if asynchronous:
+            self._queue = queue.Queue()
+            threading.Thread(target=self._deliver_queued, name="fuzz-logger", daemon=True).start()
+
     @property
     def most_recent_test_id(self):
         """Return a value (e.g. string) representing the most recent test case."""
         return self._cur_test_case_id
 
+    def accepts(self, msg_type):
+        """True if at least one backend keeps messages of type msg_type."""
+        return len(self._backends_for(msg_type)) > 0
+
+    def refresh_interest(self):
+        """Forget the cached backend interest, e.g. after changing the log level of a backend."""
+        self._interest.clear()
+
+    def flush(self):
+        """Wait until every message has been delivered to the backends."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def log_record(self, record):
+        """Deliver a :class:`LogRecord` to the interested backends."""
+        backends = self._backends_for(record.type)
+        if len(backends) == 0:
+            return
+        if self._queue is None:
+            for fuzz_logger in backends:
+                record.deliver(fuzz_logger)
+        else:
+            record.description  # Format in the calling thread, while the values it refers to are current.
+            self._queue.put(functools.partial(self._deliver, backends, record))
+
     def open_test_step(self, description):
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.open_test_step(description=description)
+        self._log(msg_type="step", description=description)
 
     def log_error(self, description):
+        description = _resolve(description)
         if self._cur_test_case_id not in self.error_test_cases:
             self.error_test_cases[self._cur_test_case_id] = []
         self.error_test_cases[self._cur_test_case_id].append(description)
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_error(description=description)
+        self._log(msg_type="error", description=description)
 
     def log_fail(self, description=""):
+        description = _resolve(description)
         if self._cur_test_case_id not in self.failed_test_cases:
             self.failed_test_cases[self._cur_test_case_id] = []
         self.failed_test_cases[self._cur_test_case_id].append(description)
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_fail(description=description)
+        self._log(msg_type="fail", description=description)
 
     def log_target_warn(self, description=""):
+        description = _resolve(description)
         if self._cur_test_case_id not in self.target_warn_test_cases:
             self.target_warn_test_cases[self._cur_test_case_id] = []
         self.target_warn_test_cases[self._cur_test_case_id].append(description)
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_target_warn(description=description)
+        self._log(msg_type="target-warn", description=description)
 
     def log_target_error(self, description=""):
+        description = _resolve(description)
         if self._cur_test_case_id not in self.target_error_test_cases:
             self.target_error_test_cases[self._cur_test_case_id] = []
         self.target_error_test_cases[self._cur_test_case_id].append(description)
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_target_error(description=description)
+        self._log(msg_type="target-error", description=description)
 
     def log_info(self, description):
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_info(description=description)
+        self._log(msg_type="info", description=description)
 
     def log_recv(self, data):
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_recv(data=data)
+        self._log(msg_type="receive", data=data)
 
     def log_pass(self, description=""):
         if self._cur_test_case_id != self._last_passed_id:
             self.passed_test_case_count += 1
             self._last_passed_id = self._cur_test_case_id
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_pass(description=description)
+        self._log(msg_type="pass", description=description)
 
     def log_check(self, description):
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_check(description=description)
+        self._log(msg_type="check", description=description)
 
     def open_test_case(self, test_case_id, name, index, *args, **kwargs):
         self._cur_test_case_id = test_case_id
         self.test_case_count += 1
         for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.open_test_case(test_case_id=test_case_id, name=name, index=index, *args, **kwargs)
+            self._call(
+                functools.partial(
+                    fuzz_logger.open_test_case, test_case_id=test_case_id, name=name, index=index, *args, **kwargs
+                )
+            )
 
     def log_send(self, data):
-        for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.log_send(data=data)
+        self._log(msg_type="send", data=data)
 
     def close_test_case(self):
         for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.close_test_case()
+            self._call(fuzz_logger.close_test_case)
 
     def close_test(self):
         for fuzz_logger in self._fuzz_loggers:
-            fuzz_logger.close_test()
+            self._call(fuzz_logger.close_test)
+        self.flush()
+
+    def _backends_for(self, msg_type):
+        try:
+            return self._interest[msg_type]
+        except KeyError:
+            backends = [fuzz_logger for fuzz_logger in self._fuzz_loggers if fuzz_logger.accepts(msg_type)]
+            self._interest[msg_type] = backends
+            return backends
+
+    def _log(self, msg_type, description=None, data=None):
+        if len(self._backends_for(msg_type)) > 0:
+            self.log_record(LogRecord(type=msg_type, description=description, data=data))
+
+    def _call(self, method):
+        if self._queue is None:
+            method()
+        else:
+            self._queue.put(method)
+
+    @staticmethod
+    def _deliver(backends, record):
+        for fuzz_logger in backends:
+            record.deliver(fuzz_logger)
+
+    def _deliver_queued(self):
+        while True:
+            method = self._queue.get()
+            try:
+                method()
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self._queue.task_done()
 
     def failure_summary(self) -> str:
         """Return test summary string based on fuzz logger results.
@@ -127,3 +205,10 @@ class FuzzLogger(IFuzzLogger):
             summary += "\t{0}".format("\n\t".join(map(str, self.target_error_test_cases)))
 
         return summary
+
+
+def _resolve(description):
+    """Format a lazy description."""
+    if callable(description):
+        return description()
+    return description
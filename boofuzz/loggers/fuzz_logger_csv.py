@@ -3,6 +3,7 @@ import datetime
 import sys
 
 from boofuzz import helpers
+from .buffered_log_writer import BufferedLogWriter, is_console
 from .ifuzz_logger_backend import IFuzzLoggerBackend
 
 
@@ -30,17 +31,41 @@ class FuzzLoggerCsv(IFuzzLoggerBackend):
     """
     This class formats FuzzLogger data for pcap file. It can be
     configured to output to a named file.
+
+    Rows written to the console are buffered and written in chunks, at least every `flush_interval` seconds and
+    right away on failures and errors.
     """
 
-    def __init__(self, file_handle=sys.stdout, bytes_to_str=DEFAULT_HEX_TO_STR):
+    def __init__(
+        self,
+        file_handle=sys.stdout,
+        bytes_to_str=DEFAULT_HEX_TO_STR,
+        buffered=None,
+        flush_interval=0.5,
+        max_data_length=None,
+    ):
         """
         Args:
-            file_handle (io.BinaryIO): Open file handle for logging. Defaults to sys.stdout.
+            file_handle (io.TextIO): Open file handle for logging. Defaults to sys.stdout.
             bytes_to_str (function): Function that converts sent/received bytes data to string for logging.
+            buffered (bool): Buffer rows and write them in chunks. Defaults to True for sys.stdout and sys.stderr,
+                False otherwise (file objects already buffer their writes).
+            flush_interval (float): Maximum time in seconds buffered rows wait before being written. Default 0.5.
+            max_data_length (int): Only the first max_data_length bytes of sent and received data are dumped; the
+                length column keeps the full length. Default None, meaning no limit.
         """
         self._file_handle = file_handle
         self._format_raw_bytes = bytes_to_str
-        self._csv_handle = csv.writer(self._file_handle)
+        self._max_data_length = max_data_length
+        if buffered is None:
+            buffered = is_console(file_handle)
+        self._writer = BufferedLogWriter(file_handle, flush_interval=flush_interval) if buffered else None
+        self._csv_handle = csv.writer(self._writer if buffered else self._file_handle)
+
+    def flush(self):
+        """Write buffered rows, if any."""
+        if self._writer is not None:
+            self._writer.flush()
 
     def open_test_step(self, description):
         self._print_log_msg(["open step", "", "", description])
@@ -50,12 +75,13 @@ class FuzzLoggerCsv(IFuzzLoggerBackend):
 
     def log_error(self, description):
         self._print_log_msg(["error", "", "", description])
+        self.flush()
 
     def log_recv(self, data):
-        self._print_log_msg(["recv", len(data), self._format_raw_bytes(data), repr(data)])
+        self._print_data_msg("recv", data)
 
     def log_send(self, data):
-        self._print_log_msg(["send", len(data), self._format_raw_bytes(data), repr(data)])
+        self._print_data_msg("send", data)
 
     def log_info(self, description):
         self._print_log_msg(["info", "", "", description])
@@ -65,6 +91,14 @@ class FuzzLoggerCsv(IFuzzLoggerBackend):
 
     def log_fail(self, description=""):
         self._print_log_msg(["fail", "", "", description])
+        self.flush()
+
+    def log_target_warn(self, description=""):
+        self._print_log_msg(["target warn", "", "", description])
+
+    def log_target_error(self, description=""):
+        self._print_log_msg(["target error", "", "", description])
+        self.flush()
 
     def log_pass(self, description=""):
         self._print_log_msg(["pass", "", "", description])
@@ -73,7 +107,14 @@ class FuzzLoggerCsv(IFuzzLoggerBackend):
         pass
 
     def close_test(self):
-        pass
+        if self._writer is not None:
+            self._writer.close()
+
+    def _print_data_msg(self, msg_type, data):
+        length = len(data)
+        if self._max_data_length is not None and length > self._max_data_length:
+            data = data[: self._max_data_length]
+        self._print_log_msg([msg_type, length, self._format_raw_bytes(data), repr(data)])
 
     def _print_log_msg(self, msg):
         time_stamp = get_time_stamp()
@@ -1,14 +1,23 @@
 import collections
 import datetime
+import hashlib
 import psycopg
 import psycopg.sql
 import os
 import subprocess
+import threading
+import zlib
 from typing import Generator
 from colorama import Fore, Style
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 import boofuzz.constants
 from boofuzz import data_test_case, data_test_step
+from boofuzz.exception import BoofuzzError
 from boofuzz.loggers.ifuzz_logger_backend import IFuzzLoggerBackend
 
 type Path = str
@@ -35,8 +44,85 @@ def get_db_socket_path() -> Path:
     return abs_db_socket_path
 
 
+# Payload codecs of the blobs table.
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+_MIN_COMPRESSED_LENGTH = 64  # Smaller payloads are stored as is.
+_MAX_KNOWN_HASHES = 1 << 20  # Hashes of stored blobs remembered by the writer (16 bytes each).
+
+
+def payload_hash(data: bytes) -> bytes:
+    """Key of a payload in the blobs table."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def compress_payload(data: bytes) -> tuple[int, bytes]:
+    """Compress a payload for the blobs table. Return (codec, stored bytes).
+
+    zstd is used when the zstandard package is installed, zlib otherwise. Payloads that don't shrink are stored raw.
+    """
+    if len(data) < _MIN_COMPRESSED_LENGTH:
+        return CODEC_RAW, data
+    if zstandard is not None:
+        codec, compressed = CODEC_ZSTD, zstandard.ZstdCompressor().compress(data)
+    else:
+        codec, compressed = CODEC_ZLIB, zlib.compress(data)
+    if len(compressed) >= len(data):
+        return CODEC_RAW, data
+    return codec, compressed
+
+
+def decompress_payload(codec: int, data: bytes, max_length: int = 0) -> bytes:
+    """Inverse of :func:`compress_payload`. With max_length, at most max_length bytes are returned."""
+    data = bytes(data)
+    if codec == CODEC_RAW:
+        return data[:max_length] if max_length else data
+    if codec == CODEC_ZLIB:
+        return zlib.decompressobj().decompress(data, max_length)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise BoofuzzError("Payload compressed with zstd: install the zstandard package to read it.")
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        return data[:max_length] if max_length else data
+    raise BoofuzzError(f"Unknown payload codec {codec}")
+
+
+def _step_payload(stored: bytes, codec: int | None, blob: bytes | None) -> bytes:
+    """Payload of a step row: the blob it references, or the data column for steps logged before blobs existed."""
+    if codec is None:
+        return bytes(stored)
+    return decompress_payload(codec, blob)
+
+
+def upgrade_schema(database_connection: psycopg.Connection, table_steps_name: str, table_blobs_name: str) -> None:
+    """Create the blobs table and the steps column referencing it, if they are missing.
+
+    Steps keep their `data` column for campaigns logged before payloads were deduplicated; new steps leave it empty
+    and reference a blob by hash in `data_hash`.
+    """
+    with database_connection.cursor() as c:
+        c.execute(
+            psycopg.sql.SQL(
+                """
+                CREATE TABLE IF NOT EXISTS {} (
+                hash               BYTEA         NOT NULL       PRIMARY KEY,
+                codec              SMALLINT      NOT NULL,
+                length             INTEGER       NOT NULL,
+                data               BYTEA         NOT NULL)
+                """
+            ).format(psycopg.sql.Identifier(table_blobs_name))
+        )
+        c.execute(
+            psycopg.sql.SQL('ALTER TABLE {} ADD COLUMN IF NOT EXISTS data_hash BYTEA').format(
+                psycopg.sql.Identifier(table_steps_name)
+            )
+        )
+    database_connection.commit()
+
+
 def _get_test_case_data(database_connection: psycopg.Connection, table_cases_name: str, table_steps_name: str,
-                        index: int) -> data_test_case.DataTestCase | None:
+                        table_blobs_name: str, index: int) -> data_test_case.DataTestCase | None:
     c = database_connection.cursor()
 
     c.execute(
@@ -53,9 +139,10 @@ def _get_test_case_data(database_connection: psycopg.Connection, table_cases_nam
 
     c.execute(
         psycopg.sql.SQL(
-            """SELECT type, description, data, timestamp, is_truncated FROM {}
-               WHERE test_case_index=%s"""
-        ).format(psycopg.sql.Identifier(table_steps_name)),
+            """SELECT s.type, s.description, s.data, s.timestamp, s.is_truncated, b.codec, b.data
+               FROM {} s LEFT JOIN {} b ON b.hash = s.data_hash
+               WHERE s.test_case_index=%s ORDER BY s.id"""
+        ).format(psycopg.sql.Identifier(table_steps_name), psycopg.sql.Identifier(table_blobs_name)),
         (
             index,
         )
@@ -65,7 +152,11 @@ def _get_test_case_data(database_connection: psycopg.Connection, table_cases_nam
     for row in rows:
         steps.append(
             data_test_step.DataTestStep(
-                type=row[0], description=row[1], data=row[2], timestamp=row[3].isoformat(), truncated=row[4]
+                type=row[0],
+                description=row[1],
+                data=_step_payload(row[2], row[5], row[6]),
+                timestamp=row[3].isoformat(),
+                truncated=row[4],
             )
         )
 
@@ -74,6 +165,35 @@ def _get_test_case_data(database_connection: psycopg.Connection, table_cases_nam
     )
 
 
+def _index_name(table_name: str, suffix: str) -> str:
+    """Name of an index on table_name, short enough not to be truncated (and collide) in Postgres."""
+    name = f'{table_name}_{suffix}'
+    if len(name) > boofuzz.constants.DB_MAX_IDENTIFIERS_LEN:
+        name = 'idx_' + hashlib.sha1(name.encode()).hexdigest()[:32]
+    return name
+
+
+def create_indexes(database_connection: psycopg.Connection, table_cases_name: str, table_steps_name: str) -> None:
+    """Create the indexes used by the readers to browse a campaign, if they are missing.
+
+    Cases are looked up and paginated by number, steps by test case and id, and failures have a partial index so that
+    listing them doesn't scan every step.
+    """
+    indexes = [
+        (_index_name(table_cases_name, 'number'), table_cases_name, '(number, id)', ''),
+        (_index_name(table_steps_name, 'case'), table_steps_name, '(test_case_index, id)', ''),
+        (_index_name(table_steps_name, 'fail'), table_steps_name, '(id)', "WHERE type = 'fail'"),
+    ]
+    with database_connection.cursor() as c:
+        for index_name, table_name, columns, where in indexes:
+            c.execute(
+                psycopg.sql.SQL(
+                    'CREATE INDEX IF NOT EXISTS {} ON {} ' + columns + ' ' + where
+                ).format(psycopg.sql.Identifier(index_name), psycopg.sql.Identifier(table_name))
+            )
+    database_connection.commit()
+
+
 def verify_name_len(db_name: str, db_table_name: str | None):
     """Verify that len of identifiers are good for postgres."""
     if len(db_name) > boofuzz.constants.DB_MAX_IDENTIFIERS_LEN:
@@ -91,6 +211,9 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
     Log fuzz data in a PostgreSQL database.
     Using an existing database requires more graceful exits to prevent case number duplication.
 
+    Sent and received payloads are stored once, compressed, in a blobs table keyed by their hash; steps reference
+    them by hash. Repeated payloads (prefix messages, nominal data, identical replies) cost one row of steps only.
+
     Args:
         db_name (str):       Name of the database.
         db_table_name (str | None): Name of tables in database. Default "".
@@ -173,6 +296,12 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
 
         self._db_connection.commit()
 
+        self._table_blobs_name = 'blobs' if db_table_name is None else db_table_name + '_blobs'
+        upgrade_schema(self._db_connection, self._table_steps_name, self._table_blobs_name)
+        create_indexes(self._db_connection, self._table_cases_name, self._table_steps_name)
+        self._stored_hashes = set()  # Blobs known to be in the database, to skip redundant inserts.
+        self._pending_hashes = set()  # Blobs inserted in the current transaction, known once it is committed.
+
         self._current_test_case_index = 0
 
         self._queue = collections.deque([])  # Queue that holds last n test cases before commiting
@@ -182,7 +311,9 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
         self._data_truncate_length = 512
 
     def get_test_case_data(self, index: int) -> data_test_case.DataTestCase:
-        return _get_test_case_data(self._db_connection, self._table_cases_name, self._table_steps_name, index)
+        return _get_test_case_data(
+            self._db_connection, self._table_cases_name, self._table_steps_name, self._table_blobs_name, index
+        )
 
     def open_test_case(self, test_case_id, name, index, round_type=None, seed=None, seed_index=None, *args, **kwargs):
         self._queue.append(
@@ -263,8 +394,8 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
         self._queue.append(
             [
                 psycopg.sql.SQL(
-                    """INSERT INTO {} (test_case_index, type, description, data, is_truncated, timestamp)
-                       VALUES(%s, %s, %s, %s, %s, %s)"""
+                    """INSERT INTO {} (test_case_index, type, description, data, is_truncated, timestamp, data_hash)
+                       VALUES(%s, %s, %s, %s, %s, %s, %s)"""
                 ).format(psycopg.sql.Identifier(self._table_steps_name)),
                 [
                     self._current_test_case_index,
@@ -272,8 +403,9 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
                     "",
                     memoryview(data),
                     False,
-                    get_time_stamp()
-                ]  # List and not tuple because it might trunc the data
+                    get_time_stamp(),
+                    None
+                ]  # List and not tuple because the payload is truncated and moved to the blobs table on writing
             ]
         )
 
@@ -281,8 +413,8 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
         self._queue.append(
             [
                 psycopg.sql.SQL(
-                    """INSERT INTO {} (test_case_index, type, description, data, is_truncated, timestamp)
-                       VALUES(%s, %s, %s, %s, %s, %s)"""
+                    """INSERT INTO {} (test_case_index, type, description, data, is_truncated, timestamp, data_hash)
+                       VALUES(%s, %s, %s, %s, %s, %s, %s)"""
                 ).format(psycopg.sql.Identifier(self._table_steps_name)),
                 [
                     self._current_test_case_index,
@@ -290,8 +422,9 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
                     "",
                     memoryview(data),
                     False,
-                    get_time_stamp()
-                ]  # List and not tuple because it might trunc the data
+                    get_time_stamp(),
+                    None
+                ]  # List and not tuple because the payload is truncated and moved to the blobs table on writing
             ]
         )
 
@@ -405,21 +538,54 @@ class FuzzLoggerPostgres(IFuzzLoggerBackend):
                 force = True
 
             if force or self._problem_detected or self._log_first_case:
-                for query in self._queue:
-                    # abbreviate long entries first
-                    if not self._problem_detected:
-                        self._truncate_send_recv(query)
-                    self._db_cursor.execute(query[0], query[1])
-                self._queue.clear()
-                self._db_connection.commit()
+                committed = False
+                try:
+                    for query in self._queue:
+                        # abbreviate long entries first
+                        if not self._problem_detected:
+                            self._truncate_send_recv(query)
+                        self._store_payload(query)
+                        self._db_cursor.execute(query[0], query[1])
+                    self._queue.clear()
+                    self._db_connection.commit()
+                    committed = True
+                finally:
+                    self._remember_hashes(committed)
                 self._log_first_case = False
                 self._problem_detected = False
 
     def _truncate_send_recv(self, query):
-        if query[1][1] in ["send", "recv"] and len(query[1][3]) > self._data_truncate_length:
+        if query[1][1] in ["send", "receive"] and len(query[1][3]) > self._data_truncate_length:
             query[1][4] = True
             query[1][3] = memoryview(query[1][3][: self._data_truncate_length])
 
+    def _store_payload(self, query):
+        """Move the payload of a send or receive step to the blobs table, and reference it by hash."""
+        if query[1][1] not in ["send", "receive"] or len(query[1][3]) == 0:
+            return
+        data = bytes(query[1][3])
+        data_hash = payload_hash(data)
+        if data_hash not in self._stored_hashes and data_hash not in self._pending_hashes:
+            codec, stored = compress_payload(data)
+            self._db_cursor.execute(
+                psycopg.sql.SQL(
+                    """INSERT INTO {} (hash, codec, length, data) VALUES(%s, %s, %s, %s)
+                       ON CONFLICT (hash) DO NOTHING"""
+                ).format(psycopg.sql.Identifier(self._table_blobs_name)),
+                (data_hash, codec, len(data), stored)
+            )
+            self._pending_hashes.add(data_hash)
+        query[1][3] = b""
+        query[1][6] = data_hash
+
+    def _remember_hashes(self, committed):
+        """Move the blobs of the last transaction to the known ones if it was committed, else forget them."""
+        if committed:
+            if len(self._stored_hashes) + len(self._pending_hashes) > _MAX_KNOWN_HASHES:
+                self._stored_hashes.clear()
+            self._stored_hashes.update(self._pending_hashes)
+        self._pending_hashes.clear()
+
 
 class FuzzLoggerPostgresReader:
     """Read fuzz data saved using FuzzLoggerPostgres
@@ -446,6 +612,16 @@ class FuzzLoggerPostgresReader:
 
         self._table_cases_name = 'cases' if db_table_name is None else db_table_name + '_cases'
         self._table_steps_name = 'steps' if db_table_name is None else db_table_name + '_steps'
+        # The web interface may browse from several threads at once; they share this connection.
+        self._lock = threading.RLock()
+
+        self._table_blobs_name = 'blobs' if db_table_name is None else db_table_name + '_blobs'
+        # Campaigns logged before the indexes and the blobs table existed get them on first opening.
+        try:
+            upgrade_schema(self._db_connection, self._table_steps_name, self._table_blobs_name)
+            create_indexes(self._db_connection, self._table_cases_name, self._table_steps_name)
+        except psycopg.errors.UndefinedTable:
+            self._db_connection.rollback()
 
     def __enter__(self):
         return self
@@ -455,7 +631,10 @@ class FuzzLoggerPostgresReader:
         self._db_connection.close()
 
     def get_test_case_data(self, index: int) -> data_test_case.DataTestCase:
-        return _get_test_case_data(self._db_connection, self._table_cases_name, self._table_steps_name, index)
+        with self._lock:
+            return _get_test_case_data(
+                self._db_connection, self._table_cases_name, self._table_steps_name, self._table_blobs_name, index
+            )
 
     def get_data_for_continue_command(self) -> (str, int, int):
         self._db_cursor.execute(
@@ -531,17 +710,144 @@ class FuzzLoggerPostgresReader:
     #
     @property
     def failure_map(self):
-        self._db_cursor.execute(
-            psycopg.sql.SQL(
-                '''SELECT test_case_index, description FROM {} WHERE type=%s '''
-            ).format(psycopg.sql.Identifier(self._table_steps_name)),
-            (
-                'fail',
-            )
-        )
-        failure_steps = self._db_cursor.fetchall()
-
         failure_map = collections.defaultdict(list)
-        for step in failure_steps:
-            failure_map[step[0]].append(step[1])
+        for _, test_case_index, description in self.iter_failures():
+            failure_map[test_case_index].append(description)
         return failure_map
+
+    def iter_failures(self, after_id: int = 0) -> Generator[tuple[int, int, str], None, None]:
+        """Stream every failure step as (step id, test case index, description), in id order.
+
+        Rows are fetched in batches from a server-side cursor, so that the whole result set is never held in memory.
+        """
+        with self._lock, self._db_connection.transaction():
+            with self._db_connection.cursor(name='iter_failures') as c:
+                c.itersize = 1000
+                c.execute(
+                    psycopg.sql.SQL(
+                        '''SELECT id, test_case_index, description FROM {} WHERE type = 'fail' AND id > %s
+                           ORDER BY id'''
+                    ).format(psycopg.sql.Identifier(self._table_steps_name)),
+                    (after_id,)
+                )
+                yield from c
+
+    def count_failed_test_cases(self) -> int:
+        """Return the number of test cases with at least one failure."""
+        with self._lock, self._db_connection.cursor() as c:
+            c.execute(
+                psycopg.sql.SQL(
+                    "SELECT COUNT(DISTINCT test_case_index) FROM {} WHERE type = 'fail'"
+                ).format(psycopg.sql.Identifier(self._table_steps_name))
+            )
+            count = c.fetchone()[0]
+            self._db_connection.commit()
+        return count
+
+    def get_cases_page(self, after_number: int = 0, after_id: int = 0, limit: int = 50,
+                       failed_only: bool = False) -> list[dict]:
+        """Return at most `limit` test cases following (after_number, after_id), in number order.
+
+        Keyset pagination: pass the `number` and `id` of the last case of a page to get the next one.
+        """
+        failed = psycopg.sql.SQL(
+            "EXISTS (SELECT 1 FROM {} s WHERE s.type = 'fail' AND s.test_case_index = c.number)"
+        ).format(psycopg.sql.Identifier(self._table_steps_name))
+        query = psycopg.sql.SQL(
+            '''SELECT c.id, c.number, c.name, c.round_type, c.seed, c.seed_index, c.timestamp, {failed}
+               FROM {cases} c WHERE (c.number, c.id) > (%s, %s) {only_failed}
+               ORDER BY c.number, c.id LIMIT %s'''
+        ).format(
+            failed=failed,
+            cases=psycopg.sql.Identifier(self._table_cases_name),
+            only_failed=psycopg.sql.SQL('AND ') + failed if failed_only else psycopg.sql.SQL(''),
+        )
+        with self._lock, self._db_connection.cursor() as c:
+            c.execute(query, (after_number, after_id, limit))
+            rows = c.fetchall()
+            self._db_connection.commit()
+        return [
+            {
+                'id': row[0],
+                'number': row[1],
+                'name': row[2],
+                'round_type': row[3],
+                'seed': row[4],
+                'seed_index': row[5],
+                'timestamp': row[6].isoformat(),
+                'failed': row[7],
+            }
+            for row in rows
+        ]
+
+    def get_failures_page(self, after_id: int = 0, limit: int = 50) -> list[dict]:
+        """Return at most `limit` failure steps with an id greater than `after_id`, in id order."""
+        with self._lock, self._db_connection.cursor() as c:
+            c.execute(
+                psycopg.sql.SQL(
+                    '''SELECT id, test_case_index, description, timestamp FROM {}
+                       WHERE type = 'fail' AND id > %s ORDER BY id LIMIT %s'''
+                ).format(psycopg.sql.Identifier(self._table_steps_name)),
+                (after_id, limit)
+            )
+            rows = c.fetchall()
+            self._db_connection.commit()
+        return [
+            {'id': row[0], 'test_case_index': row[1], 'description': row[2], 'timestamp': row[3].isoformat()}
+            for row in rows
+        ]
+
+    def get_steps_page(self, test_case_index: int, after_id: int = 0, limit: int = 100,
+                       preview_length: int = 64) -> list[dict]:
+        """Return at most `limit` steps of a test case with an id greater than `after_id`, in id order.
+
+        Payloads are not loaded: each step only carries its size and a hex preview of its first `preview_length`
+        bytes. Use :meth:`get_step_data` to fetch a whole payload.
+        """
+        with self._lock, self._db_connection.cursor() as c:
+            # Raw blobs and legacy rows are cut by the database; compressed blobs are sent whole and cut here.
+            c.execute(
+                psycopg.sql.SQL(
+                    '''SELECT s.id, s.type, s.description, COALESCE(b.length, octet_length(s.data)),
+                              CASE WHEN b.codec IS NULL THEN substring(s.data FROM 1 FOR %s)
+                                   WHEN b.codec = %s THEN substring(b.data FROM 1 FOR %s)
+                                   ELSE b.data END,
+                              b.codec, s.is_truncated, s.timestamp
+                       FROM {} s LEFT JOIN {} b ON b.hash = s.data_hash
+                       WHERE s.test_case_index = %s AND s.id > %s ORDER BY s.id LIMIT %s'''
+                ).format(
+                    psycopg.sql.Identifier(self._table_steps_name), psycopg.sql.Identifier(self._table_blobs_name)
+                ),
+                (preview_length, CODEC_RAW, preview_length, test_case_index, after_id, limit)
+            )
+            rows = c.fetchall()
+            self._db_connection.commit()
+        return [
+            {
+                'id': row[0],
+                'type': row[1],
+                'description': row[2],
+                'data_length': row[3],
+                'data_preview': (
+                    bytes(row[4]) if row[5] is None else decompress_payload(row[5], row[4], preview_length)
+                ).hex(),
+                'is_truncated': row[6],
+                'timestamp': row[7].isoformat(),
+            }
+            for row in rows
+        ]
+
+    def get_step_data(self, step_id: int) -> bytes | None:
+        """Return the whole payload of a step, or None if there is no such step."""
+        with self._lock, self._db_connection.cursor() as c:
+            c.execute(
+                psycopg.sql.SQL(
+                    'SELECT s.data, b.codec, b.data FROM {} s LEFT JOIN {} b ON b.hash = s.data_hash WHERE s.id = %s'
+                ).format(
+                    psycopg.sql.Identifier(self._table_steps_name), psycopg.sql.Identifier(self._table_blobs_name)
+                ),
+                (step_id,)
+            )
+            row = c.fetchone()
+            self._db_connection.commit()
+        return None if row is None else _step_payload(row[0], row[1], row[2])
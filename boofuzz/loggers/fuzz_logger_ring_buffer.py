@@ -0,0 +1,167 @@
+import collections
+import threading
+
+import attr
+
+from boofuzz import helpers
+from .ifuzz_logger_backend import IFuzzLoggerBackend
+
+
+@attr.s(slots=True)
+class LiveLogEntry:
+    """One log line kept in memory by :class:`FuzzLoggerRingBuffer`.
+
+    The HTML rendering is done on the first read, by the web server, and kept for the next readers.
+    """
+
+    seq = attr.ib(type=int)
+    test_case_index = attr.ib()
+    type = attr.ib(type=str)
+    description = attr.ib(default=None)
+    data = attr.ib(default=None)
+    timestamp = attr.ib(default=None)
+    truncated = attr.ib(type=bool, default=False)
+    _log_line = attr.ib(default=None)
+
+    @property
+    def log_line(self):
+        if self._log_line is None:
+            self._log_line = helpers.format_log_msg(
+                msg_type=self.type,
+                description=self.description,
+                data=self.data,
+                timestamp=self.timestamp,
+                truncated=self.truncated,
+                format_type="html",
+            )
+        return self._log_line
+
+    @property
+    def css_class(self):
+        return helpers.test_step_info[self.type]["css_class"]
+
+    def to_dict(self):
+        return {"css_class": self.css_class, "log_line": self.log_line}
+
+
+class FuzzLoggerRingBuffer(IFuzzLoggerBackend):
+    """
+    Keeps the most recent log entries in memory so that the web interface can push them to the browser as soon as
+    they are logged, without going through the database.
+
+    Readers call :meth:`wait_for_entries` with the sequence number of the last entry they have seen; the call returns
+    as soon as newer entries are available (long-poll).
+
+    Args:
+        max_entries (int): Maximum number of entries kept in memory. Default 1000.
+        data_truncate_length (int): Sent and received data longer than this is truncated. Default 512.
+    """
+
+    def __init__(self, max_entries=1000, data_truncate_length=512):
+        self._entries = collections.deque(maxlen=max_entries)
+        self._data_truncate_length = data_truncate_length
+        self._condition = threading.Condition()
+        self._last_seq = 0
+        self._case_start_seq = 1
+        self._test_case_index = None
+
+    @property
+    def last_seq(self):
+        """Sequence number of the most recent entry."""
+        return self._last_seq
+
+    @property
+    def current_test_case_index(self):
+        return self._test_case_index
+
+    def open_test_case(self, test_case_id, name, index, *args, **kwargs):
+        with self._condition:
+            self._test_case_index = index
+            self._case_start_seq = self._last_seq + 1
+        self._append(msg_type="test_case", description="{0}: {1}".format(index, name))
+
+    def open_test_step(self, description):
+        self._append(msg_type="step", description=description)
+
+    def log_check(self, description):
+        self._append(msg_type="check", description=description)
+
+    def log_error(self, description):
+        self._append(msg_type="error", description=description)
+
+    def log_recv(self, data):
+        self._append(msg_type="receive", data=data)
+
+    def log_send(self, data):
+        self._append(msg_type="send", data=data)
+
+    def log_info(self, description):
+        self._append(msg_type="info", description=description)
+
+    def log_fail(self, description=""):
+        self._append(msg_type="fail", description=description)
+
+    def log_target_warn(self, description=""):
+        self._append(msg_type="target-warn", description=description)
+
+    def log_target_error(self, description=""):
+        self._append(msg_type="target-error", description=description)
+
+    def log_pass(self, description=""):
+        self._append(msg_type="pass", description=description)
+
+    def close_test_case(self):
+        pass
+
+    def close_test(self):
+        pass
+
+    def _append(self, msg_type, description=None, data=None):
+        truncated = False
+        if data is not None and len(data) > self._data_truncate_length:
+            data = data[: self._data_truncate_length]
+            truncated = True
+        with self._condition:
+            self._last_seq += 1
+            self._entries.append(
+                LiveLogEntry(
+                    seq=self._last_seq,
+                    test_case_index=self._test_case_index,
+                    type=msg_type,
+                    description=description,
+                    data=data,
+                    timestamp=helpers.get_time_stamp(),
+                    truncated=truncated,
+                )
+            )
+            self._condition.notify_all()
+
+    def wait_for_entries(self, after_seq, timeout):
+        """Return the entries of the current test case logged after `after_seq`.
+
+        Blocks until at least one such entry exists or `timeout` seconds have elapsed.
+
+        If the reader has not seen the beginning of the current test case yet, the whole current test case is returned
+        and `reset` is True, meaning the reader must discard what it displayed so far.
+
+        Args:
+            after_seq (int): Sequence number of the last entry the reader has seen.
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            tuple: (index of the current test case, reset flag, last sequence number, list of LiveLogEntry)
+        """
+        with self._condition:
+            if after_seq > self._last_seq:
+                # The reader comes from a previous run.
+                after_seq = 0
+            self._condition.wait_for(lambda: self._last_seq > after_seq, timeout=timeout)
+            reset = after_seq < self._case_start_seq
+            start = self._case_start_seq if reset else after_seq + 1
+            entries = []
+            for entry in reversed(self._entries):
+                if entry.seq < start:
+                    break
+                entries.append(entry)
+            entries.reverse()
+            return self._test_case_index, reset, self._last_seq, entries
@@ -4,12 +4,19 @@ from colorama import init
 
 from boofuzz import helpers
 
+from boofuzz.loggers.buffered_log_writer import BufferedLogWriter, is_console
 from boofuzz.loggers.ifuzz_logger_backend import IFuzzLoggerBackend
 
 init()
 
 DEFAULT_HEX_TO_STR = helpers.hex_to_hexstr
 
+_LEVEL_1_TYPES = frozenset(["test_case", "error", "fail", "recap", "target-error"])
+_LEVEL_2_TYPES = _LEVEL_1_TYPES | frozenset(["check", "pass", "info", "target-warn"])
+_LEVEL_3_TYPES = _LEVEL_2_TYPES | frozenset(["step", "receive", "send"])
+# Message types written to the file handle right away when output is buffered.
+_FLUSH_TYPES = frozenset(["error", "fail", "recap", "target-error"])
+
 
 class FuzzLoggerText(IFuzzLoggerBackend):
     """
@@ -26,11 +33,25 @@ class FuzzLoggerText(IFuzzLoggerBackend):
     |     1     | Same as log level 0 but do not print on the same line.                         |
     |     2     | Log level 1 + check, pass, info and target-warn.                               |
     |     3     | Most verbose level : log level 2 + open test step, receive and send.           |
+
+    Messages above the log level are dropped before being formatted.
+
+    When logging to the console, output is kept in a :class:`BufferedLogWriter` and written in large chunks, at least
+    every `flush_interval` seconds and right away on failures and errors. At log level 0, test case lines that
+    would be overwritten on the console before the buffer is written are not written at all.
     """
 
     INDENT_SIZE = 2
 
-    def __init__(self, file_handle=sys.stdout, bytes_to_str=DEFAULT_HEX_TO_STR, log_level: int = None):
+    def __init__(
+        self,
+        file_handle=sys.stdout,
+        bytes_to_str=DEFAULT_HEX_TO_STR,
+        log_level: int = None,
+        buffered: bool = None,
+        flush_interval: float = 0.5,
+        max_data_length: int = None,
+    ):
         """
         :type file_handle: io.BinaryIO
         :param file_handle: Open file handle for logging. Defaults to sys.stdout.
@@ -40,9 +61,21 @@ class FuzzLoggerText(IFuzzLoggerBackend):
 
         :type log_level: int
         :param log_level: Current log level. From 0 to 3. Default to 0.
+
+        :type buffered: bool
+        :param buffered: Buffer output and write it in chunks. Defaults to True for sys.stdout and sys.stderr, False
+                         otherwise (file objects already buffer their writes).
+
+        :type flush_interval: float
+        :param flush_interval: Maximum time in seconds buffered output waits before being written. Default 0.5.
+
+        :type max_data_length: int
+        :param max_data_length: Only the first max_data_length bytes of sent and received data are dumped.
+                                Default None, meaning no limit.
         """
         self._file_handle = file_handle
         self._format_raw_bytes = bytes_to_str
+        self._max_data_length = max_data_length
         if log_level is not None:
             self.log_level = log_level
         else:
@@ -50,6 +83,31 @@ class FuzzLoggerText(IFuzzLoggerBackend):
                 self.log_level = 0
             else:  # Default value if not stdout
                 self.log_level = 3
+        if buffered is None:
+            buffered = is_console(file_handle)
+        self._writer = BufferedLogWriter(file_handle, flush_interval=flush_interval) if buffered else None
+
+    @property
+    def log_level(self):
+        return self._log_level
+
+    @log_level.setter
+    def log_level(self, log_level):
+        self._log_level = log_level
+        if log_level >= 3:
+            self._accepted_types = _LEVEL_3_TYPES
+        elif log_level == 2:
+            self._accepted_types = _LEVEL_2_TYPES
+        else:
+            self._accepted_types = _LEVEL_1_TYPES
+
+    def accepts(self, msg_type):
+        return msg_type in self._accepted_types
+
+    def flush(self):
+        """Write buffered output, if any."""
+        if self._writer is not None:
+            self._writer.flush()
 
     def open_test_step(self, description):
         self._print_log_msg(msg=description, msg_type="step")
@@ -92,34 +150,35 @@ class FuzzLoggerText(IFuzzLoggerBackend):
         pass
 
     def close_test(self):
-        pass
+        if self._writer is not None:
+            self._writer.close()
 
     def _print_final(self, msg_type, msg=None, data=None, begin='', end='\n'):
-        print(
-            begin +
-            helpers.format_log_msg(msg_type=msg_type, description=msg, data=data, indent_size=self.INDENT_SIZE),
-            file=self._file_handle, end=end
-        )
+        data_length = None
+        if data is not None and self._max_data_length is not None and len(data) > self._max_data_length:
+            data_length = len(data)
+            data = data[: self._max_data_length]
+        line = begin + helpers.format_log_msg(
+            msg_type=msg_type, description=msg, data=data, indent_size=self.INDENT_SIZE, data_length=data_length
+        ) + end
+        if self._writer is None:
+            self._file_handle.write(line)
+            return
+        self._writer.write(line, overwritable=(begin == '\r'))
+        if msg_type in _FLUSH_TYPES:
+            self._writer.flush()
 
     def _print_log_msg(self, msg_type, msg=None, data=None):
-        level_1 = ['test_case', 'error', 'fail', 'recap', 'target-error']
-        level_2 = level_1 + ['check', 'pass', 'info', 'target-warn']
-        level_3 = level_2 + ['step', 'receive', 'send']
-
-        unknow_msg_type = False
-        if msg_type not in level_3:
-            # Unknow msg_type.
-            unknow_msg_type = True
+        if msg_type not in self._accepted_types:
+            if msg_type in _LEVEL_3_TYPES:
+                return
+            # Unknow msg_type: logged as an error, then printed at every level.
             self.log_error(f'Unknow msg_type "{msg_type}" in FuzzLoggerText class')
 
-        if self.log_level >= 3:
-            self._print_final(msg_type, msg, data)
-        elif self.log_level == 2 and (msg_type in level_2 or unknow_msg_type):
-            self._print_final(msg_type, msg, data)
-        elif self.log_level == 1 and (msg_type in level_1 or unknow_msg_type):
-            self._print_final(msg_type, msg, data)
-        elif self.log_level == 0 and (msg_type in level_1 or unknow_msg_type):
+        if self.log_level == 0:
             if msg_type == 'test_case':
                 self._print_final(msg_type, msg, data, begin='\r', end='\033[K')
             else:
                 self._print_final(msg_type, msg, data, begin='\n', end='\n')
+        else:
+            self._print_final(msg_type, msg, data)
@@ -56,6 +56,21 @@ class IFuzzLogger(metaclass=abc.ABCMeta):
 
     """
 
+    def accepts(self, msg_type):
+        """
+        Declares whether this logger keeps messages of a given type. FuzzLogger does not format nor deliver messages
+        that none of its backends accept, and callers may check it before building an expensive message.
+
+        Defaults to True. Types are the keys of helpers.test_step_info, e.g. "info", "send" or "fail".
+
+        :param msg_type: Message type.
+        :type msg_type: str
+
+        :return: True if messages of this type are kept.
+        :rtype: bool
+        """
+        return True
+
     @abc.abstractmethod
     def open_test_case(self, test_case_id, name, index, *args, **kwargs):
         """
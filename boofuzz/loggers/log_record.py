@@ -0,0 +1,53 @@
+import time
+
+import attr
+
+from boofuzz import helpers
+
+# Record type -> name of the IFuzzLogger method it is delivered to. Types match helpers.test_step_info.
+RECORD_METHODS = {
+    "step": "open_test_step",
+    "check": "log_check",
+    "info": "log_info",
+    "error": "log_error",
+    "fail": "log_fail",
+    "pass": "log_pass",
+    "target-warn": "log_target_warn",
+    "target-error": "log_target_error",
+    "send": "log_send",
+    "receive": "log_recv",
+}
+DATA_RECORD_TYPES = frozenset(["send", "receive"])
+
+
+@attr.s(slots=True)
+class LogRecord:
+    """One log entry, built once by :class:`FuzzLogger` and delivered to every interested backend.
+
+    `description` may be given as a callable taking no argument and returning the text; it is called the first time
+    the description is read, so that text no backend wants is never formatted.
+    """
+
+    type = attr.ib(type=str)
+    _description = attr.ib(default=None)
+    data = attr.ib(default=None)
+    created = attr.ib(type=float, factory=time.time)
+
+    @property
+    def description(self):
+        if callable(self._description):
+            self._description = self._description()
+        return self._description
+
+    @property
+    def timestamp(self):
+        """Creation time, formatted like helpers.get_time_stamp()."""
+        return helpers.get_time_stamp(self.created)
+
+    def deliver(self, fuzz_logger):
+        """Call the log method of `fuzz_logger` matching the type of this record."""
+        method = getattr(fuzz_logger, RECORD_METHODS[self.type])
+        if self.type in DATA_RECORD_TYPES:
+            method(data=self.data)
+        else:
+            method(description=self.description)
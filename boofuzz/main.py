@@ -35,12 +35,20 @@ def parse_arg(command_line=None) -> tuple[argparse.ArgumentParser, argparse.Name
         required=True
     )
 
+    time_budget_parser = argparse.ArgumentParser(add_help=False)
+    time_budget_parser.add_argument(
+        '-t', '--time-budget',
+        help='Stop the campaign after this time (e.g. 3600, 90m, 2h30m), fitting the rounds into it',
+        type=boofuzz.sessions.parse_duration,
+        default=None
+    )
+
     parser = argparse.ArgumentParser('./boo')
 
     subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
 
     # fuzz
-    fuzz = subparsers.add_parser('fuzz', help='Start the fuzzer', parents=[verbose_parser])
+    fuzz = subparsers.add_parser('fuzz', help='Start the fuzzer', parents=[verbose_parser, time_budget_parser])
     fuzz.add_argument(
         '-f', '--conf-file',
         help='Location of the campaign configuration file to be used',
@@ -54,22 +62,20 @@ def parse_arg(command_line=None) -> tuple[argparse.ArgumentParser, argparse.Name
 
     # continue
     continue_ = subparsers.add_parser('continue', help='Continue a stop fuzzing campaign',
-                                      parents=[verbose_parser, save_dir_parser])
+                                      parents=[verbose_parser, save_dir_parser, time_budget_parser])
 
     # replay
     replay = subparsers.add_parser('replay', help='Replay some test case of a fuzzing campaign',
                                    parents=[verbose_parser, save_dir_parser])
     replay.add_argument(
         '-r', '--round-type',
-        help='Name of the phase to begin with',
-        required=True,
+        help='Name of the phase to begin with (required without --test-cases)',
         metavar='ROUND_TYPE',
         choices=boofuzz.constants.AVAILABLE_ROUND_TYPE
     )
     replay.add_argument(
         '-s', '--seed-index',
-        help='Number of the first seed to be used',
-        required=True,
+        help='Number of the first seed to be used (required without --test-cases)',
         type=int
     )
     replay.add_argument(
@@ -78,6 +84,66 @@ def parse_arg(command_line=None) -> tuple[argparse.ArgumentParser, argparse.Name
         type=int,
         default=None
     )
+    replay.add_argument(
+        '-i', '--test-cases',
+        help='Test cases to send again byte for byte, from their stored payloads (e.g. 3,10-12)',
+        type=boofuzz.sessions.parse_test_case_indices,
+        default=None
+    )
+    replay.add_argument(
+        '--corpus',
+        help='Packed corpus written by the export command to take the payloads from, instead of the database',
+        default=None
+    )
+    replay.add_argument(
+        '--max-rate',
+        help='With --test-cases, do not sleep between test cases',
+        action='store_true'
+    )
+
+    # export
+    export = subparsers.add_parser('export', help='Write the test cases of a campaign to files, without a target',
+                                   parents=[verbose_parser, save_dir_parser])
+    export.add_argument(
+        '-r', '--round-type',
+        help='Name of the phase to begin with (default library)',
+        metavar='ROUND_TYPE',
+        choices=boofuzz.constants.AVAILABLE_ROUND_TYPE,
+        default='library'
+    )
+    export.add_argument(
+        '-s', '--seed-index',
+        help='Number of the first seed to be used (default 0)',
+        type=int,
+        default=0
+    )
+    export.add_argument(
+        '-n', '--max-number-of-rounds',
+        help='Number of rounds to export, 0 for no limit (default 1)',
+        type=int,
+        default=1
+    )
+    export.add_argument(
+        '-o', '--output',
+        help=f'Folder for the payload files (default {boofuzz.constants.EXPORT_DIR_NAME} in the save folder)',
+        default=None
+    )
+    export.add_argument(
+        '-j', '--workers',
+        help='Number of processes generating and rendering the test cases (default: number of CPUs)',
+        type=int,
+        default=os.cpu_count()
+    )
+    export.add_argument(
+        '--packed',
+        help=f'Write one packed corpus file, {boofuzz.constants.PACKED_CORPUS_NAME}, instead of one file per case',
+        action='store_true'
+    )
+    export.add_argument(
+        '--compress',
+        help='Compress the packed corpus file',
+        action='store_true'
+    )
 
     # open
     open_ = subparsers.add_parser('open', help='Open the web interface for a fuzzing campaign',
@@ -146,6 +212,9 @@ def parse_arg(command_line=None) -> tuple[argparse.ArgumentParser, argparse.Name
         parser.print_help()
         exit(2)
 
+    if args.command == 'replay' and args.test_cases is None and (args.round_type is None or args.seed_index is None):
+        parser.error('replay needs --round-type and --seed-index, or --test-cases')
+
     return parser, args, db_parser
 
 
@@ -237,7 +306,7 @@ def save_dir_setup(save_dir_path: Path, campaign_file_path: Path, campaign_id: s
 def get_db_names(campaign_id: str, args: argparse.Namespace) -> (str, str):
     db_name = campaign_id
 
-    if args.command in ['fuzz', 'continue', 'open', 'db']:
+    if args.command in ['fuzz', 'continue', 'open', 'db', 'export']:
         db_table_name = None
     elif args.command == 'replay':
         db_table_name = 'replay_' + boofuzz.get_datetime()
@@ -260,14 +329,16 @@ def get_session(save_dir_path: Path, campaign_id: str, module, args: argparse.Na
         This function call the Config class in the campaign configuration file to initialize the boofuzz.Session.
         It also in charge of the stop recovery process.
     """
-    assert args.command in ['fuzz', 'continue', 'replay']
+    assert args.command in ['fuzz', 'continue', 'replay', 'export']
 
     db_name, db_table_name = get_db_names(campaign_id, args)
 
     # Create the session thanks to config functions in the conf file
     # sys.path.insert(0, save_dir_path)  # Old way to import callbacks in boofuzz.BaseConfig
+    # An export only generates test cases: it must not create tables in the campaign database.
     config_module: boofuzz.BaseConfig = module.Config(campaign_folder=save_dir_path, log_level_stdout=args.verbose,
-                                                      db_name=db_name, db_table_name=db_table_name)
+                                                      db_name=db_name, db_table_name=db_table_name,
+                                                      db_logging=args.command != 'export')
     # sys.path.remove(save_dir_path)  # Old way to import callbacks in boofuzz.BaseConfig
 
     config_module.session_init()
@@ -285,14 +356,17 @@ def get_session(save_dir_path: Path, campaign_id: str, module, args: argparse.Na
         config_module.session.round_type = round_type
         config_module.session.seed_index = seed_index
         config_module.session.total_mutant_index = mutant_index - 1
-    elif args.command == 'replay':
+    elif args.command in ['replay', 'export']:
         if args.round_type is not None:
             config_module.session.round_type = args.round_type
         if args.seed_index is not None:
             config_module.session.seed_index = args.seed_index
-        if args.max_number_of_rounds is not None:
+        if args.command == 'replay' and args.max_number_of_rounds is not None:
             config_module.session.max_number_of_rounds = args.max_number_of_rounds
 
+    if args.command in ['fuzz', 'continue'] and args.time_budget is not None:
+        config_module.session.planner = boofuzz.CampaignPlanner(args.time_budget)
+
     config_module.config_nominal()
 
     return config_module
@@ -334,6 +408,35 @@ def open_file(campaign_id: str, args: argparse.Namespace) -> None:
         print('Ctrl+C')
 
 
+def export(config_module: boofuzz.BaseConfig, save_dir_path: Path, args: argparse.Namespace) -> None:
+    """This function write the test cases of the campaign to files, without sending them to the target."""
+    output = args.output if args.output is not None else os.path.join(save_dir_path,
+                                                                       boofuzz.constants.EXPORT_DIR_NAME)
+    exporter = boofuzz.CorpusExporter(config_module.session, output, workers=args.workers, packed=args.packed,
+                                      compress=args.compress)
+    try:
+        exporter.export(max_number_of_rounds=args.max_number_of_rounds)
+    except KeyboardInterrupt:
+        pass  # Stops an export without round limit; the index file is complete up to here.
+    print(f'{exporter.num_exported} test cases written to {output}')
+
+
+def replay_stored(config_module: boofuzz.BaseConfig, campaign_id: str, args: argparse.Namespace) -> None:
+    """This function send stored test cases again, byte for byte, from the database or a packed corpus."""
+    if args.corpus is not None:
+        with boofuzz.PackedCorpus(args.corpus) as corpus:
+            cases = list(boofuzz.sessions.stored_cases_from_packed(corpus, args.test_cases))
+    else:
+        db_name, _ = get_db_names(campaign_id, args)
+        with boofuzz.FuzzLoggerPostgresReader(db_name) as reader:
+            cases = list(boofuzz.sessions.stored_cases_from_db(reader, args.test_cases))
+    print(f'{len(cases)} of {len(args.test_cases)} test cases found')
+    try:
+        config_module.session.replay(cases, max_rate=args.max_rate)
+    except KeyboardInterrupt:
+        pass
+
+
 def db_list() -> None:
     """This function print the db_name and db_size of each database"""
     with boofuzz.FuzzLoggerPostgresReader(boofuzz.constants.DB_DEFAULT_NAME) as reader:
@@ -377,7 +480,7 @@ def main() -> None:
         campaign_file_path = args.conf_file
         save_dir_path, campaign_id = get_save_dir(campaign_file_path, parser, args)
         save_campaign_file_path = save_dir_setup(save_dir_path, campaign_file_path, campaign_id, args, parser)
-    elif args.command in ['continue', 'replay', 'open']:
+    elif args.command in ['continue', 'replay', 'export', 'open']:
         campaign_file_path = None
         save_dir_path = args.save_dir
         json_dict = read_from_json(save_dir_path, parser)
@@ -411,6 +514,14 @@ def main() -> None:
 
     config_module = get_session(save_dir_path, campaign_id, module, args)
 
+    if args.command == 'export':
+        export(config_module, save_dir_path, args)
+        exit(0)
+
+    if args.command == 'replay' and args.test_cases is not None:
+        replay_stored(config_module, campaign_id, args)
+        exit(0)
+
     if args.command == 'fuzz':
         # Graph generation
         config_module.graph_generation(graph_name=os.path.join(save_dir_path, boofuzz.constants.GRAPH_NAME))
@@ -4,5 +4,8 @@ from .callback_monitor import CallbackMonitor
 from .network_monitor import NetworkMonitor
 from .process_monitor import ProcessMonitor
 from .busybox_monitor import BusyboxMonitor
+from .coverage_monitor import CoverageMonitor
+from .monitor_watcher import MonitorEvent, MonitorWatcher
 
-__all__ = ["BaseMonitor", "ProcessMonitor", "NetworkMonitor", "CallbackMonitor", "BusyboxMonitor"]
+__all__ = ["BaseMonitor", "ProcessMonitor", "NetworkMonitor", "CallbackMonitor", "BusyboxMonitor", "CoverageMonitor",
+           "MonitorEvent", "MonitorWatcher"]
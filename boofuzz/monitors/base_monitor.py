@@ -6,6 +6,10 @@ class BaseMonitor:
     .. versionadded:: 0.2.0
     """
 
+    #: Whether :class:`MonitorWatcher <boofuzz.monitors.MonitorWatcher>` may call post_send from a background thread.
+    #: Monitors whose post_send works on the test case that was just sent set it to False.
+    watchable = True
+
     def __init__(self, *args, **kwargs):
         return
 
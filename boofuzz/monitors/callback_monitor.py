@@ -25,6 +25,8 @@ class CallbackMonitor(BaseMonitor):
     .. versionadded:: 0.2.0
     """
 
+    watchable = False  # post_send works on the test case that was just sent
+
     def __init__(self, on_pre_send=None, on_post_send=None, on_restart_target=None, on_post_start_target=None):
         BaseMonitor.__init__(self)
 
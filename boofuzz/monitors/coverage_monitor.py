@@ -0,0 +1,67 @@
+"""Monitor feeding the edge coverage of an instrumented target back into the session."""
+
+from boofuzz.feedback import coverage_map as cov
+from boofuzz.sessions.scheduler import SIGNAL_NOVELTY
+
+from .base_monitor import BaseMonitor
+
+
+class CoverageMonitor(BaseMonitor):
+    """
+    Checks the edge coverage of each test case and keeps the values that reached new edges in the session's
+    :class:`feedback corpus <boofuzz.feedback.Corpus>`, so that later random_mutation rounds mutate them.
+
+    The target must be instrumented for AFL (afl-clang-fast, afl-gcc, or SanitizerCoverage with the AFL++ runtime) and
+    started with :attr:`CoverageMap.env <boofuzz.feedback.CoverageMap.env>` in its environment. Given the
+    :class:`ProcessMonitorLocal <boofuzz.ProcessMonitorLocal>` starting the target, the monitor sets that up itself.
+
+    Add it to the monitors of the Target, after the process monitor.
+
+    Args:
+        coverage_map (CoverageMap): Map shared with the target. Default: a new map of `map_size` bytes.
+        process_monitor (ProcessMonitorLocal): Process monitor launching the target, whose environment is set to
+            point the target at the map. Default None: set the environment yourself.
+        map_size (int): Size of the map created when `coverage_map` is None. Default 65536.
+    """
+
+    watchable = False  # post_send works on the test case that was just sent
+
+    def __init__(self, coverage_map=None, process_monitor=None, map_size=cov.MAP_SIZE):
+        BaseMonitor.__init__(self)
+
+        self.coverage_map = coverage_map if coverage_map is not None else cov.CoverageMap(map_size=map_size)
+        if process_monitor is not None:
+            process_monitor.set_env(dict(process_monitor.env or {}, **self.coverage_map.env))
+
+        self.new_coverage_count = 0
+
+    def pre_send(self, target=None, fuzz_data_logger=None, session=None):
+        """Clear the hit counts of the previous test case."""
+        self.coverage_map.reset()
+
+    def post_send(self, target=None, fuzz_data_logger=None, session=None):
+        """Check the test case's coverage and, if new, add its mutated values to the session's corpus.
+
+        Always returns True: new coverage is not a failure.
+        """
+        result = self.coverage_map.check()
+        if result == cov.NO_NEW_COVERAGE or session is None:
+            return True
+
+        self.new_coverage_count += 1
+        session.case_signals.add(SIGNAL_NOVELTY)  # new coverage is novel behaviour too
+        context = session.current_mutation_context
+        if context is not None:
+            for qualified_name, mutation in context.mutations.items():
+                session.feedback_corpus.add(qualified_name, mutation.value)
+
+        if fuzz_data_logger is not None and fuzz_data_logger.accepts("info"):
+            fuzz_data_logger.log_info(
+                "New coverage ({0}): {1} edges covered".format(
+                    "new edges" if result == cov.NEW_EDGES else "new hit counts", self.coverage_map.edges_covered
+                )
+            )
+        return True
+
+    def __repr__(self):
+        return "CoverageMonitor(shm_id={0})".format(self.coverage_map.shm_id)
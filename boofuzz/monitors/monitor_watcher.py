@@ -0,0 +1,188 @@
+"""Run a monitor's checks in a background thread, off the fuzzing loop's critical path."""
+
+import queue
+import threading
+import time
+
+import attr
+
+from .base_monitor import BaseMonitor
+
+
+@attr.s
+class MonitorEvent:
+    """Result of a background check that failed or logged something.
+
+    ``last_ok`` and ``time`` are ``time.monotonic()`` values: the failure happened between the previous successful
+    check and this one.
+    """
+
+    monitor = attr.ib()
+    time = attr.ib(type=float)
+    last_ok = attr.ib(type=float)
+    failed = attr.ib(type=bool)
+    synopsis = attr.ib(type=str, default="")
+    records = attr.ib(factory=list)
+
+
+class _RecordingLogger:
+    """Stand-in for the fuzz data logger in the watcher thread: records the calls, replayed later by the session."""
+
+    def __init__(self):
+        self.records = []
+
+    def accepts(self, *args, **kwargs):
+        return True
+
+    def __getattr__(self, name):
+        if not name.startswith(("log_", "open_test_step")):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.records.append((name, args, kwargs))
+
+        return record
+
+
+class MonitorWatcher(BaseMonitor):
+    """
+    Wrap a monitor so that its post_send runs in a background thread every `interval` seconds.
+
+    The session's own post_send call returns at once: False if a background check failed since the previous call,
+    True otherwise. Failures and messages logged by the monitor are queued as :class:`MonitorEvent` and read by the
+    session with :meth:`events`. Every other call is forwarded to the wrapped monitor, never at the same time as a
+    background check.
+
+    Checks start at the first pre_send, so that the target is up, and stop after a failure until the target is
+    restarted.
+
+    Args:
+        monitor (BaseMonitor): Monitor to wrap.
+        interval (float): Seconds between two checks.
+        target (Target): Target given to the monitor's post_send.
+        session (Session): Session given to the monitor's post_send.
+    """
+
+    def __init__(self, monitor, interval, target=None, session=None):
+        super(MonitorWatcher, self).__init__()
+        self.monitor = monitor
+        self.interval = interval
+        self.target = target
+        self.session = session
+        self.last_crash_synopsis = ""
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._armed = threading.Event()
+        self._stopped = threading.Event()
+        self._last_ok = time.monotonic()
+        self._thread = None
+
+    def __str__(self):
+        return str(self.monitor)
+
+    def __getattr__(self, name):
+        # Only reached for attributes MonitorWatcher lacks: monitor-specific methods and options.
+        if name == "monitor":
+            raise AttributeError(name)
+        return getattr(self.monitor, name)
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._watch, name="watch-{0}".format(self.monitor), daemon=True)
+            self._thread.start()
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            if self._armed.is_set():
+                self.check()
+
+    def check(self):
+        """Run one check of the wrapped monitor and queue its result if it failed or logged something."""
+        logger = _RecordingLogger()
+        with self._lock:
+            if not self._armed.is_set():
+                return
+            try:
+                alive = self.monitor.post_send(target=self.target, fuzz_data_logger=logger, session=self.session)
+                synopsis = "" if alive else self.monitor.get_crash_synopsis()
+            except Exception as e:
+                alive, synopsis = False, "Monitor check raised {0!r}".format(e)
+            now = time.monotonic()
+            if not alive:
+                # Stop checking a dead target until it is restarted.
+                self._armed.clear()
+            if not alive or logger.records:
+                self._queue.put(MonitorEvent(self, now, self._last_ok, not alive, synopsis, logger.records))
+            if alive:
+                self._last_ok = now
+
+    def events(self):
+        """Return the events queued since the previous call, without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def stop(self):
+        """Stop the watcher thread. The next pre_send starts it again."""
+        self._stopped.set()
+        self._armed.clear()
+        if self._thread is not None:
+            self._thread.join()
+
+    def alive(self, *args, **kwargs):
+        with self._lock:
+            return self.monitor.alive(*args, **kwargs)
+
+    def pre_send(self, target=None, fuzz_data_logger=None, session=None):
+        with self._lock:
+            self.monitor.pre_send(target=target, fuzz_data_logger=fuzz_data_logger, session=session)
+        if not self._armed.is_set():
+            self._last_ok = time.monotonic()
+            self._armed.set()
+        self._start()
+
+    def post_send(self, target=None, fuzz_data_logger=None, session=None):
+        failures = [event for event in self.events() if event.failed]
+        if failures:
+            self.last_crash_synopsis = failures[-1].synopsis
+        return not failures
+
+    def post_start_target(self, target=None, fuzz_data_logger=None, session=None):
+        with self._lock:
+            result = self.monitor.post_start_target(target=target, fuzz_data_logger=fuzz_data_logger, session=session)
+            self._last_ok = time.monotonic()
+            self._armed.set()
+        return result
+
+    def retrieve_data(self):
+        with self._lock:
+            return self.monitor.retrieve_data()
+
+    def set_options(self, *args, **kwargs):
+        with self._lock:
+            return self.monitor.set_options(*args, **kwargs)
+
+    def get_crash_synopsis(self):
+        if self.last_crash_synopsis:
+            synopsis, self.last_crash_synopsis = self.last_crash_synopsis, ""
+            return synopsis
+        with self._lock:
+            return self.monitor.get_crash_synopsis()
+
+    def start_target(self, *args, **kwargs):
+        with self._lock:
+            return self.monitor.start_target(*args, **kwargs)
+
+    def stop_target(self):
+        with self._lock:
+            self._armed.clear()
+            return self.monitor.stop_target()
+
+    def restart_target(self, target=None, fuzz_data_logger=None, session=None):
+        with self._lock:
+            self._armed.clear()
+            return self.monitor.restart_target(target=target, fuzz_data_logger=fuzz_data_logger, session=session)
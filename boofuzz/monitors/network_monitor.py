@@ -27,6 +27,8 @@ class NetworkMonitor(BaseMonitor, pedrpc.Client):
     .. versionadded:: 0.2.0
     """
 
+    watchable = False  # post_send ends the capture of the test case that was just sent
+
     def __init__(self, host, port):
         BaseMonitor.__init__(self)
         pedrpc.Client.__init__(self, host, port)
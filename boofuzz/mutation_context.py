@@ -30,3 +30,5 @@ class MutationContext:
     mutations = attr.ib(factory=dict, converter=mutations_list_to_dict)  # maps qualified names to a Mutation
     message_path = attr.ib(factory=list)
     protocol_session = attr.ib(type=ProtocolSession, default=None)
+    # Fuzzed message as it was sent before, one item per send: replayed as is instead of being rendered.
+    payloads = attr.ib(default=None)
@@ -0,0 +1,239 @@
+"""Packed test case corpus: every payload in one append-only data file, with a fixed-size record index beside it.
+
+Data file: a 16 bytes header (magic, flags), then either length-prefixed records (u32 length, payload), or, in
+compressed mode, zlib-compressed blocks of concatenated payloads (u32 compressed length, block).
+
+Index file (data file path + ``.idx``): a 16 bytes header, then one 32 bytes entry per record: offset of the record (or
+of its block) in the data file, offset of the payload in the decompressed block, payload length, test case index and
+message path hash.
+"""
+
+import hashlib
+import mmap
+import struct
+import zlib
+
+import attr
+
+from . import exception
+
+_DATA_MAGIC = b"BOOPACK1"
+_INDEX_MAGIC = b"BOOPIDX1"
+_HEADER = struct.Struct("<8sB7x")
+_LENGTH = struct.Struct("<I")
+_ENTRY = struct.Struct("<QIIqQ")  # offset, offset in block, length, test case index, message path hash
+_COMPRESSED = 0x01
+
+INDEX_SUFFIX = ".idx"
+
+
+def message_path_hash(message_path):
+    """Return a 64-bit hash of a message path string, e.g. ``"connect->read"``."""
+    return int.from_bytes(hashlib.blake2b(message_path.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@attr.s(frozen=True)
+class PackedRecord:
+    """Payload of a packed corpus, with the test case it belongs to."""
+
+    test_case_index = attr.ib(type=int)
+    path_hash = attr.ib(type=int)
+    data = attr.ib(type=bytes)
+
+
+class PackedCorpusWriter:
+    """
+    Append payloads to a packed corpus, creating it if needed.
+
+    In compressed mode, payloads are buffered until `block_size` bytes are pending, then written as one zlib block:
+    call :meth:`flush` or :meth:`close` to write the last one.
+
+    Args:
+        path (str): Data file. The index is written beside it.
+        compress (bool): Write zlib-compressed blocks. Must match the mode of an existing corpus. Default False.
+        block_size (int): Uncompressed size of the blocks in compressed mode. Default 1 MiB.
+    """
+
+    def __init__(self, path, compress=False, block_size=1024 * 1024):
+        self.path = path
+        self.compress = compress
+        self.block_size = block_size
+        self._data = self._open(path, _DATA_MAGIC, _COMPRESSED if compress else 0)
+        self._index = self._open(path + INDEX_SUFFIX, _INDEX_MAGIC, 0)
+        self._offset = self._data.tell()
+        self._block = bytearray()
+        self._block_entries = []
+
+    @staticmethod
+    def _open(path, magic, flags):
+        f = open(path, "ab")
+        if f.tell() == 0:
+            f.write(_HEADER.pack(magic, flags))
+        else:
+            with open(path, "rb") as existing:
+                header = existing.read(_HEADER.size)
+            if len(header) < _HEADER.size or _HEADER.unpack(header) != (magic, flags):
+                f.close()
+                raise exception.BoofuzzError("{0} is not a packed corpus file of the same mode".format(path))
+        return f
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, data, test_case_index, path_hash=0):
+        """Append a payload.
+
+        Args:
+            data (bytes): Payload.
+            test_case_index (int): Index of the test case it belongs to.
+            path_hash (int): Hash of the test case's message path, see :func:`message_path_hash`. Default 0.
+        """
+        if not self.compress:
+            self._data.write(_LENGTH.pack(len(data)))
+            self._data.write(data)
+            self._index.write(_ENTRY.pack(self._offset, 0, len(data), test_case_index, path_hash))
+            self._offset += _LENGTH.size + len(data)
+            return
+        self._block_entries.append((len(self._block), len(data), test_case_index, path_hash))
+        self._block += data
+        if len(self._block) >= self.block_size:
+            self._write_block()
+
+    def _write_block(self):
+        if not self._block_entries:
+            return
+        block = zlib.compress(bytes(self._block))
+        self._data.write(_LENGTH.pack(len(block)))
+        self._data.write(block)
+        for in_block, length, test_case_index, path_hash in self._block_entries:
+            self._index.write(_ENTRY.pack(self._offset, in_block, length, test_case_index, path_hash))
+        self._offset += _LENGTH.size + len(block)
+        self._block = bytearray()
+        self._block_entries = []
+
+    def flush(self):
+        """Write pending payloads, including an incomplete compressed block, to the files."""
+        self._write_block()
+        # Data before index: an index entry never points past the end of the data file.
+        self._data.flush()
+        self._index.flush()
+
+    def close(self):
+        if self._data.closed:
+            return
+        self.flush()
+        self._data.close()
+        self._index.close()
+
+
+class PackedCorpus:
+    """
+    Read a packed corpus through memory maps.
+
+    Records are accessed by position (``corpus[i]``), iterated in the order they were appended, or looked up by test
+    case index with :meth:`find`. The corpus is read as it was when opened.
+
+    Args:
+        path (str): Data file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._data_file = open(path, "rb")
+        self._index_file = open(path + INDEX_SUFFIX, "rb")
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        data_header = _HEADER.unpack_from(self._data) if len(self._data) >= _HEADER.size else None
+        index_header = _HEADER.unpack_from(self._index) if len(self._index) >= _HEADER.size else None
+        if data_header is None or data_header[0] != _DATA_MAGIC or index_header != (_INDEX_MAGIC, 0):
+            self.close()
+            raise exception.BoofuzzError("{0} is not a packed corpus".format(path))
+        self.compressed = bool(data_header[1] & _COMPRESSED)
+        self._len = (len(self._index) - _HEADER.size) // _ENTRY.size
+        self._block_cache = (None, None)
+        self._by_test_case = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self._len
+        if not 0 <= position < self._len:
+            raise IndexError(position)
+        offset, in_block, length, test_case_index, path_hash = _ENTRY.unpack_from(
+            self._index, _HEADER.size + position * _ENTRY.size
+        )
+        if self.compressed:
+            block = self._block(offset)
+            data = block[in_block : in_block + length]
+        else:
+            start = offset + _LENGTH.size
+            data = self._data[start : start + length]
+        return PackedRecord(test_case_index=test_case_index, path_hash=path_hash, data=data)
+
+    def __iter__(self):
+        for position in range(self._len):
+            yield self[position]
+
+    def _block(self, offset):
+        # Records are mostly read in order: keep the last decompressed block.
+        if self._block_cache[0] != offset:
+            length = _LENGTH.unpack_from(self._data, offset)[0]
+            start = offset + _LENGTH.size
+            self._block_cache = (offset, zlib.decompress(self._data[start : start + length]))
+        return self._block_cache[1]
+
+    def find(self, test_case_index):
+        """Return the records of a test case, in the order they were appended."""
+        if self._by_test_case is None:
+            self._by_test_case = {}
+            for position in range(self._len):
+                index = _ENTRY.unpack_from(self._index, _HEADER.size + position * _ENTRY.size)[3]
+                self._by_test_case.setdefault(index, []).append(position)
+        return [self[position] for position in self._by_test_case.get(test_case_index, [])]
+
+    def replay(self, connection, test_case_indices=None, max_recv_bytes=0):
+        """Send the records back to a target, one connection per test case.
+
+        Consecutive records of the same test case are sent on the same connection, in order.
+
+        Args:
+            connection (ITargetConnection): Connection to the target.
+            test_case_indices (iterable of int): Only replay these test cases. Default None: every record.
+            max_recv_bytes (int): If not 0, receive up to this many bytes after each send. Default 0.
+
+        Yields:
+            tuple: (test case index, list of the responses received).
+        """
+        wanted = set(test_case_indices) if test_case_indices is not None else None
+        current, responses = None, []
+        for record in self:
+            if wanted is not None and record.test_case_index not in wanted:
+                continue
+            if record.test_case_index != current:
+                if current is not None:
+                    connection.close()
+                    yield current, responses
+                current, responses = record.test_case_index, []
+                connection.open()
+            connection.send(record.data)
+            if max_recv_bytes:
+                responses.append(connection.recv(max_recv_bytes))
+        if current is not None:
+            connection.close()
+            yield current, responses
+
+    def close(self):
+        for f in (getattr(self, "_data", None), getattr(self, "_index", None), self._data_file, self._index_file):
+            if f is not None and not f.closed:
+                f.close()
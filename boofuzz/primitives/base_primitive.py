@@ -2,6 +2,20 @@
 import os, itertools
 from ..fuzzable import Fuzzable
 
+# (absolute path, encoding, modification time, max_len) ->
+#     (number of lines, indices of lines equal to the previous one, first line)
+_seclist_info_cache = {}
+
+
+def count_sizes(sizes, max_len):
+    """Count the leading sizes that are not above max_len, like the long value yielders that stop at the first one."""
+    count = 0
+    for size in sizes:
+        if max_len is not None and size > max_len:
+            break
+        count += 1
+    return count
+
 
 class BasePrimitive(Fuzzable):
     """
@@ -68,6 +82,16 @@ class BasePrimitive(Fuzzable):
     def num_mutations(self, default_value):
         return len(self._fuzz_library)
     
+    def set_budget(self, num_library_elements=None, num_random_mutations=None, num_random_generations=None):
+        """Change the number of elements yielded per round type. Arguments left to None are unchanged."""
+        if num_library_elements is not None:
+            self.num_library_elements = num_library_elements
+        if num_random_mutations is not None:
+            self.num_random_mutations = num_random_mutations
+        if num_random_generations is not None:
+            self.num_random_generations = num_random_generations
+        self.invalidate_num_mutations()
+
     def get_nth(self, iterator, n):
         """Return the nth item or None"""
         # If the nth element is bigger than the max number of mutations, return None
@@ -76,6 +100,67 @@ class BasePrimitive(Fuzzable):
         # return the nth item or None if it doesn't exist
         return next(itertools.islice(iterator, n, None), None)
 
+    def corpus_values(self):
+        """Return the (value, energy) pairs of the session's feedback corpus for this primitive.
+
+        Empty if the session has no corpus or the corpus knows no value of this primitive yet.
+        """
+        corpus = getattr(self.request.parent_session, "feedback_corpus", None)
+        if corpus is None:
+            return []
+        return corpus.values(self.qualified_name)
+
+    def _corpus_base(self):
+        """Return the corpus value mutated by this random_mutation round, or None.
+
+        The value is picked with a probability proportional to its energy, using the round number as position so that
+        a round always picks the same value.
+        """
+        values = self.corpus_values()
+        total_energy = sum(energy for _, energy in values)
+        if total_energy <= 0:
+            return None
+        position = self.request.parent_session.seed_index % total_energy
+        for value, energy in values:
+            if position < energy:
+                return value
+            position -= energy
+        return None
+
+    def _seclist_info(self, encoding, max_len=None):
+        """Return the number of values _yield_from_file() yields, the indices of those equal to the previous one, and
+        the first one.
+
+        Args:
+            encoding (str): Encoding of the file.
+            max_len (int): Compare and return the values cut to this length. Default None: whole values.
+
+        The file is read once per path, modification time and max_len, whatever the number of primitives using it.
+        """
+        if not self.seclist_path:
+            return 0, (), None
+        path = self._get_seclist_abs_path()
+        key = (path, encoding, os.path.getmtime(path), max_len)
+        if key not in _seclist_info_cache:
+            count = 0
+            duplicates = []
+            first = None
+            previous = None
+            with open(path, "r", encoding=encoding) as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        if max_len is not None:
+                            line = line[:max_len]
+                        if count == 0:
+                            first = line
+                        elif line == previous:
+                            duplicates.append(count)
+                        previous = line
+                        count += 1
+            _seclist_info_cache[key] = (count, tuple(duplicates), first)
+        return _seclist_info_cache[key]
+
     def _get_seclist_abs_path(self):
         """Return the absolute path of the seclist file"""
         inside_docker = os.getenv('INSIDE_DOCKER', False)
@@ -10,7 +10,7 @@ import math
 import random
 
 from funcy import compose
-from .base_primitive import BasePrimitive
+from .base_primitive import BasePrimitive, count_sizes
 
 
 class Bytes(BasePrimitive):
@@ -193,6 +193,12 @@ class Bytes(BasePrimitive):
                     for data in self._mutate_bytes(current_val):
                         yield self._adjust_mutation_for_size(data)
 
+            # Then mutate a value from the feedback corpus, if any
+            corpus_val = self._corpus_base()
+            if corpus_val is not None:
+                for data in self._mutate_bytes(corpus_val):
+                    yield self._adjust_mutation_for_size(data)
+
         if self.request.parent_session.round_type == "random_generation":
             random.seed(self.primitive_seed)
             for _ in range(self.num_random_generations):
@@ -230,6 +236,30 @@ class Bytes(BasePrimitive):
         else :
             yield default_value
 
+    def _num_variable_mutations(self, default_value):
+        """Number of values yielded by _yield_variable_mutations()."""
+        if not self.use_default_value:
+            return 1
+        count = 0
+        for length in self._default_value_multipliers:
+            for _ in range(2):
+                count += 1
+                if self.max_len is not None and len(default_value) * length >= self.max_len:
+                    return count
+        return count
+
+    def _num_long_magic_debug_values(self):
+        """Number of values yielded by _yield_long_magic_debug_values()."""
+        if not self.use_long_bytes:
+            return 0
+        sizes = [
+            length + delta for length, delta in itertools.product(self._long_bytes_lengths, self._long_bytes_deltas)
+        ]
+        per_sequence = count_sizes(sizes, self.max_len) + count_sizes(self._extra_long_bytes_lengths, self.max_len)
+        if self.max_len is not None:
+            per_sequence += 1
+        return per_sequence * sum(1 for sequence in self._magic_debug_values if len(sequence) != 0)
+
     def _yield_from_file(self):
         """
         Load fuzz library from file.         
@@ -312,20 +342,16 @@ class Bytes(BasePrimitive):
         """
 
         if self.request.parent_session.round_type == "library" :
-            return len(
-                list(
-                    itertools.islice(
-                        itertools.chain(
-                            self._yield_variable_mutations(default_value),
-                            self._yield_long_magic_debug_values(),
-                            self._yield_from_file(),
-                        ),
-                        self.num_library_elements
-                    )
-                )
+            # Count the values of the library chain without building them
+            return min(
+                self._num_variable_mutations(default_value) + self._num_long_magic_debug_values()
+                + self._seclist_info(encoding="ascii")[0],
+                self.num_library_elements,
             )
 
         if self.request.parent_session.round_type == "random_mutation":
+            if self._corpus_base() is not None:
+                return 2 * self.num_random_mutations
             return self.num_random_mutations
 
         if self.request.parent_session.round_type == "random_generation":
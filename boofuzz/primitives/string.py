@@ -3,7 +3,24 @@ import itertools
 import math
 import random
 
-from .base_primitive import BasePrimitive
+from .base_primitive import BasePrimitive, count_sizes
+
+
+def _primitive_root(pattern):
+    """Return the shortest string whose repetition gives pattern."""
+    length = len(pattern)
+    for size in range(1, length):
+        if length % size == 0 and pattern[:size] * (length // size) == pattern:
+            return pattern[:size]
+    return pattern
+
+
+def _shortest_period(value):
+    """Return the shortest prefix of value whose repetition, cut to the length of value, gives value."""
+    for size in range(1, len(value)):
+        if value[size:] == value[:-size]:
+            return value[:size]
+    return value
 
 
 class String(BasePrimitive):
@@ -123,7 +140,6 @@ class String(BasePrimitive):
         self.padding = padding
         if isinstance(padding, str):
             self.padding = self.padding.encode(self.encoding)
-        self._static_num_mutations = None
         self.random_indices = {}
         self.use_long_strings = use_long_strings
         self.use_default_value = use_default_value
@@ -285,6 +301,15 @@ class String(BasePrimitive):
                         else:
                             yield data
 
+            # Then mutate a value from the feedback corpus, if any
+            corpus_val = self._corpus_base()
+            if corpus_val is not None:
+                for data in self._mutate_character(corpus_val):
+                    if self.len_unit == "chars":
+                        yield self._adjust_mutation_for_size(data)
+                    else:
+                        yield data
+
         # If round_type is "random_generation", generate random strings
         elif self.request.parent_session.round_type == "random_generation":
             random.seed(self.primitive_seed)
@@ -320,15 +345,78 @@ class String(BasePrimitive):
             return self.num_random_generations
 
         if self.request.parent_session.round_type == "random_mutation":
+            if self._corpus_base() is not None:
+                return 2 * self.num_random_mutations
             return self.num_random_mutations
 
-        variable_num_mutations = sum(1 for _
-                                     in self._yield_variable_default_value(default_value=default_value))
-        if self._static_num_mutations is None:
-            #  Counting the number of mutations with default value ""
-            # results in 0 variable_num_mutations 3 * "" = ""
-            self._static_num_mutations = sum(1 for _ in self.mutations(default_value=""))
-        return self._static_num_mutations + variable_num_mutations
+        # Library round: count the values mutations() yields without building them. The library is cut to
+        # num_library_elements before values equal to the previous one are skipped.
+        count = 0
+        previous = None
+        for signature in itertools.islice(self._library_signatures(default_value), self.num_library_elements):
+            if signature != previous:
+                count += 1
+            previous = signature
+        return count
+
+    def _library_signatures(self, default_value):
+        """Yield, for each value of the library chain of mutations(), a signature that is equal for equal values,
+        without building the long ones.
+
+        A value, once cut to max_len in "chars" mode, is described by its shortest period and its length. A value
+        repeating a pattern at least twice has the pattern's primitive root as shortest period, so only the values
+        shorter than that are built. Seclist lines after the first are only told apart from their neighbours.
+        """
+        truncate = self.len_unit == "chars" and self.max_len is not None
+
+        def cut(length):
+            return min(length, self.max_len) if truncate else length
+
+        def repeated(pattern, length):
+            length = cut(length)
+            root = _primitive_root(pattern)
+            if length >= 2 * len(root):
+                return (root, length)
+            value = (root * math.ceil(length / len(root)))[:length]
+            return (_shortest_period(value), length)
+
+        if self.use_default_value:
+            for multiplier in self._default_value_multipliers:
+                yield repeated(default_value, len(default_value) * multiplier)
+
+        if self.use_long_strings:
+            sizes = [
+                length + delta
+                for length, delta in itertools.product(self._long_string_lengths, self._long_string_deltas)
+            ]
+            sizes = sizes[: count_sizes(sizes, self.max_len)]
+            extra_sizes = self._extra_long_string_lengths[: count_sizes(self._extra_long_string_lengths, self.max_len)]
+            for sequence in self.long_string_seeds:
+                for size in itertools.chain(sizes, extra_sizes):
+                    yield repeated(sequence, size)
+                if self.max_len is not None:
+                    yield repeated(sequence, math.ceil(self.max_len / len(sequence)) * len(sequence))
+
+            for size in self._long_string_lengths[: count_sizes(self._long_string_lengths, self.max_len)]:
+                length = cut(size)
+                for loc in self.random_indices[size]:
+                    if loc >= length:
+                        yield repeated("D", length)
+                    else:
+                        # A single terminator: the period must be long enough to never bring it onto a "D".
+                        period = max(loc, length - 1 - loc) + 1
+                        yield ("D" * loc + "\x00" + "D" * (period - loc - 1), length)
+
+        num_lines, line_duplicates, first_line = self._seclist_info(
+            encoding="utf-8", max_len=self.max_len if truncate else None
+        )
+        line_duplicates = set(line_duplicates)
+        group = 0
+        for index in range(num_lines):
+            if index not in line_duplicates:
+                group += 1
+            # The first line and its duplicates may equal the value before them.
+            yield (_shortest_period(first_line), len(first_line)) if group == 1 else ("seclist", group)
 
     def _delete_random_character(self, string_to_mutate: str) -> str:
         """Returns s with a random character deleted"""
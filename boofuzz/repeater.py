@@ -7,10 +7,13 @@ class Repeater(metaclass=ABCMeta):
 
     :param sleep_time: Time to sleep between repetitions.
     :type sleep_time: float
+    :param pacer: Pacer to wait on between repetitions instead of sleeping, e.g. the session's. Default None.
+    :type pacer: AimdPacer
     """
 
-    def __init__(self, sleep_time):
+    def __init__(self, sleep_time, pacer=None):
         self.sleep_time = sleep_time
+        self.pacer = pacer
 
     @abstractmethod
     def start(self):
@@ -24,7 +27,10 @@ class Repeater(metaclass=ABCMeta):
         :return: True if the operation should repeat, False otherwise.
         :rtype: Bool
         """
-        time.sleep(self.sleep_time)
+        if self.pacer is not None:
+            self.pacer.wait()
+        else:
+            time.sleep(self.sleep_time)
 
     @abstractmethod
     def reset(self):
@@ -46,10 +52,12 @@ class TimeRepeater(Repeater):
     :type duration: float
     :param sleep_time: Time to sleep between repetitions.
     :type sleep_time: float
+    :param pacer: Pacer to wait on between repetitions instead of sleeping. Default None.
+    :type pacer: AimdPacer
     """
 
-    def __init__(self, duration, sleep_time=0):
-        super(TimeRepeater, self).__init__(sleep_time)
+    def __init__(self, duration, sleep_time=0, pacer=None):
+        super(TimeRepeater, self).__init__(sleep_time, pacer=pacer)
 
         if duration <= 0:
             raise ValueError("Time must be a non-negative non-zero value")
@@ -84,10 +92,12 @@ class CountRepeater(Repeater):
     :type count: int
     :param sleep_time: Time to sleep between repetitions.
     :type sleep_time: float
+    :param pacer: Pacer to wait on between repetitions instead of sleeping. Default None.
+    :type pacer: AimdPacer
     """
 
-    def __init__(self, count, sleep_time=0):
-        super(CountRepeater, self).__init__(sleep_time)
+    def __init__(self, count, sleep_time=0, pacer=None):
+        super(CountRepeater, self).__init__(sleep_time, pacer=pacer)
 
         if count < 1:
             raise ValueError("Count must be greater or equal to 1")
@@ -1,9 +1,56 @@
 """Init file for the sessions module."""
 from .base_config import BaseConfig
+from .campaign_planner import CampaignPlanner, parse_duration
 from .connection import Connection
+from .corpus_export import CorpusExporter
+from .covering_array import CoveringArray
+from .crash_bisection import RecentCase, shortest_crashing_sequence
+from .nominal_schedule import AdaptiveNominalSchedule
+from .pacing import AimdPacer, TokenBucket
+from .readiness import BannerProbe, NominalProbe, ReadinessProbe, TCPConnectProbe, UDPProbe
+from .render_pool import RenderPool
+from .replay import StoredCase, parse_test_case_indices, stored_cases_from_db, stored_cases_from_packed
+from .scheduler import EnergyScheduler, StackOrderScheduler
+from .sent_payloads import SentPayloadFilter
 from .session import Session, open_test_run, get_datetime
-from .session_info import SessionInfo
+from .session_info import LiveSessionInfo, SessionInfo
+from .stats_segment import StatsSegmentReader, StatsSegmentWriter
 from .target import Target
-from .web_app import WebApp
+from .web_app import WebApp, serve_live_web_ui
 
-__all__ = ["BaseConfig", "Connection", "SessionInfo", "Target", "Session", "WebApp", "open_test_run", "get_datetime"]
+__all__ = [
+    "AdaptiveNominalSchedule",
+    "AimdPacer",
+    "BannerProbe",
+    "BaseConfig",
+    "CampaignPlanner",
+    "Connection",
+    "CorpusExporter",
+    "CoveringArray",
+    "EnergyScheduler",
+    "LiveSessionInfo",
+    "NominalProbe",
+    "ReadinessProbe",
+    "RecentCase",
+    "RenderPool",
+    "SentPayloadFilter",
+    "SessionInfo",
+    "StackOrderScheduler",
+    "StatsSegmentReader",
+    "StatsSegmentWriter",
+    "StoredCase",
+    "Target",
+    "TCPConnectProbe",
+    "TokenBucket",
+    "UDPProbe",
+    "Session",
+    "WebApp",
+    "open_test_run",
+    "get_datetime",
+    "parse_duration",
+    "parse_test_case_indices",
+    "serve_live_web_ui",
+    "shortest_crashing_sequence",
+    "stored_cases_from_db",
+    "stored_cases_from_packed",
+]
@@ -5,7 +5,11 @@ import typing
 
 from boofuzz.connections import BaseSocketConnection, UDPSocketConnection
 from boofuzz.callbacks.base_callback import BaseCallback
+from boofuzz.feedback import ResponseFingerprinter
 from boofuzz.monitors import BaseMonitor
+from .nominal_schedule import AdaptiveNominalSchedule
+from .pacing import AimdPacer
+from .readiness import ReadinessProbe
 from .session import Session
 from .target import Target
 
@@ -37,6 +41,35 @@ class BaseConfig:
     :param pre_send: Pre send callback
     :type post_test_case: typing.Callable
     :param post_test_case: Post test case callback
+    :type time_budget: float
+    :param time_budget: Wall-clock budget of the campaign in seconds, see :class:`CampaignPlanner`
+    :type max_depth: int
+    :param max_depth: Maximum number of elements mutated together
+    :type covering_arrays: bool
+    :param covering_arrays: Build test cases mutating several elements from covering arrays, see :class:`Session`
+    :type covering_array_levels: int
+    :param covering_array_levels: Number of mutations of each element combined by the covering arrays
+    :type skip_duplicate_payloads: bool
+    :param skip_duplicate_payloads: Skip test cases whose rendered payload was already sent
+    :type cases_per_prefix: int
+    :param cases_per_prefix: Consecutive test cases of a message path sent after a single setup of its prefix
+    :type readiness_probe: ReadinessProbe
+    :param readiness_probe: Probe polled after a restart instead of sleeping, see :class:`ReadinessProbe`
+    :type monitor_interval: float
+    :param monitor_interval: Check the monitors from background threads at this interval, see :class:`Session`
+    :type render_ahead: bool
+    :param render_ahead: Render the fuzzed message in the background while the test case sets up, see :class:`Session`
+    :type render_workers: int
+    :param render_workers: Worker processes generating and rendering test cases, see :class:`Session`
+    :type bisect_failures: int
+    :param bisect_failures: Latest test cases replayed to find which one caused a failure, see :class:`Session`
+    :type send_rate: float
+    :param send_rate: Initial sends per second of an :class:`AimdPacer` pacing the target. Default None: not paced
+    :type adaptive_nominal_test: bool
+    :param adaptive_nominal_test: Schedule the nominal tests with an :class:`AdaptiveNominalSchedule` starting at
+        nominal_test_interval
+    :type response_feedback: bool
+    :param response_feedback: Give extra random_mutation energy to values getting new kinds of responses
 
     And here every :class:`Session` attributes:
 
@@ -57,6 +90,7 @@ class BaseConfig:
     socket: BaseSocketConnection = UDPSocketConnection
     target_number: int = 1
     recv_timeout: float = 10
+    readiness_probe: ReadinessProbe | None = None
 
     # Campaign
     fuzz: bool = True
@@ -67,6 +101,23 @@ class BaseConfig:
     receive_data_after_each_request: bool = True
     receive_data_after_fuzz: bool = True
     max_depth: int = 1
+    covering_arrays: bool = False
+    covering_array_levels: int = 16
+    response_feedback: bool = False
+    time_budget: float | None = None
+    skip_duplicate_payloads: bool = False
+    cases_per_prefix: int = 1
+    render_ahead: bool = False
+    render_workers: int = 0
+    bisect_failures: int = 0
+    send_rate: float | None = None
+    adaptive_nominal_test: bool = False
+
+    # Web interface
+    web_ui_process: bool = False
+
+    # Logging
+    async_logging: bool = False
 
     # Callback
     callback_module: BaseCallback = BaseCallback
@@ -75,6 +126,7 @@ class BaseConfig:
 
     # Monitor
     external_monitor: BaseMonitor|None = None
+    monitor_interval: float | None = None
     meth_for_monitor_alive: list[typing.Callable]|None = None
 
     def __init__(
@@ -82,13 +134,15 @@ class BaseConfig:
             campaign_folder: str = None,
             log_level_stdout: int = 0,
             db_name: str = None,
-            db_table_name: str | None = None
+            db_table_name: str | None = None,
+            db_logging: bool = True
     ):
         # Attributes
         self.log_level_stdout = log_level_stdout
         self.campaign_folder = campaign_folder
         self.db_name = db_name
         self.db_table_name = db_table_name
+        self.db_logging = db_logging
         self.session: Session | None = None
         self.cb = self.callback_module()
 
@@ -108,7 +162,8 @@ class BaseConfig:
                     uri = self.uri,
                     recv_timeout=self.recv_timeout),
                 monitors=self.external_monitor,
-                monitor_alive=self.meth_for_monitor_alive
+                monitor_alive=self.meth_for_monitor_alive,
+                readiness_probe=self.readiness_probe,
             ),
             receive_data_after_each_request=self.receive_data_after_each_request,
             receive_data_after_fuzz=self.receive_data_after_fuzz,
@@ -118,10 +173,28 @@ class BaseConfig:
             log_level_stdout=self.log_level_stdout,
             db_name=self.db_name,
             db_table_name=self.db_table_name,
+            db_logging=self.db_logging,
             restart_sleep_time=self.restart_sleep_time,
             round_type=self.round_type,
             nominal_test_interval=self.nominal_test_interval,
-            campaign_folder=self.campaign_folder
+            campaign_folder=self.campaign_folder,
+            web_ui_process=self.web_ui_process,
+            async_logging=self.async_logging,
+            response_fingerprinter=ResponseFingerprinter() if self.response_feedback else None,
+            time_budget=self.time_budget,
+            max_depth=self.max_depth,
+            covering_arrays=self.covering_arrays,
+            covering_array_levels=self.covering_array_levels,
+            skip_duplicate_payloads=self.skip_duplicate_payloads,
+            cases_per_prefix=self.cases_per_prefix,
+            monitor_interval=self.monitor_interval,
+            render_ahead=self.render_ahead,
+            render_workers=self.render_workers,
+            bisect_failures=self.bisect_failures,
+            pacer=AimdPacer(self.send_rate) if self.send_rate else None,
+            nominal_schedule=(
+                AdaptiveNominalSchedule(interval=self.nominal_test_interval) if self.adaptive_nominal_test else None
+            ),
         )
 
         # For loop to add multiple targets
@@ -131,7 +204,8 @@ class BaseConfig:
                     host = self.host,
                     port = self.port,
                     uri = self.uri,
-                    recv_timeout=self.recv_timeout)
+                    recv_timeout=self.recv_timeout),
+                readiness_probe=self.readiness_probe,
             ))
 
     def graph_generation(self, graph_name) -> None:
@@ -0,0 +1,155 @@
+"""Fit a fuzz_indefinitely campaign into a wall-clock time budget."""
+
+import math
+import re
+import time
+
+from boofuzz import exception
+from boofuzz.primitives.base_primitive import BasePrimitive
+
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)([smhd]?)")
+
+
+def parse_duration(text):
+    """Parse a duration such as "90", "45m", "2h30m" or "1d" into seconds."""
+    text = str(text).strip().lower()
+    position = 0
+    seconds = 0.0
+    for match in _DURATION_RE.finditer(text):
+        if match.start() != position:
+            break
+        seconds += float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+        position = match.end()
+    if position != len(text) or position == 0:
+        raise ValueError("Invalid duration: {0!r}".format(text))
+    return seconds
+
+
+class CampaignPlanner:
+    """
+    Split a time budget across the rounds of :meth:`Session.fuzz_indefinitely <boofuzz.Session.fuzz_indefinitely>`.
+
+    The library round gets `library_share` of the budget, random_mutation rounds `mutation_share`, and
+    random_generation rounds the rest. Before each round, the planner estimates the number of test cases that fit in the
+    round's share at the measured execution speed; if the round has more, the per-element budgets of every primitive
+    (num_library_elements, num_random_mutations, num_random_generations) are scaled down by the same factor, so that
+    each request keeps a share of the time proportional to its mutation count. Budgets only cut the end of an element's
+    mutations: the remaining test cases are the same as without planner. random_mutation rounds stop when their share
+    is spent, and the campaign stops with a recap when the deadline is reached.
+
+    Args:
+        time_budget (float): Budget in seconds.
+        library_share (float): Part of the budget for the library round. Default 0.4.
+        mutation_share (float): Part of the budget for the random_mutation rounds. Default 0.4.
+        initial_exec_speed (float): Test cases per second assumed before any measurement. Default 10.
+        min_cases_per_element (int): Elements keep at least this budget, even if the round overruns. Default 1.
+    """
+
+    def __init__(
+        self, time_budget, library_share=0.4, mutation_share=0.4, initial_exec_speed=10.0, min_cases_per_element=1
+    ):
+        self.time_budget = time_budget
+        self.library_share = library_share
+        self.mutation_share = mutation_share
+        self.initial_exec_speed = initial_exec_speed
+        self.min_cases_per_element = min_cases_per_element
+
+        self.deadline = None
+        self._start_time = None
+        self._start_cases = 0
+        self._mutation_phase_end = None
+        self._original_budgets = {}  # primitive -> (num_library_elements, num_random_mutations, num_random_generations)
+
+    def start(self, session):
+        """Start the clock."""
+        self._start_time = time.time()
+        self._start_cases = session.num_cases_actually_fuzzed
+        self.deadline = self._start_time + self.time_budget
+
+    @property
+    def remaining(self):
+        """Seconds left before the deadline."""
+        return max(0.0, self.deadline - time.time())
+
+    def check_deadline(self):
+        """Raise BoofuzzStopCampaign if the deadline is reached."""
+        if self.deadline is not None and time.time() >= self.deadline:
+            raise exception.BoofuzzStopCampaign("Time budget of {0:.0f} seconds exhausted".format(self.time_budget))
+
+    def exec_speed(self, session):
+        """Test cases per second since the planner started, or initial_exec_speed before the first test case."""
+        cases = session.num_cases_actually_fuzzed - self._start_cases
+        elapsed = time.time() - self._start_time
+        if cases <= 0 or elapsed <= 0:
+            return self.initial_exec_speed
+        return cases / elapsed
+
+    def mutation_phase_over(self):
+        """Return True once the random_mutation rounds have spent their share of the budget."""
+        return self._mutation_phase_end is not None and time.time() >= self._mutation_phase_end
+
+    def plan_round(self, session, rounds_left=1):
+        """Scale the per-element budgets so that the round about to start fits in its share of the time left.
+
+        Args:
+            session (Session): Session, with round_type set to the round about to start.
+            rounds_left (int): Rounds of this type still to run, including this one.
+
+        Returns:
+            float: Scale applied to the budgets, 1 if the round fits as is.
+        """
+        remaining = self.remaining
+        if session.round_type == "library":
+            round_time = remaining * self.library_share
+        elif session.round_type == "random_mutation":
+            if self._mutation_phase_end is None:
+                later_share = 1 - self.library_share
+                share = self.mutation_share / later_share if later_share > 0 else 1
+                self._mutation_phase_end = time.time() + remaining * share
+            round_time = max(0.0, self._mutation_phase_end - time.time()) / max(rounds_left, 1)
+        else:
+            round_time = remaining
+
+        primitives = self._primitives(session)
+        self._restore(primitives)
+        total_num_mutations = session.total_num_mutations  # num_mutations() overwrites it
+        num_cases = session.num_mutations()
+        session.total_num_mutations = total_num_mutations
+        capacity = round_time * self.exec_speed(session)
+        if not num_cases or capacity >= num_cases:
+            return 1.0
+
+        scale = capacity / num_cases
+        for primitive in primitives:
+            library, mutations, generations = self._original_budgets[primitive]
+            primitive.set_budget(
+                num_library_elements=self._scaled(library, scale),
+                num_random_mutations=self._scaled(mutations, scale),
+                num_random_generations=self._scaled(generations, scale),
+            )
+        return scale
+
+    def _scaled(self, budget, scale):
+        return min(budget, max(self.min_cases_per_element, int(math.floor(budget * scale))))
+
+    def _primitives(self, session):
+        primitives = []
+        for node in session.nodes.values():
+            for element in getattr(node, "names", {}).values():
+                if isinstance(element, BasePrimitive):
+                    primitives.append(element)
+                    if element not in self._original_budgets:
+                        self._original_budgets[element] = (
+                            element.num_library_elements,
+                            element.num_random_mutations,
+                            element.num_random_generations,
+                        )
+        return primitives
+
+    def _restore(self, primitives):
+        for primitive in primitives:
+            library, mutations, generations = self._original_budgets[primitive]
+            primitive.set_budget(
+                num_library_elements=library, num_random_mutations=mutations, num_random_generations=generations
+            )
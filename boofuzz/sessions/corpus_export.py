@@ -0,0 +1,115 @@
+"""Write the fuzzed messages of a campaign to files, without a target."""
+
+import csv
+import os
+import time
+
+from boofuzz import constants, exception
+from boofuzz.packed_corpus import PackedCorpusWriter, message_path_hash
+
+
+class CorpusExporter:
+    """
+    Enumerate the test cases of a session's rounds and write the fuzzed message of each to a file.
+
+    Nothing is sent: no connection, monitor, callback or database logging runs. Each payload is written to
+    ``<directory>/<test case index>``, or appended to the packed corpus ``<directory>/corpus.pack`` (see
+    :class:`PackedCorpus`), and ``<directory>/index.csv`` lists the index, file, size and test case name of every
+    payload, so the files can feed other harnesses, replayers or regression suites.
+
+    Test cases are generated and rendered as by :meth:`Session.fuzz_indefinitely`, with the session's render workers
+    if it has some. Messages referring to earlier responses are rendered with their default values, and rounds
+    depending on target feedback (response-based scheduling, the feedback corpus) follow an empty corpus.
+
+    Args:
+        session (Session): Session holding the protocol definition, starting round_type and seed_index.
+        directory (str): Directory for the payload files, created if needed.
+        workers (int): Render worker processes, see the `render_workers` option of :class:`Session`. Default None:
+            keep the session's.
+        packed (bool): Write a packed corpus instead of one file per payload. Default False.
+        compress (bool): Compress the packed corpus. Default False.
+    """
+
+    def __init__(self, session, directory, workers=None, packed=False, compress=False):
+        self.session = session
+        self.directory = directory
+        if workers is not None:
+            self.session.render_workers = workers
+        self.packed = packed
+        self.compress = compress
+        self.num_exported = 0
+        self.num_failed = 0
+        self._index_writer = None
+        self._packed_writer = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def export(self, max_number_of_rounds=1):
+        """Export rounds from the session's round_type and seed_index on.
+
+        Args:
+            max_number_of_rounds (int): Number of rounds to export, 0 for no limit. Default 1.
+
+        Returns:
+            int: Number of payloads written.
+        """
+        session = self.session
+        session.planner = None
+        session.max_number_of_rounds = max_number_of_rounds
+        session.total_num_round = 0
+        session.calculate_total_round()
+
+        start = time.time()
+        with open(os.path.join(self.directory, constants.EXPORT_INDEX_NAME), "w", newline="") as index_file:
+            self._index_writer = csv.writer(index_file)
+            self._index_writer.writerow(["index", "file", "size", "name"])
+            if self.packed:
+                self._packed_writer = PackedCorpusWriter(
+                    os.path.join(self.directory, constants.PACKED_CORPUS_NAME), compress=self.compress
+                )
+            try:
+                session._fuzz_rounds(fuzz_round=self.export_round)
+            except exception.BoofuzzStopCampaign:
+                pass
+            finally:
+                self._index_writer = None
+                if self._packed_writer is not None:
+                    self._packed_writer.close()
+                    self._packed_writer = None
+
+        session._fuzz_data_logger.log_info(
+            "Exported {0} test cases to {1} in {2:.1f} seconds".format(
+                self.num_exported, self.directory, time.time() - start
+            )
+        )
+        if self.num_failed:
+            session._fuzz_data_logger.log_info("{0} test cases failed to render".format(self.num_failed))
+        return self.num_exported
+
+    def export_round(self):
+        """Export the test cases of the session's current round."""
+        session = self.session
+        session.feedback_corpus.start_round()
+        for mutation_context in session._generate_test_cases():
+            try:
+                data = session._take_rendered(mutation_context)
+            except Exception as e:
+                self.num_failed += 1
+                session._fuzz_data_logger.log_info(
+                    "Could not render test case {0}: {1!r}".format(session.total_mutant_index, e)
+                )
+                continue
+            if self._packed_writer is not None:
+                file_name = constants.PACKED_CORPUS_NAME
+                self._packed_writer.append(
+                    data,
+                    test_case_index=session.total_mutant_index,
+                    path_hash=message_path_hash(session._message_path_to_str(mutation_context.message_path)),
+                )
+            else:
+                file_name = str(session.total_mutant_index)
+                with open(os.path.join(self.directory, file_name), "wb") as f:
+                    f.write(data)
+            self._index_writer.writerow(
+                [session.total_mutant_index, file_name, len(data), session._test_case_name(mutation_context)]
+            )
+            self.num_exported += 1
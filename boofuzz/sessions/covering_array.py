@@ -0,0 +1,168 @@
+"""t-wise covering arrays over the mutations of a request's elements, for test cases mutating several elements.
+
+With max_depth > 1, the historical generator runs every combination of `depth` mutated elements: the sum, over every
+set of `depth` elements, of the product of their mutation counts, quickly billions of test cases. A covering array of
+strength t is a much smaller set of rows such that, for any t elements, every combination of their values appears in
+at least one row. Each element is a factor whose level 0 is its default value and level n its n-th mutation, so any t
+mutations of t different elements (and any fewer mutations with the other elements at their default value) are sent
+together at least once, along with other elements' values.
+
+Rows are built one at a time, as they are needed, with a deterministic density strategy (in the manner of AETG and
+Bryce and Colbourn's DDA): a row starts from the first t-tuple not covered yet, then each other factor takes the value
+covering the most uncovered t-tuples with the factors already set, the default value 0 on ties, so that rows mutate as
+few elements as they can. Each row covers at least one new tuple, and the array is complete once every tuple is
+covered. Uncovered tuples are kept as one flag per tuple, so memory grows with the number of t-tuples of values, not
+with the number of rows.
+"""
+
+import functools
+import itertools
+import math
+
+
+class _UncoveredTuples:
+    """Flags of the t-tuples of values not covered yet, for every combination of t factors."""
+
+    def __init__(self, levels, strength):
+        self.levels = levels
+        self.combinations = list(itertools.combinations(range(len(levels)), strength))
+        self.weights = []  # per combination: factor -> weight of its value in the index of a tuple
+        self.flags = []  # per combination: bytearray, 1 where the tuple of that index is not covered
+        for combination in self.combinations:
+            weights, size = {}, 1
+            for factor in reversed(combination):
+                weights[factor] = size
+                size *= levels[factor]
+            self.weights.append(weights)
+            self.flags.append(bytearray(b"\x01") * size)
+        # factor -> indexes of the combinations it belongs to
+        self.by_factor = [[] for _ in levels]
+        for index, combination in enumerate(self.combinations):
+            for factor in combination:
+                self.by_factor[factor].append(index)
+        self._first = 0  # combinations before this one are fully covered
+
+    def first(self):
+        """Return the first uncovered tuple as {factor: value}, or None if every tuple is covered."""
+        while self._first < len(self.combinations):
+            position = self.flags[self._first].find(1)
+            if position >= 0:
+                combination, weights = self.combinations[self._first], self.weights[self._first]
+                return {factor: position // weights[factor] % self.levels[factor] for factor in combination}
+            self._first += 1
+        return None
+
+    def best_value(self, factor, row):
+        """Return the value of `factor` covering the most uncovered tuples with the factors set in `row`."""
+        gains = [0] * self.levels[factor]
+        step = None
+        for index in self.by_factor[factor]:
+            weights = self.weights[index]
+            base = 0
+            for other, weight in weights.items():
+                if other == factor:
+                    step = weight
+                elif row[other] is None:
+                    break
+                else:
+                    base += row[other] * weight
+            else:
+                flags = self.flags[index]
+                for value in range(len(gains)):
+                    gains[value] += flags[base + value * step]
+        return max(range(len(gains)), key=lambda value: (gains[value], -value))
+
+    def cover(self, row):
+        """Mark the tuples of a complete row as covered."""
+        for weights, flags in zip(self.weights, self.flags):
+            flags[sum(row[factor] * weight for factor, weight in weights.items())] = 0
+
+
+def _generate_rows(levels, strength):
+    """Yield the rows of a covering array of the given strength, one at a time, as tuples of levels."""
+    uncovered = _UncoveredTuples(levels, strength)
+    while True:
+        seed = uncovered.first()
+        if seed is None:
+            return
+        row = [seed.get(factor) for factor in range(len(levels))]
+        for factor in range(len(levels)):
+            if row[factor] is None:
+                row[factor] = uncovered.best_value(factor, row)
+        uncovered.cover(row)
+        yield tuple(row)
+
+
+class CoveringArray:
+    """
+    Covering array of strength `strength` over factors with `levels` values each.
+
+    Rows are built lazily, when they are iterated or indexed, and kept. They always come in the same order for the same
+    levels and strength, so that a test case built from row n can be rebuilt later. The number of rows is only known
+    once they are all built: :meth:`estimated_len` gives a lower bound until then.
+
+    Args:
+        levels (list of int): Number of values of each factor, including the default value 0.
+        strength (int): Number of factors whose combinations of values are all covered. Capped to the number of
+            factors.
+        min_weight (int): Rows with fewer non-zero values are left out. Default 0: keep every row.
+    """
+
+    def __init__(self, levels, strength=2, min_weight=0):
+        self.levels = tuple(levels)
+        self.strength = min(strength, len(self.levels))
+        self.min_weight = min_weight
+        self._rows = []
+        self.complete = self.strength == 0 or 0 in self.levels
+        if not self.complete:
+            self._pending = (
+                row
+                for row in _generate_rows(self.levels, self.strength)
+                if sum(1 for value in row if value) >= min_weight
+            )
+
+    def _build(self, count=None):
+        """Build rows until there are `count` of them, or all of them if None."""
+        while not self.complete and (count is None or len(self._rows) < count):
+            row = next(self._pending, None)
+            if row is None:
+                self.complete = True
+            else:
+                self._rows.append(row)
+
+    def estimated_len(self):
+        """Return the number of rows if they are all built, else a lower bound without building more rows.
+
+        Every combination of non-zero values of the `strength` factors with the most levels needs its own row.
+        """
+        if self.complete:
+            return len(self._rows)
+        largest = sorted(self.levels, reverse=True)[: self.strength]
+        bound = math.prod(n - 1 for n in largest) if self.min_weight <= self.strength else 0
+        return max(len(self._rows), bound)
+
+    def __len__(self):
+        self._build()
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if index < 0:
+            self._build()
+        else:
+            self._build(index + 1)
+        return self._rows[index]
+
+    def __iter__(self):
+        index = 0
+        while True:
+            self._build(index + 1)
+            if index >= len(self._rows):
+                return
+            yield self._rows[index]
+            index += 1
+
+
+@functools.lru_cache(maxsize=64)
+def covering_array(levels, strength=2, min_weight=0):
+    """Return the :class:`CoveringArray` for these arguments, shared (levels must be a tuple)."""
+    return CoveringArray(levels, strength=strength, min_weight=min_weight)
@@ -0,0 +1,60 @@
+"""Attribute a failure to the test case that caused it, when the target only fails some test cases later."""
+
+import attr
+
+
+@attr.s
+class RecentCase:
+    """A test case as it was sent, kept by :class:`Session` to send it again (see the `bisect_failures` option).
+
+    `payloads` holds the bytes of each send of the fuzzed message: it is replayed as it was, not rendered again.
+    """
+
+    index = attr.ib(type=int)
+    name = attr.ib(type=str)
+    fuzz_node = attr.ib()
+    mutant = attr.ib()
+    message_path = attr.ib(factory=list)
+    mutations = attr.ib(factory=dict)
+    payloads = attr.ib(factory=list)
+
+
+def shortest_crashing_sequence(cases, crashes):
+    """Return the shortest sequence of `cases` found to make the target fail, or None if it could not be reproduced.
+
+    The last case, the one during which the failure was noticed, is tried alone first. Otherwise, once every case
+    together is confirmed to fail, the latest start of a failing suffix is searched by bisection: the case at that
+    start is the culprit, since the suffix fails with it and passes without it. Finally, the cases after the culprit
+    that are not needed for the failure are dropped one at a time.
+
+    At most 2 + log2(len(cases)) + len(cases) replays are run.
+
+    Args:
+        cases (list of RecentCase): Test cases, in the order they were sent.
+        crashes (callable): Called with a sequence of cases: restarts the target, sends them in order and returns True
+            if the target failed.
+
+    Returns:
+        list of RecentCase: The culprit first, then the later cases needed to make the target fail.
+    """
+    if crashes(cases[-1:]):
+        return cases[-1:]
+    if len(cases) == 1 or not crashes(cases):
+        return None
+    # cases[failing:] makes the target fail, cases[passing:] does not.
+    failing, passing = 0, len(cases) - 1
+    while passing - failing > 1:
+        middle = (failing + passing) // 2
+        if crashes(cases[middle:]):
+            failing = middle
+        else:
+            passing = middle
+    sequence = cases[failing:]
+    i = 1
+    while i < len(sequence):
+        candidate = sequence[:i] + sequence[i + 1 :]
+        if crashes(candidate):
+            sequence = candidate
+        else:
+            i += 1
+    return sequence
@@ -0,0 +1,68 @@
+"""Decide when the session checks its target with the nominal test, from how healthy the target has been."""
+
+import collections
+
+
+class AdaptiveNominalSchedule:
+    """
+    Run the nominal test after a number of test cases that follows the target's health, instead of every
+    `nominal_test_interval` test cases.
+
+    The interval doubles after each passing nominal test, up to `max_interval`. It drops to `min_interval` after a
+    failed nominal test, a restart, and as soon as a test case gets a target warning or exceeds its RTO: the next
+    nominal test then comes a few cases after the anomaly, or right away if they already ran.
+
+    The test cases sent since the last passing nominal test (at most `max_interval`) are kept: when a nominal test
+    fails, the session sends them again to find which one broke the target.
+
+    Args:
+        interval (int): Test cases before the first nominal test. Default 50.
+        min_interval (int): Shortest interval. Default 5.
+        max_interval (int): Longest interval. Default 800.
+    """
+
+    def __init__(self, interval=50, min_interval=5, max_interval=800):
+        if not 1 <= min_interval <= max_interval:
+            raise ValueError("intervals must satisfy 1 <= min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min(max(interval, min_interval), max_interval)
+        self.cases_since_probe = 0
+        self.cases = collections.deque(maxlen=max_interval)
+
+    def record_case(self, case, anomaly=False):
+        """Count a test case sent to the target.
+
+        Args:
+            case (RecentCase): The test case, kept for a re-check. None to only count it.
+            anomaly (bool): The test case got a target warning or exceeded its RTO.
+        """
+        self.cases_since_probe += 1
+        if case is not None:
+            self.cases.append(case)
+        if anomaly:
+            self.interval = self.min_interval
+
+    def restarted(self):
+        """The target was restarted: the test cases sent before cannot break it any more, and it is checked soon."""
+        self.cases.clear()
+        self.interval = self.min_interval
+
+    def due(self):
+        """Return True if the nominal test should run now."""
+        return self.cases_since_probe >= self.interval
+
+    def probe_done(self, healthy):
+        """Adapt the interval to the result of a nominal test.
+
+        Returns:
+            list of RecentCase: If the nominal test failed, the test cases sent since the last passing one. Else empty.
+        """
+        self.cases_since_probe = 0
+        suspects = [] if healthy else list(self.cases)
+        self.cases.clear()
+        if healthy:
+            self.interval = min(self.max_interval, self.interval * 2)
+        else:
+            self.interval = self.min_interval
+        return suspects
@@ -0,0 +1,131 @@
+"""Pace the sends to a target with a token bucket whose rate adapts to the target's health (AIMD)."""
+
+import time
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing `rate` operations per second on average, and bursts of up to `burst` operations.
+
+    Args:
+        rate (float): Operations per second.
+        burst (float): Tokens the bucket holds: operations allowed back to back after an idle time. Default 1.
+        clock (callable): Monotonic time source. Default time.monotonic.
+        sleep (callable): Called with the number of seconds to wait. Default time.sleep.
+    """
+
+    def __init__(self, rate, burst=1.0, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._last = clock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._refill()  # tokens earned so far count at the old rate
+        self._rate = rate
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    def acquire(self, tokens=1.0):
+        """Wait until `tokens` are available, and take them.
+
+        Returns:
+            float: Seconds waited.
+        """
+        self._refill()
+        waited = 0.0
+        if self._tokens < tokens:
+            waited = (tokens - self._tokens) / self._rate
+            self._sleep(waited)
+            self._refill()
+        # A short sleep leaves a debt, paid by the next call.
+        self._tokens -= tokens
+        return waited
+
+
+class AimdPacer:
+    """
+    Token bucket pacing the sends to a target, with a rate adapted by additive increase and multiplicative decrease.
+
+    The session reports congestion (RTO exceeded, connection resets and aborts, failed nominal tests) with
+    :meth:`congestion` and calls :meth:`end_case` after each test case and nominal test: the rate is then multiplied by
+    `decrease` if any congestion was reported since the previous call, else raised by `increase` sends per second. A
+    burst of timeouts within a test case thus lowers the rate once. The rate stays between `min_rate` and `max_rate`.
+
+    Args:
+        rate (float): Initial sends per second.
+        min_rate (float): Lowest rate. Default 0.1.
+        max_rate (float): Highest rate. Default 1000.
+        increase (float): Sends per second added after each healthy test case. Default 1.
+        decrease (float): Factor applied to the rate on congestion, between 0 and 1. Default 0.5.
+        burst (float): Sends allowed back to back, see :class:`TokenBucket`. Default 1.
+        clock (callable): Monotonic time source. Default time.monotonic.
+        sleep (callable): Called with the number of seconds to wait. Default time.sleep.
+    """
+
+    def __init__(
+        self,
+        rate,
+        min_rate=0.1,
+        max_rate=1000.0,
+        increase=1.0,
+        decrease=0.5,
+        burst=1.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        if not 0 < min_rate <= max_rate:
+            raise ValueError("rates must satisfy 0 < min_rate <= max_rate")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._bucket = TokenBucket(min(max(rate, min_rate), max_rate), burst=burst, clock=clock, sleep=sleep)
+        self._congestion = None
+
+    @property
+    def rate(self):
+        """Current sends per second."""
+        return self._bucket.rate
+
+    def wait(self):
+        """Wait for the next send slot.
+
+        Returns:
+            float: Seconds waited.
+        """
+        return self._bucket.acquire()
+
+    def congestion(self, reason):
+        """Report a sign of an overloaded target, applied at the next :meth:`end_case`."""
+        if self._congestion is None:
+            self._congestion = reason
+
+    def end_case(self):
+        """Adapt the rate to the test case that just ended.
+
+        Returns:
+            str: The first congestion reported during the test case, None if it was healthy.
+        """
+        reason, self._congestion = self._congestion, None
+        if reason is not None:
+            self._bucket.rate = max(self.min_rate, self.rate * self.decrease)
+        else:
+            self._bucket.rate = min(self.max_rate, self.rate + self.increase)
+        return reason
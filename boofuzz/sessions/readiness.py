@@ -0,0 +1,163 @@
+"""Readiness probes telling when a restarted target accepts test cases again.
+
+After a restart, :class:`Session` polls the probe of the :class:`Target`, with exponential backoff, until it succeeds
+or its timeout expires, instead of sleeping a fixed ``seconds_to_wait_after_restart``.
+"""
+
+import re
+import socket
+import time
+
+from boofuzz import exception, Request
+
+
+class ReadinessProbe:
+    """
+    Base class of readiness probes. Subclasses implement :meth:`probe`.
+
+    Args:
+        timeout (float): Seconds to wait for the target to be ready. Default 10.
+        initial_interval (float): Seconds between the first two attempts. Default 0.05.
+        max_interval (float): Upper bound of the interval between attempts. Default 1.
+        backoff (float): Factor applied to the interval after each failed attempt. Default 2.
+        host (str): Host to probe. Default None: the host of the target's connection.
+        port (int): Port to probe. Default None: the port of the target's connection.
+    """
+
+    def __init__(self, timeout=10.0, initial_interval=0.05, max_interval=1.0, backoff=2.0, host=None, port=None):
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.host = host
+        self.port = port
+
+    def address(self, target):
+        """(host, port) to probe: the probe's own, or else the ones of the target's connection."""
+        connection = target.get_connection()
+        host = self.host if self.host is not None else getattr(connection, "host", None)
+        port = self.port if self.port is not None else getattr(connection, "port", None)
+        if host is None or port is None:
+            raise exception.BoofuzzError(
+                "{0} needs a host and a port: give them, or use a connection having them".format(type(self).__name__)
+            )
+        return host, port
+
+    def probe(self, target, session):
+        """Make one attempt. Return True if the target is ready; OSError means it is not.
+
+        Args:
+            target (Target): Target to probe.
+            session (Session): Session fuzzing the target.
+        """
+        raise NotImplementedError
+
+    def wait(self, target, session=None):
+        """Probe until the target is ready or the timeout expires.
+
+        Args:
+            target (Target): Target to probe.
+            session (Session): Session fuzzing the target.
+
+        Returns:
+            int: Number of attempts when the target is ready, 0 on timeout.
+        """
+        deadline = time.monotonic() + self.timeout
+        interval = self.initial_interval
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                if self.probe(target, session):
+                    return attempts
+            except (OSError, exception.BoofuzzTargetConnectionFailedError, exception.BoofuzzTargetConnectionReset):
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return 0
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def _socket_timeout(self):
+        return min(max(self.max_interval, 0.1), self.timeout)
+
+
+class TCPConnectProbe(ReadinessProbe):
+    """Ready when a TCP connection to the target is accepted."""
+
+    def probe(self, target, session):
+        with socket.create_connection(self.address(target), timeout=self._socket_timeout()):
+            return True
+
+
+class BannerProbe(ReadinessProbe):
+    """
+    Ready when the target sends, on a new TCP connection, data matching a pattern.
+
+    Args:
+        pattern (bytes): Regular expression searched in the first data received.
+        **kwargs: See :class:`ReadinessProbe`.
+    """
+
+    def __init__(self, pattern, **kwargs):
+        super(BannerProbe, self).__init__(**kwargs)
+        self.pattern = re.compile(pattern)
+
+    def probe(self, target, session):
+        with socket.create_connection(self.address(target), timeout=self._socket_timeout()) as sock:
+            return self.pattern.search(sock.recv(4096)) is not None
+
+
+class UDPProbe(ReadinessProbe):
+    """
+    Ready when the target answers a UDP datagram.
+
+    Args:
+        request (bytes): Datagram to send.
+        expect (bytes): Regular expression the response must match. Default None: any response.
+        **kwargs: See :class:`ReadinessProbe`.
+    """
+
+    def __init__(self, request, expect=None, **kwargs):
+        super(UDPProbe, self).__init__(**kwargs)
+        self.request = request
+        self.expect = re.compile(expect) if expect is not None else None
+
+    def probe(self, target, session):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(self._socket_timeout())
+            # Connected, so that an ICMP port unreachable fails the next recv instead of waiting for the timeout.
+            sock.connect(self.address(target))
+            sock.send(self.request)
+            data = sock.recv(65535)
+        return self.expect is None or self.expect.search(data) is not None
+
+
+class NominalProbe(ReadinessProbe):
+    """
+    Ready when the target answers the nominal requests of the session (see :meth:`Session.set_nominal_data`), sent on
+    the target's own connection. Callback functions of the nominal data are not called.
+
+    Args:
+        expect_response (bool): Require a non-empty response to the last request. Default True.
+        **kwargs: See :class:`ReadinessProbe`.
+    """
+
+    def __init__(self, expect_response=True, **kwargs):
+        super(NominalProbe, self).__init__(**kwargs)
+        self.expect_response = expect_response
+
+    def probe(self, target, session):
+        requests = [data for data in session._nominal_data if isinstance(data, Request)]
+        if not requests:
+            raise exception.BoofuzzError("NominalProbe needs nominal requests: see Session.set_nominal_data()")
+        connection = target.get_connection()
+        connection.open()
+        try:
+            data = b""
+            for request in requests:
+                connection.send(request.render())
+                data = connection.recv(target.max_recv_bytes)
+        finally:
+            connection.close()
+        return bool(data) or not self.expect_response
@@ -0,0 +1,287 @@
+"""Generate and render test cases in worker processes.
+
+Each worker is forked from the fuzzing process when a round starts, so it holds the same protocol definition, round,
+seed and feedback corpus, and generates exactly the mutations serial generation would. The top-level elements of the
+requests are dealt out to the workers in turn; a worker generates the mutations of its elements only, renders the
+fuzzed messages and writes them, with the mutations, to its own :class:`ShmRing`. The fuzzing process reads the rings
+in element order, so test cases keep their serial order and indexes.
+
+Only depth 1 test cases, produced by the :class:`StackOrderScheduler`, are generated this way.
+"""
+
+import mmap
+import multiprocessing
+import os
+import pickle
+import struct
+import tempfile
+import traceback
+from concurrent.futures import Future
+
+from boofuzz import exception
+from boofuzz.mutation import Mutation
+from boofuzz.mutation_context import MutationContext
+
+# write position, read position (byte counters, never wrapped), writer closed flag
+_HEADER = struct.Struct("<QQB")
+_WRITE_OFFSET = 0
+_READ_OFFSET = 8
+_CLOSED_OFFSET = 16
+_POSITION = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF
+_LIVENESS_INTERVAL = 0.5
+
+_INLINE = b"R"
+_SPILLED = b"F"
+
+
+class ShmRing:
+    """
+    Single-producer, single-consumer ring of length-prefixed records in anonymous shared memory.
+
+    Create it before forking the producer. A record that does not fit before the end of the buffer is written at its
+    start, after a wrap marker. Records larger than half the capacity are refused.
+
+    Neither side polls: the producer releases a semaphore for each record it publishes, and when the writer is closed,
+    and the consumer waits on it; the consumer releases another one for each record it reads, on which the producer
+    waits while the ring is full.
+
+    Args:
+        capacity (int): Size of the record area in bytes.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._mmap = mmap.mmap(-1, _HEADER.size + capacity)
+        _HEADER.pack_into(self._mmap, 0, 0, 0, 0)
+        self._published = multiprocessing.Semaphore(0)
+        self._freed = multiprocessing.Semaphore(0)
+
+    def _position(self, offset):
+        return _POSITION.unpack_from(self._mmap, offset)[0]
+
+    @property
+    def max_record_size(self):
+        return self.capacity // 2 - _LENGTH.size
+
+    def put(self, data):
+        """Append a record, waiting for the consumer to free enough space."""
+        if len(data) > self.max_record_size:
+            raise ValueError("Record of {0} bytes larger than {1}".format(len(data), self.max_record_size))
+        write = self._position(_WRITE_OFFSET)
+        offset = write % self.capacity
+        needed = _LENGTH.size + len(data)
+        padding = 0 if self.capacity - offset >= needed else self.capacity - offset
+        while write + padding + needed - self._position(_READ_OFFSET) > self.capacity:
+            self._freed.acquire()
+        if padding:
+            if padding >= _LENGTH.size:
+                _LENGTH.pack_into(self._mmap, _HEADER.size + offset, _WRAP)
+            offset = 0
+        start = _HEADER.size + offset
+        _LENGTH.pack_into(self._mmap, start, len(data))
+        self._mmap[start + _LENGTH.size : start + needed] = data
+        # Publish the record only once it is written.
+        _POSITION.pack_into(self._mmap, _WRITE_OFFSET, write + padding + needed)
+        self._published.release()
+
+    def close_writer(self):
+        """Tell the consumer that no record will follow."""
+        self._mmap[_CLOSED_OFFSET] = 1
+        self._published.release()
+
+    def _wait_published(self, producer_alive):
+        while not self._published.acquire(timeout=None if producer_alive is None else _LIVENESS_INTERVAL):
+            if not producer_alive() and not self._published.acquire(block=False):
+                raise exception.BoofuzzError("A render worker died without finishing its test cases")
+
+    def get(self, producer_alive=None):
+        """Return the next record, or None once the writer is closed and every record was read.
+
+        Args:
+            producer_alive (callable): Called every half second while waiting; if it returns False with no record
+                pending, the producer died and BoofuzzError is raised.
+        """
+        self._wait_published(producer_alive)
+        read = self._position(_READ_OFFSET)
+        while True:
+            if self._position(_WRITE_OFFSET) == read:
+                # Only the closed writer signals without a record: let later calls see it too.
+                self._published.release()
+                return None
+            offset = read % self.capacity
+            if self.capacity - offset < _LENGTH.size:
+                read += self.capacity - offset
+                continue
+            start = _HEADER.size + offset
+            length = _LENGTH.unpack_from(self._mmap, start)[0]
+            if length == _WRAP:
+                read += self.capacity - offset
+                continue
+            data = self._mmap[start + _LENGTH.size : start + _LENGTH.size + length]
+            _POSITION.pack_into(self._mmap, _READ_OFFSET, read + _LENGTH.size + length)
+            self._freed.release()
+            return data
+
+    def close(self):
+        self._mmap.close()
+
+
+def depth_1_elements(session, path=None):
+    """Yield (ordinal, message path, request, top-level element) in the order serial generation fuzzes them."""
+    ordinal = 0
+    for message_path in session._iterate_protocol_message_paths(path=path):
+        node = session.nodes[message_path[-1].dst]
+        for item in node.stack:
+            yield ordinal, list(message_path), node, item
+            ordinal += 1
+
+
+def _encode(ring, record):
+    data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) + 1 <= ring.max_record_size:
+        return _INLINE + data
+    fd, spill_path = tempfile.mkstemp(prefix="boofuzz-render-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return _SPILLED + spill_path.encode("utf-8")
+
+
+def _decode(data):
+    if data[:1] == _SPILLED:
+        spill_path = data[1:].decode("utf-8")
+        with open(spill_path, "rb") as f:
+            data = f.read()
+        os.remove(spill_path)
+        return pickle.loads(data)
+    return pickle.loads(data[1:])
+
+
+def _produce(session, path, worker, num_workers, ring):
+    """Body of a worker process: generate and render the test cases of every num_workers-th element."""
+    try:
+        for ordinal, message_path, node, item in depth_1_elements(session, path):
+            if ordinal % num_workers != worker:
+                continue
+            session.fuzz_node = node
+            node.mutant = item
+            for mutations in item.get_mutations():
+                context = MutationContext(message_path=message_path, mutations={m.qualified_name: m for m in mutations})
+                payload = None
+                if session._can_render_ahead(context):
+                    try:
+                        payload = node.render(context)
+                    except Exception:
+                        payload = None  # rendered, and the error raised, by the test case itself
+                mutations = [(m.qualified_name, m.index, m.value) for m in mutations]
+                ring.put(_encode(ring, (ordinal, mutations, node.mutant.qualified_name, payload)))
+            ring.put(_encode(ring, (ordinal, None, None, None)))
+    except Exception:
+        ring.put(_encode(ring, ("error", traceback.format_exc(), None, None)))
+    finally:
+        ring.close_writer()
+
+
+class RenderPool:
+    """
+    Worker processes generating and rendering the depth 1 test cases of a round.
+
+    Use it as a context manager, from the process and at the point where the round's serial generation would start.
+
+    Args:
+        session (Session): Session being fuzzed.
+        num_workers (int): Number of worker processes.
+        path (list of Connection): Only fuzz the last request of this path. Default None: every request.
+        ring_size (int): Size of each worker's ring. Default 64 MiB. Larger records go through temporary files.
+    """
+
+    def __init__(self, session, num_workers, path=None, ring_size=64 * 1024 * 1024):
+        self.session = session
+        self.num_workers = num_workers
+        self.path = path
+        self.ring_size = ring_size
+        self._rings = []
+        self._workers = []
+
+    @staticmethod
+    def available():
+        """Workers are forked: the pool is not available where fork is not."""
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def __enter__(self):
+        context = multiprocessing.get_context("fork")
+        for worker in range(self.num_workers):
+            ring = ShmRing(self.ring_size)
+            process = context.Process(
+                target=_produce,
+                args=(self.session, self.path, worker, self.num_workers, ring),
+                name="boofuzz-render-{0}".format(worker),
+                daemon=True,
+            )
+            process.start()
+            self._rings.append(ring)
+            self._workers.append(process)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_):
+        for process in self._workers:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        for ring in self._rings:
+            ring.close()
+        self._rings = []
+        self._workers = []
+
+    def _records(self, ordinal):
+        """Yield (mutations, mutant name, payload) of an element, until its end record."""
+        worker = ordinal % self.num_workers
+        process = self._workers[worker]
+        while True:
+            data = self._rings[worker].get(producer_alive=process.is_alive)
+            if data is None:
+                raise exception.BoofuzzError("Render worker {0} stopped before element {1}".format(worker, ordinal))
+            record_ordinal, mutations, mutant_name, payload = _decode(data)
+            if record_ordinal == "error":
+                raise exception.BoofuzzError("Render worker {0} failed:\n{1}".format(worker, mutations))
+            if mutations is None:
+                return
+            yield [Mutation(value=v, qualified_name=n, index=i) for n, i, v in mutations], mutant_name, payload
+
+    def test_cases(self):
+        """Yield the MutationContext of each depth 1 test case, updating the session like serial generation does."""
+        session = self.session
+        current_node = None
+        skip_node = False
+        for ordinal, message_path, node, item in depth_1_elements(session, self.path):
+            if node is not current_node:
+                current_node = node
+                session.fuzz_node = node
+                session.mutant_index = 0
+                skip_node = False
+            node.mutant = item
+            stopped_leaf = None
+            for mutations, mutant_name, payload in self._records(ordinal):
+                # Records of skipped elements are still read, to keep the rings in step.
+                if skip_node or (stopped_leaf is not None and mutant_name == stopped_leaf):
+                    continue
+                stopped_leaf = None
+                node.mutant = node.names.get(mutant_name, item)
+                session.mutant_index += 1
+                if session._mutations_contain_duplicate(mutations):
+                    continue
+                session.total_mutant_index += 1
+                context = MutationContext(message_path=message_path, mutations={m.qualified_name: m for m in mutations})
+                if payload is not None:
+                    future = Future()
+                    future.set_result(payload)
+                    session._rendered_ahead = (context, future)
+                yield context
+
+                if session._skip_current_node_after_current_test_case:
+                    session._skip_current_node_after_current_test_case = False
+                    skip_node = True
+                elif session._skip_current_element_after_current_test_case:
+                    session._skip_current_element_after_current_test_case = False
+                    stopped_leaf = mutant_name
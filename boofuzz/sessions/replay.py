@@ -0,0 +1,127 @@
+"""Stored test cases, replayed byte for byte by :meth:`Session.replay`."""
+
+import csv
+import os
+import re
+
+import attr
+
+from boofuzz import constants, exception
+
+_FUZZING_NODE_STEP = "Fuzzing Node '"
+_FUZZING_PRIMITIVE_STEP = "Fuzzing Primitive '"
+_ROUND = re.compile(r' round_type=(?P<round_type>\S+) seed_index=(?P<seed_index>-?\d+) seed="(?P<seed>.*)"$')
+
+
+@attr.s
+class StoredCase:
+    """A test case as it was sent: its index, its name and the bytes of its fuzzed message.
+
+    `payloads` holds one item per send of the fuzzed message, several if the request is fragmented. `complete` is False
+    when the database only kept a truncated payload: such a case cannot be replayed byte for byte.
+    """
+
+    index = attr.ib(type=int)
+    name = attr.ib(type=str)
+    payloads = attr.ib(factory=list)
+    complete = attr.ib(type=bool, default=True)
+
+    @property
+    def round(self):
+        """(round_type, seed_index, seed) the test case was generated in, or None if its name does not tell."""
+        match = _ROUND.search(self.name)
+        if match is None:
+            return None
+        return match.group("round_type"), int(match.group("seed_index")), match.group("seed")
+
+    @property
+    def case_name(self):
+        """Name without the round: message path and mutation names."""
+        return _ROUND.sub("", self.name)
+
+
+def parse_test_case_indices(text):
+    """Parse test case indices given as comma-separated numbers and ranges, e.g. ``"3,10-12"``.
+
+    Returns:
+        list of int: The indices, in the given order, ranges expanded.
+    """
+    indices = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        try:
+            first = int(first)
+            last = int(last) if last else first
+        except ValueError:
+            raise exception.BoofuzzError("Invalid test case index or range: {0!r}".format(part))
+        if last < first:
+            raise exception.BoofuzzError("Empty test case range: {0!r}".format(part))
+        indices.extend(range(first, last + 1))
+    return indices
+
+
+def stored_cases_from_db(reader, indices):
+    """Yield the stored test cases of a campaign database, in the order of `indices`.
+
+    The fuzzed message is made of the sends logged after the "Fuzzing Primitive" step of the test case, up to the next
+    step. Indices missing from the database are skipped.
+
+    Args:
+        reader (FuzzLoggerPostgresReader): Reader of the campaign's tables.
+        indices (iterable of int): Test case indices.
+    """
+    for index in indices:
+        data = reader.get_test_case_data(index)
+        if data is None:
+            continue
+        payloads, complete, fuzzing = [], True, False
+        for step in data.steps:
+            if step.type == "step":
+                if fuzzing and payloads:
+                    break
+                fuzzing = step.description.startswith((_FUZZING_NODE_STEP, _FUZZING_PRIMITIVE_STEP))
+            elif fuzzing and step.type == "send":
+                payloads.append(step.data)
+                complete = complete and not step.truncated
+        yield StoredCase(index=data.index, name=data.name, payloads=payloads, complete=complete and bool(payloads))
+
+
+def stored_cases_from_packed(corpus, indices=None, names=None):
+    """Yield the stored test cases of a packed corpus written by :class:`CorpusExporter`, in corpus order.
+
+    Args:
+        corpus (PackedCorpus): Corpus holding the fuzzed messages.
+        indices (iterable of int): Only these test cases. Default None: every test case of the corpus.
+        names (dict): Test case names by index. Default None: read from the exporter's index.csv beside the corpus.
+    """
+    if names is None:
+        names = read_export_index(os.path.join(os.path.dirname(corpus.path), constants.EXPORT_INDEX_NAME))
+    wanted = set(indices) if indices is not None else None
+    case = None
+    for record in corpus:
+        if wanted is not None and record.test_case_index not in wanted:
+            continue
+        if case is not None and case.index != record.test_case_index:
+            yield case
+            case = None
+        if case is None:
+            if record.test_case_index not in names:
+                raise exception.BoofuzzError(
+                    "No name for test case {0} of {1}".format(record.test_case_index, corpus.path)
+                )
+            case = StoredCase(index=record.test_case_index, name=names[record.test_case_index])
+        case.payloads.append(record.data)
+    if case is not None:
+        yield case
+
+
+def read_export_index(path):
+    """Return the test case names, by index, of an index.csv written by :class:`CorpusExporter`."""
+    try:
+        with open(path, newline="") as f:
+            return {int(row["index"]): row["name"] for row in csv.DictReader(f)}
+    except FileNotFoundError:
+        raise exception.BoofuzzError("{0} not found: test case names are needed to replay a packed corpus".format(path))
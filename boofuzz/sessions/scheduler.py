@@ -0,0 +1,152 @@
+"""Schedulers deciding in which order a round fuzzes the elements of the protocol's requests.
+
+A scheduler only orders test cases, it never changes them: the n-th mutation of an element in a round is the same
+whatever the scheduler, so every test case stays replayable from its round, seed, element and index (see
+:meth:`Session.fuzz <boofuzz.Session.fuzz>` with a test case name).
+"""
+
+from boofuzz.mutation_context import MutationContext
+
+SIGNAL_FAILURE = "failure"
+SIGNAL_WARNING = "warning"
+SIGNAL_RTO = "rto"
+SIGNAL_NOVELTY = "novelty"
+
+DEFAULT_WEIGHTS = {
+    SIGNAL_FAILURE: 8,
+    SIGNAL_WARNING: 2,
+    SIGNAL_RTO: 2,
+    SIGNAL_NOVELTY: 4,
+}
+
+
+class StackOrderScheduler:
+    """
+    Fuzz every request in graph order and every element in stack order, each to exhaustion. This is the historical
+    boofuzz behaviour and the default.
+    """
+
+    def test_cases(self, session, depth, path=None):
+        """Yield the MutationContext of the round's test cases with `depth` mutations each.
+
+        Args:
+            session (Session): Session being fuzzed.
+            depth (int): Number of mutations per test case.
+            path (list of Connection): Only fuzz the last request of this path. Default None: every request.
+        """
+        return session._generate_n_mutations(depth=depth, path=path)
+
+    def record(self, mutation_context, signals):
+        """Receive the feedback signals (SIGNAL_* constants) of the test case that just ran."""
+
+
+class _Unit:
+    """A top-level element of a request along a message path, with the mutations it has left in the round."""
+
+    def __init__(self, order, path, node, element):
+        self.order = order
+        self.path = path
+        self.node = node
+        self.element = element
+        self.given = 0
+        self.signals = {}
+        self._cases = None
+
+    def cases(self):
+        # Mutations are generated in one go: primitives draw them from the global random generator, so interleaving
+        # the generators of two elements would give other values than a replay of either.
+        if self._cases is None:
+            self._cases = []
+            self.node.mutant = self.element
+            for mutations in self.element.get_mutations():
+                self._cases.append((mutations, self.node.mutant))
+            self._cases.reverse()
+        return self._cases
+
+    @property
+    def remaining(self):
+        # Before generation, count at least one case so that the element gets generated and then dropped if empty.
+        if self._cases is None:
+            return max(self.element.get_num_mutations(), 1)
+        return len(self._cases)
+
+    def drop(self):
+        self._cases = []
+
+
+class EnergyScheduler(StackOrderScheduler):
+    """
+    Hand out test cases by slices to the (request, element) with the most energy.
+
+    An element's energy grows with the feedback signals its test cases got (failures, target warnings, RTO exceeded,
+    novel responses or coverage), each weighted by `weights`. Its priority is its energy times the mutations it has
+    left, divided by the number of cases it got so far: fresh elements are tried first, then elements that make the
+    target react get more cases, and everything still gets fuzzed by the end of the round. Ties go to graph and stack
+    order.
+
+    Only single-mutation test cases (max_depth 1, or the first depth) are scheduled; deeper depths use stack order.
+
+    Args:
+        slice_size (int): Number of consecutive test cases given to an element before choosing again. Default 10.
+        weights (dict): Energy per signal, see DEFAULT_WEIGHTS.
+    """
+
+    def __init__(self, slice_size=10, weights=None):
+        self.slice_size = slice_size
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self._current = None
+
+    def energy(self, unit):
+        return 1 + sum(self.weights.get(signal, 0) * count for signal, count in unit.signals.items())
+
+    def priority(self, unit):
+        return self.energy(unit) * unit.remaining / (1 + unit.given)
+
+    def test_cases(self, session, depth, path=None):
+        if depth != 1:
+            yield from super(EnergyScheduler, self).test_cases(session, depth=depth, path=path)
+            return
+
+        units = []
+        for message_path in session._iterate_protocol_message_paths(path=path):
+            message_path = list(message_path)
+            node = session.nodes[message_path[-1].dst]
+            for element in node.stack:
+                if element.fuzzable:
+                    units.append(_Unit(len(units), message_path, node, element))
+
+        while units:
+            unit = max(units, key=lambda u: (self.priority(u), -u.order))
+            cases = unit.cases()
+            for _ in range(self.slice_size):
+                if not cases:
+                    break
+                mutations, mutant = cases.pop()
+                unit.given += 1
+                if session._mutations_contain_duplicate(mutations):
+                    continue
+
+                session.fuzz_node = unit.node
+                unit.node.mutant = mutant
+                session.mutant_index = unit.given
+                session.total_mutant_index += 1
+                self._current = unit
+                yield MutationContext(message_path=unit.path, mutations={m.qualified_name: m for m in mutations})
+
+                if session._skip_current_node_after_current_test_case:
+                    session._skip_current_node_after_current_test_case = False
+                    for other in units:
+                        if other.path is unit.path:
+                            other.drop()
+                    break
+                elif session._skip_current_element_after_current_test_case:
+                    session._skip_current_element_after_current_test_case = False
+                    unit.drop()
+                    break
+            units = [u for u in units if u.remaining > 0]
+
+    def record(self, mutation_context, signals):
+        if self._current is None:
+            return
+        for signal in signals:
+            self._current.signals[signal] = self._current.signals.get(signal, 0) + 1
@@ -0,0 +1,95 @@
+"""Remember which payloads were already sent, to skip test cases that would send the same bytes again."""
+
+import hashlib
+import math
+
+
+class _BloomSlice:
+    """Fixed-size Bloom filter sized for `capacity` entries at `error_rate` false positives."""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.num_hashes = max(1, math.ceil(math.log2(1 / error_rate)))
+        self.num_bits = max(8, math.ceil(capacity * math.log(1 / error_rate) / math.log(2) ** 2))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, h1, h2):
+        # Enhanced double hashing (Dillinger and Manolios): plain h1 + i * h2 clusters when h2 is small modulo the size.
+        for i in range(self.num_hashes):
+            yield h1 % self.num_bits
+            h1 += h2
+            h2 += i
+
+    def __contains__(self, hashes):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(*hashes))
+
+    def add(self, hashes):
+        for p in self._positions(*hashes):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+class SentPayloadFilter:
+    """
+    Scalable Bloom filter over (message path, rendered payload) pairs.
+
+    The filter is made of slices, each one twice as large as the previous one and with half its false positive rate,
+    so that the overall rate stays below `error_rate` however many payloads are added (Almeida et al., "Scalable Bloom
+    Filters"). Slices stop growing at a quarter of `max_bytes`, and when they would use more than `max_bytes` the
+    oldest one is dropped: its payloads may be sent again, but memory stays bounded.
+
+    A false positive skips a test case whose payload was never sent; with the default rate, about one case in a
+    million.
+
+    Args:
+        initial_capacity (int): Payloads held by the first slice. Default 100000.
+        error_rate (float): Bound on the probability that a new payload is reported as already sent. Default 1e-6.
+        max_bytes (int): Memory bound of the bit arrays. Default 64 MiB.
+    """
+
+    def __init__(self, initial_capacity=100000, error_rate=1e-6, max_bytes=64 * 1024 * 1024):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.max_bytes = max_bytes
+        self._slices = []
+        self._next_capacity = initial_capacity
+        self._next_error_rate = error_rate / 2
+        self._add_slice()
+
+    def __len__(self):
+        return sum(s.count for s in self._slices)
+
+    @property
+    def num_bytes(self):
+        """Memory used by the bit arrays."""
+        return sum(len(s.bits) for s in self._slices)
+
+    @staticmethod
+    def _hashes(message_path, data):
+        digest = hashlib.blake2b(message_path.encode("utf-8") + b"\x00" + bytes(data), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+    def check_and_add(self, message_path, data):
+        """Add a payload. Return True if it was (probably) added before.
+
+        Args:
+            message_path (str): Name of the message path the payload is sent on.
+            data (bytes): Rendered payload.
+        """
+        hashes = self._hashes(message_path, data)
+        if any(hashes in s for s in self._slices):
+            return True
+        if self._slices[-1].count >= self._slices[-1].capacity:
+            self._add_slice()
+        self._slices[-1].add(hashes)
+        return False
+
+    def _add_slice(self):
+        new_slice = _BloomSlice(self._next_capacity, self._next_error_rate)
+        if len(new_slice.bits) * 4 <= self.max_bytes:
+            self._next_capacity *= 2
+        self._next_error_rate /= 2
+        self._slices.append(new_slice)
+        while len(self._slices) > 1 and self.num_bytes > self.max_bytes:
+            del self._slices[0]
@@ -1,15 +1,20 @@
+import collections
 import datetime
 import errno
 import itertools
 import logging
+import multiprocessing
 import os
 import pickle
 import socket
+import tempfile
 import threading
 import time
 import traceback
 import warnings
+import weakref
 import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from builtins import input
 from io import open
 import typing
@@ -23,6 +28,7 @@ from boofuzz import (
     constants,
     event_hook,
     exception,
+    feedback,
     helpers,
     pgraph,
     primitives,
@@ -30,15 +36,27 @@ from boofuzz import (
 )
 
 from boofuzz.loggers import fuzz_logger, fuzz_logger_curses, fuzz_logger_text, fuzz_logger_postgres
+from boofuzz.loggers.fuzz_logger_ring_buffer import FuzzLoggerRingBuffer
 from boofuzz.exception import BoofuzzFailure
-from boofuzz.monitors import CallbackMonitor
+from boofuzz.monitors import CallbackMonitor, MonitorWatcher
+from boofuzz.mutation import Mutation
 from boofuzz.mutation_context import MutationContext
 from boofuzz.protocol_session import ProtocolSession
+from boofuzz.protocol_session_reference import ProtocolSessionReference
 from boofuzz.web.app import app
 from boofuzz.primitives.static import Static
+from .campaign_planner import CampaignPlanner
 from .connection import Connection
+from .covering_array import covering_array
+from .nominal_schedule import AdaptiveNominalSchedule
+from .pacing import AimdPacer
+from .crash_bisection import RecentCase, shortest_crashing_sequence
+from .render_pool import RenderPool
+from .scheduler import SIGNAL_FAILURE, SIGNAL_NOVELTY, SIGNAL_RTO, SIGNAL_WARNING, StackOrderScheduler
+from .sent_payloads import SentPayloadFilter
 from .session_info import SessionInfo
-from .web_app import WebApp
+from .stats_segment import StatsSegmentWriter
+from .web_app import WebApp, serve_live_web_ui
 from .target import Target
 from boofuzz.connections import UDPSocketConnection
 
@@ -63,7 +81,7 @@ class Session(pgraph.Graph):
         session_filename (str): Filename to serialize persistent data to. Default None.
         index_start (int);      First test case of library round to run
         index_end (int);        Last test case index to run
-        sleep_time (float):     Time in seconds to sleep in between tests. Default 0.
+        sleep_time (float):     Time in seconds to sleep in between tests, unless a pacer is set. Default 0.
         restart_interval (int): Restart the target after n test cases, disable by setting to 0 (default).
         console_gui (bool):     Use curses to generate a static console screen similar to the webinterface. Has not been
                                 tested under Windows. Works only if fuzz_loggers and log_level_stdout are kept to None.
@@ -85,10 +103,14 @@ class Session(pgraph.Graph):
         web_port (int or None): Port for monitoring fuzzing campaign via a web browser. Set to None to disable the web
                                 app. Default 26000.
         keep_web_open (bool):     Keep the webinterface open after session completion. Default True.
+        web_ui_process (bool):    Serve the web interface from a separate process instead of a thread of the fuzzing
+                                  process. Live statistics are then published in a shared-memory stats segment
+                                  and the web interface never competes with the fuzzing loop. Default False.
         log_level_stdout (int): If fuzz_loggers is kept to None, a FuzzLoggerText to stdout will be created with this
                                 log level. See FuzzLoggerText for explanation on log levels.
         fuzz_loggers (list of ifuzz_logger.IFuzzLogger): For saving test data and results. Default Log to stdout with a
                                                          log level of 0.
+        async_logging (bool): Call the fuzz loggers from a worker thread instead of the fuzzing loop. Default False.
         fuzz_db_keep_only_n_pass_cases (int): Minimize disk usage by only saving passing test cases
                                               if they are in the n test cases preceding a failure or error.
                                               Set to 0 to save after every test case (high disk I/O!). Default 0.
@@ -116,6 +138,9 @@ class Session(pgraph.Graph):
                                 Defaults to ./boofuzz-results/{uniq_timestamp}.db
         db_name (str):          Name of database. Defaults to {uniq_timestamp}
         db_table_name (str | None): Name of table in database.
+        db_logging (bool):      Log the test cases to the database. False for sessions that only generate test cases
+                                (see :class:`CorpusExporter <boofuzz.CorpusExporter>`): no database nor table is
+                                created. Default True.
         campaign_folder (str):  Folder to store campaign files. Default None.
         web_address:            Address where's Boofuzz logger exposed. Default 'localhost'
 
@@ -133,7 +158,8 @@ class Session(pgraph.Graph):
 
         nominal_recv_test (typing.Callable[['Session'], bool] | None):   Test function after nominal data test.
 
-        seconds_to_wait_after_restart (int):    Time in seconds to wait after a target restart. Default 3.
+        seconds_to_wait_after_restart (int):    Time in seconds to wait after a target restart, for targets without
+                                                readiness probe (see :class:`Target`). Default 3.
 
         rto_alpha_value (float) : See the :meth:`Request.calculate_rto` method for more details.
 
@@ -143,6 +169,73 @@ class Session(pgraph.Graph):
             num_mutations will return None if this value is None or greater than 1, as the number of mutations is typically very large when using combinatorial fuzzing.
             Set to 1 for "simple" fuzzing.
 
+        covering_arrays (bool): With max_depth > 1, build the test cases of depth t from a t-wise covering array over
+            the fuzzable elements of each request (see :class:`CoveringArray <boofuzz.sessions.CoveringArray>`)
+            instead of every combination of t mutations. Rows are built as the test cases are sent: until an array is
+            complete, num_mutations counts a lower bound of its rows. Default False.
+
+        covering_array_levels (int): Number of mutations of each element combined by the covering arrays: the first
+            ones, which are library values for strings and bytes. Default 16.
+
+        response_fingerprinter (feedback.ResponseFingerprinter | None): Black-box feedback. Responses to fuzzed
+            requests are fingerprinted, and mutated values giving a request a response it never gave before get extra
+            energy in the feedback corpus used by random_mutation rounds. Default None: no response feedback.
+
+        scheduler (StackOrderScheduler | EnergyScheduler | None): Order in which each round fuzzes the elements of the
+            requests. Default None: StackOrderScheduler, every element in stack order.
+
+        time_budget (float | None): Wall-clock budget of fuzz_indefinitely, in seconds. A CampaignPlanner splits it
+            across rounds and shrinks per-element budgets to fit, and the campaign stops with a recap at the deadline.
+            Default None: no deadline.
+
+        skip_duplicate_payloads (bool): Render each test case before running it, and skip it if the same bytes were
+            already sent on the same message path during the session (see SentPayloadFilter). Skipped cases keep their
+            index and are logged as such. Default False.
+
+        cases_per_prefix (int): Number of consecutive test cases of the same message path sent over one connection.
+            Above 1, the connection, the pre_send callbacks and the messages leading to the fuzzed one are set up once
+            and each following case only sends its fuzzed message, until the message path changes, the limit is
+            reached, a test case fails or the target is restarted; then the whole path is replayed. Cases sent on a
+            shared prefix log the case that set it up: replaying from that case with the same option sends the same
+            bytes on the same connection. Default 1: every test case replays the whole message path.
+
+        monitor_interval (float | None): Check the target's monitors from background threads every monitor_interval
+            seconds instead of calling their post_send after each test case (see MonitorWatcher). Each test case then
+            only reads the failures queued since the previous one, and a failure is reported on the case during which
+            it was noticed, with the range of cases run since the last good check. Callback and coverage monitors,
+            which work per test case, are still called after each case. Default None: no background checks.
+
+        render_ahead (bool): Render the fuzzed message of each test case in a background thread as soon as the case
+            starts, so that CPU-heavy renders overlap with opening the connection, the pre_send callbacks and the
+            round trips of the messages leading to the fuzzed one. Messages are still rendered when sent if they
+            refer to a ProtocolSessionReference, if their edge has a callback, if they are fragmented or if they also
+            appear earlier in the message path. pre_send and earlier callbacks must not change the fuzzed request.
+            Default False.
+
+        render_workers (int): Number of worker processes generating and rendering the depth 1 test cases of each round
+            (see RenderPool). The workers are forked when the round starts and write to shared-memory rings read by
+            the fuzzing loop; test cases, their order and their indexes are the same as with serial generation.
+            Needs fork (not on Windows) and the StackOrderScheduler. Default 0: generate in the fuzzing process.
+
+        bisect_failures (int): Keep the last bisect_failures test cases sent since the target was started, and when a
+            failure is detected, find which of them caused it: the target is restarted and the cases are sent again,
+            the fuzzed messages byte for byte, in shorter and shorter sequences (see shortest_crashing_sequence).
+            Crash counts and thresholds then apply to the element fuzzed by the culprit, and failure_attributions maps
+            the failed test case to the culprit and the cases needed after it. Each failure costs up to
+            2 + log2(n) + n restarts. Default 0: failures are attributed to the test case during which they are noticed.
+
+        pacer (AimdPacer): Rate limiter waited on before each send, instead of a fixed sleep_time. Its rate rises
+            after each test case and nominal test without trouble, and drops on RTO exceeded warnings, connection
+            resets and aborts, and failed nominal tests. The current rate is shown in the web interface. Default None:
+            send as fast as the target answers.
+
+        nominal_schedule (AdaptiveNominalSchedule): Run the nominal test when this schedule says so instead of every
+            nominal_test_interval test cases: more often after target warnings, RTO overruns and restarts, less and
+            less often while the target stays healthy. When a nominal test fails, the test cases sent since the last
+            passing one are sent again to a restarted target, each replay followed by the nominal test, to find the
+            shortest sequence that breaks it again (see shortest_crashing_sequence); failure_attributions records it.
+            Default None: every nominal_test_interval test cases.
+
     .. versionchanged:: 0.4.2
        This class has been moved into the sessions subpackage. The full path is now boofuzz.sessions.session.Session.
     """
@@ -156,6 +249,8 @@ class Session(pgraph.Graph):
             restart_interval=0,
             web_port=constants.DEFAULT_WEB_UI_PORT,
             keep_web_open=True,
+            web_ui_process=False,
+            async_logging=False,
             console_gui=False,
             crash_threshold_request=12,
             crash_threshold_element=3,
@@ -185,6 +280,7 @@ class Session(pgraph.Graph):
             db_filename=None,
             db_name: str = None,
             db_table_name: str | None = None,
+            db_logging: bool = True,
             campaign_folder=None,
             seed_index: int = 0,
             round_type: str = "library",
@@ -195,6 +291,19 @@ class Session(pgraph.Graph):
             nominal_recv_test: typing.Callable[['Session'], bool] | None = None,
             seconds_to_wait_after_restart: int = 3,
             max_depth: int = 1,
+            covering_arrays: bool = False,
+            covering_array_levels: int = 16,
+            response_fingerprinter: feedback.ResponseFingerprinter | None = None,
+            scheduler: StackOrderScheduler | None = None,
+            time_budget: float | None = None,
+            skip_duplicate_payloads: bool = False,
+            cases_per_prefix: int = 1,
+            monitor_interval: float | None = None,
+            render_ahead: bool = False,
+            render_workers: int = 0,
+            bisect_failures: int = 0,
+            pacer: AimdPacer | None = None,
+            nominal_schedule: AdaptiveNominalSchedule | None = None,
 
     ):
         self._ignore_connection_reset = ignore_connection_reset
@@ -213,6 +322,7 @@ class Session(pgraph.Graph):
         self.restart_interval = restart_interval
         self.web_port = web_port
         self._keep_web_open = keep_web_open
+        self._web_ui_process = web_ui_process
         self.console_gui = console_gui
         self._crash_threshold_node = crash_threshold_request
         self._crash_threshold_element = crash_threshold_element
@@ -251,14 +361,54 @@ class Session(pgraph.Graph):
 
         self._db_table_name = db_table_name
 
-        self._db_logger = fuzz_logger_postgres.FuzzLoggerPostgres(
-            db_name=self._db_name, db_table_name=self._db_table_name, num_log_cases=fuzz_db_keep_only_n_pass_cases
-        )
+        if db_logging:
+            self._db_logger = fuzz_logger_postgres.FuzzLoggerPostgres(
+                db_name=self._db_name, db_table_name=self._db_table_name, num_log_cases=fuzz_db_keep_only_n_pass_cases
+            )
+            fuzz_loggers = [self._db_logger] + fuzz_loggers
+        else:
+            self._db_logger = None
         self.campaign_folder = campaign_folder
 
+        # Values that reached new coverage or responses, mutated by the random_mutation rounds (see feedback.Corpus).
+        self.feedback_corpus = feedback.Corpus(
+            path=os.path.join(campaign_folder, constants.FEEDBACK_CORPUS_NAME) if campaign_folder is not None else None
+        )
+        self.current_mutation_context: MutationContext | None = None
+        self.response_fingerprinter = response_fingerprinter
+        self.response_novelty = feedback.NoveltyTable()
+        self.scheduler = scheduler if scheduler is not None else StackOrderScheduler()
+        self.case_signals: set[str] = set()  # Feedback signals of the current test case, for the scheduler
+        self.planner = CampaignPlanner(time_budget) if time_budget else None
+        self.sent_payloads = SentPayloadFilter() if skip_duplicate_payloads else None
+        self.num_cases_skipped_duplicate = 0
+        self.cases_per_prefix = cases_per_prefix
+        self._shared_prefix = None  # [message path key, index of the case that set it up, cases sent on it]
+        self.monitor_interval = monitor_interval
+        self._case_starts = collections.deque(maxlen=4096)  # (time.monotonic(), index) of the latest test cases
+        self.render_ahead = render_ahead
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") if render_ahead else None
+        self._rendered_ahead = None  # (MutationContext, Future of its fuzzed message)
+        self._renders_lazily = {}  # request name -> it refers to a ProtocolSessionReference
+        self.render_workers = render_workers
+        self.bisect_failures = bisect_failures
+        self._recent_cases = collections.deque(maxlen=bisect_failures) if bisect_failures > 0 else None
+        self._case_payloads = None  # sends of the current fuzzed message, kept for bisect_failures
+        self.failure_attributions = {}  # failed test case index -> indexes of the cases found to cause the failure
+        self.pacer = pacer
+        self.nominal_schedule = nominal_schedule
+
         self._crash_filename = "boofuzz-crash-bin-{0}".format(get_datetime())
 
-        self._fuzz_data_logger = fuzz_logger.FuzzLogger(fuzz_loggers=[self._db_logger] + fuzz_loggers)
+        # In-memory log of the current test case, pushed to the in-process web interface without database queries.
+        if self.web_port is not None and not self._web_ui_process:
+            self.live_log = FuzzLoggerRingBuffer()
+            fuzz_loggers = fuzz_loggers + [self.live_log]
+        else:
+            self.live_log = None
+
+        self._fuzz_data_logger = fuzz_logger.FuzzLogger(fuzz_loggers=fuzz_loggers, asynchronous=async_logging)
+        self._db_reader = None
         self._check_data_received_each_request = check_data_received_each_request
         self._receive_data_after_each_request = receive_data_after_each_request
         self._receive_data_after_fuzz = receive_data_after_fuzz
@@ -268,7 +418,10 @@ class Session(pgraph.Graph):
         self.end_time = None
         self.cumulative_pause_time = 0
 
-        if self.web_port is not None:
+        self._stats_segment = None
+        self._close_stats_segment = None
+        self.web_interface_process = None
+        if self.web_port is not None and not self._web_ui_process:
             self.web_interface_thread = self.build_webapp_thread(port=self.web_port, address=self.web_address)
 
         if pre_send_callbacks is None:
@@ -301,6 +454,7 @@ class Session(pgraph.Graph):
         self.total_num_mutations = 0  # total available protocol mutations (before combining multiple mutations)
         self.total_mutant_index = 0  # index within all mutations iterated through, including skipped mutations
         self.mutant_index = 0  # index within currently mutating element
+        self.num_mutations_element = 0  # number of mutations of the request currently being fuzzed
         self.num_cases_actually_fuzzed = 0
         self.fuzz_node: Request | None = None  # Request object currently being fuzzed
         self.current_test_case_name = ""
@@ -313,6 +467,8 @@ class Session(pgraph.Graph):
         self.crashing_primitives = {}
         self.on_failure = event_hook.EventHook()
         self.max_depth = max_depth
+        self.covering_arrays = covering_arrays
+        self.covering_array_levels = covering_array_levels
 
         # import settings if they exist.
         self.import_file()
@@ -403,9 +559,9 @@ class Session(pgraph.Graph):
                                 f'It has to be a Request containing only Static primitive or a callback function.'
                                 f'{data}')
 
-    def nominal_test(self) -> None:
+    def nominal_test(self) -> bool:
         """
-        This function is call each time the nominal_test_interval is reach.
+        This function is call each time the nominal_test_interval is reach, or when the nominal_schedule says so.
 
         It is responsible for :
             * Open the target's connection
@@ -413,16 +569,50 @@ class Session(pgraph.Graph):
             * Detect a failure
             * Close the target's connection
             * Log everything
+            * With a nominal_schedule, adapt the interval and re-check the latest test cases after a failure
+
+        Returns:
+            bool: False if the nominal test failed.
         """
         if not self._nominal_data:
-            return
+            return True
 
-        self._fuzz_data_logger.open_test_step(f"nominal test interval of {self.nominal_test_interval} reached")
+        if self.nominal_schedule is not None:
+            self._fuzz_data_logger.open_test_step(
+                f"nominal test after {self.nominal_schedule.cases_since_probe} test cases"
+            )
+        else:
+            self._fuzz_data_logger.open_test_step(f"nominal test interval of {self.nominal_test_interval} reached")
         self.target_to_use = 0
         target = self.targets[0]
         self._open_connection_keep_trying(target)
         # pre
         self._pre_send(target)
+        self._send_nominal_data(target)
+        # post
+
+        failure_already_detected = False
+        if not self.nominal_recv_test(self):
+            failure_already_detected = True
+            self._fuzz_data_logger.log_fail(f'Fail during nominal test. {self.total_mutant_index=}')
+            self._report_congestion("nominal test failed")
+
+        crashed = self._check_for_passively_detected_failures(
+            target, failure_already_detected=failure_already_detected
+        )
+        if not self._reuse_target_connection:
+            target.close()
+        self._adapt_pace()
+        healthy = not failure_already_detected and not crashed
+        if self.nominal_schedule is not None:
+            suspects = self.nominal_schedule.probe_done(healthy)
+            if suspects:
+                self._recheck_after_nominal_failure(target, suspects)
+        self._fuzz_data_logger.open_test_step("end of nominal test")
+        return healthy
+
+    def _send_nominal_data(self, target: Target):
+        """Send the nominal requests and call the nominal callbacks, in order."""
         for data in self._nominal_data:
             if isinstance(data, Request):
                 self._fuzz_data_logger.log_info(f'Transmit nominal data {data.name}')
@@ -438,17 +628,53 @@ class Session(pgraph.Graph):
             else:
                 self._fuzz_data_logger.log_info(f'Callback nominal data {data}')
                 data(target=target, fuzz_data_logger=self._fuzz_data_logger, session=self)
-        # post
 
-        failure_already_detected = False
-        if not self.nominal_recv_test(self):
-            failure_already_detected = True
-            self._fuzz_data_logger.log_fail(f'Fail during nominal test. {self.total_mutant_index=}')
+    def _recheck_after_nominal_failure(self, target: Target, cases):
+        """Find which of the test cases sent since the last passing nominal test broke the target.
 
-        self._check_for_passively_detected_failures(target, failure_already_detected=failure_already_detected)
-        if not self._reuse_target_connection:
-            target.close()
-        self._fuzz_data_logger.open_test_step("end of nominal test")
+        Args:
+            target (Target): Target that failed the nominal test, restarted before each replay and afterwards.
+            cases (list of RecentCase): Test cases sent since the last passing nominal test, in order.
+        """
+        self._fuzz_data_logger.open_test_step(
+            "Re-checking test cases #{0} to #{1} with the nominal test".format(cases[0].index, cases[-1].index)
+        )
+        sequence = self._shortest_failing_sequence(
+            cases, lambda replayed: self._nominal_fails_after(target, replayed)
+        )
+        self._restart_target(target)
+        if sequence is None:
+            self._fuzz_data_logger.log_info(
+                "Nominal test failure not reproduced by replaying test cases #{0} to #{1}".format(
+                    cases[0].index, cases[-1].index
+                )
+            )
+            return
+        self.failure_attributions[self.total_mutant_index] = [case.index for case in sequence]
+        self._fuzz_data_logger.log_info(
+            "Nominal test failure attributed to test case #{0} ({1}), reproduced by replaying test cases {2}".format(
+                sequence[0].index, sequence[0].name, ", ".join("#{0}".format(case.index) for case in sequence)
+            )
+        )
+
+    def _nominal_fails_after(self, target: Target, cases):
+        """Replay test cases to the restarted target, then run the nominal test. Return True if anything failed."""
+        if self._replay_crashes(target, cases):
+            return True
+        try:
+            target.open()
+            try:
+                self._pre_send(target)
+                self._send_nominal_data(target)
+                healthy = self.nominal_recv_test(self)
+            finally:
+                if not self._reuse_target_connection:
+                    target.close()
+        except (BoofuzzFailure, exception.BoofuzzTargetConnectionFailedError) as e:
+            self._fuzz_data_logger.log_info("Nominal test failed: {0}".format(e))
+            return True
+        self._fuzz_data_logger.log_info("Nominal test passed." if healthy else "Nominal test failed.")
+        return not healthy
 
     @property
     def netmon_results(self):
@@ -489,6 +715,14 @@ class Session(pgraph.Graph):
         if self._callback_monitor not in target.monitors:
             target.monitors.append(self._callback_monitor)
 
+        if self.monitor_interval:
+            target.monitors = [
+                MonitorWatcher(monitor, self.monitor_interval, target=target, session=self)
+                if monitor.watchable and not isinstance(monitor, MonitorWatcher)
+                else monitor
+                for monitor in target.monitors
+            ]
+
         # Give its parent target to the target's socket connection, for logging purposes.
         target.get_connection().parent_target = target
         # Give to target his parent session
@@ -655,7 +889,7 @@ class Session(pgraph.Graph):
         Returns:
             int: Total number of mutations in this session.
         """
-        if self.max_depth is None or self.max_depth > 1:
+        if self.max_depth is None or (self.max_depth > 1 and not self.covering_arrays):
             self.total_num_mutations = 0
             return self.total_num_mutations
 
@@ -682,6 +916,9 @@ class Session(pgraph.Graph):
         for edge in self.edges_from(this_node.id):
             next_node = self.nodes[edge.dst]
             self.total_num_mutations += next_node.get_num_mutations()
+            if self.covering_arrays:
+                for depth in range(2, self.max_depth + 1):
+                    self.total_num_mutations += self._covering_array(next_node, depth).estimated_len()
 
             if edge.src != self.root.id:
                 path.append(edge)
@@ -698,15 +935,22 @@ class Session(pgraph.Graph):
         """
         If that pause flag is raised, enter an endless loop until it is lowered.
         """
+        self._sync_pause_flag()
         if self.is_paused:
             pause_start = time.time()
             while 1:
+                self._sync_pause_flag()
                 if self.is_paused:
                     time.sleep(1)
                 else:
                     break
             self.cumulative_pause_time += time.time() - pause_start
 
+    def _sync_pause_flag(self):
+        """Pick up the pause flag toggled by an out-of-process web interface."""
+        if self._stats_segment is not None:
+            self.is_paused = self._stats_segment.paused
+
     def _check_for_passively_detected_failures(self, target:Target, failure_already_detected=False):
         """Check for and log passively detected failures. Return True if any found.
 
@@ -728,7 +972,11 @@ class Session(pgraph.Graph):
             # monitors that did not detect a crash as supplemental information.
             finished_monitors = []
             for monitor in target.monitors:
-                if not monitor.post_send(target=target, fuzz_data_logger=self._fuzz_data_logger, session=self):
+                if isinstance(monitor, MonitorWatcher):
+                    alive = self._read_monitor_events(monitor)
+                else:
+                    alive = monitor.post_send(target=target, fuzz_data_logger=self._fuzz_data_logger, session=self)
+                if not alive:
                     has_crashed = True
                     self._fuzz_data_logger.log_fail(
                         f"{str(monitor)} detected crash on test case #{self.total_mutant_index}: {monitor.get_crash_synopsis()}"
@@ -743,11 +991,48 @@ class Session(pgraph.Graph):
                     if len(synopsis) > 0:
                         self._fuzz_data_logger.log_fail(
                             "{0} provided additional information for crash on #{1}: {2}".format(
-                                str(monitor), self.total_mutant_index, monitor.get_crash_synopsis()
+                                str(monitor), self.total_mutant_index, synopsis
                             )
                         )
         return has_crashed
 
+    def _read_monitor_events(self, watcher):
+        """Log what a monitor watcher found since the previous test case. Return False if it noticed a failure.
+
+        Args:
+            watcher (MonitorWatcher): Monitor checked in the background.
+        """
+        alive = True
+        for event in watcher.events():
+            for name, args, kwargs in event.records:
+                getattr(self._fuzz_data_logger, name)(*args, **kwargs)
+            if event.failed:
+                alive = False
+                watcher.last_crash_synopsis = event.synopsis
+                cases = self._cases_between(event.last_ok, event.time)
+                if cases:
+                    self._fuzz_data_logger.log_info(
+                        "{0} noticed the failure in the background; it happened during test cases #{1} to #{2}".format(
+                            watcher, cases[0], cases[-1]
+                        )
+                    )
+        return alive
+
+    def _cases_between(self, start, end):
+        """Indexes of the test cases that ran between two time.monotonic() values."""
+        cases = []
+        for i, (case_start, index) in enumerate(self._case_starts):
+            next_start = self._case_starts[i + 1][0] if i + 1 < len(self._case_starts) else float("inf")
+            if case_start <= end and next_start >= start:
+                cases.append(index)
+        return cases
+
+    def _stop_monitor_watchers(self):
+        for target in self.targets:
+            for monitor in target.monitors:
+                if isinstance(monitor, MonitorWatcher):
+                    monitor.stop()
+
     def _get_monitor_data(self, target):
         """Query monitors for any data they may want to add to this test case.
 
@@ -771,6 +1056,7 @@ class Session(pgraph.Graph):
         """Process any failures in crash_synopses.
 
         If crash_synopses contains any entries, perform these failure-related actions:
+         - find the test case that caused it, if bisect_failures is set
          - log failure summary if needed
          - save failures to self.monitor_results (for website)
          - exhaust node if crash threshold is reached
@@ -786,11 +1072,19 @@ class Session(pgraph.Graph):
         """
         crash_synopses = self._fuzz_data_logger.failed_test_cases.get(self._fuzz_data_logger.most_recent_test_id, [])
         if len(crash_synopses) > 0:
+            crash_synopses = list(crash_synopses)
+            fuzz_node, mutant = self.fuzz_node, self.fuzz_node.mutant
+            if self._recent_cases:
+                culprit = self._bisect_failure(target)
+                if culprit is not None and culprit.index != self.total_mutant_index:
+                    fuzz_node, mutant = culprit.fuzz_node, culprit.mutant
+                    crash_synopses.append("Caused by test case #{0}: {1}".format(culprit.index, culprit.name))
+
             self._fuzz_data_logger.open_test_step("Failure summary")
 
             # retrieve the primitive that caused the crash and increment it's individual crash count.
-            self.crashing_primitives[self.fuzz_node.mutant] = self.crashing_primitives.get(self.fuzz_node.mutant, 0) + 1
-            self.crashing_primitives[self.fuzz_node] = self.crashing_primitives.get(self.fuzz_node, 0) + 1
+            self.crashing_primitives[mutant] = self.crashing_primitives.get(mutant, 0) + 1
+            self.crashing_primitives[fuzz_node] = self.crashing_primitives.get(fuzz_node, 0) + 1
 
             # print crash synopsis
             if len(crash_synopses) > 1:
@@ -806,6 +1100,7 @@ class Session(pgraph.Graph):
             # Skip it
             if (
                     self.fuzz_node.mutant is not None
+                    and fuzz_node is self.fuzz_node
                     and self.crashing_primitives[self.fuzz_node] >= self._crash_threshold_node
             ):
                 skipped = max(0, self.fuzz_node.get_num_mutations() - self.mutant_index)
@@ -817,6 +1112,7 @@ class Session(pgraph.Graph):
                 self.mutant_index += skipped
             elif (
                     self.fuzz_node.mutant is not None
+                    and mutant is self.fuzz_node.mutant
                     and self.crashing_primitives[self.fuzz_node.mutant] >= self._crash_threshold_element
             ):
                 if not isinstance(self.fuzz_node.mutant, primitives.Group) and not isinstance(
@@ -835,6 +1131,112 @@ class Session(pgraph.Graph):
         else:
             return False
 
+    def _bisect_failure(self, target):
+        """Find which of the latest test cases caused the failure of the current one, see the bisect_failures option.
+
+        Args:
+            target (Target): Failed target, restarted before each replay.
+
+        Returns:
+            RecentCase: The culprit, or None if replaying the cases did not make the target fail again.
+        """
+        cases = list(self._recent_cases) + [self._recent_case(self.current_mutation_context)]
+        self._fuzz_data_logger.open_test_step(
+            "Bisecting the failure over test cases #{0} to #{1}".format(cases[0].index, cases[-1].index)
+        )
+        self._end_prefix_sharing(target)
+        sequence = self._shortest_failing_sequence(cases, lambda replayed: self._replay_crashes(target, replayed))
+        if sequence is None:
+            self._fuzz_data_logger.log_info(
+                "Failure not reproduced by replaying test cases #{0} to #{1}: left on test case #{1}".format(
+                    cases[0].index, cases[-1].index
+                )
+            )
+            return None
+        self.failure_attributions[self.total_mutant_index] = [case.index for case in sequence]
+        self._fuzz_data_logger.log_info(
+            "Failure attributed to test case #{0} ({1}), reproduced by replaying test cases {2}".format(
+                sequence[0].index, sequence[0].name, ", ".join("#{0}".format(case.index) for case in sequence)
+            )
+        )
+        return sequence[0]
+
+    def _shortest_failing_sequence(self, cases, fails):
+        """Run shortest_crashing_sequence over replays of test cases, and set the session back to the current case.
+
+        Args:
+            cases (list of RecentCase): Test cases, in the order they were sent.
+            fails (callable): Called with a sequence of cases, replays them and returns True if the target failed.
+        """
+        fuzz_node = self.fuzz_node
+        mutants = {case.fuzz_node: case.fuzz_node.mutant for case in cases}
+        self._case_payloads = None
+        try:
+            return shortest_crashing_sequence(cases, fails)
+        finally:
+            self.fuzz_node = fuzz_node
+            for node, mutant in mutants.items():
+                node.mutant = mutant
+            self.continue_case = True
+
+    def _recent_case(self, mutation_context):
+        """Return the current test case as a RecentCase, to send it again when bisecting a failure."""
+        return RecentCase(
+            index=self.total_mutant_index,
+            name=self.current_test_case_name,
+            fuzz_node=self.fuzz_node,
+            mutant=self.fuzz_node.mutant,
+            message_path=list(mutation_context.message_path),
+            mutations=dict(mutation_context.mutations),
+            payloads=list(self._case_payloads or []),
+        )
+
+    def _replay_crashes(self, target, cases):
+        """Restart the target, send test cases again, one connection each, and return True if the target failed.
+
+        Failures are checked after each case, with the monitors' post_send. They are not logged as failures of the
+        current test case.
+
+        Args:
+            target (Target): Target to replay the cases to.
+            cases (list of RecentCase): Test cases, in order.
+        """
+        self._fuzz_data_logger.open_test_step(
+            "Bisection: replaying test cases {0}".format(", ".join("#{0}".format(case.index) for case in cases))
+        )
+        self._restart_target(target)
+        for case in cases:
+            self.fuzz_node = case.fuzz_node
+            self.fuzz_node.mutant = case.mutant
+            self.continue_case = True
+            mutation_context = MutationContext(
+                message_path=case.message_path, mutations=case.mutations, payloads=case.payloads
+            )
+            try:
+                target.open()
+                try:
+                    self._pre_send(target)
+                    self._transmit_prefix(target, mutation_context)
+                    self._transmit_fuzzed_message(target, mutation_context)
+                finally:
+                    if not self._reuse_target_connection:
+                        target.close()
+            except (BoofuzzFailure, exception.BoofuzzTargetConnectionFailedError) as e:
+                self._fuzz_data_logger.log_info("Target failed on test case #{0}: {1}".format(case.index, e))
+                return True
+            for monitor in target.monitors:
+                if isinstance(monitor, MonitorWatcher):
+                    monitor.check()
+                if not monitor.post_send(target=target, fuzz_data_logger=self._fuzz_data_logger, session=self):
+                    self._fuzz_data_logger.log_info(
+                        "{0} detected a failure after test case #{1}: {2}".format(
+                            monitor, case.index, monitor.get_crash_synopsis()
+                        )
+                    )
+                    return True
+        self._fuzz_data_logger.log_info("No failure.")
+        return False
+
     def register_post_test_case_callback(self, method):
         """Register a post-test case method.
 
@@ -876,7 +1278,7 @@ class Session(pgraph.Graph):
         self._fuzz_data_logger.log_info("No post_send callback registered.")
 
     # noinspection PyMethodMayBeStatic
-    def _pre_send(self, target: Target):
+    def _pre_send(self, target: Target, shared_prefix=False):
         """
         Execute custom methods to run prior to each fuzz request. The order of events is as follows::
 
@@ -886,11 +1288,17 @@ class Session(pgraph.Graph):
 
         Args:
             target (session.target): Target we are sending data to
+            shared_prefix (bool): The test case reuses the connection of the previous one: skip the pre_send
+                callbacks, which set up that connection, and only run the monitors.
         """
+        if self.monitor_interval:
+            self._case_starts.append((time.monotonic(), self.total_mutant_index))
 
         for monitor in target.monitors:
+            if shared_prefix and isinstance(monitor, CallbackMonitor):
+                continue
             try:
-                self._fuzz_data_logger.open_test_step("Monitor {}.pre_send()".format(str(monitor)))
+                self._fuzz_data_logger.open_test_step(lambda: "Monitor {}.pre_send()".format(str(monitor)))
                 monitor.pre_send(target=target, fuzz_data_logger=self._fuzz_data_logger, session=self)
             except Exception as e:
                 ...
@@ -931,10 +1339,7 @@ class Session(pgraph.Graph):
             for monitor in target.monitors:
                 self._fuzz_data_logger.log_info("Restarting target process using {}".format(monitor.__class__.__name__))
                 if monitor.restart_target(target=target, fuzz_data_logger=self._fuzz_data_logger, session=self):
-                    # TODO: doesn't this belong in the process monitor?
-                    self._fuzz_data_logger.log_info(
-                        f"Giving the process {self.seconds_to_wait_after_restart} seconds to settle in")
-                    time.sleep(self.seconds_to_wait_after_restart)
+                    self._wait_until_ready(target, self.seconds_to_wait_after_restart)
                     restarted = True
                     break
 
@@ -943,20 +1348,138 @@ class Session(pgraph.Graph):
                 monitor.post_start_target(target=self.targets[self.target_to_use],
                                           fuzz_data_logger=self._fuzz_data_logger, session=self)
         else:
-            self._fuzz_data_logger.log_info(
-                "No reset handler available... sleeping for {} seconds".format(self.restart_sleep_time)
-            )
-            time.sleep(self.restart_sleep_time)
+            self._fuzz_data_logger.log_info("No reset handler available...")
+            self._wait_until_ready(target, self.restart_sleep_time)
 
         # pass specified target parameters to the PED-RPC server to re-establish connections.
         target.monitors_alive()
 
+        if self._recent_cases:
+            # The test cases sent before the restart cannot be the cause of the next failures.
+            self._recent_cases.clear()
+        if self.nominal_schedule is not None:
+            self.nominal_schedule.restarted()
+
+    def _wait_until_ready(self, target: Target, seconds: float):
+        """Wait for the target to be ready after a restart: poll its readiness probe, or else sleep `seconds`.
+
+        Args:
+            target (Target): Restarted target.
+            seconds (float): Time to sleep when the target has no readiness probe.
+        """
+        if target.readiness_probe is None:
+            self._fuzz_data_logger.log_info(f"Giving the target {seconds} seconds to settle in")
+            time.sleep(seconds)
+            return
+        start = time.monotonic()
+        attempts = target.wait_until_ready()
+        if attempts:
+            self._fuzz_data_logger.log_info(
+                "Target ready after {0:.3f}s ({1} probes)".format(time.monotonic() - start, attempts)
+            )
+        else:
+            self._fuzz_data_logger.log_info(
+                "Target still not ready after {0}s, going on".format(target.readiness_probe.timeout)
+            )
+
     def server_init(self):
         """Called by fuzz() to initialize variables, web interface, etc."""
-        if self.web_port is not None:
-            if not self.web_interface_thread.is_alive():
-                # spawn the web interface.
-                self.web_interface_thread.start()
+        if self.web_port is None:
+            return
+        if self._web_ui_process:
+            if self.web_interface_process is None or not self.web_interface_process.is_alive():
+                self.web_interface_process = self.build_webapp_process(port=self.web_port, address=self.web_address)
+                self.web_interface_process.start()
+        elif not self.web_interface_thread.is_alive():
+            # spawn the web interface.
+            self.web_interface_thread.start()
+
+    def build_webapp_process(self, port=constants.DEFAULT_WEB_UI_PORT, address=constants.DEFAULT_WEB_UI_ADDRESS):
+        """
+        Create the stats segment and the process serving the web interface from it.
+        """
+        if self._stats_segment is None:
+            folder = self.campaign_folder if self.campaign_folder is not None else tempfile.gettempdir()
+            self._stats_segment = StatsSegmentWriter(
+                os.path.join(folder, "{0}-{1}".format(self._db_name, constants.STATS_SEGMENT_NAME))
+            )
+            self._stats_segment.paused = self.is_paused
+            self._publish_stats()
+            # The web interface outlives fuzz(): the segment goes away with the session, or when the user closes it.
+            self._close_stats_segment = weakref.finalize(self, self._stats_segment.close, remove=True)
+
+        # spawn rather than fork: the child must not inherit the database connection nor the fuzzing threads.
+        process = multiprocessing.get_context("spawn").Process(
+            target=serve_live_web_ui,
+            kwargs={
+                "stats_segment_path": self._stats_segment.path,
+                "db_name": self._db_name,
+                "db_table_name": self._db_table_name,
+                "web_port": port,
+                "web_address": address,
+            },
+            name="fuzzungus-web",
+            daemon=True,
+        )
+        self._fuzz_data_logger.log_info("Web interface process serving http://%s:%d" % (address, port))
+        return process
+
+    def _stop_webapp_process(self):
+        """Stop the web interface process, if any, then close and remove its stats segment."""
+        if self.web_interface_process is not None:
+            self.web_interface_process.terminate()
+            self.web_interface_process.join()
+            self.web_interface_process = None
+        if self._stats_segment is not None:
+            self._close_stats_segment()
+            self._stats_segment = None
+
+    def _publish_stats(self):
+        """Publish the live statistics in the stats segment, if the web interface runs in its own process."""
+        if self._stats_segment is None:
+            return
+        self._stats_segment.publish(
+            total_mutant_index=self.total_mutant_index,
+            total_num_mutations=self.total_num_mutations,
+            mutant_index=self.mutant_index,
+            num_mutations_element=self.num_mutations_element,
+            num_failures=len(self.monitor_results),
+            start_time=self.start_time,
+            runtime=self.runtime,
+            exec_speed=self.exec_speed if self.runtime > 0 else 0,
+            current_element=self.fuzz_node.name if self.fuzz_node is not None else "",
+            current_test_case_name=self.current_test_case_name,
+            send_rate=self.pacer.rate if self.pacer is not None else None,
+        )
+
+    def current_run_stats(self):
+        """Return the live statistics displayed by the web interface.
+
+        Only cached counters are read, so the web interface never triggers a mutation count.
+        """
+        return {
+            "is_paused": self.is_paused,
+            "current_index": self.total_mutant_index,
+            "num_mutations": self.total_num_mutations,
+            "current_index_element": self.mutant_index,
+            "num_mutations_element": self.num_mutations_element,
+            "current_element": self.fuzz_node.name if self.fuzz_node is not None else None,
+            "current_test_case_name": self.current_test_case_name,
+            "runtime": self.runtime,
+            "exec_speed": self.exec_speed,
+            "send_rate": self.pacer.rate if self.pacer is not None else None,
+        }
+
+    def failure_summary(self, limit):
+        """Return the number of failed test cases, and a map of test case indexes to their failures for the first
+        `limit` failures, as displayed by the web interface."""
+        failures, num_reasons = {}, 0
+        for index, reasons in list(itertools.islice(self.monitor_results.items(), limit)):
+            if num_reasons >= limit:
+                break
+            failures[index] = reasons[: limit - num_reasons]
+            num_reasons += len(failures[index])
+        return len(self.monitor_results), failures
 
     def _callback_current_node(self, node, edge, test_case_context):
         """Execute callback preceding current node.
@@ -973,7 +1496,7 @@ class Session(pgraph.Graph):
 
         # if the edge has a callback, process it. the callback has the option to render the node, modify it and return.
         if edge.callback:
-            self._fuzz_data_logger.open_test_step("Callback function '{0}'".format(edge.callback.__name__))
+            self._fuzz_data_logger.open_test_step(lambda: "Callback function '{0}'".format(edge.callback.__name__))
             data = edge.callback(
                 self.targets[self.target_to_use],
                 self._fuzz_data_logger,
@@ -997,15 +1520,35 @@ class Session(pgraph.Graph):
             mutation_context (MutationContext): Current mutation context.
         """
 
-        if node.fragmentation is None:
+        if transmit_type == "fuzz" and mutation_context.payloads is not None:
+            # Replay: send the stored fragments as they were, even empty ones.
+            for data in mutation_context.payloads:
+                self.transmit_all(
+                    sock,
+                    node,
+                    edge,
+                    callback_data=None,
+                    mutation_context=mutation_context,
+                    transmit_type=transmit_type,
+                    data=data,
+                )
+        elif node.fragmentation is None:
             self.transmit_all(sock, node, edge, callback_data, mutation_context, transmit_type)
         else:
-            for data in node.fragmentation(session=self, sock=sock, node=node, edge=edge, callback_data=callback_data,
-                                           mutation_context=mutation_context, length=node.fragmentation_length):
-                self.transmit_all(sock, node, edge, callback_data=data, mutation_context=mutation_context,
-                                  transmit_type=transmit_type)
+            for data in node.fragmentation(
+                session=self,
+                sock=sock,
+                node=node,
+                edge=edge,
+                callback_data=callback_data,
+                mutation_context=mutation_context,
+                length=node.fragmentation_length,
+            ):
+                self.transmit_all(
+                    sock, node, edge, callback_data=data, mutation_context=mutation_context, transmit_type=transmit_type
+                )
 
-    def transmit_all(self, sock, node: Request, edge, callback_data, mutation_context, transmit_type):
+    def transmit_all(self, sock, node: Request, edge, callback_data, mutation_context, transmit_type, data=None):
         """
         Parent method for all transmission (normal and fuzzed) methods.
         This method is used to call the appropriate transmit method based on the current fuzzing state.
@@ -1018,7 +1561,11 @@ class Session(pgraph.Graph):
             callback_data (bytes): Data from previous callback.
             mutation_context (MutationContext): active mutation context
             transmit_type (str): Type of transmit. "normal" or "fuzz".
+            data (bytes): Fuzzed message to send as is, see transmit_fuzz(). Default None.
         """
+        if self.pacer is not None:
+            self.pacer.wait()
+
         # Get time before sending
         starting_time = time.time()
 
@@ -1038,6 +1585,7 @@ class Session(pgraph.Graph):
                 mutation_context.message_path[-1],
                 callback_data=callback_data,
                 mutation_context=mutation_context,
+                data=data,
             )
         else:
             self._fuzz_data_logger.log_error(f"Unknown transmit type: {transmit_type}")
@@ -1051,9 +1599,29 @@ class Session(pgraph.Graph):
             # Log elapsed time
             if node.rto < elapsed_time and node.timeout_check:
                 self._fuzz_data_logger.log_target_warn(f"RTO exceeded: {elapsed_time} > {node.rto}")
+                self.case_signals.add(SIGNAL_RTO)
+                self._report_congestion("RTO exceeded")
             # Calculate new RTO
             node.calculate_rto(elapsed_time, self.rto_alpha_value, self.rto_beta_value)
 
+    def _report_congestion(self, reason):
+        """Tell the pacer, if any, that the target shows signs of overload."""
+        if self.pacer is not None:
+            self.pacer.congestion(reason)
+
+    def _adapt_pace(self):
+        """Adapt the pacer's rate, if any, after a test case or nominal test, and log when it is lowered."""
+        if self.pacer is None:
+            return
+        rate = self.pacer.rate
+        reason = self.pacer.end_case()
+        if reason is not None:
+            self._fuzz_data_logger.log_info(
+                "Target congested ({0}): send rate lowered from {1:.1f} to {2:.1f}/s".format(
+                    reason, rate, self.pacer.rate
+                )
+            )
+
     def transmit_normal(self, sock, node: Request, edge, callback_data, mutation_context):
         """Render and transmit a non-fuzzed node, process callbacks accordingly.
 
@@ -1073,6 +1641,7 @@ class Session(pgraph.Graph):
             self.targets[self.target_to_use].send(data)
             self.last_send = data
         except exception.BoofuzzTargetConnectionReset:
+            self._report_congestion(constants.ERR_CONN_RESET)
             # TODO: Switch _ignore_connection_reset for _ignore_transmission_error, or provide retry mechanism
             if self._ignore_connection_reset:
                 self._fuzz_data_logger.log_info(constants.ERR_CONN_RESET)
@@ -1081,6 +1650,7 @@ class Session(pgraph.Graph):
         except exception.BoofuzzTargetConnectionAborted as e:
             # TODO: Switch _ignore_connection_aborted for _ignore_transmission_error, or provide retry mechanism
             msg = constants.ERR_CONN_ABORTED.format(socket_errno=e.socket_errno, socket_errmsg=e.socket_errmsg)
+            self._report_congestion(msg)
             if self._ignore_connection_aborted:
                 self._fuzz_data_logger.log_info(msg)
             else:
@@ -1108,12 +1678,14 @@ class Session(pgraph.Graph):
                     else:
                         self._fuzz_data_logger.log_pass("Some data received from target.")
         except exception.BoofuzzTargetConnectionReset:
+            self._report_congestion(constants.ERR_CONN_RESET)
             if self._check_data_received_each_request:
                 raise BoofuzzFailure(message=constants.ERR_CONN_RESET)
             else:
                 self._fuzz_data_logger.log_info(constants.ERR_CONN_RESET)
         except exception.BoofuzzTargetConnectionAborted as e:
             msg = constants.ERR_CONN_ABORTED.format(socket_errno=e.socket_errno, socket_errmsg=e.socket_errmsg)
+            self._report_congestion(msg)
             if self._check_data_received_each_request:
                 raise BoofuzzFailure(msg)
             else:
@@ -1125,7 +1697,7 @@ class Session(pgraph.Graph):
                 raise BoofuzzFailure(str(e))
         self.last_send = data
 
-    def transmit_fuzz(self, sock, node: Request, edge, callback_data, mutation_context):
+    def transmit_fuzz(self, sock, node: Request, edge, callback_data, mutation_context, data=None):
         """
         Original transmit_fuzz() method of boofuzz, now encapsulated in a parent method that allows for fragmentation.
         Render and transmit a fuzzed node, process callbacks accordingly.
@@ -1136,21 +1708,26 @@ class Session(pgraph.Graph):
             edge (pgraph.edge.edge (pgraph.edge), optional): Edge along the current fuzz path from "node" to next node.
             callback_data (bytes): Data from previous callback.
             mutation_context (MutationContext): Current mutation context.
+            data (bytes): Message to send as is, e.g. a stored payload. Default None: callback_data if any, else the
+                rendered message.
         """
-        if callback_data:
-            data = callback_data
-        else:
-            data = self.fuzz_node.render(mutation_context)
+        if data is None:
+            data = callback_data if callback_data else self._take_rendered(mutation_context)
+        if self._case_payloads is not None:
+            self._case_payloads.append(data)
 
+        starting_time = time.time()
         try:  # send
             self.targets[self.target_to_use].send(data)
         except exception.BoofuzzTargetConnectionReset:
+            self._report_congestion(constants.ERR_CONN_RESET)
             if self._ignore_connection_issues_when_sending_fuzz_data:
                 self._fuzz_data_logger.log_info(constants.ERR_CONN_RESET)
             else:
                 raise BoofuzzFailure(message=constants.ERR_CONN_RESET)
         except exception.BoofuzzTargetConnectionAborted as e:
             msg = constants.ERR_CONN_ABORTED.format(socket_errno=e.socket_errno, socket_errmsg=e.socket_errmsg)
+            self._report_congestion(msg)
             if self._ignore_connection_issues_when_sending_fuzz_data:
                 self._fuzz_data_logger.log_info(msg)
             else:
@@ -1168,15 +1745,19 @@ class Session(pgraph.Graph):
                 if isinstance(connection, UDPSocketConnection) and not connection.bind:
                     connection.reuse_my_port()
                 self.last_recv = self.targets[self.target_to_use].recv()
+                if self.response_fingerprinter is not None:
+                    self._response_feedback(node, self.last_recv, time.time() - starting_time, mutation_context)
                 if node.answer_must_not_contain or node.answer_must_contain:
                     node.analyze_answer(data=self.last_recv, session=self)
         except exception.BoofuzzTargetConnectionReset:
+            self._report_congestion(constants.ERR_CONN_RESET)
             if self._check_data_received_each_request:
                 raise BoofuzzFailure(message=constants.ERR_CONN_RESET)
             else:
                 self._fuzz_data_logger.log_info(constants.ERR_CONN_RESET)
         except exception.BoofuzzTargetConnectionAborted as e:
             msg = constants.ERR_CONN_ABORTED.format(socket_errno=e.socket_errno, socket_errmsg=e.socket_errmsg)
+            self._report_congestion(msg)
             if self._check_data_received_each_request:
                 raise BoofuzzFailure(msg)
             else:
@@ -1190,13 +1771,26 @@ class Session(pgraph.Graph):
                 raise BoofuzzFailure(str(e))
         self.last_send = data
 
+    def _response_feedback(self, node: Request, data: bytes, elapsed_time: float, mutation_context: MutationContext):
+        """Fingerprint the response to a fuzzed request and reward the mutated values if the response is novel."""
+        fingerprint = self.response_fingerprinter.fingerprint(data, elapsed_time=elapsed_time, request=node)
+        if not self.response_novelty.observe(node.name, fingerprint):
+            return
+        self.case_signals.add(SIGNAL_NOVELTY)
+        for qualified_name, mutation in mutation_context.mutations.items():
+            self.feedback_corpus.add_energy(qualified_name, mutation.value, self.response_fingerprinter.energy)
+        self._fuzz_data_logger.log_info(
+            lambda: "New response class for {0} ({1} so far)".format(node.name, self.response_novelty.classes(node.name))
+        )
+
     def build_webapp_thread(self, port=constants.DEFAULT_WEB_UI_PORT,
                             address=constants.DEFAULT_WEB_UI_ADDRESS) -> threading.Thread:
         """
         Create Webapp interface.
         """
         app.session = self
-        http_server = HTTPServer(WSGIContainer(app))
+        # Requests are served from a thread pool so that long-polling clients don't block the IO loop.
+        http_server = HTTPServer(WSGIContainer(app, executor=ThreadPoolExecutor(max_workers=8)))
         while True:
             try:
                 http_server.listen(port, address=address)
@@ -1246,27 +1840,53 @@ class Session(pgraph.Graph):
         self.round_type = memo
 
     def check_max_number_of_rounds(self) -> None:
-        """ Function use to increment and check if the total number of round go beyond the max number of round. """
+        """ Function use to increment and check if the total number of round go beyond the max number of round.
+
+        Raises:
+            exception.BoofuzzStopCampaign: If the maximum number of rounds is reached.
+        """
         self.total_num_round += 1
         if self.max_number_of_rounds == 0:
             return
         if self.total_num_round >= self.max_number_of_rounds:
-            self._fuzz_data_logger.log_error(
+            raise exception.BoofuzzStopCampaign(
                 f'Stop because total_num_round>=max_number_of_rounds ({self.max_number_of_rounds})')
-            exit(0)
 
     def fuzz_indefinitely(self, name=None):
         """
             Parent function of fuzz(). Is only used to call fuzz() in a loop.
             It fuzzes first with library mutations, then with random mutations, and then indefinitely with random
             generations.
+
+            Returns when max_number_of_rounds or the time budget is reached, after logging a recap.
         """
         self._keep_web_open = False
 
         self.calculate_total_round()  # Set _total_random_mutation_rounds
+        if self.planner is not None:
+            self.planner.start(self)
+
+        try:
+            self._fuzz_rounds(name=name)
+        except exception.BoofuzzStopCampaign as e:
+            self._fuzz_data_logger.log_info(str(e))
+            self._log_recap()
+
+    def _fuzz_rounds(self, name=None, fuzz_round=None):
+        """Rounds of fuzz_indefinitely, from the current round_type and seed_index on.
+
+        Args:
+            name (str): Passed to :meth:`fuzz`.
+            fuzz_round (callable): Called instead of :meth:`fuzz` to run each round, once the session is set up for it.
+        """
+        if fuzz_round is None:
+            def fuzz_round():
+                self.fuzz(name=name)
 
         if self.round_type == "library":
-            self.fuzz(name=name)
+            if self.planner is not None:
+                self.planner.plan_round(self)
+            fuzz_round()
             self._index_start = 1
             self.round_type = "random_mutation"
             self.check_max_number_of_rounds()
@@ -1274,10 +1894,14 @@ class Session(pgraph.Graph):
         if self.round_type == "random_mutation":
             # Increment the seed index, from the starting seed to the total number of random mutation rounds
             for self.seed_index in range(self.seed_index, self._total_random_mutation_rounds):
+                if self.planner is not None:
+                    if self.planner.mutation_phase_over():
+                        break
+                    self.planner.plan_round(self, rounds_left=self._total_random_mutation_rounds - self.seed_index)
                 # Concatenate the mutation index with the mutation type to create a unique seed index
                 # Otherwise the seed index will be the same for each mutation type
                 self.seed = self.round_type + '.' + str(self.seed_index)
-                self.fuzz(name=name)
+                fuzz_round()
                 self.check_max_number_of_rounds()
             # At the end of the random mutation rounds, set the mutation type to random generation
             self.round_type = "random_generation"
@@ -1286,11 +1910,30 @@ class Session(pgraph.Graph):
         if self.round_type == "random_generation":
             # Is the "indefinitely" of "fuzz_indefinitely"
             while True:
+                if self.planner is not None:
+                    self.planner.plan_round(self)
                 self.seed = self.round_type + '.' + str(self.seed_index)
-                self.fuzz(name=name)
+                fuzz_round()
                 self.seed_index += 1
                 self.check_max_number_of_rounds()
 
+    def _log_recap(self):
+        """Log the failure summary to the text loggers and save it in the campaign folder."""
+        logging_text = f"Total time: {time.time() - self.start_time} seconds\n"
+        if self.num_cases_skipped_duplicate:
+            logging_text += f"Test cases skipped as duplicate payloads: {self.num_cases_skipped_duplicate}\n"
+        logging_text += self._fuzz_data_logger.failure_summary()
+
+        for logger in self._fuzz_data_logger._fuzz_loggers:
+            if isinstance(logger, fuzz_logger_text.FuzzLoggerText):
+                logger.log_recap(logging_text)
+
+        # Save the log recap to the campaign folder as a text file
+        if self.campaign_folder is not None:
+            with open(os.path.join(self.campaign_folder, constants.LOG_RECAP_NAME), "w", encoding="utf-8") as f:
+                # Write the recap
+                f.write(logging_text)
+
     def fuzz(self, name=None):
         """Fuzz the entire protocol tree.
 
@@ -1310,8 +1953,9 @@ class Session(pgraph.Graph):
         """
 
         if name is None or name == "":
+            self.feedback_corpus.start_round()
             self.total_num_mutations += self.num_mutations()
-            self._main_fuzz_loop(self._generate_mutations_indefinitely())
+            self._main_fuzz_loop(self._generate_test_cases())
         else:
             path, mutations = helpers.parse_test_case_name(name)
             if len(mutations) < 1:
@@ -1348,7 +1992,7 @@ class Session(pgraph.Graph):
         self.total_mutant_index = 0
         self.total_num_mutations = self.nodes[node_edges[-1].dst].get_num_mutations()
 
-        self._main_fuzz_loop(self._generate_mutations_indefinitely(path=node_edges))
+        self._main_fuzz_loop(self._generate_test_cases(path=node_edges))
 
     def fuzz_single_case(self, mutant_index):
         """Deprecated: Fuzz a test case by mutant_index.
@@ -1430,6 +2074,15 @@ class Session(pgraph.Graph):
                 if self.total_mutant_index < self._index_start:
                     continue
 
+                if self.planner is not None:
+                    self.planner.check_deadline()
+
+                if self.sent_payloads is not None and self._payload_already_sent(mutation_context):
+                    self._log_skipped_duplicate(mutation_context)
+                    if self._index_end is not None and self.total_mutant_index >= self._index_end:
+                        break
+                    continue
+
                 # Check restart interval
                 if (
                         self.num_cases_actually_fuzzed
@@ -1437,28 +2090,32 @@ class Session(pgraph.Graph):
                         and self.num_cases_actually_fuzzed % self.restart_interval == 0
                 ):
                     self._fuzz_data_logger.open_test_step(f"restart interval of {self.restart_interval} reached")
+                    self._end_prefix_sharing(self.targets[self.target_to_use])
                     self._restart_target(self.targets[self.target_to_use])
 
                 self._fuzz_current_case(mutation_context)
+                self.scheduler.record(mutation_context, self.case_signals)
 
                 self.num_cases_actually_fuzzed += 1
 
                 # Check nominal data test interval
-                if (
-                        self.num_cases_actually_fuzzed
-                        and self.nominal_test_interval
-                        and self.num_cases_actually_fuzzed % self.nominal_test_interval == 0
-                ):
+                if self._nominal_test_due():
+                    self._end_prefix_sharing(self.targets[self.target_to_use])
                     self.nominal_test()
 
                 if self._index_end is not None and self.total_mutant_index >= self._index_end:
                     break
 
+            self._end_prefix_sharing(self.targets[self.target_to_use])
             if self._reuse_target_connection:
                 self.targets[self.target_to_use].close()
 
+            self._publish_stats()
+
             if self._keep_web_open and self.web_port is not None:
                 self.end_time = time.time()
+                if self._stats_segment is not None:
+                    self._stats_segment.set_finished()
                 print(
                     "\nFuzzing session completed. Keeping webinterface up on {}:{}".format(
                         self.web_address, self.web_port
@@ -1466,25 +2123,15 @@ class Session(pgraph.Graph):
                     "\nPress ENTER to close webinterface",
                 )
                 input()
+                self._stop_webapp_process()
         except KeyboardInterrupt:
             # TODO: should wait for the end of the ongoing test case, and stop gracefully netmon and procmon
             self.export_file()
-
-            # Assuming self._fuzz_data_logger_fuzz_loggers is the list of loggers
-            fuzz_logger_text_instance: fuzz_logger_text.FuzzLoggerText = next(
-                filter(lambda x: isinstance(x, fuzz_logger_text.FuzzLoggerText), self._fuzz_data_logger._fuzz_loggers),
-                None)
             self._fuzz_data_logger.log_error("SIGINT received ... exiting")
-
-            logging_text = f"Total time: {time.time() - self.start_time} seconds\n" + self._fuzz_data_logger.failure_summary()
-            fuzz_logger_text_instance.log_recap(logging_text)
-
-            # Save the log recap to the campaign folder as a text file
-            if self.campaign_folder is not None:
-                with open(os.path.join(self.campaign_folder, constants.LOG_RECAP_NAME), "w", encoding="utf-8") as f:
-                    # Write the recap
-                    f.write(logging_text)
-
+            self._log_recap()
+            raise
+        except exception.BoofuzzStopCampaign:
+            self.export_file()
             raise
         except exception.BoofuzzRestartFailedError:
             self._fuzz_data_logger.log_error("Restarting the target failed, exiting.")
@@ -1498,8 +2145,169 @@ class Session(pgraph.Graph):
             self.export_file()
             raise
         finally:
+            self._stop_monitor_watchers()
             self._fuzz_data_logger.close_test()
 
+    @staticmethod
+    def _message_path_key(message_path):
+        return tuple((edge.src, edge.dst) for edge in message_path)
+
+    def _reuse_prefix(self, target, mutation_context):
+        """Return True if the test case can be sent on the prefix set up by a previous one, else end that prefix."""
+        if self._shared_prefix is None:
+            return False
+        key, _, count = self._shared_prefix
+        if key == self._message_path_key(mutation_context.message_path) and count < self.cases_per_prefix:
+            return True
+        self._end_prefix_sharing(target)
+        return False
+
+    def _nominal_test_due(self):
+        """Return True if the nominal test should run after the test case that just ended."""
+        if self.nominal_schedule is not None:
+            return self.nominal_schedule.due()
+        return bool(
+            self.num_cases_actually_fuzzed
+            and self.nominal_test_interval
+            and self.num_cases_actually_fuzzed % self.nominal_test_interval == 0
+        )
+
+    def _end_prefix_sharing(self, target):
+        """Close the connection kept open for the next test cases of the same message path, if any."""
+        if self._shared_prefix is None:
+            return
+        self._shared_prefix = None
+        if not self._reuse_target_connection:
+            target.close()
+
+    def _payload_already_sent(self, mutation_context):
+        """Render the fuzzed message of a test case and return True if the same bytes were sent before on its path."""
+        if mutation_context.payloads is not None:
+            return False  # replayed cases are never skipped
+        if self._rendered_ahead is not None and self._rendered_ahead[0] is mutation_context:
+            # Rendered by a render worker.
+            return self.sent_payloads.check_and_add(
+                self._message_path_to_str(mutation_context.message_path), self._rendered_ahead[1].result()
+            )
+        try:
+            data = self.fuzz_node.render(mutation_context)
+        except Exception:
+            # Elements referring to earlier responses only render while the test case runs: never skip those.
+            return False
+        if self._render_executor is not None and self._can_render_ahead(mutation_context):
+            future = Future()
+            future.set_result(data)
+            self._rendered_ahead = (mutation_context, future)
+        return self.sent_payloads.check_and_add(self._message_path_to_str(mutation_context.message_path), data)
+
+    def _can_render_ahead(self, mutation_context):
+        """Return True if the fuzzed message of a test case renders the same before the test case runs."""
+        if mutation_context.payloads is not None:
+            return False
+        if mutation_context.message_path[-1].callback is not None or self.fuzz_node.fragmentation is not None:
+            return False
+        # Rendering is not thread-safe for a given request: the prefix must not send the fuzzed request itself.
+        if any(self.nodes[edge.dst] is self.fuzz_node for edge in mutation_context.message_path[:-1]):
+            return False
+        if self.fuzz_node.name not in self._renders_lazily:
+            self._renders_lazily[self.fuzz_node.name] = self._refers_to_protocol_session(self.fuzz_node.stack)
+        return not self._renders_lazily[self.fuzz_node.name]
+
+    def _refers_to_protocol_session(self, stack):
+        for item in stack:
+            if isinstance(getattr(item, "_default_value", None), ProtocolSessionReference):
+                return True
+            if isinstance(getattr(item, "stack", None), list) and self._refers_to_protocol_session(item.stack):
+                return True
+        return False
+
+    def _render_ahead(self, mutation_context):
+        """Start rendering the fuzzed message of a test case in the background, if it can be."""
+        if self._rendered_ahead is not None and self._rendered_ahead[0] is mutation_context:
+            return
+        self._rendered_ahead = None
+        if self._render_executor is not None and self._can_render_ahead(mutation_context):
+            future = self._render_executor.submit(self.fuzz_node.render, mutation_context)
+            self._rendered_ahead = (mutation_context, future)
+
+    def _take_rendered(self, mutation_context):
+        """Return the fuzzed message of a test case: rendered ahead if it was, rendered now otherwise."""
+        if self._rendered_ahead is not None and self._rendered_ahead[0] is mutation_context:
+            future = self._rendered_ahead[1]
+            self._rendered_ahead = None
+            return future.result()
+        return self.fuzz_node.render(mutation_context)
+
+    def _discard_rendered_ahead(self):
+        """Wait for a render the test case did not use, so that it never runs alongside the next case's renders."""
+        if self._rendered_ahead is not None:
+            future = self._rendered_ahead[1]
+            self._rendered_ahead = None
+            future.exception()  # blocks until the render is done; its result, or error, is dropped
+
+    def _log_skipped_duplicate(self, mutation_context):
+        """Record a test case skipped because its payload was already sent, so that its index stays in the logs."""
+        self.num_cases_skipped_duplicate += 1
+        test_case_name = self._test_case_name(mutation_context)
+        self._fuzz_data_logger.open_test_case(
+            f"{self.total_mutant_index}: {test_case_name}",
+            name=test_case_name,
+            index=self.total_mutant_index,
+            num_mutations=self.total_num_mutations,
+            current_index=self.mutant_index,
+            current_num_mutations=self.fuzz_node.get_num_mutations(),
+            round_type=self.round_type,
+            seed=self.seed,
+            seed_index=self.seed_index,
+        )
+        self._fuzz_data_logger.log_info("Skipped: the same payload was already sent on this message path.")
+        self._fuzz_data_logger.close_test_case()
+
+    def replay(self, cases, max_rate=False):
+        """Send stored test cases again, byte for byte.
+
+        The target is brought up once. Each case follows its original message path: the messages before the fuzzed
+        one are rendered and sent with their callbacks as during fuzzing, and the fuzzed message is sent exactly as
+        stored. Failures are detected, logged and attributed as during fuzzing, under the original test case index,
+        name and round.
+
+        Args:
+            cases (iterable of StoredCase): Test cases to replay, e.g. from :func:`stored_cases_from_db` or
+                :func:`stored_cases_from_packed`. Incomplete cases are logged and skipped.
+            max_rate (bool): Don't sleep between test cases (`sleep_time`) and don't wait for the pacer. Default False.
+        """
+        cases = list(cases)
+        self.total_num_mutations = len(cases)
+        sleep_time, pacer = self.sleep_time, self.pacer
+        if max_rate:
+            self.sleep_time, self.pacer = 0, None
+        try:
+            self._main_fuzz_loop(self._generate_stored_test_cases(cases))
+        finally:
+            self.sleep_time, self.pacer = sleep_time, pacer
+
+    def _generate_stored_test_cases(self, cases):
+        """Yield the MutationContext of each stored test case, setting the session up as when it was generated."""
+        for case in cases:
+            if not case.complete:
+                self._fuzz_data_logger.log_info(
+                    "Test case {0} not replayed: its fuzzed message was not stored whole".format(case.index)
+                )
+                continue
+            path_names, mutation_names = helpers.parse_test_case_name(case.case_name)
+            path = self._path_names_to_edges(node_names=path_names)
+            self.fuzz_node = self.nodes[path[-1].dst]
+            mutations = {}
+            for mutation_name in mutation_names:
+                qualified_name, index = mutation_name.rsplit(":", 1)
+                mutations[qualified_name] = Mutation(value=None, qualified_name=qualified_name, index=int(index))
+            self.fuzz_node.mutant = self.fuzz_node.names.get(next(iter(mutations), None), self.fuzz_node.stack[0])
+            if case.round is not None:
+                self.round_type, self.seed_index, self.seed = case.round
+            self.total_mutant_index = case.index
+            self.mutant_index = case.index
+            yield MutationContext(message_path=path, mutations=mutations, payloads=case.payloads)
+
     def _generate_single_case_by_index(self, test_case_index):
         fuzz_index = 1
         for m in self._generate_mutations_indefinitely():
@@ -1509,12 +2317,30 @@ class Session(pgraph.Graph):
                 break
             fuzz_index += 1
 
-    def _generate_mutations_indefinitely(self, path=None):
+    def _generate_test_cases(self, path=None):
+        """Yield the test cases of a round: from render workers if the session has some, else generated here."""
+        if self.render_workers < 1 or type(self.scheduler) is not StackOrderScheduler:
+            yield from self._generate_mutations_indefinitely(path=path)
+            return
+        if not RenderPool.available():
+            warnings.warn("render_workers needs fork, which is not available: generating test cases serially.")
+            yield from self._generate_mutations_indefinitely(path=path)
+            return
+
+        valid_case_found = False
+        with RenderPool(self, self.render_workers, path=path) as pool:
+            for mutation_context in pool.test_cases():
+                valid_case_found = True
+                yield mutation_context
+        if valid_case_found:
+            yield from self._generate_mutations_indefinitely(path=path, start_depth=2)
+
+    def _generate_mutations_indefinitely(self, path=None, start_depth=1):
         """Yield MutationContext with n mutations per message over all messages, with n increasing indefinitely."""
-        depth = 1
+        depth = start_depth
         while self.max_depth is None or depth <= self.max_depth:
             valid_case_found_at_this_depth = False
-            for m in self._generate_n_mutations(depth=depth, path=path):
+            for m in self.scheduler.test_cases(self, depth=depth, path=path):
                 valid_case_found_at_this_depth = True
                 yield m
             if not valid_case_found_at_this_depth:
@@ -1537,11 +2363,83 @@ class Session(pgraph.Graph):
         Yields:
             MutationContext: A MutationContext containing one mutation.
         """
+        if depth > 1 and self.covering_arrays:
+            yield from self._generate_covering_array_mutations_for_path(path, depth=depth)
+            return
+
         for mutations in self._generate_n_mutations_for_path_recursive(path, depth=depth):
             if not self._mutations_contain_duplicate(mutations):
                 self.total_mutant_index += 1
                 yield MutationContext(message_path=path, mutations={n.qualified_name: n for n in mutations})
 
+    def _covering_array_elements(self, node):
+        """Fuzzable leaf elements of a request, the factors of its covering arrays."""
+        return [element for element in node.walk() if element.fuzzable]
+
+    def _covering_array(self, node, depth, values=None):
+        """Return the covering array of strength depth over the elements of a request.
+
+        Rows with a single mutation are left out, the depth 1 test cases already send them. Each element contributes at
+        most covering_array_levels mutations.
+
+        Args:
+            node (Request): Request.
+            depth (int): Strength of the array.
+            values (list of list): Mutations of each element. Default None: use the elements' mutation counts.
+        """
+        elements = self._covering_array_elements(node)
+        if depth > len(elements):
+            return covering_array((), strength=depth, min_weight=2)
+        if values is None:
+            counts = (element.get_num_mutations() for element in elements)
+        else:
+            counts = (len(element_values) for element_values in values)
+        levels = tuple(1 + min(count, self.covering_array_levels) for count in counts)
+        return covering_array(levels, strength=depth, min_weight=2)
+
+    def _generate_covering_array_mutations_for_path(self, path, depth):
+        """Yield a MutationContext per row of the covering array of strength depth of the last message of path.
+
+        Args:
+            path (list of Connection): Nodes (Requests) along the path to the current one being fuzzed.
+            depth (int): Strength of the covering array.
+
+        Yields:
+            MutationContext: A MutationContext with one mutation per element that the row does not leave at its default
+            value.
+        """
+        self.fuzz_node = self.nodes[path[-1].dst]
+        self.mutant_index = 0
+
+        # Each element's mutations are generated in one go, since primitives reseed the global random generator: the
+        # values are those of depth 1 test cases.
+        values = []
+        for element in self._covering_array_elements(self.fuzz_node):
+            self.fuzz_node.mutant = element
+            mutations = element.get_mutations()
+            values.append(list(itertools.islice(mutations, self.covering_array_levels)))
+            mutations.close()
+
+        array = self._covering_array(self.fuzz_node, depth, values=values)
+        counted = array.estimated_len()
+        for row in array:
+            mutations = []
+            for element_values, level in zip(values, row):
+                if level:
+                    mutations += element_values[level - 1]
+            self.mutant_index += 1
+            self.total_mutant_index += 1
+            yield MutationContext(message_path=path, mutations={m.qualified_name: m for m in mutations})
+
+            if self._skip_current_node_after_current_test_case:
+                self._skip_current_node_after_current_test_case = False
+                break
+            # Elements cannot be skipped one by one, every row mutates several of them.
+            self._skip_current_element_after_current_test_case = False
+        else:
+            # The array is complete: replace the lower bound num_mutations counted by its size.
+            self.total_num_mutations += len(array) - counted
+
     def _generate_n_mutations_for_path_recursive(self, path, depth, skip_elements=None):
         if skip_elements is None:
             skip_elements = set()
@@ -1612,10 +2510,18 @@ class Session(pgraph.Graph):
             path.pop()
 
     def _mutations_contain_duplicate(self, mutations):
-        names = [m.qualified_name for m in mutations]
-        for name1, name2 in itertools.combinations(names, r=2):
-            if name1 in name2 or name2 in name1:
+        """Return True if two mutations target the same element, or an element and one of its parent blocks."""
+        names = set()
+        for mutation in mutations:
+            if mutation.qualified_name in names:
                 return True
+            names.add(mutation.qualified_name)
+        for name in names:
+            prefix = name.rpartition(".")[0]
+            while prefix:
+                if prefix in names:
+                    return True
+                prefix = prefix.rpartition(".")[0]
         return False
 
     def _generate_mutations_for_request(self, path, skip_elements=None):
@@ -1750,7 +2656,7 @@ class Session(pgraph.Graph):
             if not self._reuse_target_connection:
                 target.close()
 
-            if self.sleep_time > 0:
+            if self.sleep_time > 0 and self.pacer is None:
                 self._fuzz_data_logger.open_test_step("Sleep between tests.")
                 self._fuzz_data_logger.log_info("sleeping for %f seconds" % self.sleep_time)
                 time.sleep(self.sleep_time)
@@ -1778,8 +2684,18 @@ class Session(pgraph.Graph):
 
         self._pause_if_pause_flag_is_set()
 
+        self._render_ahead(mutation_context)
         test_case_name = self._test_case_name(mutation_context)
         self.current_test_case_name = test_case_name
+        self.current_mutation_context = mutation_context
+        self.num_mutations_element = self.fuzz_node.get_num_mutations()
+        self.case_signals = set()
+        keep_case = self._recent_cases is not None or self.nominal_schedule is not None
+        self._case_payloads = [] if keep_case else None
+        logger = self._fuzz_data_logger
+        failures_before = len(logger.failed_test_cases) + len(logger.error_test_cases)
+        failures_before += len(logger.target_error_test_cases)
+        warnings_before = len(logger.target_warn_test_cases)
 
         self._fuzz_data_logger.open_test_case(
             f'{self.total_mutant_index}: {test_case_name}',
@@ -1787,85 +2703,139 @@ class Session(pgraph.Graph):
             index=self.total_mutant_index,
             num_mutations=self.total_num_mutations,
             current_index=self.mutant_index,
-            current_num_mutations=self.fuzz_node.get_num_mutations(),
+            current_num_mutations=self.num_mutations_element,
             round_type=self.round_type,
             seed=self.seed,
             seed_index=self.seed_index
         )
+        self._publish_stats()
 
-        if self.total_num_mutations is not None:
-            self._fuzz_data_logger.log_info(
-                "Type: {0}. Case {1} of {2} overall.".format(
-                    type(self.fuzz_node.mutant).__name__,
-                    self.total_mutant_index,
-                    self.total_num_mutations,
+        if self._fuzz_data_logger.accepts("info"):
+            if self.total_num_mutations is not None:
+                self._fuzz_data_logger.log_info(
+                    "Type: {0}. Case {1} of {2} overall.".format(
+                        type(self.fuzz_node.mutant).__name__,
+                        self.total_mutant_index,
+                        self.total_num_mutations,
+                    )
                 )
-            )
-        else:
-            self._fuzz_data_logger.log_info(
-                "Type: {0}".format(
-                    type(self.fuzz_node.mutant).__name__,
+            else:
+                self._fuzz_data_logger.log_info(
+                    "Type: {0}".format(
+                        type(self.fuzz_node.mutant).__name__,
+                    )
                 )
-            )
 
+        shared_prefix = self._reuse_prefix(target, mutation_context)
+        case_completed = False
         try:
-            self._open_connection_keep_trying(target)
+            if shared_prefix:
+                _, first_index, count = self._shared_prefix
+                self._fuzz_data_logger.log_info(
+                    "Prefix shared: sent on the connection set up by test case {0}, after {1} test case(s).".format(
+                        first_index, count
+                    )
+                )
+                self._pre_send(target, shared_prefix=True)
+            else:
+                self._open_connection_keep_trying(target)
 
-            self._pre_send(target)
+                self._pre_send(target)
 
-            for e in mutation_context.message_path[:-1]:
-                if self.continue_case:
-                    prev_node = self.nodes[e.src]
-                    node: Request = self.nodes[e.dst]
-                    protocol_session = ProtocolSession(
-                        previous_message=prev_node,
-                        current_message=node,
-                    )
-                    mutation_context.protocol_session = protocol_session
-                    callback_data = self._callback_current_node(node=node, edge=e, test_case_context=protocol_session)
-                    if self.continue_case:
-                        self._fuzz_data_logger.open_test_step("Transmit Prep Node '{0}'".format(node.name))
-                        self.fragmentation_check(target, node, e, callback_data=callback_data,
-                                                 mutation_context=mutation_context, transmit_type="normal")
+                self._transmit_prefix(target, mutation_context)
 
-            prev_node = self.nodes[mutation_context.message_path[-1].src]
-            node = self.nodes[mutation_context.message_path[-1].dst]
-            protocol_session = ProtocolSession(
-                previous_message=prev_node,
-                current_message=node,
-            )
-            mutation_context.protocol_session = protocol_session
-            callback_data = self._callback_current_node(
-                node=self.fuzz_node, edge=mutation_context.message_path[-1], test_case_context=protocol_session
-            )
-            if self.continue_case:
-                self._fuzz_data_logger.open_test_step(f"Fuzzing Node '{self.fuzz_node.name}'")
-                self._fuzz_data_logger.open_test_step(f"Fuzzing Primitive '{self.fuzz_node.mutant.qualified_name}'")
+                if self.cases_per_prefix > 1 and self.continue_case:
+                    self._shared_prefix = [
+                        self._message_path_key(mutation_context.message_path), self.total_mutant_index, 0
+                    ]
 
-                self.fragmentation_check(
-                    target,
-                    self.fuzz_node,
-                    mutation_context.message_path[-1],
-                    callback_data=callback_data,
-                    mutation_context=mutation_context,
-                    transmit_type="fuzz"
-                )
+            self._transmit_fuzzed_message(target, mutation_context)
 
             self._check_for_passively_detected_failures(target=target)
-            if not self._reuse_target_connection:
+            case_completed = True
+            if not self._reuse_target_connection and self._shared_prefix is None:
                 target.close()
 
-            if self.sleep_time > 0:
+            if self.sleep_time > 0 and self.pacer is None:
                 self._fuzz_data_logger.open_test_step("Sleep between tests.")
                 self._sleep(self.sleep_time)
         except BoofuzzFailure as e:
             self._fuzz_data_logger.log_fail(e.message)
             self._check_for_passively_detected_failures(target=target, failure_already_detected=True)
         finally:
-            self._process_failures(target=target)
+            self._discard_rendered_ahead()
+            restarted = self._process_failures(target=target)
+            self._adapt_pace()
+            if self._recent_cases is not None and not restarted:
+                self._recent_cases.append(self._recent_case(mutation_context))
+            failures = len(logger.failed_test_cases) + len(logger.error_test_cases)
+            failures += len(logger.target_error_test_cases)
+            if failures > failures_before:
+                self.case_signals.add(SIGNAL_FAILURE)
+            if self._shared_prefix is not None:
+                if restarted or failures > failures_before or not self.continue_case or not case_completed:
+                    self._end_prefix_sharing(target)
+                else:
+                    self._shared_prefix[2] += 1
+            if len(logger.target_warn_test_cases) > warnings_before:
+                self.case_signals.add(SIGNAL_WARNING)
+            if self.nominal_schedule is not None:
+                self.nominal_schedule.record_case(
+                    None if restarted else self._recent_case(mutation_context),
+                    anomaly=SIGNAL_WARNING in self.case_signals or SIGNAL_RTO in self.case_signals,
+                )
             self._fuzz_data_logger.close_test_case()
             self.export_file()
 
+    def _transmit_prefix(self, target: Target, mutation_context: MutationContext):
+        """Send the messages of the message path leading to the fuzzed one, with their callbacks."""
+        for e in mutation_context.message_path[:-1]:
+            if self.continue_case:
+                prev_node = self.nodes[e.src]
+                node: Request = self.nodes[e.dst]
+                protocol_session = ProtocolSession(
+                    previous_message=prev_node,
+                    current_message=node,
+                )
+                mutation_context.protocol_session = protocol_session
+                callback_data = self._callback_current_node(
+                    node=node, edge=e, test_case_context=protocol_session
+                )
+                if self.continue_case:
+                    self._fuzz_data_logger.open_test_step(
+                        lambda: "Transmit Prep Node '{0}'".format(node.name)
+                    )
+                    self.fragmentation_check(target, node, e, callback_data=callback_data,
+                                             mutation_context=mutation_context, transmit_type="normal")
+
+    def _transmit_fuzzed_message(self, target: Target, mutation_context: MutationContext):
+        """Send the fuzzed message, the last of the message path, after its callback."""
+        prev_node = self.nodes[mutation_context.message_path[-1].src]
+        node = self.nodes[mutation_context.message_path[-1].dst]
+        protocol_session = ProtocolSession(
+            previous_message=prev_node,
+            current_message=node,
+        )
+        mutation_context.protocol_session = protocol_session
+        callback_data = self._callback_current_node(
+            node=self.fuzz_node, edge=mutation_context.message_path[-1], test_case_context=protocol_session
+        )
+        if self.continue_case:
+            if self._fuzz_data_logger.accepts("step"):
+                self._fuzz_data_logger.open_test_step(f"Fuzzing Node '{self.fuzz_node.name}'")
+                self._fuzz_data_logger.open_test_step(
+                    f"Fuzzing Primitive '{self.fuzz_node.mutant.qualified_name}'"
+                )
+
+            self.fragmentation_check(
+                target,
+                self.fuzz_node,
+                mutation_context.message_path[-1],
+                callback_data=callback_data,
+                mutation_context=mutation_context,
+                transmit_type="fuzz"
+            )
+
     def _open_connection_keep_trying(self, target: Target):
         """Open connection and if it fails, keep retrying.
 
@@ -1904,8 +2874,12 @@ class Session(pgraph.Graph):
                     out_of_available_sockets_count += 1
                     if out_of_available_sockets_count == 50:
                         raise exception.BoofuzzError("There are no available sockets. Ending fuzzing.")
-                    self._fuzz_data_logger.log_info("There are no available sockets. Waiting for another 5 seconds.")
-                    time.sleep(5)
+                    # Sockets in TIME_WAIT are released one by one: retry soon, then back off up to 5 seconds.
+                    delay = min(0.05 * 2 ** (out_of_available_sockets_count - 1), 5)
+                    self._fuzz_data_logger.log_info(
+                        "There are no available sockets. Waiting for another {0:g} seconds.".format(delay)
+                    )
+                    time.sleep(delay)
 
     def _sleep(self, seconds):
         self._fuzz_data_logger.log_info("sleeping for %f seconds" % seconds)
@@ -1941,6 +2915,15 @@ class Session(pgraph.Graph):
         """
         return "->".join([self.nodes[e.dst].name for e in message_path])
 
+    @property
+    def db_reader(self):
+        """FuzzLoggerPostgresReader on the campaign database, with its own connection (for use by web server)."""
+        if self._db_reader is None:
+            self._db_reader = fuzz_logger_postgres.FuzzLoggerPostgresReader(
+                db_name=self._db_name, db_table_name=self._db_table_name
+            )
+        return self._db_reader
+
     def test_case_data(self, index):
         """Return test case data object (for use by web server)
 
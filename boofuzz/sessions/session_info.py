@@ -1,6 +1,7 @@
 import warnings
 
 from ..loggers.fuzz_logger_postgres import FuzzLoggerPostgresReader
+from .stats_segment import StatsSegmentReader
 
 
 class SessionInfo:
@@ -12,10 +13,40 @@ class SessionInfo:
 
     def __init__(self, db_name, db_table_name):
         self._db_reader = FuzzLoggerPostgresReader(db_name=db_name, db_table_name=db_table_name)
+        self.live_log = None
+        self._monitor_results = None
+        self._failure_summary = None
+
+    @property
+    def db_reader(self):
+        """FuzzLoggerPostgresReader used to browse the campaign."""
+        return self._db_reader
 
     @property
     def monitor_results(self):
-        return self._db_reader.failure_map
+        # The campaign is over: failures are read once.
+        if self._monitor_results is None:
+            self._monitor_results = self._db_reader.failure_map
+        return self._monitor_results
+
+    def failure_summary(self, limit):
+        """Return the number of failed test cases, and a map of test case indexes to their failures for the first
+        `limit` failures. The whole failure map is never loaded.
+
+        The campaign is over: the summary is read once.
+        """
+        if self._failure_summary is None:
+            failures, _ = self._first_failures(limit)
+            self._failure_summary = self._db_reader.count_failed_test_cases(), failures
+        return self._failure_summary
+
+    def _first_failures(self, limit):
+        """Return the map of test case indexes to failures for the first `limit` failures, and how many were read."""
+        page = self._db_reader.get_failures_page(limit=limit)
+        failures = {}
+        for failure in page:
+            failures.setdefault(failure["test_case_index"], []).append(failure["description"])
+        return failures, len(page)
 
     @property
     def monitor_data(self):
@@ -85,3 +116,113 @@ class SessionInfo:
     @property
     def current_test_case_name(self):
         return ""
+
+    def current_run_stats(self):
+        """Return the live statistics displayed by the web interface."""
+        return {
+            "is_paused": self.is_paused,
+            "current_index": self.total_mutant_index,
+            "num_mutations": self.total_num_mutations,
+            "current_index_element": 0,
+            "num_mutations_element": 0,
+            "current_element": None,
+            "current_test_case_name": self.current_test_case_name,
+            "runtime": self.runtime,
+            "exec_speed": self.exec_speed,
+            "send_rate": None,
+        }
+
+
+class LiveSessionInfo(SessionInfo):
+    """Session information for a web interface running outside the fuzzing process.
+
+    Live counters are read from the shared-memory stats segment published by the fuzzing
+    :class:`Session <boofuzz.Session>`, test cases and failures are read from the database.
+
+    Args:
+        stats_segment_path (str): Path of the stats segment written by the session.
+        db_name (str): Name of the database of the campaign.
+        db_table_name (str | None): Name of the table in the database.
+    """
+
+    def __init__(self, stats_segment_path, db_name, db_table_name):
+        super(LiveSessionInfo, self).__init__(db_name=db_name, db_table_name=db_table_name)
+        self._stats = StatsSegmentReader(stats_segment_path)
+        self._failure_map = {}
+        self._failure_map_count = 0
+        self._first_page = {}
+        self._first_page_size = 0
+        self._first_page_count = 0
+
+    @property
+    def monitor_results(self):
+        # The failure map only changes when the session reports a new failure, so only go to the database then.
+        num_failures = self._stats.read()["num_failures"]
+        if num_failures != self._failure_map_count:
+            self._failure_map = self._db_reader.failure_map
+            self._failure_map_count = num_failures
+        return self._failure_map
+
+    def failure_summary(self, limit):
+        # The session publishes the number of failed test cases. The first page of failures is only read again when
+        # that number changes, and only until it is full: later failures come after it.
+        num_failures = self._stats.read()["num_failures"]
+        if num_failures != self._first_page_count and self._first_page_size < limit:
+            self._first_page, self._first_page_size = self._first_failures(limit)
+            self._first_page_count = num_failures
+        return num_failures, self._first_page
+
+    @property
+    def monitor_data(self):
+        return {}
+
+    @property
+    def total_num_mutations(self):
+        return self._stats.read()["total_num_mutations"]
+
+    @property
+    def total_mutant_index(self):
+        return self._stats.read()["total_mutant_index"]
+
+    @property
+    def mutant_index(self):
+        return self._stats.read()["mutant_index"]
+
+    @property
+    def is_paused(self):
+        return self._stats.paused
+
+    @is_paused.setter
+    def is_paused(self, value):
+        self._stats.paused = value
+
+    @property
+    def state(self):
+        return "finished" if self._stats.finished else "running"
+
+    @property
+    def exec_speed(self):
+        return self._stats.read()["exec_speed"]
+
+    @property
+    def runtime(self):
+        return self._stats.read()["runtime"]
+
+    @property
+    def current_test_case_name(self):
+        return self._stats.read()["current_test_case_name"]
+
+    def current_run_stats(self):
+        stats = self._stats.read()
+        return {
+            "is_paused": stats["is_paused"],
+            "current_index": stats["total_mutant_index"],
+            "num_mutations": stats["total_num_mutations"],
+            "current_index_element": stats["mutant_index"],
+            "num_mutations_element": stats["num_mutations_element"],
+            "current_element": stats["current_element"] or None,
+            "current_test_case_name": stats["current_test_case_name"],
+            "runtime": stats["runtime"],
+            "exec_speed": stats["exec_speed"],
+            "send_rate": stats["send_rate"],
+        }
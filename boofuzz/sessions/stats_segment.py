@@ -0,0 +1,202 @@
+"""Shared-memory segment carrying the live statistics of a fuzzing session.
+
+The fuzzing process owns a :class:`StatsSegmentWriter` and publishes a handful of counters into a small memory mapped
+file after each test case. Any other process (typically the web interface, see
+:func:`boofuzz.sessions.web_app.serve_live_web_ui`) opens the same file with a :class:`StatsSegmentReader` and gets a
+consistent snapshot without ever talking to the fuzzing process.
+
+Consistency is guaranteed by a sequence lock: the writer makes the sequence number odd before touching the payload and
+even again afterwards, readers retry until they observe the same even value before and after copying the payload.
+The pause flag lives outside of the protected payload, because it is the only field written by the readers.
+"""
+
+import mmap
+import os
+import struct
+import time
+
+MAGIC = b"FZGSTATS"
+VERSION = 2
+
+# magic, version, paused flag, finished flag, pid of the writer, sequence number
+_HEADER = struct.Struct("<8sHBBIQ")
+# total_mutant_index, total_num_mutations, mutant_index, num_mutations_element, num_failures,
+# start_time, runtime, exec_speed, send_rate, current_element, current_test_case_name
+_PAYLOAD = struct.Struct("<qqqqqdddd128s512s")
+
+_PAUSED_OFFSET = 10
+_FINISHED_OFFSET = 11
+_SEQ_OFFSET = 16
+_SEQ = struct.Struct("<Q")
+
+SEGMENT_SIZE = _HEADER.size + _PAYLOAD.size
+
+
+def _encode(text, size):
+    return (text or "").encode("utf-8", errors="replace")[:size]
+
+
+def _decode(raw):
+    return raw.rstrip(b"\x00").decode("utf-8", errors="replace")
+
+
+class StatsSegmentWriter:
+    """Create the stats segment at `path` and publish session statistics into it.
+
+    Args:
+        path (str): Location of the backing file. The file is created (or truncated) by the writer.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w+b")
+        self._file.truncate(SEGMENT_SIZE)
+        self._mmap = mmap.mmap(self._file.fileno(), SEGMENT_SIZE)
+        self._seq = 0
+        _HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, 0, 0, os.getpid(), self._seq)
+
+    @property
+    def paused(self):
+        """Pause flag, as toggled by the readers."""
+        return bool(self._mmap[_PAUSED_OFFSET])
+
+    @paused.setter
+    def paused(self, value):
+        self._mmap[_PAUSED_OFFSET] = 1 if value else 0
+
+    def publish(
+        self,
+        total_mutant_index,
+        total_num_mutations,
+        mutant_index,
+        num_mutations_element,
+        num_failures,
+        start_time,
+        runtime,
+        exec_speed,
+        current_element,
+        current_test_case_name,
+        send_rate=None,
+    ):
+        """Write a new snapshot of the session statistics.
+
+        `send_rate` is the rate of the session's pacer in sends per second, None without pacer.
+
+        This is a couple of `struct.pack_into` calls and is cheap enough to be done for every test case.
+        """
+        self._seq += 1
+        _SEQ.pack_into(self._mmap, _SEQ_OFFSET, self._seq)
+        _PAYLOAD.pack_into(
+            self._mmap,
+            _HEADER.size,
+            total_mutant_index,
+            -1 if total_num_mutations is None else total_num_mutations,
+            mutant_index,
+            num_mutations_element,
+            num_failures,
+            start_time,
+            runtime,
+            exec_speed,
+            -1.0 if send_rate is None else send_rate,
+            _encode(current_element, 128),
+            _encode(current_test_case_name, 512),
+        )
+        self._seq += 1
+        _SEQ.pack_into(self._mmap, _SEQ_OFFSET, self._seq)
+
+    def set_finished(self, finished=True):
+        self._mmap[_FINISHED_OFFSET] = 1 if finished else 0
+
+    def close(self, remove=False):
+        """Unmap the segment.
+
+        Args:
+            remove (bool): Also delete the backing file. Readers that already mapped it keep their view of it.
+        """
+        self._mmap.close()
+        self._file.close()
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                # Still opened by a reader on Windows, or already gone.
+                pass
+
+
+class StatsSegmentReader:
+    """Open an existing stats segment created by a :class:`StatsSegmentWriter`.
+
+    Args:
+        path (str): Location of the backing file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), SEGMENT_SIZE)
+        magic, version, _, _, _, _ = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("{0} is not a stats segment (version {1})".format(path, VERSION))
+
+    @property
+    def paused(self):
+        return bool(self._mmap[_PAUSED_OFFSET])
+
+    @paused.setter
+    def paused(self, value):
+        self._mmap[_PAUSED_OFFSET] = 1 if value else 0
+
+    @property
+    def finished(self):
+        return bool(self._mmap[_FINISHED_OFFSET])
+
+    @property
+    def writer_pid(self):
+        return _HEADER.unpack_from(self._mmap, 0)[4]
+
+    def read(self):
+        """Return a consistent snapshot of the segment as a dict.
+
+        Retries while the writer is in the middle of an update.
+        """
+        while True:
+            seq_before = _SEQ.unpack_from(self._mmap, _SEQ_OFFSET)[0]
+            if seq_before % 2 == 0:
+                payload = _PAYLOAD.unpack_from(self._mmap, _HEADER.size)
+                if _SEQ.unpack_from(self._mmap, _SEQ_OFFSET)[0] == seq_before:
+                    break
+            time.sleep(0)
+
+        (
+            total_mutant_index,
+            total_num_mutations,
+            mutant_index,
+            num_mutations_element,
+            num_failures,
+            start_time,
+            runtime,
+            exec_speed,
+            send_rate,
+            current_element,
+            current_test_case_name,
+        ) = payload
+        return {
+            "total_mutant_index": total_mutant_index,
+            "total_num_mutations": None if total_num_mutations < 0 else total_num_mutations,
+            "mutant_index": mutant_index,
+            "num_mutations_element": num_mutations_element,
+            "num_failures": num_failures,
+            "start_time": start_time,
+            "runtime": runtime,
+            "exec_speed": exec_speed,
+            "send_rate": None if send_rate < 0 else send_rate,
+            "current_element": _decode(current_element),
+            "current_test_case_name": _decode(current_test_case_name),
+            "is_paused": self.paused,
+            "finished": self.finished,
+        }
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
@@ -42,6 +42,9 @@ class Target:
     :type max_recv_bytes: int
     :param repeater: Repeater to use for sending. Default None.
     :type repeater: repeater.Repeater
+    :param readiness_probe: Probe telling when the target is ready after a restart, see
+        :class:`ReadinessProbe <boofuzz.sessions.readiness.ReadinessProbe>`. Default None: sleep a fixed time.
+    :type readiness_probe: ReadinessProbe
     :param procmon: Deprecated interface for adding a process monitor.
     :type procmon: BaseMonitor
     :param procmon_options: Deprecated interface for adding a process monitor.
@@ -58,6 +61,7 @@ class Target:
         monitor_alive:typing.Callable=None,
         max_recv_bytes=10000,
         repeater=None,
+        readiness_probe=None,
         procmon=None,
         procmon_options=None,
         **kwargs
@@ -67,6 +71,7 @@ class Target:
         self._target_connection = connection
         self.max_recv_bytes = max_recv_bytes
         self.repeater = repeater
+        self.readiness_probe = readiness_probe
         # If the monitor is a lone monitor, wrap it in a list.
         if isinstance(monitors, BaseMonitor):
             monitors = [monitors]
@@ -141,6 +146,20 @@ class Target:
         self._target_connection.open()
         self._fuzz_data_logger.log_info("Connection opened.")
 
+    def wait_until_ready(self):
+        """
+        Poll the readiness probe until the target is ready or the probe's timeout expires.
+
+        :return: Number of attempts when the target is ready, 0 on timeout.
+        """
+        if self._fuzz_data_logger is not None:
+            self._fuzz_data_logger.log_info(
+                "Waiting up to {0}s for the target to be ready ({1})...".format(
+                    self.readiness_probe.timeout, type(self.readiness_probe).__name__
+                )
+            )
+        return self.readiness_probe.wait(self, self.parent_session)
+
     def pedrpc_connect(self):
         warnings.warn(
             "pedrpc_connect has been renamed to monitors_alive. "
@@ -185,13 +204,14 @@ class Target:
         if max_bytes is None:
             max_bytes = self.max_recv_bytes
 
-        if self._fuzz_data_logger is not None:
-            self._fuzz_data_logger.log_info("Receiving...")
+        logger = self._fuzz_data_logger
+        if logger is not None and logger.accepts("info"):
+            logger.log_info("Receiving...")
 
         data = self._target_connection.recv(max_bytes=max_bytes)
 
-        if self._fuzz_data_logger is not None:
-            self._fuzz_data_logger.log_recv(data)
+        if logger is not None and logger.accepts("receive"):
+            logger.log_recv(data)
 
         return data
 
@@ -206,12 +226,13 @@ class Target:
             None
         """
         num_sent = 0
-        if self._fuzz_data_logger is not None:
+        logger = self._fuzz_data_logger
+        if logger is not None and logger.accepts("info"):
             repeat = ""
             if self.repeater is not None:
                 repeat = ", " + self.repeater.log_message()
 
-            self._fuzz_data_logger.log_info("Sending {0} bytes{1}...".format(len(data), repeat))
+            logger.log_info("Sending {0} bytes{1}...".format(len(data), repeat))
 
         if self.repeater is not None:
             self.repeater.start()
@@ -221,8 +242,8 @@ class Target:
         else:
             num_sent = self._target_connection.send(data=data)
 
-        if self._fuzz_data_logger is not None:
-            self._fuzz_data_logger.log_send(data[:num_sent])
+        if logger is not None and logger.accepts("send"):
+            logger.log_send(data[:num_sent])
 
     def set_fuzz_data_logger(self, fuzz_data_logger):
         """
@@ -1,3 +1,5 @@
+import errno
+import socket
 import threading
 
 from tornado.httpserver import HTTPServer
@@ -6,6 +8,7 @@ from tornado.wsgi import WSGIContainer
 
 from boofuzz import constants
 from boofuzz.web.app import app
+from .session_info import LiveSessionInfo
 
 
 class WebApp:
@@ -41,3 +44,39 @@ class WebApp:
         if not self._web_interface_thread.is_alive():
             # spawn the web interface.
             self._web_interface_thread.start()
+
+
+def serve_live_web_ui(
+    stats_segment_path,
+    db_name,
+    db_table_name,
+    web_port=constants.DEFAULT_WEB_UI_PORT,
+    web_address=constants.DEFAULT_WEB_UI_ADDRESS,
+):
+    """Serve the web interface of a running session from a separate process.
+
+    Live statistics come from the stats segment published by the session, everything else from the database, so
+    the web server never competes with the fuzzing loop. This function blocks; it is the target of the process
+    started by :class:`Session <boofuzz.Session>` when `web_ui_process` is enabled.
+
+    Args:
+        stats_segment_path (str): Path of the stats segment written by the session.
+        db_name (str): Name of the database of the campaign.
+        db_table_name (str | None): Name of the table in the database.
+        web_port (int): Port for monitoring fuzzing campaign via a web browser. Default 26000.
+        web_address (string): Address binded to port. Default 'localhost'.
+    """
+    app.session = LiveSessionInfo(stats_segment_path=stats_segment_path, db_name=db_name, db_table_name=db_table_name)
+    http_server = HTTPServer(WSGIContainer(app))
+    while True:
+        try:
+            http_server.listen(web_port, address=web_address)
+        except socket.error as exc:
+            # Only handle "Address already in use"
+            if exc.errno != errno.EADDRINUSE:
+                raise
+            web_port += 1
+        else:
+            print("Web interface can be found at http://%s:%d" % (web_address, web_port))
+            break
+    IOLoop.current().start()
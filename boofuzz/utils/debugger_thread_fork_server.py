@@ -0,0 +1,167 @@
+"""Start targets through the AFL fork server, so that restarting a target takes milliseconds.
+
+Targets built with afl-clang-fast / afl-gcc (or any compiler wrapper linking the AFL++ runtime) run a fork server
+when file descriptors 198 and 199 are open: the process initialises once (up to ``__AFL_INIT()`` with deferred
+initialisation, or up to ``main`` otherwise), writes four bytes on fd 199 to say it is ready, then, for every four
+bytes read on fd 198, forks a child starting from that state, writes the child's pid on fd 199 and, when the child
+exits, its ``waitpid`` status. Restarting the target is then a fork instead of an exec and an initialisation.
+"""
+
+import atexit
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import threading
+
+from .debugger_thread_simple import DebuggerThreadSimple
+
+FORKSRV_FD = 198
+# AFL++ speaks an extended handshake unless told otherwise.
+OLD_FORKSERVER_ENV = {"AFL_OLD_FORKSERVER": "1"}
+
+
+class ForkServer:
+    """
+    A target process running the AFL fork server.
+
+    Args:
+        command (list of str): Command starting the instrumented target.
+        env (dict): Environment of the target. Default None: the environment of this process.
+        init_timeout (float): Seconds to wait for the fork server to be ready. Default 10.
+    """
+
+    def __init__(self, command, env=None, init_timeout=10.0):
+        control_read, self._control = os.pipe()
+        self._status, status_write = os.pipe()
+
+        def attach_pipes():
+            os.dup2(control_read, FORKSRV_FD)
+            os.dup2(status_write, FORKSRV_FD + 1)
+
+        try:
+            # The pipe ends are not inheritable; only their copies on 198 and 199 reach the target.
+            self.process = subprocess.Popen(
+                command, env=dict(env or os.environ, **OLD_FORKSERVER_ENV), preexec_fn=attach_pipes, close_fds=False
+            )
+        finally:
+            os.close(control_read)
+            os.close(status_write)
+
+        self._lock = threading.Lock()
+        self.child_pid = None
+        if self._read_int(timeout=init_timeout) is None:
+            self.close()
+            raise RuntimeError(
+                "No fork server handshake from {0}: is the target built with AFL instrumentation?".format(command)
+            )
+        atexit.register(self.close)
+
+    def _read_int(self, timeout=None):
+        """Read a 4-byte integer from the status pipe, or return None on timeout or end of file."""
+        data = b""
+        while len(data) < 4:
+            if timeout is not None and not select.select([self._status], [], [], timeout)[0]:
+                return None
+            chunk = os.read(self._status, 4 - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return struct.unpack("I", data)[0]
+
+    def is_running(self):
+        return self.process.poll() is None
+
+    def fork(self):
+        """Fork a new child from the initialised target and return its pid."""
+        with self._lock:
+            os.write(self._control, struct.pack("I", 0))
+            pid = self._read_int(timeout=10)
+        if not pid:
+            raise RuntimeError("The fork server did not start a child")
+        self.child_pid = pid
+        return pid
+
+    def wait(self):
+        """Block until the current child exits and return its waitpid status, or None if the fork server died."""
+        status = self._read_int()
+        self.child_pid = None
+        return status
+
+    def close(self):
+        """Stop the fork server and its child."""
+        for pid in (self.child_pid, self.process.pid):
+            if pid is None:
+                continue
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+        self.process.wait()
+        for fd in (self._control, self._status):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._control = self._status = -1
+
+
+class DebuggerThreadForkServer(DebuggerThreadSimple):
+    """Debugger thread starting the target through the AFL fork server (Linux and macOS only).
+
+    The first start launches the last start command as a fork server; each start, including the first one, then
+    forks a fresh child from the initialised target, whose exit status is reported like DebuggerThreadSimple does.
+    The fork server is kept by the process monitor across restarts. Earlier start commands run once, before the fork
+    server. Children inherit the fork server's stdout and stderr: capture_output is not supported.
+
+    Use it with :class:`ProcessMonitorLocal <boofuzz.ProcessMonitorLocal>` as debugger_class, and set the session's
+    seconds_to_wait_after_restart to 0.
+    """
+
+    settle_time = 0
+    stop_grace_time = 0
+
+    def __init__(self, start_commands, process_monitor, **kwargs):
+        super(DebuggerThreadForkServer, self).__init__(start_commands, process_monitor, **kwargs)
+        self.capture_output = False
+
+    def _fork_server(self):
+        server = getattr(self.process_monitor, "fork_server", None)
+        if server is not None and server.is_running():
+            return server
+
+        for command in self.start_commands[:-1]:
+            self.log("exec start command: {0}".format(command))
+            subprocess.Popen(command)
+        env = dict(os.environ, **self.env) if self.env else None
+        self.log("starting fork server: {0}".format(self.start_commands[-1]))
+        server = ForkServer(self.start_commands[-1], env=env)
+        self.process_monitor.fork_server = server
+        return server
+
+    def spawn_target(self):
+        try:
+            self.pid = self._fork_server().fork()
+        except (OSError, RuntimeError) as e:
+            print("Error while starting the fork server: {0}".format(e), file=sys.stderr)
+            return False
+        self.process_monitor.log("forked target, pid: {0}".format(self.pid))
+        return True
+
+    def run(self):
+        if not self.spawn_target():
+            self.finished_starting.set()
+            self.process_monitor.last_synopsis = "Fork server failed to start the target\n"
+            return
+        self.finished_starting.set()
+        self.exit_status = self.process_monitor.fork_server.wait()
+        self._record_exit()
+
+    def shutdown(self):
+        """Stop the fork server, when the process monitor is done."""
+        server = getattr(self.process_monitor, "fork_server", None)
+        if server is not None:
+            server.close()
+            self.process_monitor.fork_server = None
@@ -57,6 +57,10 @@ class DebuggerThreadSimple(threading.Thread):
     the exit status/code.
     """
 
+    # Seconds ProcessMonitorLocal waits after the thread has started the target, and before stopping it.
+    settle_time = 2
+    stop_grace_time = 1
+
     def __init__(
         self,
         start_commands,
@@ -66,6 +70,7 @@ class DebuggerThreadSimple(threading.Thread):
         coredump_dir=None,
         log_level=1,
         capture_output=False,
+        env=None,
         **kwargs
     ):
         threading.Thread.__init__(self)
@@ -76,6 +81,7 @@ class DebuggerThreadSimple(threading.Thread):
         self.process_monitor = process_monitor
         self.coredump_dir = coredump_dir
         self.capture_output = capture_output
+        self.env = env
         self.finished_starting = threading.Event()
         # if isinstance(start_commands, basestring):
         #     self.tokens = start_commands.split(' ')
@@ -104,10 +110,11 @@ class DebuggerThreadSimple(threading.Thread):
         for command in self.start_commands:
             self.log("exec start command: {0}".format(command))
             try:
+                env = dict(os.environ, **self.env) if self.env else None
                 if self.capture_output:
-                    self._process = subprocess.Popen(command, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+                    self._process = subprocess.Popen(command, stderr=subprocess.PIPE, stdout=subprocess.PIPE, env=env)
                 else:
-                    self._process = subprocess.Popen(command)
+                    self._process = subprocess.Popen(command, env=env)
             except WindowsError as e:
                 print(
                     'WindowsError {errno}: "{strerror} while starting "{cmd}"'.format(
@@ -153,6 +160,10 @@ class DebuggerThreadSimple(threading.Thread):
             exit_info = os.waitpid(self.pid, 0)
             self.exit_status = exit_info[1]  # [0] is the pid
 
+        self._record_exit()
+
+    def _record_exit(self):
+        """Build the crash synopsis of the process from self.exit_status and its output, if captured."""
         default_reason = "Process died for unknown reason"
         if self.exit_status is not None:
             if os.WCOREDUMP(self.exit_status):
@@ -30,7 +30,9 @@ def _split_command_if_str(command):
 
 
 class ProcessMonitorLocal(BaseMonitor):
-    def __init__(self, crash_filename, debugger_class, proc_name=None, pid_to_ignore=None, level=1, coredump_dir=None):
+    def __init__(
+        self, crash_filename, debugger_class, proc_name=None, pid_to_ignore=None, level=1, coredump_dir=None, env=None
+    ):
         """
         @type  crash_filename: str
         @param crash_filename: Name of file to (un)serialize crash bin to/from
@@ -40,6 +42,9 @@ class ProcessMonitorLocal(BaseMonitor):
         @param pid_to_ignore:  (Optional, def=None) Ignore this PID when searching for the target process
         @type  level:          int
         @param level:          (Optional, def=1) Log output level, increase for more verbosity
+        @type  env:            dict
+        @param env:            (Optional, def=None) Environment variables added to the target's environment, e.g.
+                               CoverageMap.env
         """
 
         self.crash_filename = os.path.abspath(crash_filename)
@@ -48,11 +53,13 @@ class ProcessMonitorLocal(BaseMonitor):
         self.ignore_pid = pid_to_ignore
         self.log_level = level
         self.capture_output = False
+        self.env = env
 
         self.stop_commands = []
         self.start_commands = []
         self.test_number = None
         self.debugger_thread = None
+        self.fork_server = None  # kept across restarts by DebuggerThreadForkServer
         self.crash_bin = utils.crash_binning.CrashBinning()
 
         self.last_synopsis = ""
@@ -77,6 +84,8 @@ class ProcessMonitorLocal(BaseMonitor):
     def __exit__(self, exc_type, exc_value, traceback):
         if self.debugger_thread is not None and self.debugger_thread.is_alive():
             self.debugger_thread.stop_target()
+        if self.debugger_thread is not None and hasattr(self.debugger_thread, "shutdown"):
+            self.debugger_thread.shutdown()
 
     # noinspection PyMethodMayBeStatic
     def alive(self):
@@ -159,12 +168,15 @@ class ProcessMonitorLocal(BaseMonitor):
             log_level=self.log_level,
             coredump_dir=self.coredump_dir,
             capture_output=self.capture_output,
+            env=self.env,
         )
         self.debugger_thread.daemon = True
         self.debugger_thread.start()
         self.debugger_thread.finished_starting.wait()
-        self.log("giving debugger thread 2 seconds to settle in", 5)
-        time.sleep(2)
+        settle_time = getattr(self.debugger_class, "settle_time", 2)
+        if settle_time:
+            self.log("giving debugger thread {0} seconds to settle in".format(settle_time), 5)
+            time.sleep(settle_time)
         return True
 
     def stop_target(self):
@@ -191,17 +203,15 @@ class ProcessMonitorLocal(BaseMonitor):
 
     def _stop_target(self):
         # give the debugger thread a chance to exit.
-        time.sleep(1)
+        time.sleep(getattr(self.debugger_class, "stop_grace_time", 1))
         if len(self.stop_commands) < 1:
             self.debugger_thread.stop_target()
-            while self.debugger_thread.is_alive():
-                time.sleep(0.1)
+            self.debugger_thread.join()
         else:
             for command in self.stop_commands:
                 if command == ["TERMINATE_PID"] or command == "TERMINATE_PID":
                     self.debugger_thread.stop_target()
-                    while self.debugger_thread.is_alive():
-                        time.sleep(0.1)
+                    self.debugger_thread.join()
                 else:
                     self.log("Executing stop command: '{0}'".format(command), 2)
                     subprocess.Popen(command)
@@ -237,6 +247,10 @@ class ProcessMonitorLocal(BaseMonitor):
         self.stop_commands = new_stop_commands
         self.stop_commands = list(map(_split_command_if_str, new_stop_commands))
 
+    def set_env(self, new_env):
+        self.log("updating target environment to: {0}".format(new_env))
+        self.env = new_env
+
     def set_crash_filename(self, new_crash_filename):
         self.log("updating crash bin filename to '%s'" % new_crash_filename)
         self.crash_filename = new_crash_filename
@@ -61,6 +61,7 @@ class ProcessMonitorPedrpcServer(pedrpc.Server):
         self.start_commands = []
         self.test_number = None
         self.debugger_thread = None
+        self.fork_server = None  # kept across restarts by DebuggerThreadForkServer
         self.crash_bin = utils.crash_binning.CrashBinning()
 
         self.last_synopsis = ""
@@ -85,6 +86,8 @@ class ProcessMonitorPedrpcServer(pedrpc.Server):
     def __exit__(self, exc_type, exc_value, traceback):
         if self.debugger_thread is not None and self.debugger_thread.is_alive():
             self.debugger_thread.stop_target()
+        if self.debugger_thread is not None and hasattr(self.debugger_thread, "shutdown"):
+            self.debugger_thread.shutdown()
         self.stop()
 
     # noinspection PyMethodMayBeStatic
@@ -165,8 +168,10 @@ class ProcessMonitorPedrpcServer(pedrpc.Server):
         self.debugger_thread.daemon = True
         self.debugger_thread.start()
         self.debugger_thread.finished_starting.wait()
-        self.log("giving debugger thread 2 seconds to settle in", 5)
-        time.sleep(2)
+        settle_time = getattr(self.debugger_class, "settle_time", 2)
+        if settle_time:
+            self.log("giving debugger thread {0} seconds to settle in".format(settle_time), 5)
+            time.sleep(settle_time)
         return True
 
     def stop_target(self):
@@ -193,17 +198,15 @@ class ProcessMonitorPedrpcServer(pedrpc.Server):
 
     def _stop_target(self):
         # give the debugger thread a chance to exit.
-        time.sleep(1)
+        time.sleep(getattr(self.debugger_class, "stop_grace_time", 1))
         if len(self.stop_commands) < 1:
             self.debugger_thread.stop_target()
-            while self.debugger_thread.is_alive():
-                time.sleep(0.1)
+            self.debugger_thread.join()
         else:
             for command in self.stop_commands:
                 if command == ["TERMINATE_PID"] or command == "TERMINATE_PID":
                     self.debugger_thread.stop_target()
-                    while self.debugger_thread.is_alive():
-                        time.sleep(0.1)
+                    self.debugger_thread.join()
                 else:
                     self.log("Executing stop command: '{0}'".format(command), 2)
                     subprocess.Popen(command)
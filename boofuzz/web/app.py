@@ -4,9 +4,12 @@ import os
 import flask
 from flask import Flask, redirect, render_template
 
-from .. import exception
+from .. import exception, helpers
 
 MAX_LOG_LINE_LEN = 1500
+LIVE_LOG_TIMEOUT = 20  # seconds a long-polling client may be kept waiting
+MAX_PAGE_SIZE = 500
+CRASH_SUMMARY_SIZE = 50  # failures listed on the index page, the others are paged through /api/failures
 
 prefix = os.environ.get("FLASK_APP_PREFIX", "")
 
@@ -51,6 +54,102 @@ def api_test_case(test_case_index):
     return flask.jsonify(data)
 
 
+@app.route(f"{prefix}/api/live-log")
+def api_live_log():
+    """Long-poll the log of the current test case.
+
+    Returns as soon as entries newer than the `after` sequence number have been logged, or after `timeout` seconds.
+    Entries come from the in-memory ring buffer of the session; `supported` is False when there is none, in which case
+    the client falls back to polling /api/current-test-case.
+    """
+    live_log = getattr(app.session, "live_log", None)
+    if live_log is None:
+        return flask.jsonify({"supported": False})
+
+    after = flask.request.args.get("after", default=0, type=int)
+    timeout = min(flask.request.args.get("timeout", default=LIVE_LOG_TIMEOUT, type=float), LIVE_LOG_TIMEOUT)
+    index, reset, last_seq, entries = live_log.wait_for_entries(after_seq=after, timeout=timeout)
+    data = {
+        "supported": True,
+        "index": index,
+        "reset": reset,
+        "last_seq": last_seq,
+        "log_data": [entry.to_dict() for entry in entries],
+    }
+    return flask.jsonify(data)
+
+
+def _page_limit(default):
+    return max(1, min(flask.request.args.get("limit", default=default, type=int), MAX_PAGE_SIZE))
+
+
+@app.route(f"{prefix}/api/cases")
+def api_cases():
+    """Page through the test cases of the campaign, in index order.
+
+    Query parameters: `after_number` and `after_id` (keyset of the last case already seen), `limit`, and `failed=1` to
+    list failed test cases only. The response holds the keyset of the next page in `next`, or null on the last page.
+    """
+    limit = _page_limit(default=50)
+    cases = app.session.db_reader.get_cases_page(
+        after_number=flask.request.args.get("after_number", default=0, type=int),
+        after_id=flask.request.args.get("after_id", default=0, type=int),
+        limit=limit,
+        failed_only=flask.request.args.get("failed", default=0, type=int) == 1,
+    )
+    next_page = None
+    if len(cases) == limit:
+        next_page = {"after_number": cases[-1]["number"], "after_id": cases[-1]["id"]}
+    return flask.jsonify({"cases": cases, "next": next_page})
+
+
+@app.route(f"{prefix}/api/failures")
+def api_failures():
+    """Page through the failures of the campaign, in the order they were logged.
+
+    Query parameters: `after` (id of the last failure already seen) and `limit`.
+    """
+    limit = _page_limit(default=50)
+    failures = app.session.db_reader.get_failures_page(
+        after_id=flask.request.args.get("after", default=0, type=int), limit=limit
+    )
+    next_page = {"after": failures[-1]["id"]} if len(failures) == limit else None
+    return flask.jsonify({"failures": failures, "next": next_page})
+
+
+@app.route(f"{prefix}/api/test-case/<int:test_case_index>/steps")
+def api_test_case_steps(test_case_index):
+    """Page through the steps of a test case.
+
+    Payloads are not sent: each step has its length and a hex preview of its first `preview` bytes. The whole payload
+    is available from /api/step/<id>/data.
+
+    Query parameters: `after` (id of the last step already seen), `limit` and `preview`.
+    """
+    limit = _page_limit(default=100)
+    steps = app.session.db_reader.get_steps_page(
+        test_case_index=test_case_index,
+        after_id=flask.request.args.get("after", default=0, type=int),
+        limit=limit,
+        preview_length=max(0, min(flask.request.args.get("preview", default=64, type=int), MAX_LOG_LINE_LEN)),
+    )
+    for step in steps:
+        step["css_class"] = helpers.test_step_info[step["type"]]["css_class"]
+    next_page = {"after": steps[-1]["id"]} if len(steps) == limit else None
+    return flask.jsonify({"index": test_case_index, "steps": steps, "next": next_page})
+
+
+@app.route(f"{prefix}/api/step/<int:step_id>/data")
+def api_step_data(step_id):
+    """Whole payload of a step, as hex, or as raw bytes with `raw=1`."""
+    data = app.session.db_reader.get_step_data(step_id)
+    if data is None:
+        flask.abort(404)
+    if flask.request.args.get("raw", default=0, type=int) == 1:
+        return flask.Response(data, mimetype="application/octet-stream")
+    return flask.jsonify({"id": step_id, "length": len(data), "data": data.hex()})
+
+
 def _get_log_data(test_case_id):
     results = []
     try:
@@ -67,40 +166,28 @@ def _get_log_data(test_case_id):
 
 @app.route(f"{prefix}/api/current-run")
 def index_update():
-    data = {
-        "session_info": {
-            "is_paused": app.session.is_paused,
-            "current_index": app.session.total_mutant_index,
-            "num_mutations": app.session.total_num_mutations,
-            "current_index_element": app.session.mutant_index if app.session is not None else None,
-            "num_mutations_element": (
-                app.session.fuzz_node.get_num_mutations() if app.session.fuzz_node is not None else None
-            ),
-            "current_element": app.session.fuzz_node.name if app.session.fuzz_node is not None else None,
-            "current_test_case_name": app.session.current_test_case_name,
-            "crashes": _crash_summary_info(),
-            "runtime": app.session.runtime,
-            "exec_speed": app.session.exec_speed,
-        }
-    }
+    session_info = app.session.current_run_stats()
+    session_info["num_failures"], session_info["crashes"] = _crash_summary_info()
+    data = {"session_info": session_info}
 
     return flask.jsonify(data)
 
 
 @app.route(f"{prefix}/")
 def index():
-    crashes = _crash_summary_info()
+    num_failures, crashes = _crash_summary_info()
+    stats = app.session.current_run_stats()
 
     # which node (request) are we currently fuzzing.
-    if app.session.fuzz_node is not None and app.session.fuzz_node.name:
-        current_name = app.session.fuzz_node.name
+    if stats["current_element"]:
+        current_name = stats["current_element"]
     else:
         current_name = "[N/A]"
 
     # render sweet progress bars.
-    if app.session.fuzz_node is not None:
-        mutant_index = float(app.session.mutant_index)
-        num_mutations = float(app.session.fuzz_node.get_num_mutations())
+    if stats["current_element"] is not None:
+        mutant_index = float(stats["current_index_element"])
+        num_mutations = float(stats["num_mutations_element"])
 
         try:
             progress_current = min(mutant_index / num_mutations, 1)
@@ -115,8 +202,8 @@ def index():
         mutant_index = 0
         num_mutations = 100  # TODO improve template instead of hard coding fake values
 
-    total_mutant_index = float(app.session.total_mutant_index)
-    total_num_mutations = app.session.total_num_mutations
+    total_mutant_index = float(stats["current_index"])
+    total_num_mutations = stats["num_mutations"]
     if total_num_mutations is None:
         progress_total = 0
     else:
@@ -142,15 +229,16 @@ def index():
         "total_num_mutations": commify(int(total_num_mutations)) if total_num_mutations is not None else None,
     }
 
-    return render_template("index.html", state=state, crashes=crashes)
+    return render_template("index.html", state=state, crashes=crashes, num_failures=num_failures)
 
 
 def _crash_summary_info():
+    """Return the number of failed test cases and the summary of the first failures."""
+    num_failures, monitor_results = app.session.failure_summary(limit=CRASH_SUMMARY_SIZE)
+
     crashes = []
-    procmon_result_keys = list(app.session.monitor_results)
-    procmon_result_keys.sort()
-    for key in procmon_result_keys:
-        val = app.session.monitor_results[key]
+    for key in sorted(monitor_results):
+        val = monitor_results[key]
         status_bytes = "&nbsp;"
 
         if key in app.session.monitor_data:
@@ -158,4 +246,5 @@ def _crash_summary_info():
 
         crash = {"key": key, "reasons": val, "status_bytes": status_bytes}
         crashes.append(crash)
-    return crashes
+
+    return num_failures, crashes
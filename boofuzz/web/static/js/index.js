@@ -3,6 +3,8 @@ let failure_map = {};
 let test_case_log_snap = true;
 let test_case_log_index = 0;
 let last_test_case_log_response = "";
+let live_log_supported = true;
+let live_log_seq = 0;
 
 const StringUtilities = {
     repeat: function (str, times) {
@@ -18,6 +20,8 @@ function update_current_run_info(response) {
     document.getElementById('current_element').textContent = response.session_info.current_element + ":";
     document.getElementById('current_test_case_name').textContent = response.session_info.current_test_case_name;
     document.getElementById('exec_speed').textContent = response.session_info.exec_speed.toFixed(1) + "/sec";
+    document.getElementById('send_rate').textContent = response.session_info.send_rate == null ?
+        "not paced" : response.session_info.send_rate.toFixed(1) + "/sec";
     document.getElementById('run_time').textContent = response.session_info.runtime.toFixed(0) + " sec";
 
 
@@ -122,6 +126,35 @@ function update_current_test_case_log(response) {
     test_cases_table.appendChild(new_entries);
 }
 
+function make_log_row(log_entry) {
+    let new_span = document.createElement('span');
+    new_span.setAttribute('class', log_entry.css_class);
+    new_span.textContent = log_entry.log_line;
+    let new_td = document.createElement('td');
+    let new_tr = document.createElement('tr');
+    new_td.appendChild(new_span);
+    new_tr.appendChild(new_td);
+    return new_tr;
+}
+
+function update_live_test_case_log(response) {
+    let test_cases_table = document.getElementById('test-steps-table');
+    let entries = test_cases_table.firstChild;
+    if (response.reset || live_log_seq === 0 || entries === null) {
+        logUpdateIndex(response.index);
+        while (test_cases_table.firstChild){
+            test_cases_table.removeChild(test_cases_table.firstChild);
+        }
+        entries = document.createElement('tbody');
+        test_cases_table.appendChild(entries);
+    }
+    response.log_data.forEach(function(log_entry) {
+        entries.appendChild(make_log_row(log_entry));
+    });
+    // Make sure a switch back to polling redraws the table.
+    last_test_case_log_response = "";
+}
+
 function continually_update_current_run_info()
 {
     function update_repeat(response)
@@ -157,7 +190,29 @@ function continually_update_current_test_case_log()
     {
         setTimeout(continually_update_current_test_case_log, 100);
     }
-    if (test_case_log_snap) {
+    function update_live_repeat(response)
+    {
+        if (!response.supported) {
+            live_log_supported = false;
+        }
+        else if (test_case_log_snap) {
+            update_live_test_case_log(response);
+            live_log_seq = response.last_seq;
+        }
+        // The server only answers when there is something new, so ask again right away.
+        setTimeout(continually_update_current_test_case_log, 0);
+    }
+    function _live_repeat_only()
+    {
+        setTimeout(continually_update_current_test_case_log, 1000);
+    }
+    if (test_case_log_snap && live_log_supported) {
+        fetch(new Request(`api/live-log?after=${live_log_seq}`), {method: 'GET'})
+            .then(function(response) { return response.json() })
+            .then(update_live_repeat)
+            .catch(_live_repeat_only);
+    }
+    else if (test_case_log_snap) {
         fetch(new Request('api/current-test-case'), {method: 'GET'})
             .then(function(response) { return response.json() })
             .then(update_repeat)
@@ -211,6 +266,8 @@ function initialize_state(){
 
 function logSnapChangeHandler(event){
     test_case_log_snap = event.target.checked;
+    // Start over from the whole current test case.
+    live_log_seq = 0;
     if (test_case_log_snap) {
         document.getElementById('test-case-log-index-input').value = '';
     }
@@ -233,6 +290,7 @@ function logNavGoTo(num){
 
 function logUpdateSnap(on){
     test_case_log_snap = on;
+    live_log_seq = 0;
     document.getElementById('test-case-log-snap').checked = on;
 }
 
@@ -4,6 +4,7 @@ import click
 
 from boofuzz import helpers
 from boofuzz.constants import DEFAULT_PROCMON_PORT
+from boofuzz.utils.debugger_thread_fork_server import DebuggerThreadForkServer
 from boofuzz.utils.debugger_thread_simple import DebuggerThreadSimple
 from boofuzz.utils.process_monitor_pedrpc_server import ProcessMonitorPedrpcServer
 
@@ -43,12 +44,12 @@ def err(msg):
     sys.stderr.write("ERR> " + msg + "\n") or sys.exit(1)
 
 
-def serve_procmon(port, crash_bin, proc_name, ignore_pid, log_level, coredump_dir):
+def serve_procmon(port, crash_bin, proc_name, ignore_pid, log_level, coredump_dir, fork_server=False):
     with ProcessMonitorPedrpcServer(
         host="0.0.0.0",
         port=port,
         crash_filename=crash_bin,
-        debugger_class=DebuggerThreadSimple,
+        debugger_class=DebuggerThreadForkServer if fork_server else DebuggerThreadSimple,
         proc_name=proc_name,
         pid_to_ignore=ignore_pid,
         level=log_level,
@@ -92,7 +93,12 @@ def serve_procmon(port, crash_bin, proc_name, ignore_pid, log_level, coredump_di
     help="directory where coredumps are moved to (you may need to adjust ulimits to create coredumps)",
     default="coredumps",
 )
-def go(crash_bin, ignore_pid, log_level, proc_name, port, coredump_dir):
+@click.option(
+    "--fork-server",
+    is_flag=True,
+    help="start the target through the AFL fork server (AFL-instrumented targets only): restarts take milliseconds",
+)
+def go(crash_bin, ignore_pid, log_level, proc_name, port, coredump_dir, fork_server):
     if coredump_dir is not None:
         helpers.mkdir_safe(coredump_dir)
 
@@ -103,6 +109,7 @@ def go(crash_bin, ignore_pid, log_level, proc_name, port, coredump_dir):
         ignore_pid=ignore_pid,
         log_level=log_level,
         coredump_dir=coredump_dir,
+        fork_server=fork_server,
     )
 
 
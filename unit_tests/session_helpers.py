@@ -0,0 +1,29 @@
+"""Sessions for the unit tests, built by the Session constructor without database, web interface nor console output."""
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Session
+from boofuzz.loggers import fuzz_logger_postgres
+
+
+def make_session(target=None, fuzz_loggers=None, **kwargs):
+    """Return a Session fuzzing `target`, logging to `fuzz_loggers` (default: nowhere) and to a mocked database.
+
+    Other keyword arguments are passed to the Session.
+    """
+    with mock.patch.object(fuzz_logger_postgres, "FuzzLoggerPostgres", autospec=True):
+        return Session(
+            target=target,
+            fuzz_loggers=[] if fuzz_loggers is None else fuzz_loggers,
+            web_port=None,
+            keep_web_open=False,
+            **kwargs,
+        )
+
+
+def mock_target(**kwargs):
+    """Return a mocked Target, without monitors unless given, for make_session()."""
+    kwargs.setdefault("monitors", [])
+    return mock.Mock(monitor_alive=[], **kwargs)
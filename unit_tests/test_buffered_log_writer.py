@@ -0,0 +1,124 @@
+import io
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.loggers.buffered_log_writer import BufferedLogWriter
+from boofuzz.loggers.fuzz_logger_text import FuzzLoggerText
+
+
+class TestBufferedLogWriter(unittest.TestCase):
+    def setUp(self):
+        self.file_handle = io.StringIO()
+        self.uut = BufferedLogWriter(self.file_handle, buffer_size=10, flush_interval=3600)
+
+    def tearDown(self):
+        self.uut.close()
+
+    def test_write_is_buffered(self):
+        """
+        Given: A BufferedLogWriter with a buffer size of 10.
+        When: Writing less than 10 characters, then flushing.
+        Then: Nothing is written before the flush, everything after.
+        """
+        self.uut.write("abc")
+        self.assertEqual("", self.file_handle.getvalue())
+
+        self.uut.flush()
+        self.assertEqual("abc", self.file_handle.getvalue())
+
+    def test_full_buffer_is_written(self):
+        """
+        Given: A BufferedLogWriter with a buffer size of 10.
+        When: Writing 10 characters.
+        Then: They are written without a flush.
+        """
+        self.uut.write("abcde")
+        self.uut.write("fghij")
+
+        self.assertEqual("abcdefghij", self.file_handle.getvalue())
+
+    def test_overwritable_line_is_dropped(self):
+        """
+        Given: A BufferedLogWriter holding an overwritable status line.
+        When: Writing another overwritable status line, then flushing.
+        Then: Only the second status line is written.
+        """
+        self.uut.write("\r1")
+        self.uut.write("\r2", overwritable=True)
+        self.uut.write("\r3", overwritable=True)
+        self.uut.flush()
+
+        self.assertEqual("\r1\r3", self.file_handle.getvalue())
+
+    def test_close(self):
+        """
+        Given: A BufferedLogWriter holding text, with its flush thread running.
+        When: Closing it.
+        Then: The text is written, the thread stops and the exit handler is unregistered, until the next write.
+        """
+        self.uut.write("abc")
+        thread = self.uut._flush_thread
+
+        with mock.patch("atexit.unregister") as unregister:
+            self.uut.close()
+
+        self.assertEqual("abc", self.file_handle.getvalue())
+        self.assertFalse(thread.is_alive())
+        unregister.assert_called_once_with(self.uut.flush)
+
+        self.uut.write("d")
+        self.assertTrue(self.uut._flush_thread.is_alive())
+
+
+class TestFuzzLoggerTextBuffering(unittest.TestCase):
+    def setUp(self):
+        self.file_handle = io.StringIO()
+
+    def test_filtered_messages_are_not_formatted(self):
+        """
+        Given: A FuzzLoggerText at log level 1.
+        When: Logging sent data.
+        Then: Nothing is formatted nor written.
+        """
+        uut = FuzzLoggerText(file_handle=self.file_handle, log_level=1)
+
+        with mock.patch("boofuzz.helpers.format_log_msg") as format_log_msg:
+            uut.log_send(b"data")
+
+        format_log_msg.assert_not_called()
+        self.assertEqual("", self.file_handle.getvalue())
+
+    def test_failures_are_flushed(self):
+        """
+        Given: A buffered FuzzLoggerText at log level 2.
+        When: Logging an info message, then a failure.
+        Then: Nothing is written after the info message, both messages after the failure.
+        """
+        uut = FuzzLoggerText(file_handle=self.file_handle, log_level=2, buffered=True, flush_interval=3600)
+
+        uut.log_info("info")
+        self.assertEqual("", self.file_handle.getvalue())
+
+        uut.log_fail("fail")
+        self.assertIn("info", self.file_handle.getvalue())
+        self.assertIn("fail", self.file_handle.getvalue())
+
+    def test_data_dump_is_capped(self):
+        """
+        Given: A FuzzLoggerText with max_data_length of 2.
+        When: Logging 4 bytes of sent data.
+        Then: The full length is logged but only 2 bytes are dumped.
+        """
+        uut = FuzzLoggerText(file_handle=self.file_handle, log_level=3, max_data_length=2)
+
+        uut.log_send(b"ABCD")
+
+        self.assertIn("Transmitted 4 bytes (first 2 bytes shown)", self.file_handle.getvalue())
+        self.assertIn(": 41 42 b'AB'", self.file_handle.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
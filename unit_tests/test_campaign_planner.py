@@ -0,0 +1,76 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import exception
+from boofuzz.primitives import String
+from boofuzz.sessions import CampaignPlanner, parse_duration
+
+
+class TestParseDuration(unittest.TestCase):
+    def test_units(self):
+        """
+        Given: Durations with and without units.
+        When: Parsing them.
+        Then: They are converted to seconds, and invalid ones are rejected.
+        """
+        self.assertEqual(90, parse_duration("90"))
+        self.assertEqual(9000, parse_duration("2h30m"))
+        self.assertEqual(86400, parse_duration("1d"))
+        with self.assertRaises(ValueError):
+            parse_duration("2 hours")
+
+
+class TestCampaignPlanner(unittest.TestCase):
+    def setUp(self):
+        self.primitive = String(name="s", default_value="abc")
+        self.session = mock.Mock(round_type="library", num_cases_actually_fuzzed=0, total_num_mutations=7)
+        self.session.nodes = {0: object(), 1: mock.Mock(names={"r.s": self.primitive})}
+        self.session.num_mutations.side_effect = lambda: 5 * self.primitive.num_library_elements
+
+    def test_round_is_scaled_to_fit(self):
+        """
+        Given: A 100 s budget at 1 case/s and a library round of 250 cases.
+        When: Planning the library round, which gets 40 s.
+        Then: Element budgets are scaled by 40/250 and total_num_mutations is left alone.
+        """
+        uut = CampaignPlanner(time_budget=100, initial_exec_speed=1)
+        uut.start(self.session)
+
+        scale = uut.plan_round(self.session)
+
+        self.assertAlmostEqual(40 / 250, scale, places=2)
+        self.assertEqual(7, self.primitive.num_library_elements)
+        self.assertEqual(7, self.session.total_num_mutations)
+
+    def test_budgets_restored_when_round_fits(self):
+        """
+        Given: A planner that scaled budgets down for a round.
+        When: Planning a round that fits with the original budgets.
+        Then: The original budgets are restored.
+        """
+        uut = CampaignPlanner(time_budget=100, initial_exec_speed=1)
+        uut.start(self.session)
+        uut.plan_round(self.session)
+
+        uut.initial_exec_speed = 1000
+        self.assertEqual(1.0, uut.plan_round(self.session))
+        self.assertEqual(50, self.primitive.num_library_elements)
+
+    def test_deadline(self):
+        """
+        Given: A planner whose budget is spent.
+        When: Checking the deadline.
+        Then: BoofuzzStopCampaign is raised.
+        """
+        uut = CampaignPlanner(time_budget=0)
+        uut.start(self.session)
+
+        with self.assertRaises(exception.BoofuzzStopCampaign):
+            uut.check_deadline()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import CorpusExporter, PackedCorpus, Request, Session, constants
+from boofuzz.loggers import fuzz_logger_postgres
+from boofuzz.primitives import Bytes, String
+from boofuzz.sessions import RenderPool
+from unit_tests.session_helpers import make_session, mock_target
+
+
+class TestCorpusExporter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        # The target is never started nor sent anything: the configuration only has to define one.
+        self.session = make_session(target=mock_target())
+        self.request = Request(
+            "r",
+            children=(
+                String(name="text", default_value="abc", max_len=20),
+                Bytes(name="tail", default_value=b"\x00\x01", max_len=4),
+            ),
+        )
+        self.session.connect(self.request)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_index(self):
+        with open(os.path.join(self.directory, constants.EXPORT_INDEX_NAME), newline="") as f:
+            return list(csv.DictReader(f))
+
+    def read_files(self):
+        files = {}
+        for name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, name), "rb") as f:
+                files[name] = f.read()
+        return files
+
+    def test_library_round(self):
+        """
+        Given: A session at its library round.
+        When: Exporting one round.
+        Then: Every test case has a file holding its rendered message, listed in the index with its name.
+        """
+        num_exported = CorpusExporter(self.session, self.directory).export()
+
+        rows = self.read_index()
+        self.assertGreater(num_exported, 10)
+        self.assertEqual(num_exported, len(rows))
+        self.assertEqual([str(i) for i in range(1, num_exported + 1)], [row["index"] for row in rows])
+        for row in rows:
+            with open(os.path.join(self.directory, row["file"]), "rb") as f:
+                self.assertEqual(int(row["size"]), len(f.read()))
+            self.assertIn("round_type=library", row["name"])
+        self.assertEqual("random_mutation", self.session.round_type)
+
+    def test_without_database(self):
+        """
+        Given: A session built without database logging.
+        When: Exporting one round.
+        Then: No database logger is created and every test case is exported.
+        """
+        with mock.patch.object(fuzz_logger_postgres, "FuzzLoggerPostgres", autospec=True) as db_logger:
+            session = Session(
+                target=mock_target(), fuzz_loggers=[], web_port=None, keep_web_open=False, db_logging=False
+            )
+        session.connect(self.request)
+
+        num_exported = CorpusExporter(session, self.directory).export()
+
+        db_logger.assert_not_called()
+        self.assertGreater(num_exported, 10)
+        self.assertEqual(num_exported, len(self.read_index()))
+
+    def test_seed_range(self):
+        """
+        Given: A session starting at the second random mutation seed.
+        When: Exporting two rounds.
+        Then: The test cases of seeds 1 and 2 are exported.
+        """
+        self.session.round_type = "random_mutation"
+        self.session.seed_index = 1
+        self.session._total_random_mutation_rounds = 10
+        self.session.calculate_total_round = mock.Mock()
+
+        CorpusExporter(self.session, self.directory).export(max_number_of_rounds=2)
+
+        seeds = sorted({row["name"].split("seed_index=")[1].split()[0] for row in self.read_index()})
+        self.assertEqual(["1", "2"], seeds)
+
+    def test_packed(self):
+        """
+        Given: A session at its library round.
+        When: Exporting it to a compressed packed corpus.
+        Then: The corpus holds the same payloads as the separate files, with their test case indexes.
+        """
+        CorpusExporter(self.session, self.directory).export()
+        files = self.read_files()
+
+        self.session.round_type = "library"
+        self.session.total_mutant_index = 0
+        CorpusExporter(self.session, self.directory, packed=True, compress=True).export()
+
+        with PackedCorpus(os.path.join(self.directory, constants.PACKED_CORPUS_NAME)) as corpus:
+            self.assertEqual(len(files) - 1, len(corpus))
+            for record in corpus:
+                self.assertEqual(files[str(record.test_case_index)], record.data)
+
+    @unittest.skipUnless(RenderPool.available(), "Render workers need fork")
+    def test_render_workers(self):
+        """
+        Given: A session at its library round.
+        When: Exporting it with and without render workers.
+        Then: The same files are written.
+        """
+        CorpusExporter(self.session, self.directory, workers=0).export()
+        serial = self.read_files()
+
+        self.session.round_type = "library"
+        self.session.total_mutant_index = 0
+        CorpusExporter(self.session, self.directory, workers=2).export()
+
+        self.assertEqual(serial, self.read_files())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import itertools
+import unittest
+
+from boofuzz import Request
+from boofuzz.mutation import Mutation
+from boofuzz.primitives import Bytes, String
+from boofuzz.sessions import CoveringArray
+from unit_tests.session_helpers import make_session
+
+
+def uncovered_tuples(array):
+    missing = 0
+    for factors in itertools.combinations(range(len(array.levels)), array.strength):
+        needed = set(itertools.product(*(range(array.levels[f]) for f in factors)))
+        needed.difference_update(tuple(row[f] for f in factors) for row in array)
+        missing += len(needed)
+    return missing
+
+
+class TestCoveringArray(unittest.TestCase):
+    def test_covers_every_tuple(self):
+        """
+        Given: Factors with different numbers of values.
+        When: Building covering arrays of strength 2 and 3.
+        Then: Every combination of values of every 2 (3) factors is in a row, in far fewer rows than the product.
+        """
+        for levels, strength in [((3, 3, 3, 3), 2), ((6, 5, 4, 2, 2, 7), 2), ((4, 4, 4, 4, 4), 3)]:
+            with self.subTest(levels=levels, strength=strength):
+                uut = CoveringArray(levels, strength=strength)
+
+                self.assertEqual(0, uncovered_tuples(uut))
+                self.assertLess(len(uut), sum(1 for _ in itertools.product(*(range(n) for n in levels))))
+
+    def test_rows_are_stable_and_addressable(self):
+        """
+        Given: Two covering arrays with the same parameters.
+        When: Reading their rows by index.
+        Then: They are the same.
+        """
+        first = CoveringArray((5, 4, 3, 3), strength=2)
+        second = CoveringArray((5, 4, 3, 3), strength=2)
+
+        self.assertEqual(list(first), [second[i] for i in range(len(second))])
+
+    def test_min_weight(self):
+        """
+        Given: A covering array leaving out rows with fewer than 2 non-zero values.
+        When: Iterating it.
+        Then: Every row has at least 2 non-zero values.
+        """
+        uut = CoveringArray((4, 4, 4), strength=2, min_weight=2)
+
+        self.assertTrue(all(sum(1 for value in row if value) >= 2 for row in uut))
+
+    def test_rows_are_built_lazily(self):
+        """
+        Given: A covering array over many values.
+        When: Reading its first rows.
+        Then: Only those rows are built, and estimated_len gives a lower bound until the array is complete, then its
+            length.
+        """
+        uut = CoveringArray((200, 200, 6, 6, 6), strength=2)
+
+        first = list(itertools.islice(uut, 3))
+
+        self.assertEqual(first, [uut[i] for i in range(3)])
+        self.assertEqual(3, len(uut._rows))
+        self.assertFalse(uut.complete)
+        self.assertEqual(199 * 199, uut.estimated_len())
+
+        small = CoveringArray((4, 3, 3), strength=2)
+        self.assertLessEqual(small.estimated_len(), len(small))
+        self.assertEqual(len(small), small.estimated_len())
+
+
+class TestSessionCoveringArrays(unittest.TestCase):
+    def setUp(self):
+        self.session = make_session(covering_arrays=True)
+        self.request = Request(
+            name="r",
+            children=(
+                Bytes(name="length", default_value=b"\x00", max_len=4, num_library_elements=6),
+                String(name="content", default_value="abc", num_library_elements=5),
+                String(name="other", default_value="x", num_library_elements=4),
+            ),
+        )
+        self.session.connect(self.request)
+        self.path = self.session.edges_from(self.session.root.id)
+
+    def test_depth_2_cases(self):
+        """
+        Given: A session with covering arrays and a request with three elements.
+        When: Generating the depth 2 test cases.
+        Then: Each case mutates at least two elements, every pair of their mutations is sent, and the count matches
+            the covering array.
+        """
+        contexts = list(self.session._generate_n_mutations_for_path(self.path, depth=2))
+
+        pairs = set()
+        for context in contexts:
+            self.assertGreaterEqual(len(context.mutations), 2)
+            values = sorted((m.qualified_name, m.index) for m in context.mutations.values())
+            pairs.update(itertools.combinations(values, 2))
+        self.assertIn((("r.content", 4), ("r.length", 5)), pairs)
+        self.assertEqual(len(contexts), len(self.session._covering_array(self.request, 2)))
+        self.assertEqual(len(contexts), self.session.total_mutant_index)
+
+    def test_levels_are_capped(self):
+        """
+        Given: A session combining at most 3 mutations of each element.
+        When: Generating the depth 2 test cases.
+        Then: Only the first 3 mutations of each element are sent, and num_mutations counted a lower bound of them.
+        """
+        self.session.covering_array_levels = 3
+        self.session.max_depth = 2
+        counted = self.session.num_mutations()
+
+        contexts = list(self.session._generate_n_mutations_for_path(self.path, depth=2))
+
+        self.assertEqual((4, 4, 4), self.session._covering_array(self.request, 2).levels)
+        self.assertTrue(all(m.index < 3 for context in contexts for m in context.mutations.values()))
+        self.assertLessEqual(counted - (6 + 5 + 4), len(contexts))
+
+    def test_no_cases_beyond_number_of_elements(self):
+        """
+        Given: A request with three elements.
+        When: Generating depth 4 test cases.
+        Then: There are none.
+        """
+        self.assertEqual([], list(self.session._generate_n_mutations_for_path(self.path, depth=4)))
+
+
+class TestMutationsContainDuplicate(unittest.TestCase):
+    def test_parent_and_same_element(self):
+        """
+        Given: Sets of mutations.
+        When: Checking them for duplicates.
+        Then: The same element twice, or an element and its parent block, are duplicates; names sharing a prefix
+            are not.
+        """
+        session = make_session()
+
+        def mutations(*names):
+            return [Mutation(value=b"", qualified_name=name, index=0) for name in names]
+
+        self.assertTrue(session._mutations_contain_duplicate(mutations("r.a", "r.a")))
+        self.assertTrue(session._mutations_contain_duplicate(mutations("r.block", "r.block.a")))
+        self.assertFalse(session._mutations_contain_duplicate(mutations("r.a", "r.ab")))
+        self.assertFalse(session._mutations_contain_duplicate(mutations("r.a", "r.b", "r.block.c")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Request, Target
+from boofuzz.mutation_context import MutationContext
+from boofuzz.primitives import Group, String
+from boofuzz.sessions.crash_bisection import RecentCase, shortest_crashing_sequence
+from unit_tests.session_helpers import make_session, mock_target
+
+
+def delayed_crash(culprit):
+    """Target failing on any case sent after `culprit`, as if the culprit had corrupted its state."""
+
+    def crashes(cases):
+        indexes = [case.index for case in cases]
+        return culprit in indexes[:-1]
+
+    return crashes
+
+
+class TestShortestCrashingSequence(unittest.TestCase):
+    def setUp(self):
+        self.cases = [RecentCase(index=i, name=str(i), fuzz_node=None, mutant=None) for i in range(1, 9)]
+        self.replayed = []
+
+    def counting(self, crashes):
+        def replay(cases):
+            self.replayed.append([case.index for case in cases])
+            return crashes(cases)
+
+        return replay
+
+    def test_delayed_crash(self):
+        """
+        Given: Eight test cases, the third corrupting the target, which fails on the next case.
+        When: Searching the shortest crashing sequence.
+        Then: The third case comes first, followed by a single later case, within the replay budget.
+        """
+        sequence = shortest_crashing_sequence(self.cases, self.counting(delayed_crash(3)))
+
+        self.assertEqual([3, 8], [case.index for case in sequence])
+        self.assertLessEqual(len(self.replayed), 2 + 3 + len(self.cases))
+
+    def test_last_case_alone(self):
+        """
+        Given: A target failing on the last test case alone.
+        When: Searching the shortest crashing sequence.
+        Then: The last case is the sequence, after a single replay.
+        """
+        sequence = shortest_crashing_sequence(self.cases, self.counting(lambda cases: cases[-1].index == 8))
+
+        self.assertEqual([8], [case.index for case in sequence])
+        self.assertEqual([[8]], self.replayed)
+
+    def test_not_reproduced(self):
+        """
+        Given: A failure that does not happen again.
+        When: Searching the shortest crashing sequence.
+        Then: None is returned after replaying the last case, then every case.
+        """
+        self.assertIsNone(shortest_crashing_sequence(self.cases, self.counting(lambda cases: False)))
+        self.assertEqual([[8], list(range(1, 9))], self.replayed)
+
+
+class TestSessionBisection(unittest.TestCase):
+    def setUp(self):
+        # The target is corrupted by b"poison" and fails on whatever it gets after it, until restarted.
+        self.sent = []
+        monitor = mock.Mock()
+        monitor.post_send.side_effect = lambda **kwargs: b"poison" not in self.sent[:-1]
+        self.target = mock_target(monitors=[monitor])
+        self.target.send.side_effect = self.sent.append
+        self.session = make_session(target=self.target, bisect_failures=8)
+        self.session._restart_target = mock.Mock(side_effect=lambda target: self.sent.clear())
+
+        self.request = Request("b", children=(String(name="s", default_value="abc"),), timeout_check=False)
+        self.session.connect(self.request)
+        self.request.mutant = self.request.names["b.s"]
+        self.session.fuzz_node = self.request
+        self.path = self.session.edges_from(self.session.root.id)
+
+        payloads = [b"a", b"poison", b"b", b"c"]
+        self.session._recent_cases.extend(
+            self.recent(index, payload) for index, payload in enumerate(payloads, start=10)
+        )
+        self.session.total_mutant_index = 14
+        self.session.current_test_case_name = "b:[b.s:14]"
+        self.session.current_mutation_context = MutationContext(message_path=self.path, mutations={})
+        self.session._case_payloads = [b"d"]
+
+    def recent(self, index, payload):
+        return RecentCase(
+            index=index,
+            name="b:[b.s:{0}]".format(index),
+            fuzz_node=self.request,
+            mutant=self.request.names["b.s"],
+            message_path=self.path,
+            payloads=[payload],
+        )
+
+    def test_culprit_found(self):
+        """
+        Given: A target failing on test case 14 because test case 11 corrupted it.
+        When: Bisecting the failure.
+        Then: Test case 11 is the culprit, the stored payloads are sent again and the attribution is recorded.
+        """
+        culprit = self.session._bisect_failure(self.target)
+
+        self.assertEqual(11, culprit.index)
+        self.assertEqual([11, 14], self.session.failure_attributions[14])
+        self.assertIn(mock.call(b"poison"), self.target.send.call_args_list)
+        self.assertIs(self.request, self.session.fuzz_node)
+
+    def test_not_reproduced(self):
+        """
+        Given: A failure that replaying the latest test cases does not cause again.
+        When: Bisecting the failure.
+        Then: No culprit is returned and no attribution is recorded.
+        """
+        self.target.monitors[0].post_send.side_effect = lambda **kwargs: True
+
+        self.assertIsNone(self.session._bisect_failure(self.target))
+        self.assertEqual({}, self.session.failure_attributions)
+
+
+class TestFuzzBisection(unittest.TestCase):
+    def setUp(self):
+        # The target is corrupted by b"poison", and fails when it gets b"trigger" afterwards, until restarted.
+        self.received = []
+        self.sent = []
+        self.recorded = None
+        connection = mock.Mock()
+        connection.send.side_effect = self.send
+        self.session = make_session(
+            target=Target(connection=connection),
+            bisect_failures=8,
+            post_test_case_callbacks=[self.check],
+            restart_callbacks=[self.restart],
+            seconds_to_wait_after_restart=0,
+        )
+        self.session.connect(
+            Request("r", children=(Group(name="g", values=["x", "poison", "a", "b", "trigger", "c"]),))
+        )
+
+    def send(self, data):
+        self.received.append(data)
+        self.sent.append(data)
+        return len(data)
+
+    def check(self, session, **kwargs):
+        if b"poison" in self.received[:-1] and self.received[-1] == b"trigger":
+            if self.recorded is None:
+                self.recorded = [case.payloads for case in session._recent_cases]
+            return False
+        return True
+
+    def restart(self, **kwargs):
+        self.received.clear()
+
+    def test_culprit_found(self):
+        """
+        Given: A session bisecting failures, fuzzing a target that test case 1 corrupts and test case 4 makes fail.
+        When: Fuzzing.
+        Then: The payloads of the test cases before the failure are recorded and replayed to the target, test case 1
+         is found to cause the failure of test case 4, and fuzzing goes on.
+        """
+        self.session.fuzz()
+
+        self.assertEqual([[b"poison"], [b"a"], [b"b"]], self.recorded)
+        self.assertEqual([b"poison", b"a", b"b", b"trigger"], self.sent[:4])
+        # The failing test case is replayed alone, then after the recorded ones.
+        self.assertEqual([b"trigger", b"poison", b"a", b"b", b"trigger"], self.sent[4:9])
+        self.assertEqual({4: [1, 4]}, self.session.failure_attributions)
+        self.assertIn("Caused by test case #1: r:[r.g:0]", self.session.monitor_results[4][-1])
+        self.assertEqual(b"c", self.sent[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
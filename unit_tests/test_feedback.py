@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Request, exception
+from boofuzz.feedback import Corpus, NoveltyTable, ResponseFingerprinter, coverage_map, response_novelty
+from boofuzz.monitors import CoverageMonitor
+
+
+class TestCorpus(unittest.TestCase):
+    def test_values_are_frozen_per_round(self):
+        """
+        Given: A Corpus.
+        When: Adding a value during a round.
+        Then: The value is only returned once the next round starts.
+        """
+        uut = Corpus()
+
+        self.assertTrue(uut.add("req.field", b"abc"))
+        self.assertFalse(uut.add("req.field", b"abc"))
+
+        self.assertEqual([], uut.values("req.field"))
+        uut.start_round()
+        self.assertEqual([(b"abc", 1)], uut.values("req.field"))
+
+    def test_persistence(self):
+        """
+        Given: A Corpus kept in a file, with values and energy, and a whole test case kept by an earlier version.
+        When: Creating a new Corpus from the same file.
+        Then: It holds the same values and energies.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "corpus.jsonl")
+            first = Corpus(path=path)
+            first.add("req.name", "value")
+            first.add_energy("req.name", "value", 2)
+            first.add("req.length", 7)
+            with open(path, "a") as f:
+                f.write('{"request": "req", "input": "0001"}\n')
+
+            uut = Corpus(path=path)
+
+        self.assertEqual([("value", 3)], uut.values("req.name"))
+        self.assertEqual([(7, 1)], uut.values("req.length"))
+        self.assertEqual(2, len(uut))
+
+
+class TestCoverageMap(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.uut = coverage_map.CoverageMap(map_size=16)
+        except exception.BoofuzzError as e:
+            self.skipTest(str(e))
+
+    def tearDown(self):
+        self.uut.close()
+
+    def test_check(self):
+        """
+        Given: A CoverageMap.
+        When: Checking hit counts with a new edge, then more hits on it, then the same hits again.
+        Then: check() reports new edges, then new hit counts, then nothing new.
+        """
+        self.assertEqual(coverage_map.NEW_EDGES, self.uut.check(bytes([0, 1] + [0] * 14)))
+        self.assertEqual(coverage_map.NEW_HIT_COUNTS, self.uut.check(bytes([0, 5] + [0] * 14)))
+        self.assertEqual(coverage_map.NO_NEW_COVERAGE, self.uut.check(bytes([0, 6] + [0] * 14)))
+        self.assertEqual(1, self.uut.edges_covered)
+
+    def test_monitor_adds_mutations_to_corpus(self):
+        """
+        Given: A CoverageMonitor and a session whose last test case hit a new edge.
+        When: Calling post_send().
+        Then: The mutated values are added to the session's corpus.
+        """
+        session = mock.MagicMock()
+        session.feedback_corpus = Corpus()
+        session.current_mutation_context.mutations = {"req.field": mock.Mock(value=b"xyz")}
+        monitor = CoverageMonitor(coverage_map=self.uut)
+        monitor.pre_send()
+        self.uut.read = mock.Mock(return_value=bytes([1] + [0] * 15))
+
+        self.assertTrue(monitor.post_send(session=session))
+
+        session.feedback_corpus.start_round()
+        self.assertEqual([(b"xyz", 1)], session.feedback_corpus.values("req.field"))
+
+
+class TestResponseNovelty(unittest.TestCase):
+    def setUp(self):
+        self.uut = ResponseFingerprinter()
+
+    def test_volatile_fields_are_masked(self):
+        """
+        Given: A ResponseFingerprinter.
+        When: Fingerprinting two responses differing only by a counter.
+        Then: They have the same fingerprint.
+        """
+        self.assertEqual(self.uut.fingerprint(b"OK id=12"), self.uut.fingerprint(b"OK id=97"))
+
+    def test_opcode_and_length_class(self):
+        """
+        Given: A ResponseFingerprinter.
+        When: Fingerprinting responses with another status byte, or much longer.
+        Then: Their fingerprints differ.
+        """
+        self.assertNotEqual(self.uut.fingerprint(b"OK"), self.uut.fingerprint(b"KO"))
+        self.assertNotEqual(
+            self.uut.fingerprint(b"OK").length_class, self.uut.fingerprint(b"OK" + b"!" * 100).length_class
+        )
+
+    def test_latency_bucket(self):
+        """
+        Given: A request with an RTO estimate of 0.3 s, and a request without measurement.
+        When: Fingerprinting a response slower than the RTO, and a response to the other request.
+        Then: The latency buckets are slow and unknown.
+        """
+        request = Request("measured")
+        request.calculate_rto(0.1)
+
+        self.assertEqual(response_novelty.LATENCY_SLOW, self.uut.fingerprint(b"", 1.0, request).latency)
+        self.assertEqual(response_novelty.LATENCY_UNKNOWN, self.uut.fingerprint(b"", 1.0, Request("new")).latency)
+
+    def test_novelty_is_per_request(self):
+        """
+        Given: A NoveltyTable.
+        When: Observing the same fingerprint for two requests, twice.
+        Then: It is new once per request.
+        """
+        table = NoveltyTable()
+        fingerprint = self.uut.fingerprint(b"OK")
+
+        self.assertTrue(table.observe("a", fingerprint))
+        self.assertFalse(table.observe("a", fingerprint))
+        self.assertTrue(table.observe("b", fingerprint))
+        self.assertEqual(2, len(table))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import signal
+import sys
+import textwrap
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.utils.debugger_thread_fork_server import DebuggerThreadForkServer, ForkServer
+
+# Speaks the AFL fork server protocol like an instrumented target would; each child exits with the code in argv[1].
+FAKE_TARGET = textwrap.dedent("""
+    import os, struct, sys
+    os.write(199, struct.pack("I", 0))
+    while len(os.read(198, 4)) == 4:
+        pid = os.fork()
+        if pid == 0:
+            os._exit(int(sys.argv[1]))
+        os.write(199, struct.pack("I", pid))
+        os.write(199, struct.pack("I", os.waitpid(pid, 0)[1]))
+    """)
+
+
+@unittest.skipIf(sys.platform == "win32", "The fork server needs fork")
+class TestForkServer(unittest.TestCase):
+    def command(self, exit_code):
+        return [sys.executable, "-c", FAKE_TARGET, str(exit_code)]
+
+    def test_fork_and_wait(self):
+        """
+        Given: A target running the fork server.
+        When: Forking two children.
+        Then: Each one has its own pid and its exit status is reported.
+        """
+        uut = ForkServer(self.command(3))
+        try:
+            first = uut.fork()
+            self.assertEqual(3, os.WEXITSTATUS(uut.wait()))
+            second = uut.fork()
+            self.assertEqual(3, os.WEXITSTATUS(uut.wait()))
+        finally:
+            uut.close()
+
+        self.assertNotEqual(first, second)
+        self.assertFalse(uut.is_running())
+
+    def test_no_handshake(self):
+        """
+        Given: A target without fork server.
+        When: Starting it as a fork server.
+        Then: RuntimeError is raised.
+        """
+        with self.assertRaises(RuntimeError):
+            ForkServer([sys.executable, "-c", "pass"], init_timeout=5)
+
+    def test_debugger_thread_reuses_server(self):
+        """
+        Given: A process monitor and a target killed by SIGTERM.
+        When: Running two debugger threads one after the other.
+        Then: Both use the same fork server, and the exit is reported in the synopsis.
+        """
+        process_monitor = mock.Mock(fork_server=None, crash_filename="")
+        command = [sys.executable, "-c", FAKE_TARGET.replace("os._exit(int(sys.argv[1]))", "os.kill(os.getpid(), 15)")]
+
+        servers = []
+        for _ in range(2):
+            uut = DebuggerThreadForkServer([command], process_monitor)
+            uut.start()
+            uut.join(timeout=10)
+            servers.append(process_monitor.fork_server)
+        try:
+            self.assertIs(servers[0], servers[1])
+            self.assertTrue(os.WIFSIGNALED(uut.exit_status))
+            self.assertEqual(signal.SIGTERM, os.WTERMSIG(uut.exit_status))
+            self.assertIn("Exit code: {0}".format(uut.exit_status), process_monitor.last_synopsis)
+        finally:
+            uut.shutdown()
+        self.assertIsNone(process_monitor.fork_server)
+
+
+if __name__ == "__main__":
+    unittest.main()
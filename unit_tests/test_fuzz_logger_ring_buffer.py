@@ -0,0 +1,109 @@
+import threading
+import time
+import unittest
+
+from boofuzz.loggers import FuzzLoggerRingBuffer
+
+
+class TestFuzzLoggerRingBuffer(unittest.TestCase):
+    def setUp(self):
+        self.uut = FuzzLoggerRingBuffer(max_entries=10, data_truncate_length=4)
+
+    def test_entries_of_current_test_case(self):
+        """
+        Given: A FuzzLoggerRingBuffer with a test case and two steps logged.
+        When: Calling wait_for_entries() from the beginning.
+        Then: The whole test case is returned, with reset set.
+        """
+        self.uut.open_test_case("1: case", name="case", index=1)
+        self.uut.open_test_step("step")
+        self.uut.log_info("info")
+
+        index, reset, last_seq, entries = self.uut.wait_for_entries(after_seq=0, timeout=0)
+
+        self.assertEqual(1, index)
+        self.assertTrue(reset)
+        self.assertEqual(3, last_seq)
+        self.assertEqual(["log-case", "log-step", "log-info"], [e.css_class for e in entries])
+        self.assertIn("1: case", entries[0].log_line)
+
+    def test_incremental_entries(self):
+        """
+        Given: A FuzzLoggerRingBuffer with a reader up to date.
+        When: A new entry is logged and the reader asks for entries after its last sequence number.
+        Then: Only the new entry is returned.
+        """
+        self.uut.open_test_case("1: case", name="case", index=1)
+        _, _, last_seq, _ = self.uut.wait_for_entries(after_seq=0, timeout=0)
+        self.uut.log_pass("ok")
+
+        _, reset, _, entries = self.uut.wait_for_entries(after_seq=last_seq, timeout=0)
+
+        self.assertFalse(reset)
+        self.assertEqual(["log-pass"], [e.css_class for e in entries])
+
+    def test_new_test_case_resets_reader(self):
+        """
+        Given: A FuzzLoggerRingBuffer with a reader up to date on test case 1.
+        When: Test case 2 is opened.
+        Then: The reader gets test case 2 only, with reset set.
+        """
+        self.uut.open_test_case("1: case", name="case", index=1)
+        self.uut.log_info("info")
+        _, _, last_seq, _ = self.uut.wait_for_entries(after_seq=0, timeout=0)
+        self.uut.open_test_case("2: case", name="case", index=2)
+        self.uut.log_fail("fail")
+
+        index, reset, _, entries = self.uut.wait_for_entries(after_seq=last_seq, timeout=0)
+
+        self.assertEqual(2, index)
+        self.assertTrue(reset)
+        self.assertEqual(["log-case", "log-fail"], [e.css_class for e in entries])
+
+    def test_wait_times_out(self):
+        """
+        Given: A FuzzLoggerRingBuffer with a reader up to date.
+        When: Nothing is logged.
+        Then: wait_for_entries() returns no entries after the timeout.
+        """
+        self.uut.open_test_case("1: case", name="case", index=1)
+
+        _, reset, _, entries = self.uut.wait_for_entries(after_seq=1, timeout=0.01)
+
+        self.assertFalse(reset)
+        self.assertEqual([], entries)
+
+    def test_wait_wakes_up_on_new_entry(self):
+        """
+        Given: A reader waiting for new entries.
+        When: Another thread logs an entry.
+        Then: The reader returns well before its timeout with that entry.
+        """
+        self.uut.open_test_case("1: case", name="case", index=1)
+        timer = threading.Timer(0.05, self.uut.log_error, args=("error",))
+        timer.start()
+
+        start = time.time()
+        _, _, _, entries = self.uut.wait_for_entries(after_seq=1, timeout=10)
+        timer.join()
+
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(["log-error"], [e.css_class for e in entries])
+
+    def test_data_is_truncated(self):
+        """
+        Given: A FuzzLoggerRingBuffer with data_truncate_length of 4.
+        When: Logging 8 bytes of sent data.
+        Then: Only 4 bytes are kept and the entry is marked as truncated.
+        """
+        self.uut.open_test_case("1: case", name="case", index=1)
+        self.uut.log_send(b"12345678")
+
+        _, _, _, entries = self.uut.wait_for_entries(after_seq=1, timeout=0)
+
+        self.assertEqual(b"1234", entries[0].data)
+        self.assertTrue(entries[0].truncated)
+
+
+if __name__ == "__main__":
+    unittest.main()
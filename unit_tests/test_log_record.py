@@ -0,0 +1,108 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.loggers import FuzzLogger, IFuzzLoggerBackend, LogRecord
+
+
+class TestLazyFuzzLogger(unittest.TestCase):
+    def setUp(self):
+        self.info_logger = mock.MagicMock(spec=IFuzzLoggerBackend)
+        self.info_logger.accepts.side_effect = lambda msg_type: msg_type == "info"
+        self.fail_logger = mock.MagicMock(spec=IFuzzLoggerBackend)
+        self.fail_logger.accepts.side_effect = lambda msg_type: msg_type == "fail"
+
+    def test_messages_go_to_interested_backends_only(self):
+        """
+        Given: A FuzzLogger with a backend accepting info messages and one accepting failures.
+        When: Logging an info message.
+        Then: Only the first backend gets it.
+        """
+        uut = FuzzLogger(fuzz_loggers=[self.info_logger, self.fail_logger])
+
+        uut.log_info("info")
+
+        self.info_logger.log_info.assert_called_once_with(description="info")
+        self.fail_logger.log_info.assert_not_called()
+
+    def test_lazy_description_is_formatted_once(self):
+        """
+        Given: A FuzzLogger with two backends accepting info messages.
+        When: Logging an info message given as a callable.
+        Then: The callable is called once and both backends get its result.
+        """
+        uut = FuzzLogger(fuzz_loggers=[self.info_logger, self.info_logger])
+        description = mock.Mock(return_value="formatted")
+
+        uut.log_info(description)
+
+        description.assert_called_once_with()
+        self.assertEqual(2, self.info_logger.log_info.call_count)
+        self.info_logger.log_info.assert_called_with(description="formatted")
+
+    def test_unwanted_description_is_not_formatted(self):
+        """
+        Given: A FuzzLogger with a backend accepting failures only.
+        When: Logging a step given as a callable.
+        Then: The callable is never called and accepts("step") is False.
+        """
+        uut = FuzzLogger(fuzz_loggers=[self.fail_logger])
+        description = mock.Mock(return_value="formatted")
+
+        uut.open_test_step(description)
+
+        description.assert_not_called()
+        self.assertFalse(uut.accepts("step"))
+
+    def test_failures_are_counted_without_backends(self):
+        """
+        Given: A FuzzLogger with a backend accepting info messages only.
+        When: Logging a lazy failure.
+        Then: The failure is recorded in the summary.
+        """
+        uut = FuzzLogger(fuzz_loggers=[self.info_logger])
+        uut.open_test_case("1", name="case", index=1)
+
+        uut.log_fail(lambda: "crash")
+
+        self.assertEqual({"1": ["crash"]}, uut.failed_test_cases)
+        self.fail_logger.log_fail.assert_not_called()
+
+    def test_asynchronous_delivery(self):
+        """
+        Given: An asynchronous FuzzLogger.
+        When: Logging messages then closing the test.
+        Then: Every message has been delivered in order when close_test() returns.
+        """
+        backend = mock.MagicMock(spec=IFuzzLoggerBackend)
+        uut = FuzzLogger(fuzz_loggers=[backend], asynchronous=True)
+
+        uut.open_test_case("1", name="case", index=1)
+        uut.log_send(b"data")
+        uut.log_pass("ok")
+        uut.close_test()
+
+        self.assertEqual(
+            ["open_test_case", "log_send", "log_pass", "close_test"],
+            [name for name, _, _ in backend.method_calls if name != "accepts"],
+        )
+
+
+class TestLogRecord(unittest.TestCase):
+    def test_deliver_data(self):
+        """
+        Given: A receive LogRecord.
+        When: Delivering it to a backend.
+        Then: log_recv() is called with the data.
+        """
+        backend = mock.MagicMock(spec=IFuzzLoggerBackend)
+
+        LogRecord(type="receive", data=b"data").deliver(backend)
+
+        backend.log_recv.assert_called_once_with(data=b"data")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import time
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.monitors import BaseMonitor, MonitorWatcher
+from unit_tests.session_helpers import make_session, mock_target
+
+
+class FlakyMonitor(BaseMonitor):
+    def __init__(self):
+        super(FlakyMonitor, self).__init__()
+        self.crashed = False
+        self.checks = 0
+
+    def post_send(self, target=None, fuzz_data_logger=None, session=None):
+        self.checks += 1
+        if self.crashed:
+            fuzz_data_logger.log_target_warn("target gone")
+        return not self.crashed
+
+    def get_crash_synopsis(self):
+        return "SIGSEGV"
+
+
+class TestMonitorWatcher(unittest.TestCase):
+    def setUp(self):
+        self.monitor = FlakyMonitor()
+        self.uut = MonitorWatcher(self.monitor, interval=0.01)
+
+    def tearDown(self):
+        self.uut.stop()
+
+    def test_checks_start_at_pre_send(self):
+        """
+        Given: A watched monitor.
+        When: Waiting before and after the first pre_send.
+        Then: The monitor is only checked after pre_send, and post_send does not call it.
+        """
+        time.sleep(0.05)
+        self.assertEqual(0, self.monitor.checks)
+
+        self.uut.pre_send()
+        time.sleep(0.1)
+
+        self.assertGreater(self.monitor.checks, 0)
+        checks = self.monitor.checks
+        self.assertTrue(self.uut.post_send())
+        self.assertLessEqual(self.monitor.checks - checks, 2)
+
+    def test_failure_is_queued_once(self):
+        """
+        Given: A watched monitor whose target crashes.
+        When: Reading the events.
+        Then: There is one failure event with the synopsis and the logged warning, and checks stop until a restart.
+        """
+        self.uut.pre_send()
+        time.sleep(0.05)
+        self.monitor.crashed = True
+        time.sleep(0.1)
+
+        events = self.uut.events()
+
+        self.assertEqual(1, len(events))
+        self.assertTrue(events[0].failed)
+        self.assertEqual("SIGSEGV", events[0].synopsis)
+        self.assertEqual([("log_target_warn", ("target gone",), {})], events[0].records)
+        self.assertLess(events[0].last_ok, events[0].time)
+        checks = self.monitor.checks
+        time.sleep(0.05)
+        self.assertEqual(checks, self.monitor.checks)
+
+        self.monitor.crashed = False
+        self.uut.post_start_target()
+        time.sleep(0.05)
+        self.assertGreater(self.monitor.checks, checks)
+
+
+class TestSessionMonitorEvents(unittest.TestCase):
+    def setUp(self):
+        self.logger = mock.MagicMock()
+        self.session = make_session(fuzz_loggers=[self.logger], monitor_interval=0.01)
+        self.session._case_starts.extend([(10.0, 1), (11.0, 2), (12.0, 3), (13.0, 4)])
+
+    def test_failure_attributed_to_case_window(self):
+        """
+        Given: A watcher that noticed a failure between 11.5 and 12.5.
+        When: The session reads its events.
+        Then: The failure is reported, its log records are replayed, and test cases 2 and 3 are named.
+        """
+        watcher = mock.Mock(spec=MonitorWatcher)
+        watcher.events.return_value = [
+            mock.Mock(failed=True, synopsis="SIGSEGV", last_ok=11.5, time=12.5, records=[("log_info", ("x",), {})])
+        ]
+
+        self.assertFalse(self.session._read_monitor_events(watcher))
+
+        self.assertEqual("SIGSEGV", watcher.last_crash_synopsis)
+        self.logger.log_info.assert_any_call(description="x")
+        self.assertIn("#2 to #3", self.logger.log_info.call_args.kwargs["description"])
+
+    def test_only_watchable_monitors_are_wrapped(self):
+        """
+        Given: A session with a monitor interval.
+        When: Adding a target with a process monitor and the callback monitor.
+        Then: Only the process monitor is checked in the background.
+        """
+        target = mock_target(monitors=[FlakyMonitor()])
+
+        self.session.add_target(target)
+
+        self.assertIsInstance(target.monitors[0], MonitorWatcher)
+        self.assertIs(self.session._callback_monitor, target.monitors[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import AdaptiveNominalSchedule, Request
+from boofuzz.primitives import Static, String
+from boofuzz.sessions import RecentCase
+from unit_tests.session_helpers import make_session, mock_target
+
+
+class TestAdaptiveNominalSchedule(unittest.TestCase):
+    def setUp(self):
+        self.uut = AdaptiveNominalSchedule(interval=10, min_interval=2, max_interval=30)
+
+    def run_cases(self, count, anomaly=False):
+        due = []
+        for i in range(count):
+            self.uut.record_case(i, anomaly=anomaly)
+            due.append(self.uut.due())
+        return due
+
+    def test_backs_off_while_healthy(self):
+        """
+        Given: A schedule starting at 10 test cases, with a maximum of 30.
+        When: Nominal tests keep passing.
+        Then: They are due after 10, 20, then 30 test cases.
+        """
+        intervals = []
+        for _ in range(3):
+            intervals.append(self.run_cases(40).index(True) + 1)
+            self.assertEqual([], self.uut.probe_done(healthy=True))
+
+        self.assertEqual([10, 20, 30], intervals)
+
+    def test_anomaly_brings_probe_forward(self):
+        """
+        Given: A schedule 3 test cases after its last nominal test, with a minimum interval of 2.
+        When: A test case gets a target warning.
+        Then: The nominal test is due right away.
+        """
+        self.assertEqual([False] * 3, self.run_cases(3))
+
+        self.assertEqual([True], self.run_cases(1, anomaly=True))
+
+    def test_failure_returns_cases_since_last_pass(self):
+        """
+        Given: A schedule whose last nominal test passed, then a restart, then test cases.
+        When: The next nominal test fails.
+        Then: Only the cases sent since the restart are returned, and the interval drops to its minimum.
+        """
+        self.run_cases(4)
+        self.uut.probe_done(healthy=True)
+        self.run_cases(3)
+        self.uut.restarted()
+        self.uut.record_case("a")
+        self.uut.record_case("b")
+
+        self.assertEqual(["a", "b"], self.uut.probe_done(healthy=False))
+        self.assertEqual(2, self.uut.interval)
+
+
+class TestNominalRecheck(unittest.TestCase):
+    def setUp(self):
+        # The target keeps answering test cases after b"poison", but fails the nominal test until restarted.
+        self.sent = [b"a", b"poison", b"b", b"c"]
+        self.target = mock_target()
+        self.target.send.side_effect = self.sent.append
+        self.session = make_session(
+            target=self.target,
+            nominal_data=[Request("n", children=(Static(name="hello", default_value=b"hello"),))],
+            nominal_recv_test=lambda session: b"poison" not in self.sent,
+            nominal_schedule=AdaptiveNominalSchedule(interval=4, min_interval=2),
+        )
+        self.session._restart_target = mock.Mock(side_effect=lambda target: self.sent.clear())
+        self.session.total_mutant_index = 13
+
+        self.request = Request("b", children=(String(name="s", default_value="abc"),), timeout_check=False)
+        self.session.connect(self.request)
+        self.request.mutant = self.request.names["b.s"]
+        self.session.fuzz_node = self.request
+        self.path = self.session.edges_from(self.session.root.id)
+
+        for index, payload in enumerate(list(self.sent), start=10):
+            self.session.nominal_schedule.record_case(
+                RecentCase(
+                    index=index,
+                    name="b:[b.s:{0}]".format(index),
+                    fuzz_node=self.request,
+                    mutant=self.request.mutant,
+                    message_path=self.path,
+                    payloads=[payload],
+                )
+            )
+
+    def test_failed_nominal_test_is_attributed(self):
+        """
+        Given: Four test cases since the last passing nominal test, the second breaking the target.
+        When: The nominal test fails.
+        Then: The cases are replayed with the nominal test, the second one is found alone, and the target restarted.
+        """
+        self.assertFalse(self.session.nominal_test())
+
+        self.assertEqual({13: [11]}, self.session.failure_attributions)
+        self.assertEqual([], self.sent)
+        self.assertEqual(2, self.session.nominal_schedule.interval)
+
+
+if __name__ == "__main__":
+    unittest.main()
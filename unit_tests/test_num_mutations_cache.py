@@ -0,0 +1,100 @@
+import itertools
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Request
+from boofuzz.primitives import Bytes, String
+
+
+def _request(*children):
+    request = Request(name="r", children=children)
+    request.parent_session = mock.Mock(round_type="library", seed="library.0", feedback_corpus=None)
+    return request
+
+
+class TestNumMutationsCache(unittest.TestCase):
+    def test_count_is_cached(self):
+        """
+        Given: A request with a string.
+        When: Counting its mutations twice.
+        Then: The string is only counted once.
+        """
+        string = String(name="s", default_value="abc")
+        request = _request(string)
+
+        with mock.patch.object(String, "num_mutations", return_value=3) as num_mutations:
+            self.assertEqual(3, request.get_num_mutations())
+            self.assertEqual(3, request.get_num_mutations())
+        self.assertEqual(1, num_mutations.call_count)
+
+    def test_push_and_budget_invalidate(self):
+        """
+        Given: A request whose mutation count is cached.
+        When: Pushing an element, then changing a budget.
+        Then: The count follows both changes.
+        """
+        request = _request(String(name="s", default_value="abc", num_library_elements=10))
+        self.assertEqual(10, request.get_num_mutations())
+
+        request.push(String(name="t", default_value="abc", num_library_elements=5))
+        self.assertEqual(15, request.get_num_mutations())
+
+        request.names["r.t"].set_budget(num_library_elements=2, num_random_mutations=40, num_random_generations=50)
+        self.assertEqual(12, request.get_num_mutations())
+
+    def test_round_change_invalidates(self):
+        """
+        Given: A request whose library round count is cached.
+        When: The session moves to a random_generation round.
+        Then: The count is the random_generation one.
+        """
+        request = _request(String(name="s", default_value="abc", num_random_generations=7))
+        request.get_num_mutations()
+
+        request.parent_session.round_type = "random_generation"
+        request.parent_session.seed = "random_generation.0"
+
+        self.assertEqual(7, request.get_num_mutations())
+
+    def test_closed_form_matches_mutations(self):
+        """
+        Given: Strings and bytes with various defaults, lengths and library budgets, down to lengths at which
+            different library values are cut to the same string.
+        When: Counting their library mutations.
+        Then: The count equals the number of values mutations() yields.
+        """
+        for default, max_len, num_library_elements, len_unit, seclist_path in itertools.product(
+            ["", "abc", "C", "A", "AA", "D", "\x00", "abcabc", "\u00e9"],
+            [1000, 10, 5, 2, 1, 0],
+            [50, 100000],
+            ["bytes", "chars"],
+            ["", "home_made_seclists/original-string-seclist.txt"],
+        ):
+            string = String(
+                name="s",
+                default_value=default,
+                max_len=max_len,
+                len_unit=len_unit,
+                num_library_elements=num_library_elements,
+                seclist_path=seclist_path,
+            )
+            _request(string)
+            with self.subTest(
+                default=default, max_len=max_len, n=num_library_elements, len_unit=len_unit, seclist=seclist_path
+            ):
+                self.assertEqual(sum(1 for _ in string.mutations(default)), string.num_mutations(default))
+
+        for default, max_len, num_library_elements in itertools.product(
+            [b"", b"abc", b"A", b"\x00"], [1000, 10, 5, 2, 1], [50, 100000]
+        ):
+            data = Bytes(name="b", default_value=default, max_len=max_len, num_library_elements=num_library_elements)
+            _request(data)
+            with self.subTest(default=default, max_len=max_len, n=num_library_elements):
+                self.assertEqual(sum(1 for _ in data.mutations(default)), data.num_mutations(default))
+
+
+if __name__ == "__main__":
+    unittest.main()
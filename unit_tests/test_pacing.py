@@ -0,0 +1,163 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import AimdPacer, CountRepeater, Group, Request, Target, TokenBucket
+from unit_tests.session_helpers import make_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.uut = TokenBucket(rate=10, burst=2, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_then_rate(self):
+        """
+        Given: A full bucket of 2 tokens refilled at 10 per second.
+        When: Acquiring 4 tokens back to back.
+        Then: The burst goes through without waiting, then each token waits a tenth of a second.
+        """
+        waited = [self.uut.acquire() for _ in range(4)]
+
+        self.assertEqual([0, 0], waited[:2])
+        for seconds in waited[2:]:
+            self.assertAlmostEqual(0.1, seconds)
+
+    def test_idle_time_fills_up_to_burst(self):
+        """
+        Given: An empty bucket.
+        When: Staying idle for ten seconds, then acquiring 3 tokens.
+        Then: Only the burst of 2 is available without waiting.
+        """
+        self.uut.acquire()
+        self.uut.acquire()
+        self.clock.now += 10
+
+        waited = [self.uut.acquire() for _ in range(3)]
+
+        self.assertEqual([0, 0], waited[:2])
+        self.assertAlmostEqual(0.1, waited[2])
+
+
+class TestAimdPacer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.uut = AimdPacer(
+            rate=10, min_rate=2, max_rate=12, increase=1, decrease=0.5, clock=self.clock, sleep=self.clock.sleep
+        )
+
+    def test_additive_increase_up_to_max(self):
+        """
+        Given: A pacer at 10 sends per second, with a maximum of 12.
+        When: Three healthy test cases end.
+        Then: The rate grows by 1 per case, up to 12.
+        """
+        for _ in range(3):
+            self.assertIsNone(self.uut.end_case())
+
+        self.assertEqual(12, self.uut.rate)
+
+    def test_one_decrease_per_case_down_to_min(self):
+        """
+        Given: A pacer at 10 sends per second, with a minimum of 2.
+        When: Test cases end after several congestion reports each.
+        Then: The rate is halved once per case, down to 2, and the first reason is returned.
+        """
+        rates = []
+        for _ in range(3):
+            self.uut.congestion("RTO exceeded")
+            self.uut.congestion("connection reset")
+            self.assertEqual("RTO exceeded", self.uut.end_case())
+            rates.append(self.uut.rate)
+
+        self.assertEqual([5, 2.5, 2], rates)
+
+    def test_waits_at_the_new_rate(self):
+        """
+        Given: A pacer whose rate was lowered to 5 sends per second.
+        When: Waiting for two send slots.
+        Then: The second one comes a fifth of a second after the first.
+        """
+        self.uut.congestion("RTO exceeded")
+        self.uut.end_case()
+
+        self.uut.wait()
+        self.assertAlmostEqual(0.2, self.uut.wait())
+
+    def test_repeater_waits_on_pacer(self):
+        """
+        Given: A count repeater with a pacer.
+        When: Repeating.
+        Then: The pacer is waited on instead of sleeping.
+        """
+        pacer = mock.Mock()
+        repeater = CountRepeater(count=2, sleep_time=5, pacer=pacer)
+
+        while repeater.repeat():
+            pass
+
+        self.assertEqual(3, pacer.wait.call_count)
+
+
+class TestSessionPacing(unittest.TestCase):
+    def setUp(self):
+        self.logger = mock.MagicMock()
+        self.session = make_session(fuzz_loggers=[self.logger], pacer=AimdPacer(rate=10))
+
+    def test_congestion_is_logged(self):
+        """
+        Given: A session with a pacer.
+        When: A connection reset is reported, then a test case ends.
+        Then: The rate is lowered and the reason logged.
+        """
+        self.session._report_congestion("connection reset")
+        self.session._adapt_pace()
+
+        self.assertEqual(5, self.session.pacer.rate)
+        self.logger.log_info.assert_called_once_with(
+            description="Target congested (connection reset): send rate lowered from 10.0 to 5.0/s"
+        )
+
+    def test_no_sleep_time_with_pacer(self):
+        """
+        Given: Sessions with a sleep_time of 5 seconds, one of them with a pacer.
+        When: Fuzzing.
+        Then: The session with a pacer waits on it before each send and never sleeps sleep_time; the other one sleeps
+         sleep_time after each test case.
+        """
+        clock = FakeClock()
+        for pacer in (AimdPacer(rate=10, clock=clock, sleep=clock.sleep), None):
+            with self.subTest(pacer=pacer is not None):
+                connection = mock.Mock()
+                connection.send.side_effect = lambda data, **kwargs: len(data)
+                session = make_session(target=Target(connection=connection), sleep_time=5, pacer=pacer)
+                session.connect(Request("r", children=(Group(name="g", values=["a", "b", "c"]),)))
+
+                with mock.patch("boofuzz.sessions.session.time.sleep") as sleep:
+                    session.fuzz()
+
+                sleeps = [c for c in sleep.call_args_list if c == mock.call(5)]
+                if pacer is None:
+                    self.assertEqual(session.num_cases_actually_fuzzed, len(sleeps))
+                else:
+                    self.assertEqual([], sleeps)
+                    self.assertGreater(len(clock.slept), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import FileConnection, PackedCorpus, PackedCorpusWriter, constants, exception
+from boofuzz.packed_corpus import message_path_hash
+
+PAYLOADS = [(bytes([i % 256]) * (i * 37 % 500), i // 3 + 1) for i in range(300)]
+
+
+class TestPackedCorpus(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, constants.PACKED_CORPUS_NAME)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, compress, payloads=PAYLOADS):
+        with PackedCorpusWriter(self.path, compress=compress, block_size=4096) as writer:
+            for data, test_case_index in payloads:
+                writer.append(data, test_case_index, path_hash=message_path_hash("a->b"))
+
+    def test_round_trip(self):
+        """
+        Given: Corpora written plain and in compressed blocks.
+        When: Reading them back by position, by iteration and by test case index.
+        Then: Every record comes back with its test case index and path hash.
+        """
+        for compress in (False, True):
+            with self.subTest(compress=compress):
+                self.write(compress)
+
+                with PackedCorpus(self.path) as corpus:
+                    self.assertEqual(compress, corpus.compressed)
+                    self.assertEqual(PAYLOADS, [(r.data, r.test_case_index) for r in corpus])
+                    self.assertEqual(PAYLOADS[-1][0], corpus[-1].data)
+                    self.assertEqual(PAYLOADS[150][0], corpus[150].data)
+                    self.assertEqual(message_path_hash("a->b"), corpus[7].path_hash)
+                    self.assertEqual([p[0] for p in PAYLOADS[6:9]], [r.data for r in corpus.find(3)])
+                    self.assertEqual([], corpus.find(1000))
+                os.remove(self.path)
+                os.remove(self.path + ".idx")
+
+    def test_append_to_existing(self):
+        """
+        Given: An existing plain corpus.
+        When: Appending to it in the same mode, then in compressed mode.
+        Then: The records are added, and the compressed writer is refused.
+        """
+        self.write(False, PAYLOADS[:10])
+        self.write(False, PAYLOADS[10:20])
+
+        with PackedCorpus(self.path) as corpus:
+            self.assertEqual(PAYLOADS[:20], [(r.data, r.test_case_index) for r in corpus])
+        with self.assertRaises(exception.BoofuzzError):
+            PackedCorpusWriter(self.path, compress=True)
+
+    def test_replay(self):
+        """
+        Given: A corpus with several records per test case.
+        When: Replaying two test cases to a connection.
+        Then: Each test case is sent on its own connection, records in order, and the responses are returned.
+        """
+        self.write(False)
+        connection = mock.Mock()
+        connection.recv.return_value = b"ok"
+
+        with PackedCorpus(self.path) as corpus:
+            replayed = list(corpus.replay(connection, test_case_indices=[2, 5], max_recv_bytes=10))
+
+        self.assertEqual([(2, [b"ok"] * 3), (5, [b"ok"] * 3)], replayed)
+        self.assertEqual(2, connection.open.call_count)
+        self.assertEqual(2, connection.close.call_count)
+        self.assertEqual([mock.call(p[0]) for p in PAYLOADS[3:6] + PAYLOADS[12:15]], connection.send.call_args_list)
+
+    def test_file_connection_packed(self):
+        """
+        Given: A FileConnection in packed mode.
+        When: Sending messages on two connections.
+        Then: One corpus file holds every message, numbered by connection.
+        """
+        uut = FileConnection(self.directory, packed=True)
+        for messages in ([b"a", b"bb"], [b"ccc"]):
+            uut.open()
+            for message in messages:
+                uut.send(message)
+            uut.close()
+
+        with PackedCorpus(self.path) as corpus:
+            self.assertEqual([(b"a", 1), (b"bb", 1), (b"ccc", 2)], [(r.data, r.test_case_index) for r in corpus])
+        self.assertEqual(
+            [constants.PACKED_CORPUS_NAME, constants.PACKED_CORPUS_NAME + ".idx"], sorted(os.listdir(self.directory))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
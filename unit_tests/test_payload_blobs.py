@@ -0,0 +1,111 @@
+import collections
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.loggers import fuzz_logger_postgres
+
+
+class TestPayloadCodec(unittest.TestCase):
+    def test_compressed_round_trip(self):
+        """
+        Given: A long, repetitive payload.
+        When: Compressing then decompressing it.
+        Then: It is stored compressed and decompresses to the original payload.
+        """
+        data = b"A" * 4096
+
+        codec, stored = fuzz_logger_postgres.compress_payload(data)
+
+        self.assertNotEqual(fuzz_logger_postgres.CODEC_RAW, codec)
+        self.assertLess(len(stored), len(data))
+        self.assertEqual(data, fuzz_logger_postgres.decompress_payload(codec, stored))
+
+    def test_small_payload_is_raw(self):
+        """
+        Given: A payload shorter than the compression threshold.
+        When: Compressing it.
+        Then: It is stored as is.
+        """
+        self.assertEqual((fuzz_logger_postgres.CODEC_RAW, b"abc"), fuzz_logger_postgres.compress_payload(b"abc"))
+
+    def test_preview(self):
+        """
+        Given: A compressed payload.
+        When: Decompressing it with max_length.
+        Then: Only the first max_length bytes are returned.
+        """
+        codec, stored = fuzz_logger_postgres.compress_payload(bytes(range(256)) * 16)
+
+        self.assertEqual(bytes(range(8)), fuzz_logger_postgres.decompress_payload(codec, stored, max_length=8))
+
+
+class TestStorePayload(unittest.TestCase):
+    def setUp(self):
+        self.uut = fuzz_logger_postgres.FuzzLoggerPostgres.__new__(fuzz_logger_postgres.FuzzLoggerPostgres)
+        self.uut._db_cursor = mock.MagicMock()
+        self.uut._table_blobs_name = "blobs"
+        self.uut._stored_hashes = set()
+        self.uut._pending_hashes = set()
+        self.uut._db_connection = mock.MagicMock()
+        self.uut._queue = collections.deque()
+        self.uut._queue_max_len = 0
+        self.uut._problem_detected = True
+        self.uut._log_first_case = False
+
+    def _send_query(self, data):
+        return [None, [1, "send", "", memoryview(data), False, "now", None]]
+
+    def test_repeated_payload_is_stored_once(self):
+        """
+        Given: A FuzzLoggerPostgres.
+        When: Writing two send steps with the same payload.
+        Then: One blob is inserted, and both steps reference it by hash with an empty data column.
+        """
+        first = self._send_query(b"payload")
+        second = self._send_query(b"payload")
+
+        self.uut._store_payload(first)
+        self.uut._store_payload(second)
+
+        self.assertEqual(1, self.uut._db_cursor.execute.call_count)
+        self.assertEqual(fuzz_logger_postgres.payload_hash(b"payload"), first[1][6])
+        self.assertEqual(first[1][6], second[1][6])
+        self.assertEqual(b"", second[1][3])
+
+    def test_other_steps_are_untouched(self):
+        """
+        Given: A FuzzLoggerPostgres.
+        When: Writing an info step and an empty send step.
+        Then: No blob is inserted.
+        """
+        info = [None, [1, "info", "text", b"", False, "now"]]
+
+        self.uut._store_payload(info)
+        self.uut._store_payload(self._send_query(b""))
+
+        self.uut._db_cursor.execute.assert_not_called()
+
+    def test_blob_of_failed_transaction_is_stored_again(self):
+        """
+        Given: A FuzzLoggerPostgres whose commit fails once.
+        When: Writing the same payload before and after the failure.
+        Then: The blob is inserted in both transactions, then known once committed.
+        """
+        self.uut._db_connection.commit.side_effect = [RuntimeError("connection lost"), None]
+        for _ in range(2):
+            self.uut._queue.append(self._send_query(b"payload"))
+            try:
+                self.uut._write_log(force=True)
+            except RuntimeError:
+                pass
+
+        blob_inserts = [c for c in self.uut._db_cursor.execute.call_args_list if c.args[0] is not None]
+        self.assertEqual(2, len(blob_inserts))
+        self.assertEqual({fuzz_logger_postgres.payload_hash(b"payload")}, self.uut._stored_hashes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Session
+from boofuzz.mutation_context import MutationContext
+from unit_tests.session_helpers import make_session, mock_target
+
+
+class TestPrefixSharing(unittest.TestCase):
+    def setUp(self):
+        self.target = mock_target()
+        self.session = make_session(target=self.target, cases_per_prefix=3)
+        self.path = [mock.Mock(src=0, dst=1), mock.Mock(src=1, dst=2)]
+
+    def context(self, path):
+        return MutationContext(message_path=path, mutations={})
+
+    def test_same_path_reuses_prefix_up_to_limit(self):
+        """
+        Given: A prefix set up by test case 5 and used by 2 cases, with 3 cases per prefix.
+        When: Checking the next test cases of the same path.
+        Then: One more may use it; after that the connection is closed.
+        """
+        self.session._shared_prefix = [Session._message_path_key(self.path), 5, 2]
+        self.assertTrue(self.session._reuse_prefix(self.target, self.context(self.path)))
+
+        self.session._shared_prefix[2] = 3
+        self.assertFalse(self.session._reuse_prefix(self.target, self.context(self.path)))
+        self.assertIsNone(self.session._shared_prefix)
+        self.target.close.assert_called_once_with()
+
+    def test_other_path_ends_sharing(self):
+        """
+        Given: A prefix set up for a message path.
+        When: The next test case fuzzes another path.
+        Then: The prefix is not reused and its connection is closed.
+        """
+        self.session._shared_prefix = [Session._message_path_key(self.path), 5, 1]
+
+        self.assertFalse(self.session._reuse_prefix(self.target, self.context(self.path[:1])))
+        self.target.close.assert_called_once_with()
+
+    def test_reused_connection_stays_open(self):
+        """
+        Given: A session reusing its target connection across test cases.
+        When: Ending a shared prefix.
+        Then: The connection is left open.
+        """
+        session = make_session(target=self.target, cases_per_prefix=3, reuse_target_connection=True)
+        session._shared_prefix = [Session._message_path_key(self.path), 5, 1]
+
+        session._end_prefix_sharing(self.target)
+
+        self.assertIsNone(session._shared_prefix)
+        self.target.close.assert_not_called()
+
+    def test_shared_prefix_skips_pre_send_callbacks(self):
+        """
+        Given: A target with the session's callback monitor and another monitor.
+        When: Running pre_send for a test case on a shared prefix.
+        Then: Only the other monitor runs.
+        """
+        monitor = mock.Mock()
+        self.target.monitors.append(monitor)
+
+        with mock.patch.object(self.session._callback_monitor, "pre_send") as callbacks_pre_send:
+            self.session._pre_send(self.target, shared_prefix=True)
+
+        callbacks_pre_send.assert_not_called()
+        monitor.pre_send.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
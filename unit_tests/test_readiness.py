@@ -0,0 +1,118 @@
+import socket
+import threading
+import time
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Target
+from boofuzz.sessions import BannerProbe, TCPConnectProbe, UDPProbe
+from unit_tests.session_helpers import make_session
+
+
+def free_port(kind=socket.SOCK_STREAM):
+    with socket.socket(socket.AF_INET, kind) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestReadinessProbes(unittest.TestCase):
+    def setUp(self):
+        self.target = Target(connection=mock.Mock(host="127.0.0.1", port=None))
+        self.server = None
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.close()
+
+    def listen_later(self, port, delay, banner=None):
+        def serve():
+            time.sleep(delay)
+            self.server = socket.socket()
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.server.bind(("127.0.0.1", port))
+            self.server.listen(4)
+            if banner is not None:
+                client, _ = self.server.accept()
+                client.sendall(banner)
+                client.close()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        return thread
+
+    def test_tcp_ready_soon_after_listening(self):
+        """
+        Given: A target that starts listening after 0.3 s.
+        When: Waiting with a TCP connect probe.
+        Then: It is ready after several attempts, well before the timeout.
+        """
+        port = free_port()
+        self.target.get_connection().port = port
+        self.listen_later(port, 0.3)
+
+        start = time.monotonic()
+        attempts = TCPConnectProbe(timeout=5, max_interval=0.2).wait(self.target)
+
+        self.assertGreater(attempts, 1)
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_banner(self):
+        """
+        Given: A target greeting its clients with a banner.
+        When: Waiting with a banner probe matching it.
+        Then: It is ready.
+        """
+        port = free_port()
+        self.listen_later(port, 0, banner=b"220 ftp ready\r\n")
+
+        self.assertTrue(BannerProbe(rb"^220 ", port=port, timeout=5).wait(self.target))
+
+    def test_udp_timeout(self):
+        """
+        Given: No UDP service.
+        When: Waiting with a UDP probe and a 0.3 s timeout.
+        Then: wait returns 0 after about the timeout.
+        """
+        start = time.monotonic()
+
+        self.assertEqual(0, UDPProbe(b"ping", port=free_port(socket.SOCK_DGRAM), timeout=0.3).wait(self.target))
+        self.assertLess(time.monotonic() - start, 1.5)
+
+
+class TestSessionWaitsForTarget(unittest.TestCase):
+    def setUp(self):
+        self.session = make_session()
+
+    @mock.patch("boofuzz.sessions.session.time.sleep")
+    def test_without_probe_sleeps(self, sleep):
+        """
+        Given: A target without readiness probe.
+        When: Waiting for it after a restart.
+        Then: The session sleeps the given time.
+        """
+        self.session._wait_until_ready(Target(connection=mock.Mock()), 3)
+
+        sleep.assert_called_once_with(3)
+
+    @mock.patch("boofuzz.sessions.session.time.sleep")
+    def test_with_probe_polls(self, sleep):
+        """
+        Given: A target with a readiness probe.
+        When: Waiting for it after a restart.
+        Then: The probe is polled instead of sleeping the fixed time.
+        """
+        probe = mock.Mock(timeout=10)
+        probe.wait.return_value = 2
+        target = Target(connection=mock.Mock(), readiness_probe=probe)
+
+        self.session._wait_until_ready(target, 3)
+
+        probe.wait.assert_called_once_with(target, None)
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
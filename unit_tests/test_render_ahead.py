@@ -0,0 +1,80 @@
+import threading
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import ProtocolSessionReference, Request
+from boofuzz.mutation import Mutation
+from boofuzz.mutation_context import MutationContext
+from boofuzz.primitives import String
+from unit_tests.session_helpers import make_session
+
+
+class TestRenderAhead(unittest.TestCase):
+    def setUp(self):
+        self.session = make_session(render_ahead=True)
+        self.prefix = Request(name="prefix", children=(String(name="s", default_value="hello"),))
+        self.prefix_edge = self.session.connect_boofuzz(self.prefix)
+
+    def tearDown(self):
+        self.session._render_executor.shutdown()
+
+    def fuzz(self, request, callback=None):
+        self.session.fuzz_node = request
+        path = [self.prefix_edge, self.session.connect_boofuzz(self.prefix, request, callback=callback)]
+        return MutationContext(
+            message_path=path,
+            mutations={"r.s": Mutation(value="A" * 100, qualified_name="r.s", index=0)},
+        )
+
+    def test_rendered_in_background(self):
+        """
+        Given: A session rendering ahead and a test case fuzzing a plain request.
+        When: Starting the render, then taking the fuzzed message.
+        Then: It was rendered by another thread, and is the same as a render at send time.
+        """
+        request = Request(name="r", children=(String(name="s", default_value="abc"),))
+        context = self.fuzz(request)
+        threads = []
+        render = request.render
+
+        def recording_render(mutation_context=None):
+            threads.append(threading.current_thread())
+            return render(mutation_context)
+
+        request.render = recording_render
+
+        self.session._render_ahead(context)
+        data = self.session._take_rendered(context)
+
+        self.assertEqual(b"A" * 100, data)
+        self.assertEqual(render(context), data)
+        self.assertIsNot(threading.current_thread(), threads[0])
+        self.assertIsNone(self.session._rendered_ahead)
+
+    def test_lazy_cases(self):
+        """
+        Given: Test cases fuzzing a request referring to a ProtocolSessionReference, a request with an edge callback
+            and a request also sent earlier in the path.
+        When: Starting their render ahead.
+        Then: Nothing is rendered ahead.
+        """
+        referring = Request(
+            name="r",
+            children=(
+                String(name="s", default_value="abc"),
+                String(name="token", default_value=ProtocolSessionReference(name="token", default_value="t")),
+            ),
+        )
+        plain = Request(name="r2", children=(String(name="s", default_value="abc"),))
+
+        for request, callback in [(referring, None), (plain, mock.Mock()), (self.prefix, None)]:
+            self.session._render_ahead(self.fuzz(request, callback=callback))
+
+            self.assertIsNone(self.session._rendered_ahead)
+
+
+if __name__ == "__main__":
+    unittest.main()
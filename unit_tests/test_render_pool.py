@@ -0,0 +1,139 @@
+import threading
+import unittest
+
+from boofuzz import Block, Byte, Checksum, Request
+from boofuzz.exception import BoofuzzError
+from boofuzz.primitives import Bytes, String
+from boofuzz.sessions import RenderPool
+from boofuzz.sessions.render_pool import ShmRing
+from unit_tests.session_helpers import make_session, mock_target
+
+
+class TestShmRing(unittest.TestCase):
+    def test_records_wrap_around(self):
+        """
+        Given: A small ring.
+        When: Writing and reading records of varying sizes, more than its capacity in total.
+        Then: Every record comes back in order, then None once the writer is closed.
+        """
+        uut = ShmRing(64)
+        records = [bytes([i]) * (i % 13) for i in range(100)]
+
+        received = []
+        for record in records:
+            uut.put(record)
+            received.append(uut.get())
+        uut.close_writer()
+
+        self.assertEqual(records, received)
+        self.assertIsNone(uut.get())
+
+    def test_blocking_producer_and_consumer(self):
+        """
+        Given: A small ring written to by another thread.
+        When: Reading more records than fit in it at once.
+        Then: The writer waits for space, the reader for records, and every record comes back in order.
+        """
+        uut = ShmRing(64)
+        records = [bytes([i]) * 20 for i in range(50)]
+
+        def write():
+            for record in records:
+                uut.put(record)
+            uut.close_writer()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        received = list(iter(uut.get, None))
+        writer.join()
+
+        self.assertEqual(records, received)
+
+    def test_dead_producer(self):
+        """
+        Given: An empty ring.
+        When: Reading from it while its producer is dead.
+        Then: BoofuzzError is raised.
+        """
+        with self.assertRaises(BoofuzzError):
+            ShmRing(64).get(producer_alive=lambda: False)
+
+    def test_oversized_record(self):
+        """
+        Given: A ring.
+        When: Writing a record larger than half its capacity.
+        Then: ValueError is raised.
+        """
+        with self.assertRaises(ValueError):
+            ShmRing(64).put(b"x" * 40)
+
+
+def make_request():
+    return Request(
+        "r",
+        children=(
+            Block(
+                name="body",
+                children=(String(name="text", default_value="abc", max_len=300), Byte(name="flag", default_value=1)),
+            ),
+            Checksum(block_name="body", fuzzable=False, name="sum"),
+            Bytes(name="tail", default_value=b"\x00\x01", max_len=4),
+        ),
+    )
+
+
+@unittest.skipUnless(RenderPool.available(), "Render workers need fork")
+class TestRenderPool(unittest.TestCase):
+    def setUp(self):
+        self.session = make_session(target=mock_target())
+        self.request = make_request()
+        self.session.connect(self.request)
+        self.path = self.session.edges_from(self.session.root.id)
+
+    def run_cases(self, test_cases, skip_element_at=None):
+        cases = []
+        for context in test_cases:
+            payload = self.session._take_rendered(context)
+            cases.append(
+                (
+                    self.session.total_mutant_index,
+                    self.session.mutant_index,
+                    self.request.mutant.qualified_name,
+                    sorted((m.qualified_name, m.index) for m in context.mutations.values()),
+                    payload,
+                )
+            )
+            if skip_element_at is not None and len(cases) == skip_element_at:
+                self.session._skip_current_element_after_current_test_case = True
+        return cases
+
+    def generate(self, workers, **kwargs):
+        self.session.total_mutant_index = 0
+        self.session.render_workers = workers
+        return self.run_cases(self.session._generate_test_cases(path=self.path), **kwargs)
+
+    def test_same_cases_as_serial(self):
+        """
+        Given: A request with a block, a checksum over it and another element.
+        When: Generating the round serially and with 1 and 3 render workers.
+        Then: The test cases, their indexes, mutants and rendered payloads are the same.
+        """
+        serial = self.generate(0)
+
+        self.assertGreater(len(serial), 50)
+        self.assertEqual(serial, self.generate(1))
+        self.assertEqual(serial, self.generate(3))
+
+    def test_skipped_element(self):
+        """
+        Given: A test case asking to skip the rest of its element.
+        When: Generating the round serially and with render workers.
+        Then: The same test cases are left out.
+        """
+        serial = self.generate(0, skip_element_at=5)
+
+        self.assertEqual(serial, self.generate(2, skip_element_at=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
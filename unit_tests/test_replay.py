@@ -0,0 +1,128 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Request, StoredCase
+from boofuzz.data_test_case import DataTestCase
+from boofuzz.data_test_step import DataTestStep
+from boofuzz.primitives import String
+from boofuzz.sessions import parse_test_case_indices, stored_cases_from_db
+from unit_tests.session_helpers import make_session, mock_target
+
+
+def step(type_, description="", data=b"", truncated=False):
+    return DataTestStep(type=type_, description=description, data=data, timestamp="", truncated=truncated)
+
+
+class TestStoredCases(unittest.TestCase):
+    def test_parse_indices(self):
+        """
+        Given: Test case indices and ranges.
+        When: Parsing them.
+        Then: Ranges are expanded, in the given order.
+        """
+        self.assertEqual([7, 2, 3, 4], parse_test_case_indices("7, 2-4"))
+
+    def test_from_db(self):
+        """
+        Given: Logged test cases: fragmented, truncated and missing.
+        When: Reading them as stored cases.
+        Then: The sends of the fuzzed message are kept, truncated cases are incomplete and missing ones left out.
+        """
+        logged = {
+            5: DataTestCase(
+                name='a->b:[b.s:3] round_type=library seed_index=0 seed="None"',
+                index=5,
+                timestamp="",
+                steps=[
+                    step("step", "Transmit Prep Node 'a'"),
+                    step("send", data=b"prefix"),
+                    step("step", "Fuzzing Node 'b'"),
+                    step("step", "Fuzzing Primitive 'b.s'"),
+                    step("send", data=b"frag1"),
+                    step("send", data=b"frag2"),
+                    step("step", "Sleep between tests."),
+                    step("send", data=b"ack"),
+                ],
+            ),
+            6: DataTestCase(
+                name="b:[b.s:4]",
+                index=6,
+                timestamp="",
+                steps=[step("step", "Fuzzing Node 'b'"), step("send", data=b"x" * 512, truncated=True)],
+            ),
+        }
+        reader = mock.Mock()
+        reader.get_test_case_data.side_effect = logged.get
+
+        cases = list(stored_cases_from_db(reader, [5, 6, 7]))
+
+        self.assertEqual([5, 6], [c.index for c in cases])
+        self.assertEqual([b"frag1", b"frag2"], cases[0].payloads)
+        self.assertTrue(cases[0].complete)
+        self.assertEqual(("library", 0, "None"), cases[0].round)
+        self.assertEqual("a->b:[b.s:3]", cases[0].case_name)
+        self.assertFalse(cases[1].complete)
+
+
+class TestSessionReplay(unittest.TestCase):
+    def setUp(self):
+        self.logger = mock.MagicMock()
+        self.session = make_session(target=mock_target(), fuzz_loggers=[self.logger])
+        self.session.round_type = "random_generation"
+        self.session.seed_index = 9
+        self.session.seed = "random_generation.9"
+
+        self.request = Request("b", children=(String(name="s", default_value="abc"),), timeout_check=False)
+        self.session.connect(self.request)
+        (self.edge,) = self.session.edges_from(self.session.root.id)
+
+    def test_stored_payloads_are_sent(self):
+        """
+        Given: A stored test case of two fragments, from another round, whose edge callback returns data.
+        When: Generating and transmitting it.
+        Then: The session is set to its index, name and round, and the stored fragments are sent as they are.
+        """
+        self.edge.callback = mock.Mock(return_value=b"from callback")
+        case = StoredCase(
+            index=42,
+            name='b:[b.s:3] round_type=random_mutation seed_index=2 seed="random_mutation.2"',
+            payloads=[b"\x00stored", b""],
+        )
+
+        contexts = list(self.session._generate_stored_test_cases([case]))
+
+        self.assertEqual(1, len(contexts))
+        context = contexts[0]
+        self.assertEqual(42, self.session.total_mutant_index)
+        self.assertEqual(case.name, self.session._test_case_name(context))
+        self.assertIs(self.request.names["b.s"], self.request.mutant)
+        self.assertFalse(self.session._can_render_ahead(context))
+
+        self.session.fragmentation_check(
+            self.session.targets[0],
+            self.request,
+            self.edge,
+            callback_data=b"from callback",
+            mutation_context=context,
+            transmit_type="fuzz",
+        )
+
+        self.assertEqual([mock.call(b"\x00stored"), mock.call(b"")], self.session.targets[0].send.call_args_list)
+
+    def test_incomplete_case_skipped(self):
+        """
+        Given: A stored test case whose payload was truncated in the database.
+        When: Generating the stored test cases.
+        Then: It is logged and skipped.
+        """
+        case = StoredCase(index=3, name="b:[b.s:1]", payloads=[b"x"], complete=False)
+
+        self.assertEqual([], list(self.session._generate_stored_test_cases([case])))
+        self.logger.log_info.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.mutation import Mutation
+from boofuzz.sessions import EnergyScheduler, StackOrderScheduler
+from boofuzz.sessions import scheduler
+
+
+class FakeElement:
+    def __init__(self, name, count):
+        self.qualified_name = name
+        self.fuzzable = True
+        self.count = count
+
+    def get_mutations(self):
+        for i in range(self.count):
+            yield [Mutation(value=i, qualified_name=self.qualified_name, index=i)]
+
+    def get_num_mutations(self):
+        return self.count
+
+
+class FakeSession:
+    def __init__(self, elements):
+        self.nodes = {1: mock.Mock(stack=elements)}
+        self.path = [mock.Mock(dst=1)]
+        self.total_mutant_index = 0
+        self._skip_current_node_after_current_test_case = False
+        self._skip_current_element_after_current_test_case = False
+
+    def _iterate_protocol_message_paths(self, path=None):
+        yield self.path
+
+    def _mutations_contain_duplicate(self, mutations):
+        return False
+
+
+def case_names(contexts):
+    return [(m.qualified_name, m.index) for context in contexts for m in context.mutations.values()]
+
+
+class TestEnergyScheduler(unittest.TestCase):
+    def test_same_cases_as_stack_order(self):
+        """
+        Given: An EnergyScheduler and a request with two elements.
+        When: Scheduling a round without feedback.
+        Then: Every mutation of every element is scheduled exactly once, each element's in order.
+        """
+        session = FakeSession([FakeElement("a", 25), FakeElement("b", 5)])
+
+        names = case_names(EnergyScheduler(slice_size=10).test_cases(session, depth=1))
+
+        self.assertEqual(30, len(set(names)))
+        self.assertEqual([("a", i) for i in range(25)], [n for n in names if n[0] == "a"])
+        self.assertEqual(30, session.total_mutant_index)
+
+    def test_feedback_gives_more_cases(self):
+        """
+        Given: An EnergyScheduler and a request with two elements of the same size.
+        When: The first case of the second element gets a failure.
+        Then: That element gets the next slices before the first one.
+        """
+        session = FakeSession([FakeElement("a", 40), FakeElement("b", 40)])
+        uut = EnergyScheduler(slice_size=5)
+
+        names = []
+        for context in uut.test_cases(session, depth=1):
+            names += case_names([context])
+            if names[-1] == ("b", 0):
+                uut.record(context, {scheduler.SIGNAL_FAILURE})
+
+        self.assertEqual(["a"] * 5 + ["b"] * 20, [name for name, _ in names[:25]])
+
+    def test_skip_element(self):
+        """
+        Given: An EnergyScheduler.
+        When: The session asks to skip the current element.
+        Then: Its remaining mutations are not scheduled.
+        """
+        session = FakeSession([FakeElement("a", 20), FakeElement("b", 3)])
+
+        names = []
+        for context in EnergyScheduler(slice_size=10).test_cases(session, depth=1):
+            names += case_names([context])
+            if names[-1] == ("a", 1):
+                session._skip_current_element_after_current_test_case = True
+
+        self.assertEqual([("a", 0), ("a", 1), ("b", 0), ("b", 1), ("b", 2)], names)
+
+
+class TestStackOrderScheduler(unittest.TestCase):
+    def test_delegates_to_session(self):
+        """
+        Given: A StackOrderScheduler.
+        When: Asking for test cases.
+        Then: The session's own generator is used.
+        """
+        session = mock.Mock()
+
+        StackOrderScheduler().test_cases(session, depth=2)
+
+        session._generate_n_mutations.assert_called_once_with(depth=2, path=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
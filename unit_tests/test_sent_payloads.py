@@ -0,0 +1,78 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz import Request
+from boofuzz.mutation import Mutation
+from boofuzz.mutation_context import MutationContext
+from boofuzz.primitives import String
+from boofuzz.sessions import SentPayloadFilter
+from unit_tests.session_helpers import make_session
+
+
+class TestSentPayloadFilter(unittest.TestCase):
+    def test_duplicates_per_path(self):
+        """
+        Given: A filter.
+        When: Adding payloads, again on the same path and on another one.
+        Then: Only the repetition on the same path is reported, and there are no false positives.
+        """
+        uut = SentPayloadFilter(initial_capacity=100)
+
+        self.assertEqual([], [i for i in range(5000) if uut.check_and_add("a", str(i).encode())])
+        self.assertTrue(uut.check_and_add("a", b"42"))
+        self.assertFalse(uut.check_and_add("a->b", b"42"))
+
+    def test_memory_is_bounded(self):
+        """
+        Given: A filter limited to 16 KiB.
+        When: Adding many payloads.
+        Then: Its bit arrays stay within the limit.
+        """
+        uut = SentPayloadFilter(initial_capacity=100, max_bytes=16 * 1024)
+
+        for i in range(20000):
+            uut.check_and_add("a", str(i).encode())
+
+        self.assertLessEqual(uut.num_bytes, 16 * 1024)
+
+
+class TestSessionSkipsDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.logger = mock.MagicMock()
+        self.session = make_session(fuzz_loggers=[self.logger], skip_duplicate_payloads=True)
+        self.session.total_mutant_index = 3
+        self.session.total_num_mutations = 10
+        self.session.mutant_index = 3
+
+        self.request = Request(name="r", children=(String(name="s", default_value="abc"),))
+        self.session.connect(self.request)
+        self.session.fuzz_node = self.request
+        self.path = self.session.edges_from(self.session.root.id)
+
+    def context(self, value):
+        return MutationContext(
+            message_path=self.path, mutations={"r.s": Mutation(value=value, qualified_name="r.s", index=0)}
+        )
+
+    def test_same_rendering_is_skipped(self):
+        """
+        Given: A session skipping duplicate payloads.
+        When: Two test cases render to the same bytes.
+        Then: Only the second is reported as already sent, and logging it keeps its index.
+        """
+        self.assertFalse(self.session._payload_already_sent(self.context("A" * 10)))
+        self.assertFalse(self.session._payload_already_sent(self.context("B")))
+        self.assertTrue(self.session._payload_already_sent(self.context("A" * 10)))
+
+        self.session._log_skipped_duplicate(self.context("A" * 10))
+
+        self.assertEqual(1, self.session.num_cases_skipped_duplicate)
+        self.assertEqual(3, self.logger.open_test_case.call_args.kwargs["index"])
+        self.logger.close_test_case.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
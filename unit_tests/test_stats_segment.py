@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+from boofuzz.sessions import StatsSegmentReader, StatsSegmentWriter
+
+
+class TestStatsSegment(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "live_stats.shm")
+        self.writer = StatsSegmentWriter(self.path)
+        self.reader = StatsSegmentReader(self.path)
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
+        self.directory.cleanup()
+
+    def _publish(self, **kwargs):
+        values = {
+            "total_mutant_index": 42,
+            "total_num_mutations": 1000,
+            "mutant_index": 7,
+            "num_mutations_element": 50,
+            "num_failures": 2,
+            "start_time": 1.5,
+            "runtime": 10.0,
+            "exec_speed": 4.2,
+            "current_element": "rrq",
+            "current_test_case_name": "rrq:[rrq.filename:7]",
+        }
+        values.update(kwargs)
+        self.writer.publish(**values)
+
+    def test_read_published_stats(self):
+        """
+        Given: A stats segment and a reader opened on it.
+        When: The writer publishes a snapshot.
+        Then: The reader gets back the same values.
+        """
+        self._publish()
+
+        stats = self.reader.read()
+
+        self.assertEqual(42, stats["total_mutant_index"])
+        self.assertEqual(1000, stats["total_num_mutations"])
+        self.assertEqual(7, stats["mutant_index"])
+        self.assertEqual(50, stats["num_mutations_element"])
+        self.assertEqual(2, stats["num_failures"])
+        self.assertEqual(4.2, stats["exec_speed"])
+        self.assertEqual("rrq", stats["current_element"])
+        self.assertEqual("rrq:[rrq.filename:7]", stats["current_test_case_name"])
+        self.assertFalse(stats["finished"])
+
+    def test_unknown_total_and_long_names(self):
+        """
+        Given: A stats segment.
+        When: The writer publishes an unknown total number of mutations and a test case name longer than the field.
+        Then: The reader gets None for the total and a truncated name.
+        """
+        self._publish(total_num_mutations=None, current_test_case_name="x" * 1000)
+
+        stats = self.reader.read()
+
+        self.assertIsNone(stats["total_num_mutations"])
+        self.assertEqual("x" * 512, stats["current_test_case_name"])
+
+    def test_send_rate(self):
+        """
+        Given: A stats segment.
+        When: The writer publishes snapshots without, then with a send rate.
+        Then: The reader gets None, then the rate.
+        """
+        self._publish()
+        self.assertIsNone(self.reader.read()["send_rate"])
+
+        self._publish(send_rate=12.5)
+        self.assertEqual(12.5, self.reader.read()["send_rate"])
+
+    def test_pause_flag_is_shared(self):
+        """
+        Given: A stats segment and a reader opened on it.
+        When: The reader raises the pause flag.
+        Then: The writer sees it, and a published snapshot does not lower it.
+        """
+        self.reader.paused = True
+        self._publish()
+
+        self.assertTrue(self.writer.paused)
+        self.assertTrue(self.reader.read()["is_paused"])
+
+        self.reader.paused = False
+        self.assertFalse(self.writer.paused)
+
+    def test_not_a_segment(self):
+        """
+        Given: A file which is not a stats segment.
+        When: Opening it with a reader.
+        Then: ValueError is raised.
+        """
+        path = os.path.join(self.directory.name, "other")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 1024)
+
+        with self.assertRaises(ValueError):
+            StatsSegmentReader(path)
+
+    def test_close_and_remove(self):
+        """
+        Given: A stats segment and a reader opened on it.
+        When: The writer closes it with remove=True.
+        Then: The file is gone, and the reader can still read the last snapshot.
+        """
+        self._publish()
+
+        self.writer.close(remove=True)
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(42, self.reader.read()["total_mutant_index"])
+
+
+if __name__ == "__main__":
+    unittest.main()
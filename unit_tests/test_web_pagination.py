@@ -0,0 +1,189 @@
+import unittest
+
+# pytest is required as an extras_require:
+# noinspection PyPackageRequirements
+import mock
+
+from boofuzz.loggers import fuzz_logger_postgres
+from boofuzz.sessions import session_info
+from boofuzz.web.app import _crash_summary_info, app
+from unit_tests.session_helpers import make_session
+
+
+class TestWebPagination(unittest.TestCase):
+    def setUp(self):
+        self.old_session = app.session
+        app.session = mock.MagicMock()
+        self.db_reader = app.session.db_reader
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.session = self.old_session
+
+    def test_cases_next_page(self):
+        """
+        Given: A database reader returning a full page of cases.
+        When: Requesting /api/cases with a limit of 2.
+        Then: The response holds the keyset of the last case as the next page.
+        """
+        self.db_reader.get_cases_page.return_value = [{"id": 3, "number": 1}, {"id": 7, "number": 2}]
+
+        response = self.client.get("/api/cases?limit=2&after_number=0&after_id=0").get_json()
+
+        self.db_reader.get_cases_page.assert_called_once_with(after_number=0, after_id=0, limit=2, failed_only=False)
+        self.assertEqual({"after_number": 2, "after_id": 7}, response["next"])
+
+    def test_cases_last_page(self):
+        """
+        Given: A database reader returning less cases than requested.
+        When: Requesting /api/cases.
+        Then: There is no next page.
+        """
+        self.db_reader.get_cases_page.return_value = [{"id": 3, "number": 1}]
+
+        response = self.client.get("/api/cases?limit=2&failed=1").get_json()
+
+        self.db_reader.get_cases_page.assert_called_once_with(after_number=0, after_id=0, limit=2, failed_only=True)
+        self.assertIsNone(response["next"])
+
+    def test_limit_is_capped(self):
+        """
+        Given: The web app.
+        When: Requesting /api/failures with a huge limit.
+        Then: The database is asked for at most MAX_PAGE_SIZE rows.
+        """
+        self.db_reader.get_failures_page.return_value = []
+
+        self.client.get("/api/failures?limit=100000&after=12")
+
+        self.db_reader.get_failures_page.assert_called_once_with(after_id=12, limit=500)
+
+    def test_steps_have_css_class(self):
+        """
+        Given: A database reader returning a send step.
+        When: Requesting the steps of a test case.
+        Then: The step gets the css class of send steps and the keyset of the next page is its id.
+        """
+        self.db_reader.get_steps_page.return_value = [{"id": 5, "type": "send", "data_preview": "41"}]
+
+        response = self.client.get("/api/test-case/4/steps?limit=1").get_json()
+
+        self.assertEqual("log-send", response["steps"][0]["css_class"])
+        self.assertEqual({"after": 5}, response["next"])
+
+    def test_step_data(self):
+        """
+        Given: A database reader returning a payload, then no payload.
+        When: Requesting the data of a step.
+        Then: The payload is returned as hex, as raw bytes, then a 404 is returned.
+        """
+        self.db_reader.get_step_data.return_value = b"AB"
+
+        self.assertEqual("4142", self.client.get("/api/step/1/data").get_json()["data"])
+        self.assertEqual(b"AB", self.client.get("/api/step/1/data?raw=1").data)
+
+        self.db_reader.get_step_data.return_value = None
+        self.assertEqual(404, self.client.get("/api/step/2/data").status_code)
+
+
+class TestCrashSummary(unittest.TestCase):
+    def setUp(self):
+        self.old_session = app.session
+        app.session = make_session()
+        app.session.monitor_results[3] = ["crash"]
+
+    def tearDown(self):
+        app.session = self.old_session
+
+    def test_new_failure_on_known_case(self):
+        """
+        Given: A crash summary built for one failed test case.
+        When: A second failure is recorded for the same test case.
+        Then: The summary is rebuilt with both failures.
+        """
+        _crash_summary_info()
+
+        app.session.monitor_results[3] = ["crash", "still down"]
+
+        self.assertEqual(
+            (1, [{"key": 3, "reasons": ["crash", "still down"], "status_bytes": "&nbsp;"}]), _crash_summary_info()
+        )
+
+    def test_first_failures_only(self):
+        """
+        Given: A session with four failures over three test cases.
+        When: Building a crash summary of two failures.
+        Then: It lists the first two failures, and counts the three failed test cases.
+        """
+        app.session.monitor_results.update({5: ["hang", "crash"], 8: ["crash"]})
+
+        with mock.patch("boofuzz.web.app.CRASH_SUMMARY_SIZE", 2):
+            num_failures, crashes = _crash_summary_info()
+
+        self.assertEqual(3, num_failures)
+        self.assertEqual([(3, ["crash"]), (5, ["hang"])], [(crash["key"], crash["reasons"]) for crash in crashes])
+
+
+class TestFailureSummaryFromDatabase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(session_info, "FuzzLoggerPostgresReader", autospec=True)
+        self.db_reader = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.db_reader.get_failures_page.return_value = [
+            {"id": 4, "test_case_index": 3, "description": "crash"},
+            {"id": 9, "test_case_index": 3, "description": "still down"},
+        ]
+        self.db_reader.count_failed_test_cases.return_value = 7
+
+    def test_finished_campaign(self):
+        """
+        Given: The information of a finished campaign.
+        When: Getting the failure summary twice.
+        Then: The failed test cases are counted and the first page of failures is read, once, without the failure map.
+        """
+        uut = session_info.SessionInfo(db_name="db", db_table_name="t")
+
+        self.assertEqual((7, {3: ["crash", "still down"]}), uut.failure_summary(limit=2))
+        uut.failure_summary(limit=2)
+
+        self.db_reader.get_failures_page.assert_called_once_with(limit=2)
+        self.db_reader.count_failed_test_cases.assert_called_once_with()
+        self.db_reader.iter_failures.assert_not_called()
+
+    def test_running_campaign(self):
+        """
+        Given: The information of a running campaign, whose first page of failures is full.
+        When: The session reports more failed test cases.
+        Then: Their number comes from the session, and the first page is not read again.
+        """
+        with mock.patch.object(session_info, "StatsSegmentReader", autospec=True) as stats:
+            uut = session_info.LiveSessionInfo(stats_segment_path="stats", db_name="db", db_table_name="t")
+        stats.return_value.read.return_value = {"num_failures": 1}
+        uut.failure_summary(limit=2)
+
+        stats.return_value.read.return_value = {"num_failures": 4}
+
+        self.assertEqual((4, {3: ["crash", "still down"]}), uut.failure_summary(limit=2))
+        self.db_reader.get_failures_page.assert_called_once_with(limit=2)
+        self.db_reader.count_failed_test_cases.assert_not_called()
+
+
+class TestIndexName(unittest.TestCase):
+    def test_long_index_names_stay_distinct(self):
+        """
+        Given: A table name of the maximum length.
+        When: Building the names of two indexes on it.
+        Then: The names fit in a Postgres identifier and are different.
+        """
+        table_name = "t" * 57 + "_steps"
+
+        case_index = fuzz_logger_postgres._index_name(table_name, "case")
+        fail_index = fuzz_logger_postgres._index_name(table_name, "fail")
+
+        self.assertLessEqual(len(case_index), 63)
+        self.assertNotEqual(case_index, fail_index)
+        self.assertEqual("steps_case", fuzz_logger_postgres._index_name("steps", "case"))
+
+
+if __name__ == "__main__":
+    unittest.main()